@@ -1,4 +1,5 @@
 import { call } from "frappe-ui";
+import { applyStatusColors } from "@/composables/useCalendarState";
 
 const API_BASE = "meeting_manager.meeting_manager.page.mm_enhanced_calendar.api";
 
@@ -9,6 +10,49 @@ interface Filters {
   services: string[];
 }
 
+// ── Bootstrap ──────────────────────────────────────────────────────────────
+// One get_calendar_bootstrap request feeds both the resource and the event
+// callbacks of a render. FullCalendar calls them together (resources are
+// refetched on navigation), so concurrent calls for the same range and filters
+// share the in-flight request; later refetches load fresh data.
+interface BootstrapData {
+  users: Record<string, string>;
+  departments: Record<string, string>;
+  meeting_types: Record<string, string>;
+  resources: { id: string; department: string; is_self: boolean }[];
+  bookings: any[];
+  business_hours: Record<string, { businessHours: any[]; dateOverrides: any[] }>;
+  blocked_slots: Record<string, any[]>;
+  status_colors: Record<string, { color: string; is_final: boolean }>;
+}
+
+let pendingBootstrap: { key: string; promise: Promise<BootstrapData> } | null = null;
+
+function rangeOf(fetchInfo: any): { start: string; end: string } {
+  return { start: fetchInfo.startStr.split("T")[0], end: fetchInfo.endStr.split("T")[0] };
+}
+
+function loadBootstrap(start: string, end: string, filters: Filters): Promise<BootstrapData> {
+  const params: Record<string, string> = { start, end };
+  if (filters.departments.length) params.departments = JSON.stringify(filters.departments);
+  if (filters.focusDepartment) params.focus_department = filters.focusDepartment;
+  if (filters.statuses.length) params.statuses = JSON.stringify(filters.statuses);
+  if (filters.services.length) params.services = JSON.stringify(filters.services);
+
+  const key = JSON.stringify(params);
+  if (pendingBootstrap?.key === key) return pendingBootstrap.promise;
+
+  const promise = call(`${API_BASE}.get_calendar_bootstrap`, params).then((res: BootstrapData) => {
+    if (res.status_colors && Object.keys(res.status_colors).length) applyStatusColors(res.status_colors);
+    return res;
+  });
+  pendingBootstrap = { key, promise };
+  promise.finally(() => {
+    if (pendingBootstrap?.promise === promise) pendingBootstrap = null;
+  }).catch(() => {});
+  return promise;
+}
+
 // ── Resource fetching ──────────────────────────────────────────────────────
 export async function fetchResources(
   fetchInfo: any,
@@ -17,37 +61,22 @@ export async function fetchResources(
   failureCb: (err: any) => void,
 ) {
   try {
-    const params: Record<string, string> = {};
-    if (filters.departments.length) params.departments = JSON.stringify(filters.departments);
-    if (filters.focusDepartment) params.focus_department = filters.focusDepartment;
-    const res = await call(`${API_BASE}.get_calendar_resources`, params);
-    cachedResourceIds = (res || []).map((r: any) => r.id);
-    cachedFilterKey = buildFilterKey(filters);
-    successCb(res || []);
+    const { start, end } = rangeOf(fetchInfo);
+    const data = await loadBootstrap(start, end, filters);
+    successCb(expandResources(data));
   } catch (e) {
     failureCb(e);
   }
 }
 
-// Keep resource IDs in sync for business hours
-let cachedResourceIds: string[] = [];
-let cachedFilterKey = "";
-
-function buildFilterKey(f: Filters): string {
-  return `${f.departments.join(",")}_${f.focusDepartment}`;
-}
-
-// Fetch resource IDs if not yet cached or filters changed
-async function ensureResourceIds(filters: Filters): Promise<string[]> {
-  const key = buildFilterKey(filters);
-  if (cachedResourceIds.length && cachedFilterKey === key) return cachedResourceIds;
-  const params: Record<string, string> = {};
-  if (filters.departments.length) params.departments = JSON.stringify(filters.departments);
-  if (filters.focusDepartment) params.focus_department = filters.focusDepartment;
-  const res = await call(`${API_BASE}.get_calendar_resources`, params);
-  cachedResourceIds = (res || []).map((r: any) => r.id);
-  cachedFilterKey = key;
-  return cachedResourceIds;
+function expandResources(data: BootstrapData): any[] {
+  return (data.resources || []).map((r) => ({
+    id: r.id,
+    title: data.users[r.id] || r.id,
+    department: r.department,
+    department_name: data.departments[r.department],
+    is_self: r.is_self,
+  }));
 }
 
 // ── Business-hours → background events ─────────────────────────────────────
@@ -192,44 +221,77 @@ export async function fetchEvents(
   failureCb: (err: any) => void,
 ) {
   try {
-    const startStr = fetchInfo.startStr.split("T")[0];
-    const endStr = fetchInfo.endStr.split("T")[0];
-    const baseParams: Record<string, string> = { start: startStr, end: endStr };
-    if (filters.departments.length) baseParams.departments = JSON.stringify(filters.departments);
-    if (filters.focusDepartment) baseParams.focus_department = filters.focusDepartment;
-
-    const eventParams: Record<string, string> = { ...baseParams };
-    if (filters.statuses.length) eventParams.statuses = JSON.stringify(filters.statuses);
-    if (filters.services.length) eventParams.services = JSON.stringify(filters.services);
-
-    // Ensure we have resource IDs before fetching business hours
-    const resourceIds = await ensureResourceIds(filters);
-
-    const resourceParams = {
-      resource_ids: JSON.stringify(resourceIds),
-      start_date: startStr,
-      end_date: endStr,
-    };
-
-    const [bookingEvents, businessHours, blockedSlots] = await Promise.all([
-      call(`${API_BASE}.get_calendar_events`, eventParams),
-      resourceIds.length
-        ? call(`${API_BASE}.get_all_resources_business_hours`, resourceParams)
-        : Promise.resolve({}),
-      resourceIds.length
-        ? call(`${API_BASE}.get_user_blocked_slots`, resourceParams)
-        : Promise.resolve([]),
-    ]);
-
-    const bhEvents = generateBusinessHoursEvents(businessHours || {}, startStr, endStr);
-    const blockedEvents = flattenBlockedSlots(blockedSlots || {});
-
-    successCb([...(bookingEvents || []), ...bhEvents, ...blockedEvents]);
+    const { start, end } = rangeOf(fetchInfo);
+    const data = await loadBootstrap(start, end, filters);
+
+    const bookingEvents = (data.bookings || []).flatMap((b) => expandBooking(b, data));
+    const bhEvents = generateBusinessHoursEvents(data.business_hours || {}, start, end);
+    const blockedEvents = flattenBlockedSlots(data.blocked_slots || {});
+
+    successCb([...bookingEvents, ...bhEvents, ...blockedEvents]);
   } catch (e) {
     failureCb(e);
   }
 }
 
+// A booking is sent once with its hosts and participants; it becomes one
+// event per host and, for team meetings, one read-only event per participant
+// (same shape as _get_booking_events in page/mm_enhanced_calendar/api.py,
+// which has no shared code with this function; change both together).
+function expandBooking(b: any, data: BootstrapData): any[] {
+  const color = data.status_colors?.[b.status]?.color || "#6b7280";
+  const userName = (u: string) => data.users[u] || u;
+
+  const makeEvent = (id: string, user: string, isPrimaryHost: any, isParticipant: boolean,
+    canReschedule: boolean, canReassign: boolean) => ({
+    id,
+    resourceId: user,
+    title: b.title,
+    start: b.start,
+    end: b.end,
+    backgroundColor: color,
+    borderColor: color,
+    textColor: "#ffffff",
+    extendedProps: {
+      booking_id: b.id,
+      status: b.status,
+      customer_name: b.customer_name,
+      customer_email: b.customer_email,
+      meeting_type: b.meeting_type,
+      meeting_type_name: data.meeting_types[b.meeting_type] || "Meeting",
+      department: b.department,
+      department_name: data.departments[b.department],
+      assigned_to: user,
+      assigned_to_name: userName(user),
+      is_primary_host: isPrimaryHost,
+      is_internal: b.is_internal,
+      service_type: b.service_type,
+      description: b.description,
+      duration: b.duration,
+      can_reschedule: canReschedule,
+      can_reassign: canReassign,
+      is_participant: isParticipant,
+      host_user: b.host,
+      host_name: b.host ? userName(b.host) : null,
+    },
+    editable: canReschedule,
+    resourceEditable: canReassign,
+  });
+
+  const events: any[] = [];
+  for (const h of b.hosts || []) {
+    const ev: any = makeEvent(`${b.id}-${h.user}`, h.user, h.is_primary_host, false, h.can_reschedule, b.can_reassign);
+    if (b.is_internal) ev.classNames = ["team-meeting"];
+    events.push(ev);
+  }
+  for (const p of b.participants || []) {
+    const ev: any = makeEvent(`${b.id}-participant-${p}`, p, false, true, false, false);
+    ev.classNames = ["team-meeting", "participant-event"];
+    events.push(ev);
+  }
+  return events;
+}
+
 // API returns { userId: [{ name, blocked_date, start_time, end_time, reason }] }
 function flattenBlockedSlots(data: Record<string, any[]>): any[] {
   const events: any[] = [];
@@ -37,21 +37,24 @@ async function loadStatusColors() {
   if (colorsLoaded) return;
   try {
     const res = await call(`${API_BASE}.get_status_colors`);
-    if (res && Object.keys(res).length > 0) {
-      statusData.value = res;
-      // Build simple color map for backwards compatibility
-      const colorMap: Record<string, string> = {};
-      for (const [status, info] of Object.entries(res) as [string, StatusInfo][]) {
-        colorMap[status] = info.color;
-      }
-      statusColors.value = colorMap;
-    }
+    if (res && Object.keys(res).length > 0) applyStatusColors(res);
     colorsLoaded = true;
   } catch {
     // Keep fallback colors
   }
 }
 
+// Also fed by the calendar bootstrap, which returns the same status data
+export function applyStatusColors(res: Record<string, StatusInfo>) {
+  statusData.value = res;
+  // Build simple color map for backwards compatibility
+  const colorMap: Record<string, string> = {};
+  for (const [status, info] of Object.entries(res)) {
+    colorMap[status] = info.color;
+  }
+  statusColors.value = colorMap;
+}
+
 export function getStatusColor(status: string): string {
   return statusColors.value[status] || "#6b7280";
 }
@@ -92,6 +92,13 @@ const allNavItems: NavItem[] = [
     minRole: "system_manager",
     section: "admin",
   },
+  {
+    label: "Calendar Sync",
+    to: "/admin/calendar-sync",
+    icon: "activity",
+    minRole: "system_manager",
+    section: "admin",
+  },
 
   // Personal
   {
@@ -124,6 +124,12 @@ const routes = [
     props: true,
     meta: { minRole: "system_manager", title: "Booking Status" },
   },
+  {
+    path: "/admin/calendar-sync",
+    name: "CalendarSyncHealth",
+    component: () => import("@/pages/admin/CalendarSyncHealth.vue"),
+    meta: { minRole: "system_manager", title: "Calendar Sync" },
+  },
   {
     path: "/admin/status-colors",
     redirect: "/admin/booking-statuses",
@@ -171,6 +171,29 @@ has_permission = {
 # 	}
 # }
 
+doc_events = {
+	# Roles may change; drop the cached MM access scope of the user
+	"User": {
+		"on_update": "meeting_manager.meeting_manager.utils.permissions.clear_user_access_scope"
+	},
+	# Keep customer search documents (MM Search Index) and the
+	# email/phone lookup table (MM Customer Identity) current
+	"Contact": {
+		"on_update": [
+			"meeting_manager.meeting_manager.services.search_index.update_contact_index",
+			"meeting_manager.meeting_manager.services.customer_identity.sync_contact_identities"
+		],
+		"on_trash": [
+			"meeting_manager.meeting_manager.services.search_index.remove_contact_index",
+			"meeting_manager.meeting_manager.services.customer_identity.remove_contact_identities"
+		]
+	},
+	"HD Customer": {
+		"on_update": "meeting_manager.meeting_manager.services.search_index.update_hd_customer_index",
+		"on_trash": "meeting_manager.meeting_manager.services.search_index.remove_hd_customer_index"
+	}
+}
+
 # Scheduled Tasks
 # ---------------
 
@@ -178,13 +201,25 @@ scheduler_events = {
 	"cron": {
 		# Sync all users' external calendars every 10 minutes
 		"*/10 * * * *": [
-			"meeting_manager.meeting_manager.services.calendar_sync.sync_all_users_calendars"
+			"meeting_manager.meeting_manager.services.calendar_sync.sync_all_users_calendars",
+			# Refresh OAuth tokens shortly before they expire
+			"meeting_manager.meeting_manager.services.token_manager.refresh_expiring_tokens"
 		],
 		# Process automated meeting reminders every 5 minutes
 		"*/5 * * * *": [
-			"meeting_manager.meeting_manager.services.reminder_service.process_scheduled_reminders"
+			"meeting_manager.meeting_manager.services.reminder_service.process_scheduled_reminders",
+			# Flush outbound calendar writes left over from busy flush jobs
+			"meeting_manager.meeting_manager.services.calendar_write_queue.flush_calendar_write_queue",
+			# Retry failed notification emails and flush leftovers
+			"meeting_manager.meeting_manager.services.notification_outbox.flush_notification_outbox"
 		],
-	}
+	},
+	"daily": [
+		# Repair drift in the incremental customer booking stats
+		"meeting_manager.meeting_manager.services.customer_service.reconcile_customer_booking_stats",
+		# Repair MM Department Leader / Member roles changed outside department saves
+		"meeting_manager.meeting_manager.services.role_service.reconcile_all_roles"
+	]
 }
 
 # scheduler_events = {
@@ -285,9 +320,10 @@ scheduler_events = {
 # Automatically update python controller files with type annotations for this app.
 # export_python_type_annotations = True
 
-# default_log_clearing_doctypes = {
-# 	"Logging DocType Name": 30  # days to retain logs
-# }
+default_log_clearing_doctypes = {
+	"MM Calendar Sync Run": 30,  # days to retain sync metrics
+	"MM Notification Outbox": 30
+}
 
 # Fixtures
 # --------
@@ -8,19 +8,68 @@ This module implements assignment algorithms for automatically
 assigning bookings to department members:
 - Round Robin: Fair rotation based on last assigned time
 - Least Busy: Assign to member with fewest bookings
+- Weighted: Random selection weighted by assignment_priority
+- Balanced: Composite score over load, rotation, priority, meeting type
+  affinity and remaining daily capacity
+
+Candidates are the available members, checked together with
+check_members_availability. Each candidate carries a precomputed feature
+set (see get_candidate_features) that algorithms score without further
+queries. Other apps can add algorithms through the
+"mm_assignment_algorithms" hook ({name: dotted path}); an algorithm takes
+the candidate list and returns the selected candidate. Registered names
+can be selected as a department's assignment_algorithm.
 """
 
-import frappe
-from frappe.utils import getdate, get_time, now_datetime, add_to_date
+import random
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from meeting_manager.meeting_manager.utils.validation import check_member_availability
+from itertools import accumulate
+
+import frappe
+from frappe import _
+from frappe.utils import add_to_date, cint, get_datetime, get_time, getdate, now_datetime
+
+from meeting_manager.meeting_manager.utils.validation import check_members_availability
+
+# Days of history used for meeting type affinity
+AFFINITY_DAYS = 90
+
+# Longest period for assignment statistics and rebalancing
+MAX_STATISTICS_DAYS = 366
+
+# Rebalancing: default look-ahead, most moves proposed, most bookings checked
+REBALANCE_HORIZON_DAYS = 14
+MAX_REBALANCE_MOVES = 50
+MAX_REBALANCE_CHECKS = 200
+
+# Each applied rebalancing move runs inside this savepoint
+REBALANCE_SAVEPOINT = "mm_rebalance_move"
+
+# Feature scorers used to compose algorithms: name -> function(candidate), higher is better
+FEATURE_SCORERS = {
+	"load": lambda c: -c.week_load,
+	"rotation": lambda c: c.idle_minutes,
+	"priority": lambda c: c.priority,
+	"affinity": lambda c: c.affinity,
+	"capacity": lambda c: c.capacity,
+}
+
+# Feature weights of the Balanced algorithm
+BALANCED_WEIGHTS = {
+	"load": 3,
+	"rotation": 1,
+	"priority": 1,
+	"affinity": 1,
+	"capacity": 1,
+}
 
 
 def assign_to_member(department, meeting_type, scheduled_date, scheduled_start_time, duration_minutes):
 	"""
 	Automatically assign a booking to an available department member
 
-	Uses the department's assignment algorithm (Round Robin or Least Busy)
+	Uses the department's assignment algorithm (see get_assignment_algorithms)
 
 	Args:
 		department (str): Department ID
@@ -32,7 +81,7 @@ def assign_to_member(department, meeting_type, scheduled_date, scheduled_start_t
 	Returns:
 		dict: {
 			"assigned_to": user ID,
-			"assignment_method": "Round Robin" or "Least Busy",
+			"assignment_method": algorithm name,
 			"reason": explanation of assignment
 		}
 	"""
@@ -49,18 +98,14 @@ def assign_to_member(department, meeting_type, scheduled_date, scheduled_start_t
 		frappe.throw(f"No active members in department '{dept.department_name}'")
 
 	# Check which members are available at the requested time
-	available_members = []
-
-	for member in active_members:
-		availability = check_member_availability(
-			member.member,
-			scheduled_date,
-			scheduled_start_time,
-			duration_minutes
-		)
+	availability = check_members_availability(
+		[m.member for m in active_members],
+		scheduled_date,
+		scheduled_start_time,
+		duration_minutes
+	)
 
-		if availability["available"]:
-			available_members.append(member)
+	available_members = [m for m in active_members if availability[m.member]["available"]]
 
 	if not available_members:
 		frappe.throw(
@@ -68,28 +113,187 @@ def assign_to_member(department, meeting_type, scheduled_date, scheduled_start_t
 			"Please choose a different time slot."
 		)
 
+	candidates = get_candidate_features(available_members, meeting_type, scheduled_date, availability)
+
 	# Apply assignment algorithm
-	if dept.assignment_algorithm == "Round Robin":
-		assigned_member = assign_round_robin(available_members)
-		assignment_method = "Round Robin"
-	elif dept.assignment_algorithm == "Least Busy":
-		assigned_member = assign_least_busy(available_members, scheduled_date)
-		assignment_method = "Least Busy"
+	algorithms = get_assignment_algorithms()
+	if dept.assignment_algorithm in algorithms:
+		assignment_method = dept.assignment_algorithm
+		selected = algorithms[assignment_method](candidates)
 	else:
 		# Default to round robin
-		assigned_member = assign_round_robin(available_members)
 		assignment_method = "Round Robin (default)"
+		selected = algorithms["Round Robin"](candidates)
 
 	# Update member assignment tracking
-	update_member_assignment_tracking(dept.name, assigned_member.member)
+	update_member_assignment_tracking(dept.name, selected.user)
 
 	return {
-		"assigned_to": assigned_member.member,
+		"assigned_to": selected.user,
 		"assignment_method": assignment_method,
 		"reason": f"Assigned using {assignment_method} algorithm"
 	}
 
 
+def get_candidate_features(members, meeting_type, scheduled_date, availability=None):
+	"""
+	Build the feature set of every candidate member in bulk
+
+	Args:
+		members (list): MM Department Member rows
+		meeting_type (str): Meeting Type ID of the new booking
+		scheduled_date (date or str): Date of the new booking
+		availability (dict): Result of check_members_availability, for daily capacity
+
+	Returns:
+		list: frappe._dict per member with
+			member: the MM Department Member row
+			user: user ID
+			week_load: active bookings in the 7 days from the scheduled date
+			idle_minutes: minutes since the last assignment
+			priority: assignment_priority (at least 1)
+			affinity: bookings of the meeting type in the last AFFINITY_DAYS days
+			capacity: share of the daily booking limit still free (1 without a limit)
+	"""
+	scheduled_date = getdate(scheduled_date)
+	users = [m.member for m in members]
+	availability = availability or {}
+	now = now_datetime()
+
+	# to_date is inclusive: the scheduled date and the 6 days after it
+	week_load = get_member_booking_counts(users, scheduled_date, scheduled_date + timedelta(days=6))
+	affinity = get_member_booking_counts(
+		users,
+		scheduled_date - timedelta(days=AFFINITY_DAYS),
+		scheduled_date,
+		meeting_type=meeting_type
+	) if meeting_type else {}
+
+	candidates = []
+	for member in members:
+		member_availability = availability.get(member.member) or {}
+		max_per_day = member_availability.get("max_bookings_per_day")
+		if max_per_day:
+			capacity = max(max_per_day - (member_availability.get("day_bookings") or 0), 0) / max_per_day
+		else:
+			capacity = 1
+
+		last_assigned = member.last_assigned_datetime or datetime(1970, 1, 1)
+
+		candidates.append(frappe._dict({
+			"member": member,
+			"user": member.member,
+			"week_load": week_load.get(member.member, 0),
+			"idle_minutes": (now - last_assigned).total_seconds() / 60,
+			"priority": max(member.assignment_priority or 1, 1),
+			"affinity": affinity.get(member.member, 0),
+			"capacity": capacity,
+		}))
+
+	return candidates
+
+
+def get_assignment_algorithms():
+	"""
+	Get the available assignment algorithms
+
+	Returns:
+		dict: {algorithm name: function(candidates) -> selected candidate}
+	"""
+	algorithms = {
+		"Round Robin": select_round_robin,
+		"Least Busy": select_least_busy,
+		"Weighted": select_weighted,
+		"Balanced": select_balanced,
+	}
+
+	# Dict hooks are merged into {name: [dotted paths]}; the last app wins
+	for name, paths in frappe.get_hooks("mm_assignment_algorithms").items():
+		algorithms[name] = frappe.get_attr(paths[-1])
+
+	return algorithms
+
+
+@frappe.whitelist()
+def get_assignment_algorithm_names():
+	"""
+	Get the names a department can choose as assignment_algorithm
+
+	Returns:
+		list: Algorithm names, built-in algorithms first
+	"""
+	return list(get_assignment_algorithms())
+
+
+def select_by_score(candidates, weights):
+	"""
+	Select the candidate with the highest weighted feature score
+
+	Each feature is normalized to 0..1 across the candidates before it is
+	weighted, so features on different scales can be combined. Ties go to
+	the member who has waited longest since their last assignment.
+
+	Args:
+		candidates (list): Candidates from get_candidate_features
+		weights (dict): {FEATURE_SCORERS name: weight}
+
+	Returns:
+		frappe._dict: Selected candidate
+	"""
+	scores = [0.0] * len(candidates)
+
+	for feature, weight in weights.items():
+		values = [FEATURE_SCORERS[feature](c) for c in candidates]
+		low, high = min(values), max(values)
+		if high == low:
+			continue
+		for i, value in enumerate(values):
+			scores[i] += weight * (value - low) / (high - low)
+
+	best = max(
+		range(len(candidates)),
+		key=lambda i: (scores[i], candidates[i].idle_minutes)
+	)
+	return candidates[best]
+
+
+def select_weighted(candidates, weight_feature="priority"):
+	"""
+	Random selection weighted by a feature (assignment_priority by default)
+
+	Uses cumulative weights, so the cost does not depend on the size of
+	the weights.
+
+	Args:
+		candidates (list): Candidates from get_candidate_features
+		weight_feature (str): Candidate feature used as weight
+
+	Returns:
+		frappe._dict: Selected candidate
+	"""
+	cumulative = list(accumulate(max(c[weight_feature], 0) for c in candidates))
+	if not cumulative[-1]:
+		return random.choice(candidates)
+
+	point = random.random() * cumulative[-1]
+	return candidates[min(bisect_right(cumulative, point), len(candidates) - 1)]
+
+
+def select_round_robin(candidates):
+	"""Member who has waited longest since their last assignment"""
+	return select_by_score(candidates, {"rotation": 1})
+
+
+def select_least_busy(candidates):
+	"""Member with the fewest active bookings in the next 7 days"""
+	return select_by_score(candidates, {"load": 1})
+
+
+def select_balanced(candidates):
+	"""Member with the best composite score (see BALANCED_WEIGHTS)"""
+	return select_by_score(candidates, BALANCED_WEIGHTS)
+
+
 def assign_round_robin(available_members):
 	"""
 	Assign to member with oldest last_assigned_datetime
@@ -125,77 +329,74 @@ def assign_least_busy(available_members, scheduled_date):
 	Returns:
 		MM Department Member: Selected member
 	"""
-	scheduled_date = getdate(scheduled_date)
-	week_end = scheduled_date + timedelta(days=7)
-
-	# Count bookings for each member
-	member_booking_counts = []
-
-	for member in available_members:
-		# Query the child table for assigned bookings
-		assigned_bookings = frappe.get_all(
-			"MM Meeting Booking Assigned User",
-			filters={
-				"user": member.member
-			},
-			fields=["parent"]
-		)
+	candidates = get_candidate_features(available_members, None, scheduled_date)
+	return select_least_busy(candidates).member
 
-		booking_ids = [b.parent for b in assigned_bookings]
-
-		# Count bookings in the date range with confirmed/pending status
-		booking_count = 0
-		if booking_ids:
-			booking_count = frappe.db.count(
-				"MM Meeting Booking",
-				filters={
-					"name": ["in", booking_ids],
-					"start_datetime": ["between", [scheduled_date, week_end]],
-					"booking_status": ["not in", ["Cancelled", "Sale Approved", "Booking Approved Not Sale", "Not Possible"]]
-				}
-			)
 
-		member_booking_counts.append({
-			"member": member,
-			"booking_count": booking_count
-		})
+def assign_weighted(available_members):
+	"""
+	Assign based on assignment_priority field (higher priority = more assignments)
 
-	# Sort by booking count (lowest first)
-	# If tied, use last_assigned_datetime as tiebreaker
-	sorted_members = sorted(
-		member_booking_counts,
-		key=lambda m: (
-			m["booking_count"],
-			m["member"].last_assigned_datetime or datetime(1970, 1, 1)
-		)
-	)
+	Args:
+		available_members (list): List of MM Department Member objects
 
-	return sorted_members[0]["member"]
+	Returns:
+		MM Department Member: Selected member
+	"""
+	candidates = [
+		frappe._dict(member=m, priority=max(m.assignment_priority or 1, 1))
+		for m in available_members
+	]
+	return select_weighted(candidates).member
 
 
-def assign_weighted(available_members):
+def get_member_booking_counts(users, from_date, to_date, meeting_type=None):
 	"""
-	Assign based on assignment_priority field (higher priority = more assignments)
+	Count active bookings per assigned user in a date range
 
-	This is for future implementation - weighted random selection
+	One grouped query over the assigned user index, so the cost does not
+	depend on how many bookings a member has had in the past.
 
 	Args:
-		available_members (list): List of MM Department Member objects
+		users (list): User IDs
+		from_date (date): First day (inclusive)
+		to_date (date): Last day (inclusive)
+		meeting_type (str, optional): Only count bookings of this meeting type
 
 	Returns:
-		MM Department Member: Selected member
+		dict: {user: booking count}; users without bookings are missing
 	"""
-	import random
+	if not users:
+		return {}
 
-	# Create weighted list based on assignment_priority
-	weighted_choices = []
-	for member in available_members:
-		priority = member.assignment_priority or 1
-		# Add member to list 'priority' times (higher priority = more chances)
-		weighted_choices.extend([member] * priority)
+	from meeting_manager.meeting_manager.doctype.mm_booking_status.mm_booking_status import (
+		get_finalized_statuses,
+	)
 
-	# Random selection from weighted list
-	return random.choice(weighted_choices)
+	finalized = get_finalized_statuses()
+	status_condition = "AND mb.booking_status NOT IN %(finalized)s" if finalized else ""
+	meeting_type_condition = "AND mb.meeting_type = %(meeting_type)s" if meeting_type else ""
+
+	rows = frappe.db.sql(f"""
+		SELECT au.user, COUNT(DISTINCT mb.name) AS booking_count
+		FROM `tabMM Meeting Booking Assigned User` au
+		INNER JOIN `tabMM Meeting Booking` mb ON mb.name = au.parent
+		WHERE au.parenttype = 'MM Meeting Booking'
+			AND au.user IN %(users)s
+			AND mb.start_datetime >= %(from_date)s
+			AND mb.start_datetime < %(to_date)s
+			{status_condition}
+			{meeting_type_condition}
+		GROUP BY au.user
+	""", {
+		"users": list(users),
+		"from_date": getdate(from_date),
+		"to_date": getdate(to_date) + timedelta(days=1),
+		"finalized": finalized,
+		"meeting_type": meeting_type,
+	}, as_dict=True)
+
+	return {row.user: row.booking_count for row in rows}
 
 
 def update_member_assignment_tracking(department, member):
@@ -220,53 +421,87 @@ def update_member_assignment_tracking(department, member):
 	dept.save(ignore_permissions=True)
 
 
+@frappe.whitelist()
 def get_assignment_statistics(department, days=30):
 	"""
 	Get assignment statistics for a department
 
+	Counts come from one grouped query over the assigned user table and
+	start_datetime, so a year of history costs about the same as a month.
+
 	Args:
 		department (str): Department ID
-		days (int): Number of days to look back
+		days (int): Number of days to look back (at most MAX_STATISTICS_DAYS)
 
 	Returns:
-		dict: Assignment statistics by member
-	"""
-	start_date = getdate() - timedelta(days=days)
-
-	# Get all members
-	members = frappe.get_all(
-		"MM Department Member",
-		filters={
-			"parent": department,
-			"parenttype": "MM Department"
-		},
-		fields=["member", "total_assignments", "last_assigned_datetime", "is_active"]
-	)
+		dict: {
+			"department", "period_days", "from_date", "to_date",
+			"statistics": [{
+				"member", "member_name", "is_active", "total_assignments", "last_assigned",
+				"recent_bookings": bookings in the period,
+				"active_bookings": of which not in a final status,
+				"daily_load": {date: bookings} for days with bookings,
+				"peak_daily_load", "average_daily_load"
+			}]
+		}
+	"""
+	_check_department_access(department)
+
+	days = min(max(cint(days) or 30, 1), MAX_STATISTICS_DAYS)
+	to_date = getdate()
+	from_date = to_date - timedelta(days=days)
+
+	# Members with their names in one query
+	members = frappe.db.sql("""
+		SELECT dm.member, dm.total_assignments, dm.last_assigned_datetime, dm.is_active,
+			u.full_name AS member_name
+		FROM `tabMM Department Member` dm
+		LEFT JOIN `tabUser` u ON u.name = dm.member
+		WHERE dm.parent = %(department)s AND dm.parenttype = 'MM Department'
+		ORDER BY dm.idx
+	""", {"department": department}, as_dict=True)
+
+	daily_load = {}
+	if members:
+		for row in frappe.db.sql("""
+			SELECT au.user, DATE(mb.start_datetime) AS day,
+				COUNT(DISTINCT mb.name) AS bookings,
+				COUNT(DISTINCT CASE WHEN bs.is_final = 1 THEN NULL ELSE mb.name END) AS active_bookings
+			FROM `tabMM Meeting Booking Assigned User` au
+			INNER JOIN `tabMM Meeting Booking` mb ON mb.name = au.parent
+			LEFT JOIN `tabMM Booking Status` bs ON bs.name = mb.booking_status
+			WHERE au.parenttype = 'MM Meeting Booking'
+				AND au.user IN %(users)s
+				AND mb.department = %(department)s
+				AND mb.start_datetime >= %(from_date)s
+				AND mb.start_datetime < %(to_date)s
+				AND IFNULL(mb.booking_status, '') != ''
+			GROUP BY au.user, DATE(mb.start_datetime)
+		""", {
+			"users": [m.member for m in members],
+			"department": department,
+			"from_date": from_date,
+			"to_date": to_date + timedelta(days=1),
+		}, as_dict=True):
+			daily_load.setdefault(row.user, []).append(row)
 
 	statistics = []
 
 	for member in members:
-		# Get recent bookings count
-		recent_bookings = frappe.db.count(
-			"MM Meeting Booking",
-			filters={
-				"department": department,
-				"assigned_to": member.member,
-				"scheduled_date": [">=", start_date],
-				"status": ["in", ["Confirmed", "Pending", "Completed"]]
-			}
-		)
-
-		# Get member name
-		member_name = frappe.get_value("User", member.member, "full_name")
+		member_days = daily_load.get(member.member, [])
+		recent_bookings = sum(d.bookings for d in member_days)
 
 		statistics.append({
 			"member": member.member,
-			"member_name": member_name,
+			"member_name": member.member_name,
 			"is_active": member.is_active,
 			"total_assignments": member.total_assignments or 0,
 			"recent_bookings": recent_bookings,
-			"last_assigned": member.last_assigned_datetime
+			"active_bookings": sum(d.active_bookings for d in member_days),
+			"last_assigned": member.last_assigned_datetime,
+			"daily_load": {str(d.day): d.bookings for d in sorted(member_days, key=lambda d: d.day)},
+			"peak_daily_load": max((d.bookings for d in member_days), default=0),
+			"average_daily_load": round(recent_bookings / (days + 1), 2),
 		})
 
 	# Sort by recent bookings (descending)
@@ -275,26 +510,48 @@ def get_assignment_statistics(department, days=30):
 	return {
 		"department": department,
 		"period_days": days,
+		"from_date": str(from_date),
+		"to_date": str(to_date),
 		"statistics": statistics
 	}
 
 
-def rebalance_assignments(department, dry_run=True):
+@frappe.whitelist()
+def rebalance_assignments(department, dry_run=True, days=REBALANCE_HORIZON_DAYS):
 	"""
-	Analyze and suggest rebalancing of assignments
+	Analyze the upcoming workload and propose moves that even it out
 
-	Useful for identifying if assignment algorithm is working correctly
+	Looks at the active bookings of the department in the next `days` days
+	and repeatedly moves a booking from the busiest member to the least
+	busy member who is available at that time, until the difference is at
+	most one booking. Load counts every booking a member is assigned to, as
+	in get_assignment_statistics; only bookings the member hosts can be
+	moved. Proposed moves are checked against each other, so a member never
+	receives two overlapping bookings.
 
 	Args:
 		department (str): Department ID
-		dry_run (bool): If True, only return suggestions without making changes
+		dry_run (bool): If True, only return the proposed moves; otherwise
+			apply each of them with reassign_booking in its own savepoint
+		days (int): Days ahead to rebalance
 
 	Returns:
-		dict: Rebalancing analysis and suggestions
+		dict: Rebalancing analysis, proposed "moves" [{"booking", "start_datetime",
+		"from_member", "to_member"}], "applied_moves" (booking IDs), "failed_moves"
+		[{"booking", "to_member", "error"}] and suggestions
 	"""
-	stats = get_assignment_statistics(department, days=30)
+	_check_department_access(department)
+
+	dry_run = cint(frappe.parse_json(dry_run))
+	days = min(max(cint(days) or REBALANCE_HORIZON_DAYS, 1), MAX_STATISTICS_DAYS)
 
-	active_members = [s for s in stats["statistics"] if s["is_active"]]
+	active_members = frappe.db.sql("""
+		SELECT dm.member, u.full_name AS member_name
+		FROM `tabMM Department Member` dm
+		LEFT JOIN `tabUser` u ON u.name = dm.member
+		WHERE dm.parent = %(department)s AND dm.parenttype = 'MM Department' AND dm.is_active = 1
+		ORDER BY dm.idx
+	""", {"department": department}, as_dict=True)
 
 	if not active_members:
 		return {
@@ -302,28 +559,214 @@ def rebalance_assignments(department, dry_run=True):
 			"message": "No active members in department"
 		}
 
-	# Calculate average assignments
-	total_assignments = sum(m["recent_bookings"] for m in active_members)
-	avg_assignments = total_assignments / len(active_members)
+	member_names = {m.member: m.member_name or m.member for m in active_members}
+	now = now_datetime()
+
+	assignments = frappe.db.sql("""
+		SELECT au.user, au.is_primary_host, mb.name, mb.start_datetime, mb.end_datetime, mb.duration
+		FROM `tabMM Meeting Booking Assigned User` au
+		INNER JOIN `tabMM Meeting Booking` mb ON mb.name = au.parent
+		WHERE au.parenttype = 'MM Meeting Booking'
+			AND au.user IN %(members)s
+			AND mb.department = %(department)s
+			AND mb.start_datetime >= %(now)s
+			AND mb.start_datetime < %(until)s
+			AND IFNULL(mb.booking_status, '') != ''
+			AND mb.booking_status NOT IN (SELECT name FROM `tabMM Booking Status` WHERE is_final = 1)
+		ORDER BY mb.start_datetime DESC
+	""", {
+		"department": department,
+		"members": list(member_names),
+		"now": now,
+		"until": getdate(now) + timedelta(days=days + 1),
+	}, as_dict=True)
+
+	# Load per member counts each booking once; only hosted bookings are movable
+	member_assignments = {member: set() for member in member_names}
+	booking_users = {}
+	member_bookings = {member: [] for member in member_names}
+	for row in assignments:
+		member_assignments[row.user].add(row.name)
+		booking_users.setdefault(row.name, set()).add(row.user)
+		if row.is_primary_host:
+			member_bookings[row.user].append(row)
+
+	for bookings in member_bookings.values():
+		for booking in bookings:
+			booking.assigned_users = booking_users[booking.name]
+
+	load = {member: len(member_assignments[member]) for member in member_names}
+
+	total_assignments = sum(load.values())
+	avg_assignments = total_assignments / len(member_names)
 
 	# Find imbalances (members with significantly more/fewer assignments)
 	threshold = avg_assignments * 0.3  # 30% deviation threshold
 
-	overloaded = [m for m in active_members if m["recent_bookings"] > avg_assignments + threshold]
-	underloaded = [m for m in active_members if m["recent_bookings"] < avg_assignments - threshold]
+	def summary(member):
+		return {"member": member, "member_name": member_names[member], "upcoming_bookings": load[member]}
+
+	overloaded = [summary(m) for m in member_names if load[m] > avg_assignments + threshold]
+	underloaded = [summary(m) for m in member_names if load[m] < avg_assignments - threshold]
+
+	moves = _propose_moves(load, member_bookings)
+
+	applied = []
+	failed = []
+	if not dry_run:
+		applied, failed = _apply_moves(moves)
+
+		# The projected load only includes the moves that were saved
+		for move in failed:
+			load[move["from_member"]] += 1
+			load[move["to_member"]] -= 1
+
+	for move in moves:
+		move["from_member_name"] = member_names[move["from_member"]]
+		move["to_member_name"] = member_names[move["to_member"]]
 
 	return {
 		"status": "balanced" if not (overloaded or underloaded) else "imbalanced",
+		"period_days": days,
 		"average_assignments": avg_assignments,
 		"total_assignments": total_assignments,
-		"active_members_count": len(active_members),
+		"active_members_count": len(member_names),
 		"overloaded_members": overloaded,
 		"underloaded_members": underloaded,
-		"suggestions": generate_rebalancing_suggestions(overloaded, underloaded, avg_assignments)
+		"projected_load": {m: load[m] for m in member_names},
+		"moves": moves,
+		"applied_moves": applied,
+		"failed_moves": [
+			{"booking": m["booking"], "to_member": m["to_member"], "error": m["error"]}
+			for m in failed
+		],
+		"suggestions": generate_rebalancing_suggestions(overloaded, underloaded, avg_assignments, moves)
 	}
 
 
-def generate_rebalancing_suggestions(overloaded, underloaded, avg_assignments):
+def _apply_moves(moves):
+	"""
+	Apply proposed moves with reassign_booking, each in its own savepoint
+
+	A move that fails is rolled back on its own and does not undo the moves
+	saved before it.
+
+	Args:
+		moves (list): Proposed moves from _propose_moves
+
+	Returns:
+		tuple: (applied booking IDs, failed moves with an "error" message)
+	"""
+	from meeting_manager.meeting_manager.api.booking import reassign_booking
+
+	after_commit = frappe.db.after_commit._functions
+	applied = []
+	failed = []
+
+	for move in moves:
+		pending_jobs = len(after_commit)
+		pending_messages = len(frappe.local.message_log)
+
+		frappe.db.savepoint(REBALANCE_SAVEPOINT)
+		try:
+			reassign_booking(move["booking"], move["to_member"], reason="Workload rebalancing")
+		except Exception as e:
+			frappe.db.rollback(save_point=REBALANCE_SAVEPOINT)
+			# A rollback to a savepoint keeps after-commit callbacks; drop those of the failed move
+			while len(after_commit) > pending_jobs:
+				after_commit.pop()
+			# The error is returned with the move instead of being shown as a message
+			del frappe.local.message_log[pending_messages:]
+			failed.append({**move, "error": str(e)})
+		else:
+			applied.append(move["booking"])
+
+	return applied, failed
+
+
+def _propose_moves(load, member_bookings):
+	"""
+	Greedily move bookings from the busiest to the least busy available member
+
+	Args:
+		load (dict): {member: upcoming bookings}; updated with the projected load
+		member_bookings (dict): {member: hosted bookings ordered latest first}
+
+	Returns:
+		list: Proposed moves
+	"""
+	moves = []
+	received = {member: [] for member in load}
+	checked = 0
+
+	while len(moves) < MAX_REBALANCE_MOVES and checked < MAX_REBALANCE_CHECKS:
+		busiest = max(load, key=lambda m: load[m])
+		targets = sorted(
+			(m for m in load if load[m] < load[busiest] - 1),
+			key=lambda m: load[m]
+		)
+		if not targets:
+			break
+
+		move = None
+		while member_bookings[busiest] and checked < MAX_REBALANCE_CHECKS:
+			booking = member_bookings[busiest].pop(0)
+			checked += 1
+
+			start = get_datetime(booking.start_datetime)
+			end = get_datetime(booking.end_datetime) if booking.end_datetime else start + timedelta(minutes=booking.duration or 0)
+
+			# Skip targets already on the booking or given an overlapping booking in this proposal
+			free_targets = [
+				m for m in targets
+				if m not in booking.assigned_users
+				and not any(s < end and e > start for s, e in received[m])
+			]
+			if not free_targets:
+				continue
+
+			availability = check_members_availability(
+				free_targets,
+				start.date(),
+				start.time(),
+				booking.duration or int((end - start).total_seconds() / 60),
+				exclude_booking=booking.name
+			)
+			target = next((m for m in free_targets if availability[m]["available"]), None)
+			if target:
+				move = {
+					"booking": booking.name,
+					"start_datetime": str(start),
+					"from_member": busiest,
+					"to_member": target,
+				}
+				received[target].append((start, end))
+				load[busiest] -= 1
+				load[target] += 1
+				break
+
+		if not move:
+			# Nothing of the busiest member can be moved; stop instead of cycling
+			break
+
+		moves.append(move)
+
+	return moves
+
+
+def _check_department_access(department):
+	"""Only System Managers and the department's leader may see its statistics"""
+	from meeting_manager.meeting_manager.utils.permissions import get_access_scope
+
+	scope = get_access_scope()
+	if not (scope.is_system_manager or department in scope.led_departments):
+		frappe.throw(
+			_("You do not have permission to view assignment statistics of this department"),
+			frappe.PermissionError
+		)
+
+
+def generate_rebalancing_suggestions(overloaded, underloaded, avg_assignments, moves=None):
 	"""
 	Generate suggestions for rebalancing workload
 
@@ -331,6 +774,7 @@ def generate_rebalancing_suggestions(overloaded, underloaded, avg_assignments):
 		overloaded (list): Members with too many assignments
 		underloaded (list): Members with too few assignments
 		avg_assignments (float): Average assignments per member
+		moves (list): Proposed moves from rebalance_assignments
 
 	Returns:
 		list: List of suggestion strings
@@ -343,7 +787,7 @@ def generate_rebalancing_suggestions(overloaded, underloaded, avg_assignments):
 
 	if overloaded:
 		for member in overloaded:
-			diff = member["recent_bookings"] - avg_assignments
+			diff = member["upcoming_bookings"] - avg_assignments
 			suggestions.append(
 				f"⚠ {member['member_name']} has {diff:.0f} more assignments than average. "
 				"Consider checking their availability rules or calendar sync."
@@ -351,14 +795,19 @@ def generate_rebalancing_suggestions(overloaded, underloaded, avg_assignments):
 
 	if underloaded:
 		for member in underloaded:
-			diff = avg_assignments - member["recent_bookings"]
+			diff = avg_assignments - member["upcoming_bookings"]
 			suggestions.append(
 				f"ℹ {member['member_name']} has {diff:.0f} fewer assignments than average. "
 				"This may indicate limited availability or they may have recently joined."
 			)
 
-	suggestions.append(
-		"💡 Tip: Ensure all members have similar working hours and availability rules for best balance."
-	)
+	if moves:
+		suggestions.append(
+			f"↔ {len(moves)} booking(s) can be moved to members who are available at the same time."
+		)
+	else:
+		suggestions.append(
+			"💡 Tip: Ensure all members have similar working hours and availability rules for best balance."
+		)
 
 	return suggestions
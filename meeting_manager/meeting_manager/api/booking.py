@@ -15,13 +15,18 @@ and Department Members) to manage bookings internally:
 
 from meeting_manager.meeting_manager.doctype.mm_booking_status.mm_booking_status import get_finalized_statuses, get_active_statuses
 
+import base64
+import hashlib
+import json
+
 import frappe
 from frappe import _
-from frappe.utils import getdate, get_time, get_datetime, now_datetime
+from frappe.utils import cint, getdate, get_time, get_datetime, now_datetime
 from datetime import datetime, timedelta
 from meeting_manager.meeting_manager.utils.validation import check_member_availability
 from meeting_manager.meeting_manager.api.assignment import update_member_assignment_tracking
 from meeting_manager.meeting_manager.utils.email_notifications import send_booking_confirmation_email
+from meeting_manager.meeting_manager.services.search_index import search as search_index, get_search_condition
 
 
 @frappe.whitelist()
@@ -1920,12 +1925,15 @@ def search_customers(query):
 	if not query or len(query) < 2:
 		return []
 
-	query_lower = query.lower()
-	query_pattern = f"%{query_lower}%"
+	# Ranked matches by name, email, phone, CVR or company from the search index
+	matches = search_index("Contact", query, limit=10)
+	if not matches:
+		return []
+
+	rank = {m.reference_name: i for i, m in enumerate(matches)}
 
-	# Search contacts by name, email, CVR, company, or in child tables
 	customers = frappe.db.sql("""
-		SELECT DISTINCT
+		SELECT
 			c.name as id,
 			IFNULL(c.full_name, c.first_name) as name,
 			c.email_id as email,
@@ -1935,19 +1943,10 @@ def search_customers(query):
 			c.company_name,
 			c.mm_total_bookings as total_bookings
 		FROM `tabContact` c
-		LEFT JOIN `tabContact Email` ce ON ce.parent = c.name
-		LEFT JOIN `tabContact Phone` cp ON cp.parent = c.name
-		WHERE
-			LOWER(IFNULL(c.full_name, c.first_name)) LIKE %(pattern)s
-			OR LOWER(c.email_id) LIKE %(pattern)s
-			OR LOWER(ce.email_id) LIKE %(pattern)s
-			OR LOWER(c.mm_cvr_number) LIKE %(pattern)s
-			OR LOWER(c.company_name) LIKE %(pattern)s
-			OR REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(cp.phone, ' ', ''), '-', ''), '(', ''), ')', ''), '+', '') LIKE %(pattern)s
-		ORDER BY IFNULL(c.full_name, c.first_name)
-		LIMIT 10
-	""", {"pattern": query_pattern}, as_dict=True)
+		WHERE c.name IN %(names)s
+	""", {"names": tuple(rank)}, as_dict=True)
 
+	customers.sort(key=lambda c: rank[c.id])
 	return customers
 
 
@@ -1992,6 +1991,13 @@ def get_recent_customers(limit=10):
 	return customers
 
 
+# search_bookings orders that page by seeking on (start_datetime, name)
+KEYSET_ORDERS = ("start_datetime desc", "start_datetime asc")
+
+# Exact search totals are reused for this long unless bookings change
+SEARCH_COUNT_TTL_SECONDS = 60
+
+
 @frappe.whitelist()
 def search_bookings(
 	search="",
@@ -2003,18 +2009,24 @@ def search_bookings(
 	page=1,
 	page_length=20,
 	order_by="start_datetime desc",
+	cursor=None,
+	with_total=1,
 ):
 	"""
 	Search bookings across all fields with multi-select filters.
 
-	Searches: customer name, email, phone, booking reference, meeting title,
-	notes, assigned user name.
+	Searches (via MM Search Index): customer name, email, phone, booking
+	reference, meeting title, notes, assigned user name. Words match as
+	prefixes; order_by="relevance" ranks by match quality.
+
+	Paging: pass the next_cursor of a response as cursor to get the following
+	page by seeking on (start_datetime, name) instead of OFFSET (start_datetime
+	orders only). with_total=0 skips the count, e.g. when the caller already
+	has it; otherwise the exact count is cached briefly.
 
 	Returns:
-		dict: { data, total, page, page_length }
+		dict: { data, total, page, page_length, has_more, next_cursor }
 	"""
-	import json
-
 	if frappe.session.user == "Guest":
 		frappe.throw(_("You must be logged in"))
 
@@ -2045,12 +2057,12 @@ def search_bookings(
 			params[f"svc_{i}"] = s
 		conditions.append(f"b.select_mkru IN ({placeholders})")
 
-	# Department filter (department is on meeting_type, not booking)
+	# Department filter (denormalized from the meeting type)
 	if departments and len(departments) > 0:
 		placeholders = ", ".join([f"%(dept_{i})s" for i in range(len(departments))])
 		for i, d in enumerate(departments):
 			params[f"dept_{i}"] = d
-		conditions.append(f"mt.department IN ({placeholders})")
+		conditions.append(f"b.department IN ({placeholders})")
 
 	# Date range
 	if date_from:
@@ -2060,27 +2072,6 @@ def search_bookings(
 		conditions.append("b.start_datetime <= %(date_to)s")
 		params["date_to"] = f"{date_to} 23:59:59"
 
-	# Broad search
-	search_condition = ""
-	if search and search.strip():
-		q = f"%{search.strip()}%"
-		params["q"] = q
-		search_condition = """
-			AND (
-				b.booking_reference LIKE %(q)s
-				OR b.meeting_title LIKE %(q)s
-				OR b.customer_notes LIKE %(q)s
-				OR b.meeting_description LIKE %(q)s
-				OR b.customer_email_at_booking LIKE %(q)s
-				OR b.customer_phone_at_booking LIKE %(q)s
-				OR c.full_name LIKE %(q)s
-				OR c.first_name LIKE %(q)s
-				OR c.company_name LIKE %(q)s
-				OR c.email_id LIKE %(q)s
-				OR au_user.full_name LIKE %(q)s
-			)
-		"""
-
 	where_clause = " AND ".join(conditions) if conditions else "1=1"
 
 	# Permission scoping
@@ -2099,7 +2090,7 @@ def search_bookings(
 				dept_placeholders = ", ".join([f"%(perm_dept_{i})s" for i in range(len(all_depts))])
 				for i, d in enumerate(all_depts):
 					params[f"perm_dept_{i}"] = d
-				perm_condition = f"AND mt.department IN ({dept_placeholders})"
+				perm_condition = f"AND b.department IN ({dept_placeholders})"
 			else:
 				perm_condition = "AND 1=0"
 		else:
@@ -2112,63 +2103,166 @@ def search_bookings(
 				)
 			"""
 
-	# Count total
-	count_sql = f"""
-		SELECT COUNT(DISTINCT b.name) as cnt
-		FROM `tabMM Meeting Booking` b
-		LEFT JOIN `tabMM Meeting Type` mt ON mt.name = b.meeting_type
-		LEFT JOIN `tabContact` c ON c.name = b.customer
-		LEFT JOIN `tabMM Meeting Booking Assigned User` au ON au.parent = b.name AND au.is_primary_host = 1
-		LEFT JOIN `tabUser` au_user ON au_user.name = au.user
-		WHERE {where_clause} {search_condition} {perm_condition}
-	"""
-	total = frappe.db.sql(count_sql, params, as_dict=True)[0].cnt
-
-	# Fetch data
-	offset = (page - 1) * page_length
-	params["limit"] = page_length
-	params["offset"] = offset
-
-	# Sanitize order_by to prevent SQL injection
+	# Sanitize order_by to prevent SQL injection. Orders on (start_datetime, name)
+	# support keyset pagination; the others page with OFFSET.
 	allowed_orders = {
-		"start_datetime desc": "b.start_datetime DESC",
-		"start_datetime asc": "b.start_datetime ASC",
+		"start_datetime desc": "b.start_datetime DESC, b.name DESC",
+		"start_datetime asc": "b.start_datetime ASC, b.name ASC",
 		"creation desc": "b.creation DESC",
 		"booking_status asc": "b.booking_status ASC",
+		"relevance": "search_score DESC, b.start_datetime DESC",
 	}
-	safe_order = allowed_orders.get(order_by, "b.start_datetime DESC")
-
-	data_sql = f"""
-		SELECT DISTINCT
-			b.name,
-			b.booking_reference,
-			b.meeting_title,
-			b.booking_status,
-			b.start_datetime,
-			b.end_datetime,
-			b.duration,
-			b.customer,
-			b.customer_email_at_booking,
-			b.customer_phone_at_booking,
-			b.is_internal,
-			b.select_mkru,
-			mt.department,
-			IFNULL(c.full_name, c.first_name) as customer_name,
-			au_user.full_name as assigned_to_name
-		FROM `tabMM Meeting Booking` b
-		LEFT JOIN `tabMM Meeting Type` mt ON mt.name = b.meeting_type
-		LEFT JOIN `tabContact` c ON c.name = b.customer
-		LEFT JOIN `tabMM Meeting Booking Assigned User` au ON au.parent = b.name AND au.is_primary_host = 1
-		LEFT JOIN `tabUser` au_user ON au_user.name = au.user
-		WHERE {where_clause} {search_condition} {perm_condition}
-		ORDER BY {safe_order}
-		LIMIT %(limit)s OFFSET %(offset)s
-	"""
-	data = frappe.db.sql(data_sql, params, as_dict=True)
+	if order_by not in allowed_orders or (order_by == "relevance" and not (search and search.strip())):
+		order_by = "start_datetime desc"
+	safe_order = allowed_orders[order_by]
+	keyset = order_by in KEYSET_ORDERS
+
+	# Keyset pagination: continue after the last row of the previous page
+	seek_condition = ""
+	relaxed = False
+	if cursor:
+		position = _decode_search_cursor(cursor)
+		if position.get("o") != order_by or not keyset:
+			frappe.throw(_("This page link is no longer valid, please reload the list"))
+		relaxed = bool(position.get("r"))
+		params["cursor_start"] = position["s"]
+		params["cursor_name"] = position["n"]
+		op = "<" if order_by == "start_datetime desc" else ">"
+		seek_condition = f"""
+			AND (
+				b.start_datetime {op} %(cursor_start)s
+				OR (b.start_datetime = %(cursor_start)s AND b.name {op} %(cursor_name)s)
+			)
+		"""
+		page = None
+	else:
+		params["offset"] = (page - 1) * page_length
+
+	# Broad search through the search index (services/search_index.py)
+	search_condition = None
+	if search and search.strip():
+		search_condition = get_search_condition(search, relaxed=relaxed)
+
+	# One extra row tells whether there is a next page
+	params["limit"] = page_length + 1
+
+	while True:
+		search_join = ""
+		if search_condition:
+			params.update(search_condition["params"])
+			search_join = f"""
+				INNER JOIN `tabMM Search Index` si
+					ON si.reference_doctype = 'MM Meeting Booking'
+					AND si.reference_name = b.name
+					AND {search_condition["where"]}
+			"""
+
+		data_sql = f"""
+			SELECT
+				b.name,
+				b.booking_reference,
+				b.meeting_title,
+				b.booking_status,
+				b.start_datetime,
+				b.end_datetime,
+				b.duration,
+				b.customer,
+				b.customer_email_at_booking,
+				b.customer_phone_at_booking,
+				b.is_internal,
+				b.select_mkru,
+				b.department,
+				IFNULL(c.full_name, c.first_name) as customer_name,
+				host.full_name as assigned_to_name,
+				{search_condition["score"] if search_condition else "0"} as search_score
+			FROM `tabMM Meeting Booking` b
+			LEFT JOIN `tabContact` c ON c.name = b.customer
+			LEFT JOIN `tabUser` host ON host.name = b.primary_host
+			{search_join}
+			WHERE {where_clause} {perm_condition} {seek_condition}
+			ORDER BY {safe_order}
+			LIMIT %(limit)s {"" if cursor else "OFFSET %(offset)s"}
+		"""
+		data = frappe.db.sql(data_sql, params, as_dict=True)
+
+		# Nothing found from the start: retry with shortened words once (typo tolerance)
+		if data or cursor or page > 1 or not search_condition or not search_condition["can_relax"]:
+			break
+		relaxed = True
+		search_condition = get_search_condition(search, relaxed=True)
+
+	has_more = len(data) > page_length
+	data = data[:page_length]
+
+	next_cursor = None
+	if has_more and keyset:
+		last = data[-1]
+		next_cursor = _encode_search_cursor({
+			"o": order_by,
+			"s": str(last.start_datetime),
+			"n": last.name,
+			"r": int(relaxed),
+		})
+
+	total = None
+	if cint(with_total):
+		# Exact count (only the joins needed for filtering), cached briefly
+		count_sql = f"""
+			SELECT COUNT(*) as cnt
+			FROM `tabMM Meeting Booking` b
+			{search_join}
+			WHERE {where_clause} {perm_condition}
+		"""
+		paging = ("limit", "offset", "cursor_start", "cursor_name")
+		total = _get_cached_count(count_sql, {k: v for k, v in params.items() if k not in paging})
 
 	return {
 		"data": data,
 		"total": total,
 		"page": page,
 		"page_length": page_length,
+		"has_more": has_more,
+		"next_cursor": next_cursor,
 	}
+
+
+def _encode_search_cursor(position):
+	"""Opaque page cursor for search_bookings"""
+	return base64.urlsafe_b64encode(json.dumps(position, separators=(",", ":")).encode()).decode()
+
+
+def _decode_search_cursor(cursor):
+	try:
+		position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+		position["s"], position["n"]
+		return position
+	except Exception:
+		frappe.throw(_("Invalid page cursor"))
+
+
+def _get_cached_count(count_sql, params):
+	"""
+	Run a count query, caching the result until bookings change or
+	SEARCH_COUNT_TTL_SECONDS pass
+
+	Args:
+		count_sql (str): Query returning a single "cnt" column
+		params (dict): Query parameters (scope parameters make the key per user)
+
+	Returns:
+		int: Count
+	"""
+	from meeting_manager.meeting_manager.api.dashboard import get_cache_generation
+
+	digest = hashlib.md5(
+		frappe.as_json([count_sql, params], indent=None).encode(),
+		usedforsecurity=False
+	).hexdigest()
+	cache_key = f"mm_booking_search_count:{get_cache_generation()}:{digest}"
+
+	total = frappe.cache().get_value(cache_key)
+	if total is None:
+		total = frappe.db.sql(count_sql, params, as_dict=True)[0].cnt
+		frappe.cache().set_value(cache_key, total, expires_in_sec=SEARCH_COUNT_TTL_SECONDS)
+
+	return total
@@ -14,7 +14,26 @@ Scope logic:
 import frappe
 from frappe import _
 from frappe.utils import nowdate, getdate, get_first_day, get_last_day, add_days
-from meeting_manager.meeting_manager.doctype.mm_booking_status.mm_booking_status import get_finalized_statuses
+
+
+# Dashboard data is cached per (user, scope, day) for this many seconds
+CACHE_TTL_SECONDS = 45
+
+# Changes on every booking write; part of every dashboard cache key
+CACHE_GENERATION_KEY = "mm_dashboard_generation"
+
+PENDING_STATUSES = ("New Booking", "New Appointment")
+
+# Booking fields returned in the meeting lists
+MEETING_FIELDS = (
+	"name", "meeting_title", "booking_status", "start_datetime",
+	"end_datetime", "customer", "is_internal", "select_mkru",
+	"created_by",
+)
+
+# Non-final status with a value (matches get_finalized_statuses)
+ACTIVE_CONDITION = """IFNULL(booking.booking_status, '') != ''
+	AND booking.booking_status NOT IN (SELECT name FROM `tabMM Booking Status` WHERE is_final = 1)"""
 
 
 @frappe.whitelist()
@@ -22,6 +41,11 @@ def get_dashboard_data(scope="my"):
 	"""
 	Return dashboard statistics and meeting lists filtered by scope.
 
+	Stats come from a single aggregated query and the meeting lists from a
+	second one; the scope is applied as an EXISTS condition. Results are
+	cached per user and scope for CACHE_TTL_SECONDS and dropped on any
+	booking change.
+
 	Args:
 		scope: 'my' | 'team' | 'all'
 
@@ -31,8 +55,50 @@ def get_dashboard_data(scope="my"):
 	user = frappe.session.user
 	today = nowdate()
 
-	# Get booking names the user/team is involved in
-	booking_names = _get_scoped_booking_names(scope, user)
+	cache_key = f"mm_dashboard:{get_cache_generation()}:{user}:{scope}:{today}"
+	data = frappe.cache().get_value(cache_key)
+
+	if data is None:
+		data = _build_dashboard_data(scope, user, today)
+		frappe.cache().set_value(cache_key, data, expires_in_sec=CACHE_TTL_SECONDS)
+
+	# Blocked slots are not booking data; always read them fresh
+	blocked_slots = []
+	if scope == "my":
+		blocked_slots = frappe.get_all("MM User Blocked Slot",
+			filters={"user": user, "blocked_date": today},
+			fields=["name", "start_time", "end_time", "reason"],
+			order_by="start_time asc",
+			limit_page_length=10,
+		)
+
+	return dict(data, blocked_slots=blocked_slots)
+
+
+def clear_dashboard_cache():
+	"""Invalidate all cached dashboards (called on booking changes)"""
+	frappe.cache().set_value(CACHE_GENERATION_KEY, frappe.generate_hash(length=8))
+
+
+def get_cache_generation():
+	"""Current booking data generation; changes on every booking write"""
+	generation = frappe.cache().get_value(CACHE_GENERATION_KEY)
+	if not generation:
+		generation = frappe.generate_hash(length=8)
+		frappe.cache().set_value(CACHE_GENERATION_KEY, generation)
+	return generation
+
+
+def _build_dashboard_data(scope, user, today):
+	"""
+	Query stats and meeting lists for a scope
+
+	Returns:
+		dict with stats, today_meetings, upcoming_meetings, recent_bookings
+	"""
+	scope_condition, scope_users = _get_scope_condition(scope, user)
+	if scope_condition is None:
+		return _empty_data()
 
 	# Date boundaries
 	weekday = getdate(today).weekday()  # Monday=0
@@ -41,168 +107,116 @@ def get_dashboard_data(scope="my"):
 	month_start = get_first_day(today)
 	month_end = get_last_day(today)
 
-	finalized = get_finalized_statuses()
-	active_statuses = ["not in", finalized] if finalized else ["is", "set"]
-	pending_statuses = ["in", ["New Booking", "New Appointment"]]
-
-	# For "all" scope (system_manager), no name filter needed
-	if booking_names is None:
-		# None means "no restriction" (all scope)
-		base = {}
-	elif not booking_names:
-		# Empty list means no matching bookings
-		return _empty_response(scope, user, today)
-	else:
-		base = {"name": ["in", booking_names]}
-
-	active_base = {**base, "booking_status": active_statuses}
-
-	# Stats
-	today_count = _count("MM Meeting Booking", {
-		**active_base,
-		"start_datetime": [">=", f"{today} 00:00:00"],
-		"end_datetime": ["<=", f"{today} 23:59:59"],
-	})
-
-	week_count = _count("MM Meeting Booking", {
-		**active_base,
-		"start_datetime": [">=", f"{monday} 00:00:00"],
-		"end_datetime": ["<=", f"{sunday} 23:59:59"],
-	})
-
-	pending_count = _count("MM Meeting Booking", {
-		**base,
-		"booking_status": pending_statuses,
-	})
-
-	month_count = _count("MM Meeting Booking", {
-		**base,
-		"start_datetime": [">=", f"{month_start} 00:00:00"],
-		"end_datetime": ["<=", f"{month_end} 23:59:59"],
-	})
-
-	# Meeting fields
-	fields = [
-		"name", "meeting_title", "booking_status", "start_datetime",
-		"end_datetime", "customer", "is_internal", "select_mkru",
-		"created_by",
-	]
-
-	# Today's meetings
-	today_meetings = frappe.get_all("MM Meeting Booking",
-		filters={
-			**active_base,
-			"start_datetime": ["between", [f"{today} 00:00:00", f"{today} 23:59:59"]],
-		},
-		fields=fields,
-		order_by="start_datetime asc",
-		limit_page_length=20,
-	)
+	params = {
+		"scope_users": scope_users,
+		"today_start": f"{today} 00:00:00",
+		"today_end": f"{today} 23:59:59",
+		"week_start": f"{monday} 00:00:00",
+		"week_end": f"{sunday} 23:59:59",
+		"month_start": f"{month_start} 00:00:00",
+		"month_end": f"{month_end} 23:59:59",
+		"range_start": f"{min(getdate(monday), getdate(month_start))} 00:00:00",
+		"range_end": f"{max(getdate(sunday), getdate(month_end))} 23:59:59",
+		"pending": PENDING_STATUSES,
+	}
 
-	# Upcoming this week (after today, before end of week)
-	upcoming_meetings = frappe.get_all("MM Meeting Booking",
-		filters={
-			**active_base,
-			"start_datetime": [">", f"{today} 23:59:59"],
-			"end_datetime": ["<=", f"{sunday} 23:59:59"],
-		},
-		fields=fields,
-		order_by="start_datetime asc",
-		limit_page_length=10,
-	)
+	# Stats: one pass over the scoped bookings that can count towards any stat
+	stats = frappe.db.sql(f"""
+		SELECT
+			SUM(CASE WHEN {ACTIVE_CONDITION}
+				AND booking.start_datetime >= %(today_start)s
+				AND booking.end_datetime <= %(today_end)s THEN 1 ELSE 0 END) AS today,
+			SUM(CASE WHEN {ACTIVE_CONDITION}
+				AND booking.start_datetime >= %(week_start)s
+				AND booking.end_datetime <= %(week_end)s THEN 1 ELSE 0 END) AS week,
+			SUM(CASE WHEN booking.booking_status IN %(pending)s THEN 1 ELSE 0 END) AS pending,
+			SUM(CASE WHEN booking.start_datetime >= %(month_start)s
+				AND booking.end_datetime <= %(month_end)s THEN 1 ELSE 0 END) AS month
+		FROM `tabMM Meeting Booking` booking
+		WHERE {scope_condition}
+			AND (
+				booking.booking_status IN %(pending)s
+				OR booking.start_datetime BETWEEN %(range_start)s AND %(range_end)s
+			)
+	""", params, as_dict=True)[0]
+
+	# Meeting lists: today's, upcoming this week (after today) and most recently created
+	fields = ", ".join(f"booking.{field}" for field in MEETING_FIELDS)
+	rows = frappe.db.sql(f"""
+		(SELECT 'today_meetings' AS list, {fields}
+		FROM `tabMM Meeting Booking` booking
+		WHERE {scope_condition} AND {ACTIVE_CONDITION}
+			AND booking.start_datetime BETWEEN %(today_start)s AND %(today_end)s
+		ORDER BY booking.start_datetime ASC
+		LIMIT 20)
+		UNION ALL
+		(SELECT 'upcoming_meetings' AS list, {fields}
+		FROM `tabMM Meeting Booking` booking
+		WHERE {scope_condition} AND {ACTIVE_CONDITION}
+			AND booking.start_datetime > %(today_end)s
+			AND booking.end_datetime <= %(week_end)s
+		ORDER BY booking.start_datetime ASC
+		LIMIT 10)
+		UNION ALL
+		(SELECT 'recent_bookings' AS list, {fields}
+		FROM `tabMM Meeting Booking` booking
+		WHERE {scope_condition}
+		ORDER BY booking.creation DESC
+		LIMIT 5)
+	""", params, as_dict=True)
 
-	# Recent bookings (any status, ordered by creation)
-	recent_bookings = frappe.get_all("MM Meeting Booking",
-		filters=base,
-		fields=fields,
-		order_by="creation desc",
-		limit_page_length=5,
-	)
+	lists = {"today_meetings": [], "upcoming_meetings": [], "recent_bookings": []}
+	for row in rows:
+		lists[row.pop("list")].append(row)
 
 	# Enrich with creator names and user's role in each meeting
-	all_meetings = today_meetings + upcoming_meetings + recent_bookings
+	all_meetings = lists["today_meetings"] + lists["upcoming_meetings"] + lists["recent_bookings"]
 	_enrich_creator_names(all_meetings)
 
 	if scope == "my":
 		_enrich_user_role(all_meetings, user)
 
-	# Blocked slots (only for 'my' scope)
-	blocked_slots = []
-	if scope == "my":
-		blocked_slots = frappe.get_all("MM User Blocked Slot",
-			filters={"user": user, "blocked_date": today},
-			fields=["name", "start_time", "end_time", "reason"],
-			order_by="start_time asc",
-			limit_page_length=10,
-		)
-
 	return {
-		"stats": {
-			"today": today_count,
-			"week": week_count,
-			"pending": pending_count,
-			"month": month_count,
-		},
-		"today_meetings": today_meetings,
-		"upcoming_meetings": upcoming_meetings,
-		"recent_bookings": recent_bookings,
-		"blocked_slots": blocked_slots,
+		"stats": {key: int(stats.get(key) or 0) for key in ("today", "week", "pending", "month")},
+		**lists,
 	}
 
 
-def _get_scoped_booking_names(scope, user):
+def _get_scope_condition(scope, user):
 	"""
-	Return list of booking names visible to the user for the given scope.
-	Returns None for "all" scope (no restriction).
+	Return the SQL condition restricting bookings to the scope.
 
 	- my:   assigned as host OR internal participant
 	- team: any team member assigned as host or participant
-	- all:  None (no restriction, system_manager only)
-	"""
-	if scope == "all":
-		roles = frappe.get_roles(user)
-		if "System Manager" not in roles:
-			return _get_user_booking_names(user)
-		return None  # no restriction
-
-	if scope == "team":
-		team_members = _get_team_members(user)
-		return _get_users_booking_names(team_members)
-
-	# "my" scope
-	return _get_user_booking_names(user)
+	- all:  no restriction (system_manager only; others fall back to my)
 
-
-def _get_user_booking_names(user):
-	"""Get all booking names where user is assigned host or internal participant."""
-	return _get_users_booking_names([user])
-
-
-def _get_users_booking_names(users):
-	"""
-	Get all booking names where any of the given users is:
-	1. An assigned host (in assigned_users child table)
-	2. An internal participant (in participants child table)
+	Returns:
+		tuple: (condition on alias "booking" using %(scope_users)s, users);
+		condition is None when the scope cannot match any booking
 	"""
-	if not users:
-		return []
-
-	user_tuple = tuple(users) if len(users) > 1 else (users[0], users[0])
+	if scope == "all" and "System Manager" in frappe.get_roles(user):
+		return "1 = 1", None
 
-	names = frappe.db.sql("""
-		SELECT DISTINCT booking.name
-		FROM `tabMM Meeting Booking` booking
-		WHERE booking.name IN (
-			SELECT au.parent FROM `tabMM Meeting Booking Assigned User` au
-			WHERE au.user IN %s
+	users = _get_team_members(user) if scope == "team" else [user]
+	if not users:
+		return None, None
+
+	condition = """(
+		EXISTS (
+			SELECT 1 FROM `tabMM Meeting Booking Assigned User` au
+			WHERE au.parent = booking.name
+				AND au.parenttype = 'MM Meeting Booking'
+				AND au.user IN %(scope_users)s
 		)
-		OR booking.name IN (
-			SELECT p.parent FROM `tabMM Meeting Booking Participant` p
-			WHERE p.user IN %s AND p.participant_type = 'Internal'
+		OR EXISTS (
+			SELECT 1 FROM `tabMM Meeting Booking Participant` p
+			WHERE p.parent = booking.name
+				AND p.parenttype = 'MM Meeting Booking'
+				AND p.user IN %(scope_users)s
+				AND p.participant_type = 'Internal'
 		)
-	""", (user_tuple, user_tuple), as_dict=True)
-
-	return [r.name for r in names]
+	)"""
+	return condition, tuple(users)
 
 
 def _get_team_members(user):
@@ -296,29 +310,11 @@ def _enrich_user_role(meetings, user):
 			m["my_role"] = ""
 
 
-def _empty_response(scope, user, today):
+def _empty_data():
 	"""Return empty dashboard data."""
-	blocked_slots = []
-	if scope == "my":
-		blocked_slots = frappe.get_all("MM User Blocked Slot",
-			filters={"user": user, "blocked_date": today},
-			fields=["name", "start_time", "end_time", "reason"],
-			order_by="start_time asc",
-			limit_page_length=10,
-		)
-
 	return {
 		"stats": {"today": 0, "week": 0, "pending": 0, "month": 0},
 		"today_meetings": [],
 		"upcoming_meetings": [],
 		"recent_bookings": [],
-		"blocked_slots": blocked_slots,
 	}
-
-
-def _count(doctype, filters):
-	"""Safe count wrapper."""
-	try:
-		return frappe.db.count(doctype, filters) or 0
-	except Exception:
-		return 0
@@ -0,0 +1,221 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+"""
+Free/Busy API
+
+Returns merged busy intervals for many users over a time range in a single
+response, similar to Google Calendar's freeBusy query. Busy time comes from:
+- Synced external calendar events (MM Calendar Event Sync) that block availability
+- Non-final bookings where the user is a host or an internal participant
+- Blocked slots (MM User Blocked Slot)
+
+Callers (team meeting planner, external tools) intersect the returned
+schedules client-side instead of checking every participant per slot.
+"""
+
+import json
+from datetime import datetime
+
+import frappe
+from frappe import _
+from frappe.utils import cint, get_datetime, get_system_timezone, get_time
+
+from meeting_manager.meeting_manager.utils.permissions import (
+	get_team_members,
+	is_department_leader,
+	is_system_manager,
+)
+
+# Request limits
+MAX_USERS = 100
+MAX_RANGE_DAYS = 62
+
+
+@frappe.whitelist()
+def get_free_busy(users, start, end, include_details=0):
+	"""
+	Get merged busy intervals for users over a time range
+
+	Args:
+		users (str or list): JSON string or list of user IDs
+		start (str): Range start datetime (system timezone)
+		end (str): Range end datetime (system timezone)
+		include_details (int): Also return the unmerged source intervals per user
+
+	Returns:
+		dict: {
+			"start": str,
+			"end": str,
+			"timezone": str,
+			"users": {user: {"busy": [{"start", "end"}], "sources": [...]}}
+		}
+	"""
+	if frappe.session.user == "Guest":
+		frappe.throw(_("You must be logged in"))
+
+	if isinstance(users, str):
+		users = json.loads(users)
+
+	users = list(dict.fromkeys(u for u in (users or []) if u))
+	if not users:
+		frappe.throw(_("Please select at least one user"))
+	if len(users) > MAX_USERS:
+		frappe.throw(_("Free/busy can be requested for at most {0} users").format(MAX_USERS))
+
+	start = get_datetime(start)
+	end = get_datetime(end)
+	if end <= start:
+		frappe.throw(_("End must be after start"))
+	if (end - start).days > MAX_RANGE_DAYS:
+		frappe.throw(_("Free/busy range cannot exceed {0} days").format(MAX_RANGE_DAYS))
+
+	_check_access(users)
+
+	intervals = get_busy_intervals(users, start, end)
+	include_details = cint(include_details)
+
+	result = {}
+	for user in users:
+		sources = intervals.get(user, [])
+		result[user] = {"busy": [
+			{"start": str(s), "end": str(e)}
+			for s, e in merge_intervals([(i["start"], i["end"]) for i in sources])
+		]}
+		if include_details:
+			result[user]["sources"] = [
+				dict(i, start=str(i["start"]), end=str(i["end"])) for i in sources
+			]
+
+	return {
+		"start": str(start),
+		"end": str(end),
+		"timezone": get_system_timezone(),
+		"users": result
+	}
+
+
+def get_busy_intervals(users, start, end):
+	"""
+	Load raw busy intervals for users, clipped to [start, end)
+
+	Runs one query per source regardless of the number of users.
+
+	Args:
+		users (list): User IDs
+		start (datetime): Range start
+		end (datetime): Range end
+
+	Returns:
+		dict: {user: [{"start", "end", "source", "reference"}]}
+	"""
+	params = {"users": users, "start": start, "end": end}
+	intervals = {}
+
+	def add(user, interval_start, interval_end, source, reference):
+		interval_start = max(get_datetime(interval_start), start)
+		interval_end = min(get_datetime(interval_end), end)
+		if interval_end > interval_start:
+			intervals.setdefault(user, []).append({
+				"start": interval_start,
+				"end": interval_end,
+				"source": source,
+				"reference": reference
+			})
+
+	# External calendar events (same criteria as check_calendar_event_conflicts)
+	for row in frappe.db.sql("""
+		SELECT ci.user, ces.name, ces.start_datetime, ces.end_datetime
+		FROM `tabMM Calendar Event Sync` ces
+		INNER JOIN `tabMM Calendar Integration` ci
+			ON ces.calendar_integration = ci.name
+		WHERE ci.user IN %(users)s
+			AND ces.is_blocking_availability = 1
+			AND ces.event_type != 'All-Day Event'
+			AND ces.sync_status = 'Synced'
+			AND ces.start_datetime < %(end)s
+			AND ces.end_datetime > %(start)s
+	""", params, as_dict=True):
+		add(row.user, row.start_datetime, row.end_datetime, "calendar", row.name)
+
+	# Bookings where the user is a host or an internal participant
+	for row in frappe.db.sql("""
+		SELECT au.user, mb.name, mb.start_datetime, mb.end_datetime
+		FROM `tabMM Meeting Booking` mb
+		INNER JOIN `tabMM Meeting Booking Assigned User` au
+			ON au.parent = mb.name AND au.parenttype = 'MM Meeting Booking'
+		WHERE au.user IN %(users)s
+			AND mb.booking_status NOT IN (SELECT name FROM `tabMM Booking Status` WHERE is_final = 1)
+			AND mb.start_datetime < %(end)s
+			AND mb.end_datetime > %(start)s
+		UNION
+		SELECT p.user, mb.name, mb.start_datetime, mb.end_datetime
+		FROM `tabMM Meeting Booking` mb
+		INNER JOIN `tabMM Meeting Booking Participant` p
+			ON p.parent = mb.name AND p.parenttype = 'MM Meeting Booking'
+		WHERE p.user IN %(users)s
+			AND p.participant_type = 'Internal'
+			AND mb.booking_status NOT IN (SELECT name FROM `tabMM Booking Status` WHERE is_final = 1)
+			AND mb.start_datetime < %(end)s
+			AND mb.end_datetime > %(start)s
+	""", params, as_dict=True):
+		add(row.user, row.start_datetime, row.end_datetime, "booking", row.name)
+
+	# Blocked slots
+	for row in frappe.db.sql("""
+		SELECT user, name, blocked_date, start_time, end_time
+		FROM `tabMM User Blocked Slot`
+		WHERE user IN %(users)s
+			AND blocked_date BETWEEN %(start_date)s AND %(end_date)s
+	""", dict(params, start_date=start.date(), end_date=end.date()), as_dict=True):
+		add(
+			row.user,
+			datetime.combine(row.blocked_date, get_time(row.start_time)),
+			datetime.combine(row.blocked_date, get_time(row.end_time)),
+			"blocked",
+			row.name
+		)
+
+	for user_intervals in intervals.values():
+		user_intervals.sort(key=lambda i: (i["start"], i["end"]))
+
+	return intervals
+
+
+def merge_intervals(intervals):
+	"""
+	Merge overlapping and adjacent intervals
+
+	Args:
+		intervals (list): (start, end) tuples
+
+	Returns:
+		list: Sorted, non-overlapping (start, end) tuples
+	"""
+	merged = []
+	for interval_start, interval_end in sorted(intervals):
+		if merged and interval_start <= merged[-1][1]:
+			if interval_end > merged[-1][1]:
+				merged[-1] = (merged[-1][0], interval_end)
+		else:
+			merged.append((interval_start, interval_end))
+	return merged
+
+
+def _check_access(users):
+	"""Users may query themselves; leaders their team; System Managers anyone"""
+	current_user = frappe.session.user
+
+	if current_user == "Administrator" or is_system_manager(current_user):
+		return
+
+	allowed = {current_user}
+	if is_department_leader(current_user):
+		allowed.update(get_team_members(current_user))
+
+	denied = [u for u in users if u not in allowed]
+	if denied:
+		frappe.throw(
+			_("You do not have permission to view the schedule of: {0}").format(", ".join(denied)),
+			frappe.PermissionError
+		)
@@ -359,10 +359,6 @@ def create_customer_booking(booking_data):
 	# Insert booking (will trigger validation and notifications)
 	booking.insert(ignore_permissions=True)
 
-	# Update customer booking stats
-	from meeting_manager.meeting_manager.services.customer_service import update_customer_booking_stats
-	update_customer_booking_stats(customer_id)
-
 	# Send confirmation emails
 	try:
 		email_result = send_booking_confirmation_email(booking.name)
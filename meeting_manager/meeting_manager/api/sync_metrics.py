@@ -0,0 +1,127 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+"""
+Calendar Sync Metrics API
+Per-integration sync health (runs, failures, wall time, provider latency,
+API usage and lag) built from MM Calendar Sync Run. System managers only.
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import add_to_date, cint, get_datetime, now_datetime
+
+from meeting_manager.meeting_manager.utils.permissions import is_system_manager
+
+
+@frappe.whitelist()
+def get_sync_overview(days=7):
+	"""
+	Return aggregated sync metrics per calendar integration.
+
+	Args:
+		days: Look-back window in days (default 7)
+
+	Returns:
+		dict with window bounds, totals and one row per integration
+	"""
+	_check_access()
+
+	days = max(1, min(cint(days) or 7, 90))
+	now = now_datetime()
+	since = add_to_date(now, days=-days)
+
+	rows = frappe.db.sql("""
+		SELECT
+			ci.name AS integration,
+			ci.integration_name,
+			ci.integration_type,
+			ci.user,
+			ci.is_active,
+			ci.sync_status,
+			ci.last_sync,
+			ci.sync_error_log,
+			COUNT(r.name) AS runs,
+			SUM(CASE WHEN r.status = 'Failed' THEN 1 ELSE 0 END) AS failed_runs,
+			SUM(CASE WHEN r.status = 'Not Modified' THEN 1 ELSE 0 END) AS not_modified_runs,
+			AVG(r.wall_time_ms) AS avg_wall_time_ms,
+			MAX(r.wall_time_ms) AS max_wall_time_ms,
+			SUM(r.api_calls) AS api_calls,
+			SUM(r.bytes_received) AS bytes_received,
+			SUM(r.fetched) AS fetched,
+			SUM(r.inserted + r.updated + r.deleted) AS changed,
+			AVG(r.latency_p50_ms) AS avg_latency_p50_ms,
+			AVG(r.latency_p95_ms) AS avg_latency_p95_ms,
+			MAX(r.latency_max_ms) AS max_latency_ms,
+			AVG(r.sync_lag_seconds) AS avg_sync_lag_seconds,
+			MAX(r.started_at) AS last_run_at
+		FROM `tabMM Calendar Integration` ci
+		LEFT JOIN `tabMM Calendar Sync Run` r
+			ON r.integration = ci.name
+			AND r.started_at >= %(since)s
+		GROUP BY ci.name
+		ORDER BY SUM(r.wall_time_ms) DESC, ci.name
+	""", {"since": since}, as_dict=True)
+
+	for row in rows:
+		row.current_lag_seconds = (
+			int((now - get_datetime(row.last_sync)).total_seconds()) if row.last_sync else None
+		)
+		for key in ("avg_wall_time_ms", "avg_latency_p50_ms", "avg_latency_p95_ms", "avg_sync_lag_seconds"):
+			row[key] = int(row[key]) if row[key] is not None else None
+
+	totals = {
+		"integrations": len(rows),
+		"active_integrations": sum(1 for r in rows if r.is_active),
+		"runs": sum(r.runs or 0 for r in rows),
+		"failed_runs": sum(r.failed_runs or 0 for r in rows),
+		"api_calls": sum(r.api_calls or 0 for r in rows),
+		"bytes_received": sum(r.bytes_received or 0 for r in rows),
+	}
+
+	return {
+		"since": since,
+		"until": now,
+		"days": days,
+		"totals": totals,
+		"integrations": rows,
+	}
+
+
+@frappe.whitelist()
+def get_sync_runs(integration, days=7, limit=500):
+	"""
+	Return the sync run time series of one integration (newest first).
+
+	Args:
+		integration: MM Calendar Integration ID
+		days: Look-back window in days (default 7)
+		limit: Maximum number of runs (default 500)
+
+	Returns:
+		list of MM Calendar Sync Run rows
+	"""
+	_check_access()
+
+	days = max(1, min(cint(days) or 7, 90))
+
+	return frappe.get_all(
+		"MM Calendar Sync Run",
+		filters={
+			"integration": integration,
+			"started_at": [">=", add_to_date(now_datetime(), days=-days)],
+		},
+		fields=[
+			"started_at", "status", "wall_time_ms", "sync_lag_seconds",
+			"fetched", "inserted", "updated", "deleted", "unchanged",
+			"api_calls", "bytes_received",
+			"latency_p50_ms", "latency_p95_ms", "latency_max_ms", "error",
+		],
+		order_by="started_at desc",
+		limit_page_length=max(1, min(cint(limit) or 500, 5000)),
+	)
+
+
+def _check_access():
+	if not is_system_manager():
+		frappe.throw(_("Only System Managers can view calendar sync metrics"), frappe.PermissionError)
@@ -0,0 +1,17 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+
+
+class MMBookingReminder(Document):
+	pass
+
+
+def on_doctype_update():
+	"""Indexes for the due-reminder queue"""
+	# Due reminders are pulled by (status, due_at)
+	frappe.db.add_index("MM Booking Reminder", ["status", "due_at"])
+	# One row per reminder of a booking
+	frappe.db.add_unique("MM Booking Reminder", ["booking", "reminder_key"], constraint_name="unique_booking_reminder")
@@ -0,0 +1,225 @@
+# Copyright (c) 2026, Best Security and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests import IntegrationTestCase
+from frappe.utils import add_to_date, now_datetime
+
+from meeting_manager.meeting_manager.services import reminder_service
+
+# On IntegrationTestCase, the doctype test records and all
+# link-field test record dependencies are recursively loaded
+# Use these module variables to add/remove to/from that list
+EXTRA_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
+IGNORE_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
+
+SERVICE_MODULE = "meeting_manager.meeting_manager.services.reminder_service"
+
+
+def make_reminder(booking, minutes_from_now, status="Pending", claimed_minutes_ago=None):
+	"""Insert a reminder row without requiring the booking to exist"""
+	now = now_datetime()
+	reminder = frappe.get_doc({
+		"doctype": "MM Booking Reminder",
+		"booking": booking,
+		"reminder_key": "auto_24h",
+		"hours_before": 24,
+		"notification_type": "Email",
+		"due_at": add_to_date(now, minutes=minutes_from_now),
+		"status": status,
+		"claimed_at": add_to_date(now, minutes=-claimed_minutes_ago) if claimed_minutes_ago else None,
+		"claim_token": "old-claim" if claimed_minutes_ago else None
+	})
+	reminder.db_insert()
+	return reminder.name
+
+
+class IntegrationTestMMBookingReminder(IntegrationTestCase):
+	"""
+	Integration tests for MMBookingReminder.
+	Use this class for testing interactions between multiple components.
+	"""
+
+	def setUp(self):
+		# Claims are global, so start every test from an empty queue
+		frappe.db.delete("MM Booking Reminder")
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_claim_takes_only_due_reminders(self):
+		"""A claim marks due Pending reminders Processing and leaves future ones alone"""
+		due = make_reminder("MM-MB-TEST-0001", -5)
+		future = make_reminder("MM-MB-TEST-0002", 60)
+
+		token = reminder_service._claim_due_reminders(10)
+
+		self.assertTrue(token)
+		self.assertEqual(
+			frappe.db.get_value("MM Booking Reminder", due, ["status", "claim_token"]),
+			("Processing", token)
+		)
+		self.assertEqual(frappe.db.get_value("MM Booking Reminder", future, "status"), "Pending")
+		self.assertIsNone(reminder_service._claim_due_reminders(10))
+
+	def test_claims_do_not_overlap(self):
+		"""Consecutive claims split due reminders into disjoint batches"""
+		names = [make_reminder(f"MM-MB-TEST-{i:04d}", -10 + i) for i in range(3)]
+
+		first = reminder_service._claim_due_reminders(2)
+		second = reminder_service._claim_due_reminders(2)
+
+		tokens = dict(frappe.get_all(
+			"MM Booking Reminder",
+			filters={"name": ["in", names]},
+			fields=["name", "claim_token"],
+			as_list=True
+		))
+		self.assertEqual(list(tokens.values()).count(first), 2)
+		self.assertEqual(list(tokens.values()).count(second), 1)
+		# Oldest due reminders are claimed first
+		self.assertEqual(tokens[names[2]], second)
+
+	def test_stale_claims_are_reclaimed(self):
+		"""Processing reminders of a dead worker are claimed again after the timeout"""
+		stale = make_reminder(
+			"MM-MB-TEST-0001", -60, status="Processing",
+			claimed_minutes_ago=reminder_service.CLAIM_TIMEOUT_MINUTES + 5
+		)
+		fresh = make_reminder("MM-MB-TEST-0002", -60, status="Processing", claimed_minutes_ago=1)
+
+		token = reminder_service._claim_due_reminders(10)
+
+		self.assertEqual(frappe.db.get_value("MM Booking Reminder", stale, "claim_token"), token)
+		self.assertEqual(frappe.db.get_value("MM Booking Reminder", fresh, "claim_token"), "old-claim")
+
+	def test_parallel_batches_are_capped(self):
+		"""The scheduled job keeps at most MAX_PARALLEL_BATCHES batches in flight"""
+		for i in range(5):
+			make_reminder(f"MM-MB-TEST-{i:04d}", -5)
+
+		with (
+			patch(f"{SERVICE_MODULE}.DISPATCH_BATCH_SIZE", 1),
+			patch(f"{SERVICE_MODULE}.MAX_PARALLEL_BATCHES", 2),
+			patch("frappe.enqueue") as enqueue,
+		):
+			reminder_service.process_scheduled_reminders()
+			self.assertEqual(enqueue.call_count, 2)
+
+			# Both batches are still in flight, so the next run claims nothing
+			reminder_service.process_scheduled_reminders()
+			self.assertEqual(enqueue.call_count, 2)
+
+	def test_reminders_of_missing_bookings_are_skipped(self):
+		"""Claimed reminders whose booking no longer exists are skipped, not sent"""
+		name = make_reminder("MM-MB-TEST-0001", -5)
+		token = reminder_service._claim_due_reminders(10)
+
+		with (
+			patch(f"{SERVICE_MODULE}.check_email_configured", return_value=(True, None)),
+			patch(f"{SERVICE_MODULE}.send_notification") as send_notification,
+		):
+			reminder_service.dispatch_reminder_batch(token)
+
+		send_notification.assert_not_called()
+		self.assertEqual(
+			frappe.db.get_value("MM Booking Reminder", name, ["status", "claim_token"]),
+			("Skipped", None)
+		)
+
+	def test_idempotency_key_is_acquired_once(self):
+		"""Only the first attempt acquires a per-recipient idempotency key"""
+		key = f"mm_reminder_sent:test:{frappe.generate_hash(length=8)}"
+
+		try:
+			self.assertTrue(reminder_service._acquire_idempotency_key(key))
+			self.assertFalse(reminder_service._acquire_idempotency_key(key))
+		finally:
+			frappe.cache().delete_value(key)
+
+	def test_retried_batch_does_not_email_twice(self):
+		"""Recipients already emailed by an earlier attempt are not emailed again"""
+		booking = frappe._dict(name=f"MM-MB-TEST-{frappe.generate_hash(length=6)}", select_mkru="")
+		reminder = frappe._dict(reminder_key="auto_24h", hours_before=24)
+		recipients = [
+			("customer@example.com", "Customer", None, "Customer (customer@example.com)"),
+			("host@example.com", "Host", "Host", "Host (Host)")
+		]
+		keys = [f"mm_reminder_sent:{booking.name}:auto_24h:{email}" for email, *_ in recipients]
+
+		# The customer was emailed before the worker died
+		reminder_service._acquire_idempotency_key(keys[0])
+
+		try:
+			with (
+				patch(f"{SERVICE_MODULE}.get_template"),
+				patch(f"{SERVICE_MODULE}.send_notification", return_value={"success": True}) as send_notification,
+			):
+				sent_to, queued_for = reminder_service._send_reminder(reminder, booking, {}, recipients, {})
+
+			self.assertEqual(sent_to, ["Customer (customer@example.com)", "Host (Host)"])
+			self.assertEqual(queued_for, [])
+			self.assertEqual(
+				[call.args[0] for call in send_notification.call_args_list],
+				["host@example.com"]
+			)
+		finally:
+			frappe.cache().delete_value(keys)
+
+	def test_failed_send_releases_idempotency_key(self):
+		"""A failed send releases its key so the retry emails the recipient"""
+		booking = frappe._dict(name=f"MM-MB-TEST-{frappe.generate_hash(length=6)}", select_mkru="")
+		reminder = frappe._dict(reminder_key="auto_24h", hours_before=24)
+		recipients = [("host@example.com", "Host", "Host", "Host (Host)")]
+		key = f"mm_reminder_sent:{booking.name}:auto_24h:host@example.com"
+
+		try:
+			with (
+				patch(f"{SERVICE_MODULE}.get_template"),
+				patch(f"{SERVICE_MODULE}.send_notification", return_value={"success": False}),
+			):
+				sent_to, queued_for = reminder_service._send_reminder(reminder, booking, {}, recipients, {})
+
+			self.assertEqual((sent_to, queued_for), ([], []))
+			self.assertTrue(reminder_service._acquire_idempotency_key(key))
+		finally:
+			frappe.cache().delete_value(key)
+
+	def test_send_error_releases_idempotency_key(self):
+		"""A send that raises releases its key, so the retried batch really sends"""
+		booking = frappe._dict(name=f"MM-MB-TEST-{frappe.generate_hash(length=6)}", select_mkru="")
+		reminder = frappe._dict(reminder_key="auto_24h", hours_before=24)
+		recipients = [("host@example.com", "Host", "Host", "Host (Host)")]
+		key = f"mm_reminder_sent:{booking.name}:auto_24h:host@example.com"
+
+		try:
+			with (
+				patch(f"{SERVICE_MODULE}.get_template"),
+				patch(f"{SERVICE_MODULE}.send_notification", side_effect=Exception("SMTP down")),
+				self.assertRaises(Exception),
+			):
+				reminder_service._send_reminder(reminder, booking, {}, recipients, {})
+
+			self.assertTrue(reminder_service._acquire_idempotency_key(key))
+		finally:
+			frappe.cache().delete_value(key)
+
+	def test_queued_reminder_is_not_reported_sent(self):
+		"""Reminders handed to the notification outbox are reported as queued"""
+		booking = frappe._dict(name=f"MM-MB-TEST-{frappe.generate_hash(length=6)}", select_mkru="")
+		reminder = frappe._dict(reminder_key="auto_24h", hours_before=24)
+		recipients = [("host@example.com", "Host", "Host", "Host (Host)")]
+		key = f"mm_reminder_sent:{booking.name}:auto_24h:host@example.com"
+
+		try:
+			with (
+				patch(f"{SERVICE_MODULE}.get_template"),
+				patch(f"{SERVICE_MODULE}.send_notification", return_value={"success": True, "queued": True}),
+			):
+				sent_to, queued_for = reminder_service._send_reminder(reminder, booking, {}, recipients, {})
+
+			self.assertEqual((sent_to, queued_for), ([], ["Host (Host)"]))
+		finally:
+			frappe.cache().delete_value(key)
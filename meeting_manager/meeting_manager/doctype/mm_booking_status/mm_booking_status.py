@@ -25,6 +25,15 @@ def get_finalized_statuses():
 	)
 
 
+def get_cancelled_statuses():
+	"""Return list of status names where is_cancelled=1."""
+	return frappe.get_all(
+		"MM Booking Status",
+		filters={"is_cancelled": 1},
+		pluck="name",
+	)
+
+
 def get_active_statuses():
 	"""Return list of active status names."""
 	return frappe.get_all(
@@ -40,6 +49,7 @@ def seed_default_statuses():
 		return
 
 	final_statuses = {"Cancelled", "Sale Approved", "Booking Approved Not Sale", "Not Possible", "Completed"}
+	cancelled_statuses = {"Cancelled"}
 
 	defaults = {
 		"New Booking": "#1e40af",
@@ -66,6 +76,7 @@ def seed_default_statuses():
 		doc.color = color
 		doc.is_active = 1
 		doc.is_final = 1 if status in final_statuses else 0
+		doc.is_cancelled = 1 if status in cancelled_statuses else 0
 		doc.insert(ignore_permissions=True)
 
 	frappe.db.commit()
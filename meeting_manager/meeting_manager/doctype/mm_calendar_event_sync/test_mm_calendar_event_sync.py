@@ -1,9 +1,19 @@
 # Copyright (c) 2025, Best Security and Contributors
 # See license.txt
 
-# import frappe
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import frappe
 from frappe.tests import IntegrationTestCase
 
+from meeting_manager.meeting_manager.services import calendar_write_queue
+from meeting_manager.meeting_manager.services.calendar_write_queue import (
+	OUTBOX_KEY,
+	PENDING_DELETE_STATUS,
+	flush_calendar_write_queue,
+	queue_booking_calendar_deletes,
+)
 
 # On IntegrationTestCase, the doctype test records and all
 # link-field test record dependencies are recursively loaded
@@ -11,6 +21,7 @@ from frappe.tests import IntegrationTestCase
 EXTRA_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
 IGNORE_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
 
+QUEUE_MODULE = "meeting_manager.meeting_manager.services.calendar_write_queue"
 
 
 class IntegrationTestMMCalendarEventSync(IntegrationTestCase):
@@ -19,4 +30,163 @@ class IntegrationTestMMCalendarEventSync(IntegrationTestCase):
 	Use this class for testing interactions between multiple components.
 	"""
 
-	pass
+	def setUp(self):
+		frappe.cache().delete_value(OUTBOX_KEY)
+
+		self.integration = frappe.get_doc({
+			"doctype": "MM Calendar Integration",
+			"user": "Administrator",
+			"integration_type": "iCal",
+			"integration_name": frappe.generate_hash(length=10),
+			"ical_url": "https://example.com/calendar.ics",
+			"sync_direction": "One-way (Read Only)"
+		}).insert(ignore_permissions=True)
+
+	def tearDown(self):
+		frappe.cache().delete_value(OUTBOX_KEY)
+		frappe.db.rollback()
+
+	def make_outbound_row(self, booking_name):
+		row = frappe.get_doc({
+			"doctype": "MM Calendar Event Sync",
+			"name": f"MM-CES-{self.integration.name}-TEST",
+			"calendar_integration": self.integration.name,
+			"sync_direction": "Outbound",
+			"sync_status": "Synced",
+			"meeting_booking": booking_name,
+			"external_event_id": "external-1",
+			"event_title": "Booked meeting",
+			"start_datetime": datetime(2030, 1, 15, 9, 0),
+			"end_datetime": datetime(2030, 1, 15, 10, 0)
+		})
+		# The booking does not exist in these tests, so skip the link validation
+		row.db_insert()
+		return row
+
+	def flush_with_service(self, results):
+		service = MagicMock()
+		service.batch_write.return_value = results
+
+		with patch(
+			"meeting_manager.meeting_manager.services.token_manager.get_calendar_service",
+			return_value=service
+		):
+			flush_calendar_write_queue()
+
+		return service
+
+	def test_pop_batch_respects_batch_size(self):
+		"""Queue sets are popped in batches of FLUSH_BATCH_SIZE, decoded to str"""
+		frappe.cache().sadd(OUTBOX_KEY, "MB-1", "MB-2", "MB-3")
+
+		with patch(f"{QUEUE_MODULE}.FLUSH_BATCH_SIZE", 2):
+			first = calendar_write_queue._pop_batch(OUTBOX_KEY)
+			second = calendar_write_queue._pop_batch(OUTBOX_KEY)
+			third = calendar_write_queue._pop_batch(OUTBOX_KEY)
+
+		self.assertEqual(len(first), 2)
+		self.assertEqual(sorted(first + second), ["MB-1", "MB-2", "MB-3"])
+		self.assertEqual(third, [])
+
+	def test_repeated_queueing_syncs_booking_once(self):
+		"""A booking queued several times before a flush is synced once"""
+		with patch(f"{QUEUE_MODULE}._enqueue_flush"):
+			for _ in range(3):
+				calendar_write_queue.queue_booking_calendar_sync("MB-1")
+
+		with patch(
+			f"{QUEUE_MODULE}.sync_bookings_to_external_calendars",
+			return_value={"failed_bookings": []}
+		) as sync:
+			flush_calendar_write_queue()
+
+		sync.assert_called_once_with(["MB-1"])
+		self.assertEqual(calendar_write_queue._pop_batch(OUTBOX_KEY), [])
+
+	def test_failed_flush_requeues_bookings(self):
+		"""Bookings are put back on the queue when the flush round fails"""
+		frappe.cache().sadd(OUTBOX_KEY, "MB-1", "MB-2")
+
+		with patch(f"{QUEUE_MODULE}.sync_bookings_to_external_calendars", side_effect=Exception("provider down")):
+			flush_calendar_write_queue()
+
+		self.assertEqual(sorted(calendar_write_queue._pop_batch(OUTBOX_KEY)), ["MB-1", "MB-2"])
+
+	def test_failed_operations_requeue_their_bookings(self):
+		"""Bookings with a failed operation are queued again for the next flush, others are not"""
+		frappe.cache().sadd(OUTBOX_KEY, "MB-1", "MB-2")
+
+		with patch(
+			f"{QUEUE_MODULE}.sync_bookings_to_external_calendars",
+			return_value={"failed_bookings": ["MB-2"]}
+		) as sync:
+			flush_calendar_write_queue()
+
+		sync.assert_called_once()
+		self.assertEqual(calendar_write_queue._pop_batch(OUTBOX_KEY), ["MB-2"])
+
+	def test_failed_integration_reports_all_operations(self):
+		"""When the integration itself fails, every one of its operations is reported failed"""
+		operations = {self.integration.name: [
+			{"key": "MB-1", "action": "create", "event_id": None, "record": None},
+			{"key": "MB-2", "action": "create", "event_id": None, "record": None}
+		]}
+
+		with patch(
+			"meeting_manager.meeting_manager.services.token_manager.get_calendar_service",
+			side_effect=Exception("token revoked")
+		):
+			counts = calendar_write_queue._apply_operations(operations)
+
+		self.assertEqual(counts["failed"], 2)
+		self.assertEqual(counts["failed_keys"], {"MB-1", "MB-2"})
+
+	def test_trashed_booking_queues_external_deletes(self):
+		"""Outbound rows of a deleted booking are kept until the external event is deleted"""
+		booking_name = "MM-MB-TEST-0001"
+		row = self.make_outbound_row(booking_name)
+
+		with patch(f"{QUEUE_MODULE}._enqueue_flush") as enqueue_flush:
+			queue_booking_calendar_deletes(booking_name)
+
+		enqueue_flush.assert_called_once()
+		self.assertEqual(
+			frappe.db.get_value("MM Calendar Event Sync", row.name, ["meeting_booking", "sync_status"]),
+			(None, PENDING_DELETE_STATUS)
+		)
+
+		service = self.flush_with_service({row.name: {}})
+
+		operations = service.batch_write.call_args.args[0]
+		self.assertEqual(
+			[(op["action"], op["key"], op["event_id"]) for op in operations],
+			[("delete", row.name, "external-1")]
+		)
+		self.assertFalse(frappe.db.exists("MM Calendar Event Sync", row.name))
+
+	def test_failed_delete_keeps_row_queued(self):
+		"""A delete the provider rejected stays Deleted Locally and is retried"""
+		booking_name = "MM-MB-TEST-0001"
+		row = self.make_outbound_row(booking_name)
+
+		with patch(f"{QUEUE_MODULE}._enqueue_flush"):
+			queue_booking_calendar_deletes(booking_name)
+
+		self.flush_with_service({row.name: {"error": "Rate limit exceeded"}})
+
+		self.assertEqual(
+			frappe.db.get_value("MM Calendar Event Sync", row.name, ["sync_status", "sync_error_log"]),
+			(PENDING_DELETE_STATUS, "Rate limit exceeded")
+		)
+
+		service = self.flush_with_service({row.name: {}})
+
+		service.batch_write.assert_called_once()
+		self.assertFalse(frappe.db.exists("MM Calendar Event Sync", row.name))
+
+	def test_booking_without_outbound_rows_queues_nothing(self):
+		"""Bookings that were never pushed to an external calendar do not enqueue a flush"""
+		with patch(f"{QUEUE_MODULE}._enqueue_flush") as enqueue_flush:
+			queue_booking_calendar_deletes("MM-MB-TEST-0002")
+
+		enqueue_flush.assert_not_called()
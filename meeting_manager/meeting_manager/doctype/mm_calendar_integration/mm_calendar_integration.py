@@ -169,10 +169,21 @@ class MMCalendarIntegration(Document):
 
 	def on_update(self):
 		"""Hook called after document is saved"""
+		from meeting_manager.meeting_manager.services.token_manager import clear_access_token_cache
+
+		# Tokens may have changed; drop the cached access token in every worker
+		clear_access_token_cache(self.name)
+
 		# If this is marked as primary and active, ensure it's the only active primary
 		if self.is_primary and self.is_active:
 			self.unmark_other_primary_calendars()
 
+	def on_trash(self):
+		"""Hook called before document is deleted"""
+		from meeting_manager.meeting_manager.services.token_manager import clear_access_token_cache
+
+		clear_access_token_cache(self.name)
+
 	def unmark_other_primary_calendars(self):
 		"""Unmark other calendars as primary for this user"""
 		other_primaries = frappe.get_all(
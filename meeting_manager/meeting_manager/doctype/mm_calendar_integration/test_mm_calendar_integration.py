@@ -1,9 +1,21 @@
 # Copyright (c) 2025, Best Security and Contributors
 # See license.txt
 
-# import frappe
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import frappe
 from frappe.tests import IntegrationTestCase
+from frappe.utils import add_to_date, now_datetime
+from frappe.utils.password import set_encrypted_password
 
+from meeting_manager.meeting_manager.services.calendar_sync import (
+	collect_ical_events,
+	iter_ical_components,
+	process_calendar_events,
+	sync_ical_calendar,
+)
+from meeting_manager.meeting_manager.services.token_manager import clear_access_token_cache, get_access_token
 
 # On IntegrationTestCase, the doctype test records and all
 # link-field test record dependencies are recursively loaded
@@ -11,6 +23,29 @@ from frappe.tests import IntegrationTestCase
 EXTRA_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
 IGNORE_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
 
+WINDOW_START = datetime(2030, 1, 1)
+WINDOW_END = datetime(2030, 2, 1)
+
+
+def make_feed(*events):
+	"""Wrap VEVENT blocks in a VCALENDAR and return the feed as lines"""
+	lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Meeting Manager//Test//EN"]
+	for event in events:
+		lines.extend(event.strip().splitlines())
+	lines.append("END:VCALENDAR")
+	return lines
+
+
+WEEKLY_SERIES = """
+BEGIN:VEVENT
+UID:weekly@example.com
+SUMMARY:Weekly sync
+DTSTART:20300107T090000
+DTEND:20300107T093000
+RRULE:FREQ=WEEKLY
+EXDATE:20300121T090000
+END:VEVENT
+"""
 
 
 class IntegrationTestMMCalendarIntegration(IntegrationTestCase):
@@ -19,4 +54,230 @@ class IntegrationTestMMCalendarIntegration(IntegrationTestCase):
 	Use this class for testing interactions between multiple components.
 	"""
 
-	pass
+	def setUp(self):
+		self.integration = frappe.get_doc({
+			"doctype": "MM Calendar Integration",
+			"user": "Administrator",
+			"integration_type": "iCal",
+			"integration_name": frappe.generate_hash(length=10),
+			"ical_url": "https://example.com/calendar.ics",
+			"sync_direction": "One-way (Read Only)",
+			"sync_past_days": 0,
+			"sync_future_days": 30
+		}).insert(ignore_permissions=True)
+
+	def tearDown(self):
+		frappe.db.rollback()
+		clear_access_token_cache(self.integration.name)
+
+	def test_iter_ical_components_unfolds_lines(self):
+		"""Folded lines are joined and nested components stay inside their VEVENT"""
+		feed = make_feed("""
+BEGIN:VEVENT
+UID:folded@example.com
+SUMMARY:A very long
+  title
+BEGIN:VALARM
+ACTION:DISPLAY
+END:VALARM
+END:VEVENT
+""")
+
+		components = list(iter_ical_components(line.encode() for line in feed))
+
+		self.assertEqual(len(components), 1)
+		self.assertIn("SUMMARY:A very long title\r\n", components[0])
+		self.assertIn("BEGIN:VALARM", components[0])
+
+	def test_recurring_event_is_expanded_inside_window(self):
+		"""RRULE occurrences are generated only inside the window and EXDATE is honoured"""
+		events = collect_ical_events(make_feed(WEEKLY_SERIES), WINDOW_START, WINDOW_END)
+
+		starts = sorted(event["start_datetime"] for event in events)
+		self.assertEqual(starts, [
+			datetime(2030, 1, 7, 9, 0),
+			datetime(2030, 1, 14, 9, 0),
+			datetime(2030, 1, 28, 9, 0)
+		])
+		self.assertIn("weekly@example.com_20300114T090000", {e["external_event_id"] for e in events})
+
+	def test_modified_and_cancelled_instances_replace_occurrences(self):
+		"""RECURRENCE-ID instances replace, and cancelled ones remove, the generated occurrence"""
+		moved = """
+BEGIN:VEVENT
+UID:weekly@example.com
+RECURRENCE-ID:20300114T090000
+SUMMARY:Weekly sync (moved)
+DTSTART:20300114T140000
+DTEND:20300114T143000
+END:VEVENT
+"""
+		cancelled = """
+BEGIN:VEVENT
+UID:weekly@example.com
+RECURRENCE-ID:20300128T090000
+STATUS:CANCELLED
+DTSTART:20300128T090000
+DTEND:20300128T093000
+END:VEVENT
+"""
+
+		# Overrides are honoured whether they come before or after the master event
+		for feed in (make_feed(WEEKLY_SERIES, moved, cancelled), make_feed(cancelled, moved, WEEKLY_SERIES)):
+			events = {e["external_event_id"]: e for e in collect_ical_events(feed, WINDOW_START, WINDOW_END)}
+
+			self.assertEqual(sorted(events), [
+				"weekly@example.com_20300107T090000",
+				"weekly@example.com_20300114T090000"
+			])
+			self.assertEqual(
+				events["weekly@example.com_20300114T090000"]["start_datetime"],
+				datetime(2030, 1, 14, 14, 0)
+			)
+
+	def test_instance_moved_out_of_window_removes_occurrence(self):
+		"""An instance moved outside the window leaves no busy block at its original time"""
+		moved_out = """
+BEGIN:VEVENT
+UID:weekly@example.com
+RECURRENCE-ID:20300114T090000
+SUMMARY:Weekly sync (moved)
+DTSTART:20300304T090000
+DTEND:20300304T093000
+END:VEVENT
+"""
+
+		for feed in (make_feed(WEEKLY_SERIES, moved_out), make_feed(moved_out, WEEKLY_SERIES)):
+			events = collect_ical_events(feed, WINDOW_START, WINDOW_END)
+
+			self.assertEqual(sorted(e["external_event_id"] for e in events), [
+				"weekly@example.com_20300107T090000",
+				"weekly@example.com_20300128T090000"
+			])
+
+	def test_events_outside_window_are_skipped(self):
+		"""Single events that end before or start after the window are dropped"""
+		feed = make_feed("""
+BEGIN:VEVENT
+UID:past@example.com
+DTSTART:20291201T090000
+DTEND:20291201T100000
+END:VEVENT
+""", """
+BEGIN:VEVENT
+UID:inside@example.com
+DTSTART:20300110T090000
+DTEND:20300110T100000
+TRANSP:TRANSPARENT
+END:VEVENT
+""", """
+BEGIN:VEVENT
+UID:future@example.com
+DTSTART:20300301T090000
+DTEND:20300301T100000
+END:VEVENT
+""")
+
+		events = collect_ical_events(feed, WINDOW_START, WINDOW_END)
+
+		self.assertEqual([e["external_event_id"] for e in events], ["inside@example.com"])
+		self.assertEqual(events[0]["event_status"], "Free")
+
+	def test_process_calendar_events_bulk_upsert(self):
+		"""New events are inserted, changed ones updated and missing inbound rows deleted"""
+		events = [
+			{
+				"external_event_id": f"event-{i}",
+				"event_title": f"Event {i}",
+				"start_datetime": datetime(2030, 1, 10 + i, 9, 0),
+				"end_datetime": datetime(2030, 1, 10 + i, 10, 0)
+			}
+			for i in range(3)
+		]
+
+		counts = process_calendar_events(self.integration, events)
+		self.assertEqual(counts["inserted"], 3)
+		self.assertEqual(self.get_synced_titles(), {
+			"event-0": "Event 0",
+			"event-1": "Event 1",
+			"event-2": "Event 2"
+		})
+
+		events[0]["event_title"] = "Event 0 (renamed)"
+		counts = process_calendar_events(self.integration, events[:2])
+
+		self.assertEqual(
+			(counts["inserted"], counts["updated"], counts["unchanged"], counts["deleted"]),
+			(0, 1, 1, 1)
+		)
+		self.assertEqual(self.get_synced_titles(), {
+			"event-0": "Event 0 (renamed)",
+			"event-1": "Event 1"
+		})
+
+	def test_process_calendar_events_keeps_outbound_rows(self):
+		"""Rows pushed to the external calendar are never pruned by an inbound sync"""
+		outbound = frappe.get_doc({
+			"doctype": "MM Calendar Event Sync",
+			"calendar_integration": self.integration.name,
+			"sync_direction": "Outbound",
+			"external_event_id": "pushed-event",
+			"event_title": "Pushed booking",
+			"start_datetime": datetime(2030, 1, 15, 9, 0),
+			"end_datetime": datetime(2030, 1, 15, 10, 0)
+		}).insert(ignore_permissions=True)
+
+		counts = process_calendar_events(self.integration, [])
+
+		self.assertEqual(counts["deleted"], 0)
+		self.assertTrue(frappe.db.exists("MM Calendar Event Sync", outbound.name))
+
+	def test_conditional_get_requires_unchanged_window(self):
+		"""Validators are only sent while the stored sync window is still current"""
+		self.integration.ical_etag = '"v1"'
+		self.integration.ical_sync_window = "2000-01-01|2000-01-31"
+
+		response = MagicMock(status_code=200, headers={"ETag": '"v2"'})
+		response.__enter__.return_value = response
+		response.iter_lines.return_value = iter(make_feed())
+
+		with patch("requests.get", return_value=response) as get:
+			sync_ical_calendar(self.integration)
+
+		self.assertNotIn("If-None-Match", get.call_args.kwargs["headers"])
+		self.assertEqual(self.integration.ical_etag, '"v2"')
+
+		# Same window as the last expansion: an unchanged feed is skipped on 304
+		response.status_code = 304
+		with patch("requests.get", return_value=response) as get:
+			self.assertIsNone(sync_ical_calendar(self.integration))
+
+		self.assertEqual(get.call_args.kwargs["headers"]["If-None-Match"], '"v2"')
+
+	def test_access_token_cache_is_cleared_on_save(self):
+		"""The token is read from the cache until the integration is saved with a new one"""
+		self.integration.access_token = "token-1"
+		self.integration.token_expiry = add_to_date(now_datetime(), hours=1)
+		self.integration.save(ignore_permissions=True)
+		refresh = MagicMock()
+
+		self.assertEqual(get_access_token(self.integration, refresh), "token-1")
+
+		# Another worker stores a new token without going through the document
+		set_encrypted_password("MM Calendar Integration", self.integration.name, "token-2", "access_token")
+		self.assertEqual(get_access_token(self.integration, refresh), "token-1")
+
+		self.integration.reload()
+		self.integration.access_token = "token-3"
+		self.integration.save(ignore_permissions=True)
+
+		self.assertEqual(get_access_token(self.integration, refresh), "token-3")
+		refresh.assert_not_called()
+
+	def get_synced_titles(self):
+		return dict(frappe.get_all(
+			"MM Calendar Event Sync",
+			filters={"calendar_integration": self.integration.name},
+			fields=["external_event_id", "event_title"],
+			as_list=True
+		))
@@ -0,0 +1,12 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+
+
+class MMCustomerIdentity(Document):
+	def autoname(self):
+		from meeting_manager.meeting_manager.services.customer_identity import get_identity_key
+
+		self.name = get_identity_key(self.identity_type, self.identity_value)
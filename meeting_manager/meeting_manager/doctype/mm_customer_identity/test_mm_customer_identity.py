@@ -0,0 +1,134 @@
+# Copyright (c) 2026, Best Security and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests import IntegrationTestCase
+
+from meeting_manager.meeting_manager.services import customer_identity
+from meeting_manager.meeting_manager.services.customer_identity import (
+	find_contact,
+	get_identity_contact,
+	normalize_email,
+	normalize_phone,
+)
+from meeting_manager.meeting_manager.services.customer_service import find_or_create_customer
+
+# On IntegrationTestCase, the doctype test records and all
+# link-field test record dependencies are recursively loaded
+# Use these module variables to add/remove to/from that list
+EXTRA_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
+IGNORE_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
+
+
+class IntegrationTestMMCustomerIdentity(IntegrationTestCase):
+	"""
+	Integration tests for MMCustomerIdentity.
+	Use this class for testing interactions between multiple components.
+	"""
+
+	def setUp(self):
+		self.contacts = []
+		self.email = f"customer-{frappe.generate_hash(length=8)}@example.com"
+
+	def tearDown(self):
+		# find_or_create_customer commits, so clean up explicitly
+		for name in self.contacts:
+			if frappe.db.exists("Contact", name):
+				frappe.delete_doc("Contact", name, ignore_permissions=True, force=True)
+		frappe.db.commit()
+
+	def make_contact(self, email=None, phone=None):
+		contact = frappe.get_doc({"doctype": "Contact", "first_name": "Test Customer"})
+		if email:
+			contact.append("email_ids", {"email_id": email, "is_primary": 1})
+		if phone:
+			contact.append("phone_nos", {"phone": phone, "is_primary_phone": 1})
+		contact.insert(ignore_permissions=True)
+		self.contacts.append(contact.name)
+		return contact
+
+	def test_normalize_email(self):
+		self.assertEqual(normalize_email("  Jane.Doe@Example.COM "), "jane.doe@example.com")
+		self.assertIsNone(normalize_email("  "))
+
+	def test_normalize_phone(self):
+		"""Phone numbers are reduced to E.164, national numbers get the default country code"""
+		with patch.object(customer_identity, "_get_default_country_code", return_value="45"):
+			self.assertEqual(normalize_phone("+45 12 34 56 78"), "+4512345678")
+			self.assertEqual(normalize_phone("0045 12345678"), "+4512345678")
+			self.assertEqual(normalize_phone("12 34 56 78"), "+4512345678")
+			self.assertEqual(normalize_phone("+1 (555) 123-4567"), "+15551234567")
+			self.assertIsNone(normalize_phone("123"))
+
+	def test_contact_hooks_keep_identities_in_sync(self):
+		"""Identities follow the contact's emails and are removed with it"""
+		contact = self.make_contact(self.email.upper(), "+45 11 22 33 44")
+
+		self.assertEqual(find_contact(email=self.email), (contact.name, "Email"))
+		self.assertEqual(find_contact(phone="+4511223344"), (contact.name, "Phone"))
+
+		contact.phone_nos = []
+		contact.save(ignore_permissions=True)
+		self.assertIsNone(get_identity_contact("Phone", "+4511223344"))
+
+		frappe.delete_doc("Contact", contact.name, ignore_permissions=True, force=True)
+		self.assertIsNone(get_identity_contact("Email", self.email))
+
+	def test_first_contact_keeps_shared_identity(self):
+		"""A later contact with the same email does not take the identity over"""
+		first = self.make_contact(self.email)
+		self.make_contact(self.email)
+
+		self.assertEqual(get_identity_contact("Email", self.email), first.name)
+
+	def test_released_identity_passes_to_next_contact(self):
+		"""An identity dropped by its owner goes to the oldest other contact that has it"""
+		first = self.make_contact(self.email, "+45 11 22 33 44")
+		second = self.make_contact(self.email.upper(), "11223344")
+		self.make_contact(self.email)
+
+		first.phone_nos = []
+		first.save(ignore_permissions=True)
+		self.assertEqual(get_identity_contact("Phone", "+4511223344"), second.name)
+		self.assertEqual(get_identity_contact("Email", self.email), first.name)
+
+		frappe.delete_doc("Contact", first.name, ignore_permissions=True, force=True)
+		self.assertEqual(get_identity_contact("Email", self.email), second.name)
+
+	def test_find_or_create_customer_reuses_contact(self):
+		"""Existing customers are found by normalized email, then by phone"""
+		created = find_or_create_customer(self.email, phone="+45 55 66 77 88", name="Jane Doe")
+		self.contacts.append(created["customer_id"])
+		self.assertTrue(created["created"])
+
+		by_email = find_or_create_customer(f"  {self.email.upper()} ")
+		self.assertEqual((by_email["customer_id"], by_email["created"]), (created["customer_id"], False))
+
+		other_email = f"other-{self.email}"
+		by_phone = find_or_create_customer(other_email, phone="55667788")
+		self.assertEqual((by_phone["customer_id"], by_phone["created"]), (created["customer_id"], False))
+		self.assertEqual(get_identity_contact("Email", other_email), created["customer_id"])
+
+	def test_find_or_create_customer_loses_race(self):
+		"""The request that loses the identity claim drops its contact and returns the winner"""
+		winner = self.make_contact(self.email)
+		contact_count = frappe.db.count("Contact")
+
+		def lookup_before_winner_committed(identity_type, value, for_update=False):
+			# Unlocked lookups ran before the concurrent request committed its contact
+			return get_identity_contact(identity_type, value, for_update=True) if for_update else None
+
+		pending_jobs = len(frappe.db.after_commit._functions)
+
+		with patch(
+			"meeting_manager.meeting_manager.services.customer_service.get_identity_contact",
+			side_effect=lookup_before_winner_committed
+		):
+			result = find_or_create_customer(self.email, name="Jane Doe")
+
+		self.assertEqual((result["customer_id"], result["created"]), (winner.name, False))
+		self.assertEqual(frappe.db.count("Contact"), contact_count)
+		# Nothing is enqueued for the discarded contact
+		self.assertEqual(len(frappe.db.after_commit._functions), pending_jobs)
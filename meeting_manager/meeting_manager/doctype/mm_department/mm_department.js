@@ -1,8 +1,16 @@
 // Copyright (c) 2025, Best Security and contributors
 // For license information, please see license.txt
 
-// frappe.ui.form.on("MM Department", {
-// 	refresh(frm) {
-
-// 	},
-// });
+frappe.ui.form.on("MM Department", {
+	setup(frm) {
+		// Offer algorithms registered by other apps next to the built-in ones
+		frappe.call({
+			method: 'meeting_manager.meeting_manager.api.assignment.get_assignment_algorithm_names',
+			callback: function(r) {
+				if (r.message) {
+					frm.set_df_property('assignment_algorithm', 'options', r.message);
+				}
+			}
+		});
+	}
+});
@@ -12,6 +12,7 @@ class MMDepartment(Document):
 		self.validate_department_leader()
 		self.validate_active_members()
 		self.validate_department_slug()
+		self.validate_assignment_algorithm()
 		self.set_public_booking_url()
 
 	def before_save(self):
@@ -35,37 +36,31 @@ class MMDepartment(Document):
 
 	def on_update(self):
 		"""Sync roles after department is saved"""
-		self.sync_leader_role()
-		self.sync_member_roles()
+		self.sync_roles()
+		self.clear_access_scopes()
 
 	def on_trash(self):
 		"""Revoke roles when department is deleted"""
 		self.revoke_all_roles_on_delete()
-
-	def sync_leader_role(self):
-		"""Assign/revoke leader role based on department_leader changes"""
-		from meeting_manager.meeting_manager.services.role_service import (
-			sync_leader_role_on_department_change
-		)
-
-		old_leader = getattr(self, "_previous_leader", None)
-		new_leader = self.department_leader
-
-		sync_leader_role_on_department_change(self.name, old_leader, new_leader)
-
-	def sync_member_roles(self):
-		"""Assign/revoke member roles based on department_members changes"""
-		from meeting_manager.meeting_manager.services.role_service import (
-			sync_member_roles_on_department_change
-		)
-
-		old_members = getattr(self, "_previous_active_members", set())
-		new_members = set(
-			m.member for m in self.department_members if m.is_active
+		self.clear_access_scopes()
+
+	def clear_access_scopes(self):
+		"""Leaders, members and teams may have changed for any user"""
+		from meeting_manager.meeting_manager.utils.permissions import clear_access_scope_cache
+		clear_access_scope_cache()
+
+	def sync_roles(self):
+		"""Assign/revoke leader and member roles for everyone whose role may have changed"""
+		from meeting_manager.meeting_manager.services.role_service import sync_department_roles
+
+		sync_department_roles(
+			self.name,
+			getattr(self, "_previous_leader", None),
+			self.department_leader,
+			getattr(self, "_previous_active_members", set()),
+			set(m.member for m in self.department_members if m.is_active)
 		)
 
-		sync_member_roles_on_department_change(self.name, old_members, new_members)
-
 	def revoke_all_roles_on_delete(self):
 		"""Revoke roles from leader and all members when department is deleted"""
 		from meeting_manager.meeting_manager.services.role_service import (
@@ -167,6 +162,20 @@ class MMDepartment(Document):
 		if existing:
 			frappe.throw(f"Department Slug '{self.department_slug}' already exists. Please use a unique slug.")
 
+	def validate_assignment_algorithm(self):
+		"""Ensure assignment_algorithm is built in or registered through the mm_assignment_algorithms hook"""
+		if not self.assignment_algorithm:
+			return
+
+		from meeting_manager.meeting_manager.api.assignment import get_assignment_algorithms
+
+		algorithms = get_assignment_algorithms()
+		if self.assignment_algorithm not in algorithms:
+			frappe.throw(
+				f"Assignment Algorithm '{self.assignment_algorithm}' is not available. "
+				f"Choose one of: {', '.join(algorithms)}"
+			)
+
 	def set_public_booking_url(self):
 		"""Auto-generate public booking URL based on department slug"""
 		site_url = get_url()
@@ -1,9 +1,17 @@
 # Copyright (c) 2025, Best Security and Contributors
 # See license.txt
 
-# import frappe
+from unittest.mock import patch
+
+import frappe
 from frappe.tests import IntegrationTestCase
 
+from meeting_manager.meeting_manager.api.assignment import get_assignment_algorithms, select_least_busy
+from meeting_manager.meeting_manager.services.role_service import (
+	MM_DEPARTMENT_LEADER_ROLE,
+	MM_DEPARTMENT_MEMBER_ROLE,
+	reconcile_roles,
+)
 
 # On IntegrationTestCase, the doctype test records and all
 # link-field test record dependencies are recursively loaded
@@ -12,6 +20,33 @@ EXTRA_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
 IGNORE_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
 
 
+def make_test_user(prefix="mm-test"):
+	"""Create a user with a unique email and return its name"""
+	user = frappe.get_doc({
+		"doctype": "User",
+		"email": f"{prefix}-{frappe.generate_hash(length=8)}@example.com",
+		"first_name": prefix.replace("-", " ").title(),
+		"send_welcome_email": 0
+	}).insert(ignore_permissions=True)
+	return user.name
+
+
+def make_department(members, leader=None, **values):
+	"""Create a department with the given active members"""
+	slug = f"test-{frappe.generate_hash(length=8)}"
+	return frappe.get_doc({
+		"doctype": "MM Department",
+		"department_name": f"Test Department {slug}",
+		"department_slug": slug,
+		"department_leader": leader,
+		"department_members": [{"member": member, "is_active": 1} for member in members],
+		**values
+	}).insert(ignore_permissions=True)
+
+
+def has_role(user, role):
+	return bool(frappe.db.exists("Has Role", {"parent": user, "parenttype": "User", "role": role}))
+
 
 class IntegrationTestMMDepartment(IntegrationTestCase):
 	"""
@@ -19,4 +54,89 @@ class IntegrationTestMMDepartment(IntegrationTestCase):
 	Use this class for testing interactions between multiple components.
 	"""
 
-	pass
+	def setUp(self):
+		self.leader = make_test_user("mm-leader")
+		self.member = make_test_user("mm-member")
+		self.department = make_department([self.leader, self.member], leader=self.leader)
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_department_save_assigns_roles(self):
+		"""Leader and active members get their roles when the department is saved"""
+		self.assertTrue(has_role(self.leader, MM_DEPARTMENT_LEADER_ROLE))
+		self.assertTrue(has_role(self.leader, MM_DEPARTMENT_MEMBER_ROLE))
+		self.assertTrue(has_role(self.member, MM_DEPARTMENT_MEMBER_ROLE))
+		self.assertFalse(has_role(self.member, MM_DEPARTMENT_LEADER_ROLE))
+
+	def test_deactivated_member_loses_role(self):
+		"""Deactivating a member revokes the member role from that user only"""
+		self.department.department_members[1].is_active = 0
+		self.department.save(ignore_permissions=True)
+
+		self.assertFalse(has_role(self.member, MM_DEPARTMENT_MEMBER_ROLE))
+		self.assertTrue(has_role(self.leader, MM_DEPARTMENT_MEMBER_ROLE))
+
+	def test_member_of_another_department_keeps_role(self):
+		"""Deleting a department keeps roles that another department still calls for"""
+		make_department([self.member])
+
+		frappe.delete_doc("MM Department", self.department.name, ignore_permissions=True)
+
+		self.assertTrue(has_role(self.member, MM_DEPARTMENT_MEMBER_ROLE))
+		self.assertFalse(has_role(self.leader, MM_DEPARTMENT_LEADER_ROLE))
+		self.assertFalse(has_role(self.leader, MM_DEPARTMENT_MEMBER_ROLE))
+
+	def test_organisation_reconcile_only_assigns(self):
+		"""A reconcile of all users restores missing roles and keeps hand-granted ones"""
+		outsider = make_test_user("mm-outsider")
+		frappe.get_doc("User", outsider).add_roles(MM_DEPARTMENT_MEMBER_ROLE)
+		frappe.db.delete("Has Role", {"parent": self.member, "role": MM_DEPARTMENT_MEMBER_ROLE})
+
+		result = reconcile_roles(notify=False)
+
+		self.assertEqual(result["removed"], 0)
+		self.assertTrue(has_role(self.member, MM_DEPARTMENT_MEMBER_ROLE))
+		self.assertTrue(has_role(outsider, MM_DEPARTMENT_MEMBER_ROLE))
+
+	def test_revoke_unlinked_removes_hand_granted_roles(self):
+		"""Hand-granted roles are only revoked when explicitly requested"""
+		outsider = make_test_user("mm-outsider")
+		frappe.get_doc("User", outsider).add_roles(MM_DEPARTMENT_LEADER_ROLE)
+
+		reconcile_roles(revoke_unlinked=True, notify=False)
+
+		self.assertFalse(has_role(outsider, MM_DEPARTMENT_LEADER_ROLE))
+		self.assertTrue(has_role(self.leader, MM_DEPARTMENT_LEADER_ROLE))
+
+	def test_reconcile_revokes_only_listed_users(self):
+		"""Surplus roles are revoked from the users being reconciled, not from others"""
+		listed = make_test_user("mm-listed")
+		other = make_test_user("mm-other")
+		for user in (listed, other):
+			frappe.get_doc("User", user).add_roles(MM_DEPARTMENT_MEMBER_ROLE)
+
+		result = reconcile_roles([listed], notify=False)
+
+		self.assertEqual((result["added"], result["removed"]), (0, 1))
+		self.assertFalse(has_role(listed, MM_DEPARTMENT_MEMBER_ROLE))
+		self.assertTrue(has_role(other, MM_DEPARTMENT_MEMBER_ROLE))
+
+	def test_registered_assignment_algorithm_can_be_selected(self):
+		"""Algorithms registered through the hook are available and selectable, unknown names are not"""
+		get_hooks = frappe.get_hooks
+
+		def get_hooks_with_algorithm(hook=None, *args, **kwargs):
+			if hook == "mm_assignment_algorithms":
+				# Dict hooks are merged into {name: [dotted paths]}
+				return {"Custom": ["meeting_manager.meeting_manager.api.assignment.select_least_busy"]}
+			return get_hooks(hook, *args, **kwargs)
+
+		with patch("frappe.get_hooks", side_effect=get_hooks_with_algorithm):
+			self.assertIs(get_assignment_algorithms()["Custom"], select_least_busy)
+
+			self.department.assignment_algorithm = "Custom"
+			self.department.save(ignore_permissions=True)
+
+		self.department.assignment_algorithm = "Unknown"
+		self.assertRaises(frappe.ValidationError, self.department.save, ignore_permissions=True)
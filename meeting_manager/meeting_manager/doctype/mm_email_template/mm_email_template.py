@@ -14,6 +14,21 @@ class MMEmailTemplate(Document):
         if not self.email_body:
             frappe.throw("Email body is required")
 
+    def on_update(self):
+        """Drop cached template selections so the change applies to the next email"""
+        from meeting_manager.meeting_manager.utils.email_templates import clear_email_template_cache
+        clear_email_template_cache()
+
+    def on_trash(self):
+        """Drop cached template selections"""
+        from meeting_manager.meeting_manager.utils.email_templates import clear_email_template_cache
+        clear_email_template_cache()
+
+    def after_rename(self, old_name, new_name, merge=False):
+        """Drop cached template selections that point to the old name"""
+        from meeting_manager.meeting_manager.utils.email_templates import clear_email_template_cache
+        clear_email_template_cache()
+
     @staticmethod
     def get_template(email_type: str, service_type: str = None, language: str = "en"):
         """
@@ -72,8 +87,9 @@ class MMEmailTemplate(Document):
         Returns:
             Dict with rendered 'subject' and 'body'
         """
-        rendered_subject = frappe.render_template(template_doc.subject, context)
-        rendered_body = frappe.render_template(template_doc.email_body, context)
+        from meeting_manager.meeting_manager.utils.email_templates import render_email_template
+
+        rendered_subject, rendered_body = render_email_template(template_doc, context)
 
         # Add remote support link if enabled
         if template_doc.include_remote_support_link and template_doc.remote_support_url:
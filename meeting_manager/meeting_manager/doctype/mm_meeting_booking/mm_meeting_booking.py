@@ -32,6 +32,7 @@ class MMMeetingBooking(Document):
 		self.validate_location_settings()
 		self.validate_booking_status()
 		self.set_booking_reference()
+		self.set_department_and_primary_host()
 
 	def before_save(self):
 		"""Hook called before document is saved"""
@@ -49,6 +50,17 @@ class MMMeetingBooking(Document):
 		if not self.created_by and self.is_new():
 			self.created_by = frappe.session.user
 
+	def set_department_and_primary_host(self):
+		"""Maintain the denormalized department (from the meeting type) and primary host"""
+		self.department = (
+			frappe.get_cached_value("MM Meeting Type", self.meeting_type, "department")
+			if self.meeting_type else None
+		)
+
+		hosts = [au for au in (self.assigned_users or []) if au.user]
+		primary = next((au for au in hosts if au.is_primary_host), hosts[0] if hosts else None)
+		self.primary_host = primary.user if primary else None
+
 	def validate_meeting_type_exists(self):
 		"""Ensure the selected meeting type exists and is active"""
 		if not self.meeting_type:
@@ -355,23 +367,61 @@ class MMMeetingBooking(Document):
 				description=f"Booking created for {self.meeting_title}"
 			)
 
-			# Push new booking to external calendars (two-way sync)
-			if self.assigned_to:
-				try:
-					from meeting_manager.meeting_manager.services.calendar_sync import create_calendar_event_in_external
-					create_calendar_event_in_external(self)
-				except Exception as e:
-					frappe.log_error(
-						title=f"Calendar Sync Error - New Booking",
-						message=f"Failed to push booking {self.name} to external calendar: {str(e)}"
-					)
-
 		# Track assignment changes
 		if not self.is_new():
 			old_doc = self.get_doc_before_save()
 			if old_doc:
 				self.track_assignment_changes(old_doc)
 
+		# Keep the customer's booking count and last booking date current
+		from meeting_manager.meeting_manager.services.customer_service import apply_booking_stats_change
+		apply_booking_stats_change(self, self.get_doc_before_save())
+
+		# Push new or changed bookings to external calendars (two-way sync)
+		if self.needs_external_calendar_sync():
+			try:
+				from meeting_manager.meeting_manager.services.calendar_sync import (
+					create_calendar_event_in_external,
+				)
+				create_calendar_event_in_external(self)
+			except Exception as e:
+				frappe.log_error(
+					title=f"Calendar Sync Error - Booking Update",
+					message=f"Failed to queue booking {self.name} for external calendar sync: {e!s}"
+				)
+
+		# Materialize automated reminders for new or rescheduled bookings
+		if self.needs_reminder_schedule_update():
+			from meeting_manager.meeting_manager.services.reminder_service import schedule_booking_reminders
+			schedule_booking_reminders(self.name)
+
+	def needs_reminder_schedule_update(self):
+		"""Check whether a change affects when automated reminders are due"""
+		if not self.get_doc_before_save():
+			return True
+
+		return any(
+			self.has_value_changed(field)
+			for field in ("start_datetime", "meeting_type", "booking_status")
+		)
+
+	def needs_external_calendar_sync(self):
+		"""Check whether a change affects the events pushed to external calendars"""
+		old_doc = self.get_doc_before_save()
+		if not old_doc:
+			return bool(self.assigned_users)
+
+		old_hosts = {au.user for au in old_doc.assigned_users} if old_doc.assigned_users else set()
+		new_hosts = {au.user for au in self.assigned_users} if self.assigned_users else set()
+		if old_hosts != new_hosts:
+			return True
+
+		synced_fields = (
+			"start_datetime", "end_datetime", "booking_status", "meeting_title",
+			"meeting_location", "video_meeting_url"
+		)
+		return any(self.has_value_changed(field) for field in synced_fields)
+
 	def track_assignment_changes(self, old_doc):
 		"""Track changes in assigned users and add to assignment history"""
 		old_users = {au.user for au in old_doc.assigned_users} if old_doc.assigned_users else set()
@@ -412,6 +462,33 @@ class MMMeetingBooking(Document):
 				"notes": f"Primary host changed from {old_primary or 'None'} to {new_primary}"
 			})
 
+	def on_change(self):
+		"""Hook called after any change (save, submit, cancel, db_set)"""
+		from meeting_manager.meeting_manager.api.dashboard import clear_dashboard_cache
+		clear_dashboard_cache()
+
+		from meeting_manager.meeting_manager.services.search_index import index_bookings
+		index_bookings(self.name)
+
+	def on_trash(self):
+		"""Hook called before document is deleted"""
+		frappe.db.delete("MM Booking Reminder", {"booking": self.name})
+		frappe.db.delete("MM Notification Outbox", {"booking": self.name})
+
+		from meeting_manager.meeting_manager.services.calendar_write_queue import (
+			queue_booking_calendar_deletes,
+		)
+		queue_booking_calendar_deletes(self.name)
+
+		from meeting_manager.meeting_manager.services.search_index import remove_from_index
+		remove_from_index(self.doctype, self.name)
+
+		from meeting_manager.meeting_manager.services.customer_service import apply_booking_stats_change
+		apply_booking_stats_change(None, self)
+
+		from meeting_manager.meeting_manager.api.dashboard import clear_dashboard_cache
+		clear_dashboard_cache()
+
 	def on_cancel(self):
 		"""Hook called when document is cancelled"""
 		self.booking_status = "Cancelled"
@@ -430,3 +507,13 @@ class MMMeetingBooking(Document):
 				title=f"Calendar Sync Error - Cancel Booking",
 				message=f"Failed to delete booking {self.name} from external calendar: {str(e)}"
 			)
+
+
+def on_doctype_update():
+	"""Indexes for booking lists"""
+	# Keyset pagination of search_bookings seeks on (start_datetime, name)
+	frappe.db.add_index("MM Meeting Booking", ["start_datetime", "name"])
+	# Calendar and department lists filter by department within a time range
+	frappe.db.add_index("MM Meeting Booking", ["department", "start_datetime"])
+	# Contact permission checks look up bookings by customer
+	frappe.db.add_index("MM Meeting Booking", ["customer"])
@@ -1,9 +1,21 @@
 # Copyright (c) 2025, Best Security and Contributors
 # See license.txt
 
-# import frappe
+from unittest.mock import patch
+
+import frappe
 from frappe.tests import IntegrationTestCase
+from frappe.utils import add_days, add_to_date, getdate, now_datetime
 
+from meeting_manager.meeting_manager.api.assignment import get_candidate_features, rebalance_assignments
+from meeting_manager.meeting_manager.api.dashboard import get_cache_generation
+from meeting_manager.meeting_manager.doctype.mm_booking_status.mm_booking_status import seed_default_statuses
+from meeting_manager.meeting_manager.doctype.mm_department.test_mm_department import (
+	make_department,
+	make_test_user,
+)
+from meeting_manager.meeting_manager.services.customer_service import reconcile_customer_booking_stats
+from meeting_manager.meeting_manager.utils import permissions
 
 # On IntegrationTestCase, the doctype test records and all
 # link-field test record dependencies are recursively loaded
@@ -12,6 +24,49 @@ EXTRA_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
 IGNORE_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
 
 
+def make_meeting_type(department, **values):
+	"""Create an active meeting type open to public and internal bookings"""
+	slug = f"test-{frappe.generate_hash(length=6)}"
+	return frappe.get_doc({
+		"doctype": "MM Meeting Type",
+		"department": department,
+		"meeting_name": f"Test Meeting {slug}",
+		"meeting_slug": slug,
+		"duration": 30,
+		"location_type": "Phone Call",
+		"is_public": 1,
+		"is_internal": 1,
+		**values
+	}).insert(ignore_permissions=True)
+
+
+def make_customer():
+	"""Create a Contact with a unique email"""
+	contact = frappe.get_doc({"doctype": "Contact", "first_name": "Test Customer"})
+	contact.append("email_ids", {
+		"email_id": f"customer-{frappe.generate_hash(length=8)}@example.com",
+		"is_primary": 1
+	})
+	return contact.insert(ignore_permissions=True)
+
+
+def make_booking(meeting_type, host, customer=None, start=None, **values):
+	"""Create a 30 minute booking hosted by host; internal when no customer is given"""
+	start = start or add_days(now_datetime().replace(hour=10, minute=0, second=0, microsecond=0), 3)
+	return frappe.get_doc({
+		"doctype": "MM Meeting Booking",
+		"meeting_type": meeting_type,
+		"meeting_title": "Test Booking",
+		"booking_status": "New Booking",
+		"booking_source": "Manual Entry",
+		"start_datetime": start,
+		"end_datetime": add_to_date(start, minutes=30),
+		"customer": customer,
+		"is_internal": 0 if customer else 1,
+		"assigned_users": [{"user": host, "is_primary_host": 1}],
+		**values
+	}).insert(ignore_permissions=True)
+
 
 class IntegrationTestMMMeetingBooking(IntegrationTestCase):
 	"""
@@ -19,4 +74,189 @@ class IntegrationTestMMMeetingBooking(IntegrationTestCase):
 	Use this class for testing interactions between multiple components.
 	"""
 
-	pass
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		seed_default_statuses()
+
+	def setUp(self):
+		self.host = make_test_user("mm-host")
+		self.department = make_department([self.host])
+		self.meeting_type = make_meeting_type(self.department.name).name
+		self.customer = make_customer().name
+		self.start = add_days(now_datetime().replace(hour=10, minute=0, second=0, microsecond=0), 3)
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def get_stats(self, customer=None):
+		return tuple(frappe.db.get_value(
+			"Contact", customer or self.customer, ["mm_total_bookings", "mm_last_booking_date"]
+		))
+
+	def test_new_bookings_update_customer_stats(self):
+		"""Each booking counts once and moves the last booking date forward only"""
+		later = add_days(self.start, 7)
+
+		make_booking(self.meeting_type, self.host, self.customer, start=later)
+		self.assertEqual(self.get_stats(), (1, getdate(later)))
+
+		make_booking(self.meeting_type, self.host, self.customer, start=self.start)
+		self.assertEqual(self.get_stats(), (2, getdate(later)))
+
+	def test_cancelled_booking_is_not_counted(self):
+		"""Cancelling the last booking decrements the count and falls back to the previous date"""
+		make_booking(self.meeting_type, self.host, self.customer, start=self.start)
+		last = make_booking(self.meeting_type, self.host, self.customer, start=add_days(self.start, 7))
+
+		last.booking_status = "Cancelled"
+		last.save(ignore_permissions=True)
+		self.assertEqual(self.get_stats(), (1, getdate(self.start)))
+
+		last.booking_status = "New Booking"
+		last.save(ignore_permissions=True)
+		self.assertEqual(self.get_stats(), (2, getdate(last.start_datetime)))
+
+	def test_status_flagged_cancelled_is_not_counted(self):
+		"""Any status marked Is Cancelled in the status table is left out of the stats"""
+		frappe.get_doc({
+			"doctype": "MM Booking Status",
+			"status": "Test Withdrawn",
+			"color": "#000000",
+			"is_final": 1,
+			"is_cancelled": 1
+		}).insert(ignore_permissions=True)
+		booking = make_booking(self.meeting_type, self.host, self.customer, start=self.start)
+
+		booking.booking_status = "Test Withdrawn"
+		booking.save(ignore_permissions=True)
+		self.assertEqual(self.get_stats(), (0, None))
+
+		reconcile_customer_booking_stats()
+		self.assertEqual(self.get_stats(), (0, None))
+
+	def test_unrelated_change_keeps_stats(self):
+		"""Saves that do not touch customer, status or date leave the counters alone"""
+		booking = make_booking(self.meeting_type, self.host, self.customer, start=self.start)
+
+		booking.meeting_title = "Renamed"
+		booking.save(ignore_permissions=True)
+
+		self.assertEqual(self.get_stats(), (1, getdate(self.start)))
+
+	def test_customer_change_moves_booking(self):
+		"""Changing the customer moves the booking between the two contacts' stats"""
+		booking = make_booking(self.meeting_type, self.host, self.customer, start=self.start)
+		other = make_customer().name
+
+		booking.customer = other
+		booking.save(ignore_permissions=True)
+
+		self.assertEqual(self.get_stats(), (0, None))
+		self.assertEqual(self.get_stats(other), (1, getdate(self.start)))
+
+	def test_deleted_booking_is_removed_from_stats(self):
+		booking = make_booking(self.meeting_type, self.host, self.customer, start=self.start)
+
+		frappe.delete_doc("MM Meeting Booking", booking.name, ignore_permissions=True, force=True)
+
+		self.assertEqual(self.get_stats(), (0, None))
+
+	def test_reconcile_repairs_drift(self):
+		"""The daily reconcile recomputes counters that drifted"""
+		make_booking(self.meeting_type, self.host, self.customer, start=self.start)
+		frappe.db.set_value(
+			"Contact", self.customer, {"mm_total_bookings": 7, "mm_last_booking_date": None},
+			update_modified=False
+		)
+
+		reconcile_customer_booking_stats()
+
+		self.assertEqual(self.get_stats(), (1, getdate(self.start)))
+
+	def test_contact_permission_follows_bookings(self):
+		"""Members may open contacts they host; the answer is reused for the rest of the request"""
+		make_booking(self.meeting_type, self.host, self.customer, start=self.start)
+		outsider = make_test_user("mm-outsider")
+		make_department([outsider])
+		contact = frappe.get_doc("Contact", self.customer)
+
+		# Start of a new request
+		frappe.local.mm_contact_permission = {}
+
+		self.assertTrue(permissions.has_contact_permission(contact, "read", self.host))
+		self.assertFalse(permissions.has_contact_permission(contact, "read", outsider))
+
+		with patch.object(permissions, "_can_access_contact") as can_access_contact:
+			self.assertTrue(permissions.has_contact_permission(contact, "read", self.host))
+
+		can_access_contact.assert_not_called()
+
+	def test_meeting_type_department_change_refreshes_bookings(self):
+		"""Bookings follow the new department, and dashboards and search are refreshed"""
+		booking = make_booking(self.meeting_type, self.host, self.customer, start=self.start)
+		other = make_department([self.host]).name
+		generation = get_cache_generation()
+
+		meeting_type = frappe.get_doc("MM Meeting Type", self.meeting_type)
+		meeting_type.department = other
+		with patch("frappe.enqueue") as enqueue:
+			meeting_type.save(ignore_permissions=True)
+
+		self.assertEqual(frappe.db.get_value("MM Meeting Booking", booking.name, "department"), other)
+		self.assertNotEqual(get_cache_generation(), generation)
+		enqueue.assert_called_once()
+		self.assertEqual(
+			enqueue.call_args.args[0],
+			"meeting_manager.meeting_manager.services.search_index.reindex_meeting_type_bookings"
+		)
+
+	def test_week_load_counts_seven_days(self):
+		"""Least Busy counts the scheduled date and the 6 days after it"""
+		for days in (0, 6, 7):
+			make_booking(self.meeting_type, self.host, start=add_days(self.start, days))
+
+		candidates = get_candidate_features(self.department.department_members, None, getdate(self.start))
+
+		self.assertEqual(candidates[0].week_load, 2)
+
+	def test_rebalance_keeps_moves_saved_before_a_failure(self):
+		"""A move that fails is rolled back and reported, the others stay applied"""
+		co_host = make_test_user("mm-co-host")
+		idle = make_test_user("mm-idle")
+		department = make_department([self.host, co_host, idle]).name
+		meeting_type = make_meeting_type(department).name
+
+		bookings = [
+			make_booking(meeting_type, self.host, start=add_to_date(self.start, hours=hour)).name
+			for hour in range(3)
+		]
+		# The co-host's meeting counts towards their load, as in the assignment statistics
+		shared = make_booking(meeting_type, self.host, start=add_to_date(self.start, hours=3), assigned_users=[
+			{"user": self.host, "is_primary_host": 1},
+			{"user": co_host, "is_primary_host": 0}
+		]).name
+
+		def reassign(booking_id, new_assigned_to, reason=None):
+			frappe.db.set_value("MM Meeting Booking", booking_id, "meeting_title", "Moved")
+			if booking_id == bookings[2]:
+				frappe.throw("Conflict")
+
+		with (
+			patch(
+				"meeting_manager.meeting_manager.api.assignment.check_members_availability",
+				side_effect=lambda members, *args, **kwargs: {m: {"available": True} for m in members}
+			),
+			patch("meeting_manager.meeting_manager.api.booking.reassign_booking", side_effect=reassign)
+		):
+			result = rebalance_assignments(department, dry_run=0)
+
+		self.assertEqual(result["total_assignments"], 5)
+		# The latest booking goes to the idle member; the co-host cannot receive the shared one
+		self.assertEqual([m["booking"] for m in result["moves"]], [shared, bookings[2]])
+		self.assertEqual(result["moves"][0]["to_member"], idle)
+		self.assertEqual(result["applied_moves"], [shared])
+		self.assertEqual([m["booking"] for m in result["failed_moves"]], [bookings[2]])
+		self.assertEqual(result["projected_load"][self.host], 3)
+		self.assertEqual(frappe.db.get_value("MM Meeting Booking", shared, "meeting_title"), "Moved")
+		self.assertEqual(frappe.db.get_value("MM Meeting Booking", bookings[2], "meeting_title"), "Test Booking")
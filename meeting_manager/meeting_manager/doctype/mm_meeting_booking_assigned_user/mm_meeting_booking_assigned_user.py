@@ -23,3 +23,8 @@ class MMMeetingBookingAssignedUser(Document):
 		"""Auto-set assigned_by to current user if not already set"""
 		if not self.assigned_by:
 			self.assigned_by = frappe.session.user
+
+
+def on_doctype_update():
+	"""Index for permission checks and scope filters that start from the user"""
+	frappe.db.add_index("MM Meeting Booking Assigned User", ["user", "parent"])
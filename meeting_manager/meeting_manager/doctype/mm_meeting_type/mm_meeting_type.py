@@ -19,6 +19,51 @@ class MMMeetingType(Document):
 		self.validate_location_settings()
 		self.set_public_booking_url()
 
+	def on_update(self):
+		"""Propagate changes that bookings depend on"""
+		old_doc = self.get_doc_before_save()
+
+		# Bookings carry the department of their meeting type
+		if old_doc and old_doc.department != self.department:
+			frappe.db.sql("""
+				UPDATE `tabMM Meeting Booking`
+				SET department = %(department)s
+				WHERE meeting_type = %(meeting_type)s
+			""", {"department": self.department, "meeting_type": self.name})
+
+			# The raw UPDATE skips the booking hooks; refresh what they would have
+			from meeting_manager.meeting_manager.api.dashboard import clear_dashboard_cache
+			clear_dashboard_cache()
+
+			frappe.enqueue(
+				"meeting_manager.meeting_manager.services.search_index.reindex_meeting_type_bookings",
+				queue="long",
+				job_id=f"mm_search_index:meeting_type_bookings:{self.name}",
+				deduplicate=True,
+				enqueue_after_commit=True,
+				meeting_type=self.name
+			)
+
+		# Reschedule reminders of upcoming bookings when the reminder schedule changes
+		if old_doc and self.get_reminder_schedule_signature(old_doc) != self.get_reminder_schedule_signature(self):
+			frappe.enqueue(
+				"meeting_manager.meeting_manager.services.reminder_service.reschedule_meeting_type_reminders",
+				queue="long",
+				job_id=f"reschedule_reminders:{self.name}",
+				deduplicate=True,
+				enqueue_after_commit=True,
+				meeting_type=self.name
+			)
+
+	@staticmethod
+	def get_reminder_schedule_signature(doc):
+		"""Active reminder rows as a comparable set"""
+		return {
+			(r.hours_before_meeting, r.notification_type)
+			for r in (doc.reminder_schedule or [])
+			if r.is_active
+		}
+
 	def set_created_by(self):
 		"""Auto-set created_by to current user if not already set"""
 		if not self.created_by and self.is_new():
@@ -0,0 +1,14 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+
+
+class MMNotificationOutbox(Document):
+	pass
+
+
+def on_doctype_update():
+	"""Index for the outbox flush"""
+	frappe.db.add_index("MM Notification Outbox", ["status", "creation"])
@@ -0,0 +1,139 @@
+# Copyright (c) 2026, Best Security and Contributors
+# See license.txt
+
+import socket
+from unittest.mock import patch
+
+import frappe
+from aiosmtpd.controller import Controller
+from frappe.tests import IntegrationTestCase
+
+from meeting_manager.meeting_manager.services import notification_outbox
+from meeting_manager.meeting_manager.services.notification_outbox import (
+	flush_notification_outbox,
+	queue_email,
+)
+
+# On IntegrationTestCase, the doctype test records and all
+# link-field test record dependencies are recursively loaded
+# Use these module variables to add/remove to/from that list
+EXTRA_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
+IGNORE_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
+
+REJECTED_RECIPIENT = "rejected@example.com"
+
+
+class RecordingHandler:
+	"""aiosmtpd handler that keeps received messages and refuses REJECTED_RECIPIENT"""
+
+	def __init__(self):
+		self.messages = []
+
+	async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+		if address == REJECTED_RECIPIENT:
+			return "550 Mailbox unavailable"
+		envelope.rcpt_tos.append(address)
+		return "250 OK"
+
+	async def handle_DATA(self, server, session, envelope):
+		self.messages.append(envelope)
+		return "250 Message accepted for delivery"
+
+
+def get_free_port():
+	with socket.socket() as sock:
+		sock.bind(("127.0.0.1", 0))
+		return sock.getsockname()[1]
+
+
+class IntegrationTestMMNotificationOutbox(IntegrationTestCase):
+	"""
+	Integration tests for MMNotificationOutbox.
+	Use this class for testing interactions between multiple components.
+	"""
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.handler = RecordingHandler()
+		cls.smtp = Controller(cls.handler, hostname="127.0.0.1", port=get_free_port())
+		cls.smtp.start()
+
+	@classmethod
+	def tearDownClass(cls):
+		cls.smtp.stop()
+		super().tearDownClass()
+
+	def setUp(self):
+		self.handler.messages.clear()
+		self.recipient = f"customer-{frappe.generate_hash(length=8)}@example.com"
+
+		account = frappe.new_doc("Email Account")
+		account.update({"email_account_name": "Meetings", "email_id": "meetings@example.com", "enable_outgoing": 1})
+		account.name = "Meetings"
+
+		for patcher in (
+			patch.dict(frappe.conf, {
+				"mm_notification_outbox": 1,
+				"mute_emails": 0,
+				"mm_outbox_smtp_server": {"server": self.smtp.hostname, "port": self.smtp.port}
+			}),
+			patch.dict(frappe.flags, {"mute_emails": False}),
+			patch.object(notification_outbox, "_get_outgoing_email_account", return_value=account),
+			# The flush is called directly; no background job is needed
+			patch("frappe.enqueue"),
+		):
+			patcher.start()
+			self.addCleanup(patcher.stop)
+
+	def tearDown(self):
+		# The flush commits after each batch, so clean up explicitly
+		frappe.db.rollback()
+		frappe.db.delete("MM Notification Outbox", {"recipient": ["in", [self.recipient, REJECTED_RECIPIENT]]})
+		frappe.db.commit()
+
+	def test_outbox_is_off_by_default(self):
+		with patch.dict(frappe.conf, {"mm_notification_outbox": None}):
+			self.assertFalse(notification_outbox.is_outbox_enabled())
+
+	def test_flush_sends_over_smtp(self):
+		"""Queued messages are delivered, identical ones to the same recipient only once"""
+		first = queue_email(self.recipient, "Booking confirmed", "<p>See you soon</p>")
+		duplicate = queue_email(self.recipient, "Booking confirmed", "<p>See you soon</p>")
+		reminder = queue_email(self.recipient, "Reminder", "<p>Tomorrow at 10:00</p>")
+
+		flush_notification_outbox()
+
+		self.assertEqual(len(self.handler.messages), 2)
+		self.assertEqual({tuple(m.rcpt_tos) for m in self.handler.messages}, {(self.recipient,)})
+		self.assertIn(b"Subject: Reminder", b"".join(m.original_content for m in self.handler.messages))
+		for name in (first, duplicate, reminder):
+			self.assertEqual(
+				frappe.db.get_value("MM Notification Outbox", name, ["status", "attempts"]),
+				("Sent", 1)
+			)
+
+	def test_rejected_message_is_retried(self):
+		"""A message the server refuses is queued again with its error, the rest are sent"""
+		rejected = queue_email(REJECTED_RECIPIENT, "Booking confirmed", "<p>See you soon</p>")
+		accepted = queue_email(self.recipient, "Booking confirmed", "<p>See you soon</p>")
+
+		flush_notification_outbox()
+
+		self.assertEqual([m.rcpt_tos for m in self.handler.messages], [[self.recipient]])
+		self.assertEqual(frappe.db.get_value("MM Notification Outbox", accepted, "status"), "Sent")
+
+		status, attempts, error = frappe.db.get_value(
+			"MM Notification Outbox", rejected, ["status", "attempts", "error"]
+		)
+		self.assertEqual((status, attempts), ("Queued", 1))
+		self.assertIn("Mailbox unavailable", error)
+
+	def test_muted_emails_are_not_sent(self):
+		name = queue_email(self.recipient, "Booking confirmed", "<p>See you soon</p>")
+
+		with patch.dict(frappe.flags, {"mute_emails": True}):
+			flush_notification_outbox()
+
+		self.assertEqual(self.handler.messages, [])
+		self.assertEqual(frappe.db.get_value("MM Notification Outbox", name, "status"), "Queued")
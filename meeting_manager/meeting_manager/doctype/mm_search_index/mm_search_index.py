@@ -0,0 +1,22 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+
+
+class MMSearchIndex(Document):
+	pass
+
+
+def on_doctype_update():
+	"""Lookup and FULLTEXT indexes for the search index"""
+	frappe.db.add_unique("MM Search Index", ["reference_doctype", "reference_name"], constraint_name="unique_search_reference")
+
+	# FULLTEXT is MariaDB only; other databases fall back to LIKE on content
+	if frappe.db.db_type != "mariadb":
+		return
+
+	for index_name, columns in (("title_fulltext", "title"), ("search_fulltext", "title, content")):
+		if not frappe.db.has_index("tabMM Search Index", index_name):
+			frappe.db.sql_ddl(f"ALTER TABLE `tabMM Search Index` ADD FULLTEXT INDEX `{index_name}` ({columns})")
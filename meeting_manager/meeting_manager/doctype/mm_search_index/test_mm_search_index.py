@@ -0,0 +1,39 @@
+# Copyright (c) 2026, Best Security and Contributors
+# See license.txt
+
+from frappe.tests import IntegrationTestCase
+
+from meeting_manager.meeting_manager.services.search_index import get_search_condition
+
+# On IntegrationTestCase, the doctype test records and all
+# link-field test record dependencies are recursively loaded
+# Use these module variables to add/remove to/from that list
+EXTRA_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
+IGNORE_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
+
+
+class IntegrationTestMMSearchIndex(IntegrationTestCase):
+	"""
+	Integration tests for MMSearchIndex.
+	Use this class for testing interactions between multiple components.
+	"""
+
+	def test_short_words_are_matched_with_like(self):
+		"""Words below the FULLTEXT token size still restrict the results next to longer words"""
+		condition = get_search_condition("Jo Andersen")
+
+		self.assertEqual(condition["params"], {"search_query": "+andersen*", "search_like_0": "%jo%"})
+		self.assertIn("MATCH(si.title, si.content)", condition["where"])
+		self.assertIn("si.content LIKE %(search_like_0)s", condition["where"])
+
+	def test_only_short_words_scan_the_documents(self):
+		condition = get_search_condition("jo 42")
+
+		self.assertEqual(condition["params"], {"search_like_0": "%jo%", "search_like_1": "%42%"})
+		self.assertNotIn("MATCH", condition["where"])
+		self.assertFalse(condition["can_relax"])
+
+	def test_relaxed_query_keeps_short_words(self):
+		condition = get_search_condition("Jo Andersson", relaxed=True)
+
+		self.assertEqual(condition["params"], {"search_query": "+anderss*", "search_like_0": "%jo%"})
@@ -13,8 +13,7 @@ class MMUserBlockedSlot(Document):
 		self.validate_reason()
 		self.validate_times()
 		self.validate_not_past()
-		self.validate_no_overlap_with_own_blocked_slots()
-		self.validate_no_overlap_with_meetings()
+		self.validate_no_conflicts()
 		self.validate_user_permission()
 
 	def before_delete(self):
@@ -61,111 +60,155 @@ class MMUserBlockedSlot(Document):
 				)
 			)
 
-	def validate_no_overlap_with_own_blocked_slots(self):
-		"""Ensure no overlapping blocked slots for the same user on the same date"""
-		existing_slots = frappe.get_all(
-			"MM User Blocked Slot",
-			filters={
-				"user": self.user,
-				"blocked_date": self.blocked_date,
-				"name": ["!=", self.name or ""]
-			},
-			fields=["name", "start_time", "end_time"]
+	def validate_no_conflicts(self):
+		"""Ensure the slot overlaps neither the user's other blocked slots nor their meetings"""
+		conflicts = get_blocked_slot_conflicts(
+			self.user,
+			[{"blocked_date": self.blocked_date, "start_time": self.start_time, "end_time": self.end_time}],
+			exclude_name=self.name
 		)
+		if conflicts:
+			frappe.throw(conflicts[0]["message"])
 
-		if not existing_slots:
-			return
+	def validate_user_permission(self):
+		"""Validate user has permission to create/modify this blocked slot"""
+		check_blocked_slot_permission(self.user)
 
-		new_start = get_time(self.start_time)
-		new_end = get_time(self.end_time)
 
-		for slot in existing_slots:
-			existing_start = get_time(slot.start_time)
-			existing_end = get_time(slot.end_time)
+def check_blocked_slot_permission(user):
+	"""
+	Check the session user may manage the blocked slots of a user
 
-			# Check for overlap: NOT (new_end <= existing_start OR new_start >= existing_end)
-			if not (new_end <= existing_start or new_start >= existing_end):
-				frappe.throw(
-					_("This blocked slot overlaps with existing slot {0} ({1} - {2})").format(
-						slot.name, slot.start_time, slot.end_time
-					)
-				)
+	Args:
+		user (str): Owner of the blocked slots
+	"""
+	current_user = frappe.session.user
+
+	# System Manager can manage any user's blocks
+	if "System Manager" in frappe.get_roles(current_user):
+		return
 
-	def validate_no_overlap_with_meetings(self):
-		"""Ensure blocked slot does not overlap with any existing meetings for this user"""
-		block_date = getdate(self.blocked_date)
-		block_start = get_datetime(f"{self.blocked_date} {self.start_time}")
-		block_end = get_datetime(f"{self.blocked_date} {self.end_time}")
-
-		# Find meetings where the user is the creator
-		creator_meetings = frappe.get_all(
-			"MM Meeting Booking",
-			filters={
-				"created_by": self.user,
-				"booking_status": ["not in", ["Cancelled", "No-Show"]],
-				"start_datetime": ["<=", block_end],
-				"end_datetime": [">=", block_start],
-			},
-			fields=["name", "start_datetime", "end_datetime", "booking_status"]
+	# Department Leader can manage their team's blocks
+	if "MM Department Leader" in frappe.get_roles(current_user):
+		# Check if target user is in a department led by current user
+		led_depts = frappe.get_all(
+			"MM Department",
+			filters={"department_leader": current_user, "is_active": 1},
+			pluck="name"
 		)
 
-		# Find meetings where the user is an assigned member
-		assigned_meetings = frappe.db.sql("""
-			SELECT b.name, b.start_datetime, b.end_datetime, b.booking_status
-			FROM `tabMM Meeting Booking` b
-			INNER JOIN `tabMM Meeting Booking Assigned User` a ON a.parent = b.name
-			WHERE a.user = %(user)s
-			AND b.booking_status NOT IN ('Cancelled', 'No-Show')
-			AND b.start_datetime <= %(block_end)s
-			AND b.end_datetime >= %(block_start)s
-			AND b.name NOT IN %(exclude_names)s
-		""", {
-			"user": self.user,
-			"block_end": block_end,
-			"block_start": block_start,
-			"exclude_names": [m.name for m in creator_meetings] if creator_meetings else ["__none__"],
-		}, as_dict=True)
-
-		conflicting = creator_meetings + assigned_meetings
-
-		if conflicting:
-			meeting = conflicting[0]
-			start_str = frappe.utils.format_datetime(meeting.start_datetime, "HH:mm")
-			end_str = frappe.utils.format_datetime(meeting.end_datetime, "HH:mm")
-			frappe.throw(
-				_("Cannot block this time — it conflicts with meeting {0} ({1} – {2}, status: {3}). "
-				  "Please cancel or reschedule the meeting first.").format(
-					meeting.name, start_str, end_str, meeting.booking_status
-				)
-			)
+		if led_depts:
+			user_in_led_dept = frappe.db.exists("MM Department Member", {
+				"parent": ["in", led_depts],
+				"member": user,
+				"is_active": 1
+			})
 
-	def validate_user_permission(self):
-		"""Validate user has permission to create/modify this blocked slot"""
-		current_user = frappe.session.user
+			if user_in_led_dept or user == current_user:
+				return
 
-		# System Manager can manage any user's blocks
-		if "System Manager" in frappe.get_roles(current_user):
-			return
+	# Department Member can only manage their own blocks
+	if user != current_user:
+		frappe.throw(_("You can only manage your own blocked slots"))
 
-		# Department Leader can manage their team's blocks
-		if "MM Department Leader" in frappe.get_roles(current_user):
-			# Check if target user is in a department led by current user
-			led_depts = frappe.get_all(
-				"MM Department",
-				filters={"department_leader": current_user, "is_active": 1},
-				pluck="name"
-			)
 
-			if led_depts:
-				user_in_led_dept = frappe.db.exists("MM Department Member", {
-					"parent": ["in", led_depts],
-					"member": self.user,
-					"is_active": 1
-				})
+def get_blocked_slot_conflicts(user, slots, exclude_name=None):
+	"""
+	Check blocked slots of a user against their other blocked slots and meetings
+
+	Existing slots and meetings are loaded with one range query each for all
+	slots, so a recurring block costs the same number of queries as one slot.
 
-				if user_in_led_dept or self.user == current_user:
-					return
+	Args:
+		user (str): Owner of the blocked slots
+		slots (list): Dicts with blocked_date, start_time, end_time
+		exclude_name (str, optional): Blocked slot being updated
+
+	Returns:
+		list: [{"index": position in slots, "message": str}], first conflict per slot
+	"""
+	if not slots:
+		return []
+
+	dates = [getdate(slot["blocked_date"]) for slot in slots]
+	ranges = [
+		(
+			get_datetime(f"{getdate(slot['blocked_date'])} {slot['start_time']}"),
+			get_datetime(f"{getdate(slot['blocked_date'])} {slot['end_time']}")
+		)
+		for slot in slots
+	]
+
+	existing_slots = {}
+	for slot in frappe.get_all(
+		"MM User Blocked Slot",
+		filters={
+			"user": user,
+			"blocked_date": ["between", [min(dates), max(dates)]],
+			"name": ["!=", exclude_name or ""]
+		},
+		fields=["name", "blocked_date", "start_time", "end_time"]
+	):
+		existing_slots.setdefault(getdate(slot.blocked_date), []).append(slot)
+
+	# Meetings the user created or is assigned to
+	meetings = frappe.db.sql("""
+		SELECT b.name, b.start_datetime, b.end_datetime, b.booking_status
+		FROM `tabMM Meeting Booking` b
+		WHERE b.created_by = %(user)s
+			AND b.booking_status NOT IN ('Cancelled', 'No-Show')
+			AND b.start_datetime <= %(range_end)s
+			AND b.end_datetime >= %(range_start)s
+		UNION
+		SELECT b.name, b.start_datetime, b.end_datetime, b.booking_status
+		FROM `tabMM Meeting Booking` b
+		INNER JOIN `tabMM Meeting Booking Assigned User` a ON a.parent = b.name
+		WHERE a.user = %(user)s
+			AND b.booking_status NOT IN ('Cancelled', 'No-Show')
+			AND b.start_datetime <= %(range_end)s
+			AND b.end_datetime >= %(range_start)s
+		ORDER BY start_datetime
+	""", {
+		"user": user,
+		"range_start": min(start for start, _ in ranges),
+		"range_end": max(end for _, end in ranges),
+	}, as_dict=True)
+
+	conflicts = []
+	for index, slot in enumerate(slots):
+		new_start = get_time(slot["start_time"])
+		new_end = get_time(slot["end_time"])
+		block_start, block_end = ranges[index]
+
+		message = None
+		for existing in existing_slots.get(dates[index], []):
+			existing_start = get_time(existing.start_time)
+			existing_end = get_time(existing.end_time)
 
-		# Department Member can only manage their own blocks
-		if self.user != current_user:
-			frappe.throw(_("You can only manage your own blocked slots"))
+			# Check for overlap: NOT (new_end <= existing_start OR new_start >= existing_end)
+			if not (new_end <= existing_start or new_start >= existing_end):
+				message = _("This blocked slot overlaps with existing slot {0} ({1} - {2})").format(
+					existing.name, existing.start_time, existing.end_time
+				)
+				break
+
+		if not message:
+			meeting = next(
+				(
+					m for m in meetings
+					if get_datetime(m.start_datetime) <= block_end and get_datetime(m.end_datetime) >= block_start
+				),
+				None
+			)
+			if meeting:
+				start_str = frappe.utils.format_datetime(meeting.start_datetime, "HH:mm")
+				end_str = frappe.utils.format_datetime(meeting.end_datetime, "HH:mm")
+				message = _(
+					"Cannot block this time — it conflicts with meeting {0} ({1} – {2}, status: {3}). "
+					"Please cancel or reschedule the meeting first."
+				).format(meeting.name, start_str, end_str, meeting.booking_status)
+
+		if message:
+			conflicts.append({"index": index, "message": message})
+
+	return conflicts
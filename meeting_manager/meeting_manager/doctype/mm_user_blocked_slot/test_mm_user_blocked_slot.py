@@ -0,0 +1,133 @@
+# Copyright (c) 2026, Best Security and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests import IntegrationTestCase
+from frappe.utils import add_days, getdate
+
+from meeting_manager.meeting_manager.doctype.mm_booking_status.mm_booking_status import seed_default_statuses
+from meeting_manager.meeting_manager.doctype.mm_department.test_mm_department import (
+	make_department,
+	make_test_user,
+)
+from meeting_manager.meeting_manager.doctype.mm_meeting_booking.test_mm_meeting_booking import (
+	make_booking,
+	make_meeting_type,
+)
+from meeting_manager.meeting_manager.doctype.mm_user_blocked_slot.mm_user_blocked_slot import (
+	get_blocked_slot_conflicts,
+)
+from meeting_manager.meeting_manager.page.mm_enhanced_calendar.api import create_recurring_blocked_slots
+
+# On IntegrationTestCase, the doctype test records and all
+# link-field test record dependencies are recursively loaded
+# Use these module variables to add/remove to/from that list
+EXTRA_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
+IGNORE_TEST_RECORD_DEPENDENCIES = []  # eg. ["User"]
+
+# create_recurring_blocked_slots commits; its slots are found and removed by this reason
+TEST_REASON = "Recurring blocked slot test"
+
+
+def make_blocked_slot(user, blocked_date, start_time, end_time, reason=TEST_REASON):
+	return frappe.get_doc({
+		"doctype": "MM User Blocked Slot",
+		"user": user,
+		"blocked_date": blocked_date,
+		"start_time": start_time,
+		"end_time": end_time,
+		"reason": reason
+	}).insert(ignore_permissions=True)
+
+
+class IntegrationTestMMUserBlockedSlot(IntegrationTestCase):
+	"""
+	Integration tests for MMUserBlockedSlot.
+	Use this class for testing interactions between multiple components.
+	"""
+
+	def tearDown(self):
+		frappe.db.rollback()
+		frappe.db.delete("MM User Blocked Slot", {"reason": TEST_REASON})
+		frappe.db.commit()
+
+	def test_recurring_slots_are_created_per_occurrence(self):
+		result = create_recurring_blocked_slots(
+			"Administrator", "2030-01-07", "09:00", "10:00", TEST_REASON, "FREQ=WEEKLY;COUNT=3"
+		)
+
+		self.assertTrue(result["success"], result["message"])
+		self.assertEqual(
+			[slot["blocked_date"] for slot in result["blocked_slots"]],
+			["2030-01-07", "2030-01-14", "2030-01-21"]
+		)
+		self.assertEqual(frappe.db.count("MM User Blocked Slot", {"reason": TEST_REASON}), 3)
+
+	def test_conflicting_occurrence_blocks_the_series(self):
+		"""Without skip_conflicts nothing is created when one occurrence conflicts"""
+		existing = make_blocked_slot("Administrator", "2030-01-14", "09:30", "10:30")
+
+		result = create_recurring_blocked_slots(
+			"Administrator", "2030-01-07", "09:00", "10:00", TEST_REASON, "FREQ=WEEKLY;COUNT=3"
+		)
+
+		self.assertFalse(result["success"])
+		self.assertEqual([c["blocked_date"] for c in result["conflicts"]], ["2030-01-14"])
+		self.assertIn(existing.name, result["conflicts"][0]["message"])
+		self.assertEqual(frappe.db.count("MM User Blocked Slot", {"reason": TEST_REASON}), 1)
+
+	def test_skip_conflicts_creates_free_occurrences(self):
+		"""With skip_conflicts the free occurrences are created and the conflicts reported"""
+		make_blocked_slot("Administrator", "2030-01-14", "09:30", "10:30")
+
+		result = create_recurring_blocked_slots(
+			"Administrator", "2030-01-07", "09:00", "10:00", TEST_REASON, "FREQ=WEEKLY;COUNT=3",
+			skip_conflicts=1
+		)
+
+		self.assertTrue(result["success"], result["message"])
+		self.assertEqual(
+			[slot["blocked_date"] for slot in result["blocked_slots"]],
+			["2030-01-07", "2030-01-21"]
+		)
+		self.assertEqual([c["blocked_date"] for c in result["conflicts"]], ["2030-01-14"])
+
+	def test_open_ended_rule_is_rejected(self):
+		result = create_recurring_blocked_slots(
+			"Administrator", "2030-01-07", "09:00", "10:00", TEST_REASON, "FREQ=WEEKLY"
+		)
+
+		self.assertFalse(result["success"])
+		self.assertEqual(frappe.db.count("MM User Blocked Slot", {"reason": TEST_REASON}), 0)
+
+	def test_adjacent_slots_do_not_conflict(self):
+		make_blocked_slot("Administrator", "2030-01-14", "09:00", "10:00")
+
+		conflicts = get_blocked_slot_conflicts("Administrator", [
+			{"blocked_date": "2030-01-14", "start_time": "10:00", "end_time": "11:00"},
+			{"blocked_date": "2030-01-14", "start_time": "08:00", "end_time": "09:00"}
+		])
+
+		self.assertEqual(conflicts, [])
+
+	def test_meetings_of_the_user_conflict(self):
+		"""Occurrences overlapping the user's meetings conflict; cancelled meetings do not"""
+		seed_default_statuses()
+		host = make_test_user("mm-host")
+		meeting_type = make_meeting_type(make_department([host]).name).name
+
+		booking = make_booking(meeting_type, host)
+		cancelled = make_booking(meeting_type, host, start=add_days(booking.start_datetime, 7))
+		cancelled.booking_status = "Cancelled"
+		cancelled.save(ignore_permissions=True)
+
+		booking_date = getdate(booking.start_datetime)
+		slots = [
+			{"blocked_date": booking_date, "start_time": "09:45", "end_time": "10:15"},
+			{"blocked_date": add_days(booking_date, 7), "start_time": "09:45", "end_time": "10:15"}
+		]
+
+		conflicts = get_blocked_slot_conflicts(host, slots)
+
+		self.assertEqual([c["index"] for c in conflicts], [0])
+		self.assertIn(booking.name, conflicts[0]["message"])
@@ -39,15 +39,19 @@ def get_user_role_level():
         return ("guest", "Guest")
 
 
-def get_user_departments():
+def get_user_departments(role_level=None):
     """
     Get departments the current user has access to based on their role.
 
+    Args:
+        role_level (str, optional): Role level from get_user_role_level, if already known
+
     Returns:
         list: List of department dicts with access info
     """
     user = frappe.session.user
-    role_level, _role_name = get_user_role_level()
+    if not role_level:
+        role_level, _role_name = get_user_role_level()
 
     departments = []
 
@@ -151,31 +155,30 @@ def get_user_context():
     }
 
 
-@frappe.whitelist()
-def get_calendar_resources(departments=None, focus_department=None):
+def _get_calendar_scope(departments=None, focus_department=None):
     """
-    Get team members as calendar resources based on user role and filters.
+    Resolve the current user's role and the departments shown in the calendar.
 
     Args:
-        departments (str): JSON array of department IDs to include (Mode 1)
+        departments (str|list): JSON array of department IDs to include (Mode 1)
         focus_department (str): Single department ID to focus on (Mode 2)
 
     Returns:
-        list: Calendar resources
+        frappe._dict: {
+            "user": str,
+            "role_level": str,
+            "department_names": {department: department_name} of accessible departments,
+            "led_dept_names": [...],
+            "target_depts": [...]  # Departments to show, in display order
+        }
     """
-    user = frappe.session.user
-    role_level, _role_name = get_user_role_level()
-
-    # Parse departments filter
-    if departments:
-        if isinstance(departments, str):
-            departments = json.loads(departments)
+    if departments and isinstance(departments, str):
+        departments = json.loads(departments)
 
-    # Get user's accessible departments
-    accessible_depts = get_user_departments()
+    role_level, _role_name = get_user_role_level()
+    accessible_depts = get_user_departments(role_level)
     accessible_dept_names = [d["name"] for d in accessible_depts]
 
-    # Determine which departments to query
     if focus_department:
         # Focus mode - single department
         if focus_department not in accessible_dept_names:
@@ -188,59 +191,87 @@ def get_calendar_resources(departments=None, focus_department=None):
         # Default - all accessible departments
         target_depts = accessible_dept_names
 
-    if not target_depts:
-        return []
+    return frappe._dict({
+        "user": frappe.session.user,
+        "role_level": role_level,
+        "department_names": {d["name"]: d["department_name"] for d in accessible_depts},
+        "led_dept_names": [d["name"] for d in accessible_depts if d["is_leader"]],
+        "target_depts": target_depts
+    })
+
+
+@frappe.whitelist()
+def get_calendar_resources(departments=None, focus_department=None):
+    """
+    Get team members as calendar resources based on user role and filters.
+
+    Args:
+        departments (str): JSON array of department IDs to include (Mode 1)
+        focus_department (str): Single department ID to focus on (Mode 2)
+
+    Returns:
+        list: Calendar resources
+    """
+    return _get_calendar_resources(_get_calendar_scope(departments, focus_department))
 
-    resources = []
 
-    if role_level == "department_member":
+def _get_calendar_resources(scope):
+    """
+    Get the calendar resources of a resolved scope.
+
+    Members of several departments are listed once, under the first target
+    department they belong to.
+
+    Args:
+        scope (frappe._dict): Result of _get_calendar_scope
+
+    Returns:
+        list: [{"id", "title", "department", "department_name", "is_self"}]
+    """
+    if not scope.target_depts:
+        return []
+
+    if scope.role_level == "department_member":
         # Department members can only see themselves
-        user_full_name = frappe.db.get_value("User", user, "full_name") or user
-
-        # Find which of the target departments the user is in
-        for dept_name in target_depts:
-            is_member = frappe.db.exists("MM Department Member", {
-                "parent": dept_name,
-                "member": user,
-                "is_active": 1
-            })
-            if is_member:
-                dept_display = frappe.db.get_value("MM Department", dept_name, "department_name")
-                resources.append({
-                    "id": user,
-                    "title": user_full_name,
-                    "department": dept_name,
-                    "department_name": dept_display,
-                    "is_self": True
-                })
-                break  # Only show user once even if in multiple departments
+        members = frappe.db.sql("""
+            SELECT m.parent, m.member, u.full_name
+            FROM `tabMM Department Member` m
+            INNER JOIN `tabUser` u ON u.name = m.member
+            WHERE m.parent IN %(departments)s
+            AND m.member = %(user)s
+            AND m.is_active = 1
+        """, {"departments": scope.target_depts, "user": scope.user}, as_dict=True)
     else:
         # System Manager and Department Leader can see all members
-        for dept_name in target_depts:
-            dept_display = frappe.db.get_value("MM Department", dept_name, "department_name")
-
-            # Get active members of this department
-            members = frappe.db.sql("""
-                SELECT m.member, u.full_name
-                FROM `tabMM Department Member` m
-                INNER JOIN `tabUser` u ON u.name = m.member
-                WHERE m.parent = %s
-                AND m.is_active = 1
-                AND u.enabled = 1
-                ORDER BY u.full_name
-            """, (dept_name,), as_dict=True)
-
-            for member in members:
-                # Check if already added (user might be in multiple departments)
-                existing = next((r for r in resources if r["id"] == member.member), None)
-                if not existing:
-                    resources.append({
-                        "id": member.member,
-                        "title": member.full_name or member.member,
-                        "department": dept_name,
-                        "department_name": dept_display,
-                        "is_self": member.member == user
-                    })
+        members = frappe.db.sql("""
+            SELECT m.parent, m.member, u.full_name
+            FROM `tabMM Department Member` m
+            INNER JOIN `tabUser` u ON u.name = m.member
+            WHERE m.parent IN %(departments)s
+            AND m.is_active = 1
+            AND u.enabled = 1
+            ORDER BY u.full_name
+        """, {"departments": scope.target_depts}, as_dict=True)
+
+    members_by_dept = {}
+    for member in members:
+        members_by_dept.setdefault(member.parent, []).append(member)
+
+    resources = []
+    seen = set()
+    for dept_name in scope.target_depts:
+        for member in members_by_dept.get(dept_name, []):
+            # User might be in multiple departments
+            if member.member in seen:
+                continue
+            seen.add(member.member)
+            resources.append({
+                "id": member.member,
+                "title": member.full_name or member.member,
+                "department": dept_name,
+                "department_name": scope.department_names.get(dept_name),
+                "is_self": member.member == scope.user
+            })
 
     return resources
 
@@ -263,14 +294,51 @@ def get_calendar_events(start, end, departments=None, focus_department=None,
     Returns:
         list: FullCalendar event objects
     """
-    from datetime import datetime as dt
+    scope = _get_calendar_scope(departments, focus_department)
+    bookings, meeting_type_names = _get_calendar_bookings(
+        scope, start, end, meeting_types=meeting_types, statuses=statuses, services=services
+    )
 
-    user = frappe.session.user
-    role_level, _role_name = get_user_role_level()
+    user_names = _get_user_names(_get_booking_users(bookings))
+    color_map = _get_status_color_map()
+
+    events = []
+    for booking in bookings:
+        events.extend(_get_booking_events(
+            booking, user_names, scope.department_names, meeting_type_names, color_map
+        ))
+
+    return events
+
+
+def _get_calendar_bookings(scope, start, end, meeting_types=None, statuses=None, services=None):
+    """
+    Get the bookings of a resolved scope that the current user may see.
+
+    Hosts, participants, customer names and meeting type names are loaded
+    for all bookings at once. Each booking is returned once; users and
+    meeting types are referenced by ID.
+
+    Args:
+        scope (frappe._dict): Result of _get_calendar_scope
+        start (str): Start date (YYYY-MM-DD)
+        end (str): End date (YYYY-MM-DD)
+        meeting_types (str|list): Meeting type IDs
+        statuses (str|list): Status values
+        services (str|list): Service type values
 
+    Returns:
+        tuple: (bookings, {meeting type: meeting_name})
+            bookings: [{
+                "id", "title", "start", "end", "status", "customer_name",
+                "customer_email", "meeting_type", "department", "is_internal",
+                "service_type", "description", "duration", "can_reassign",
+                "host": primary host user,
+                "hosts": [{"user", "is_primary_host", "can_reschedule"}],
+                "participants": [user]  # Internal participants of team meetings who are not hosts
+            }]
+    """
     # Parse JSON parameters
-    if departments and isinstance(departments, str):
-        departments = json.loads(departments)
     if meeting_types and isinstance(meeting_types, str):
         meeting_types = json.loads(meeting_types)
     if statuses and isinstance(statuses, str):
@@ -278,28 +346,14 @@ def get_calendar_events(start, end, departments=None, focus_department=None,
     if services and isinstance(services, str):
         services = json.loads(services)
 
-    # Get user's accessible departments
-    accessible_depts = get_user_departments()
-    accessible_dept_names = [d["name"] for d in accessible_depts]
-    led_dept_names = [d["name"] for d in accessible_depts if d["is_leader"]]
-
-    # Determine target departments
-    if focus_department:
-        if focus_department not in accessible_dept_names:
-            frappe.throw(_("You don't have access to this department"))
-        target_depts = [focus_department]
-    elif departments:
-        target_depts = [d for d in departments if d in accessible_dept_names]
-    else:
-        target_depts = accessible_dept_names
-
-    if not target_depts:
-        return []
+    if not scope.target_depts:
+        return [], {}
 
     # Build filters for get_all query
     filters = {
         "start_datetime": [">=", start],
-        "end_datetime": ["<=", end]
+        "end_datetime": ["<=", end],
+        "department": ["in", scope.target_depts]
     }
 
     # Add meeting type filter (for focus mode)
@@ -333,63 +387,75 @@ def get_calendar_events(start, end, departments=None, focus_department=None,
             "meeting_title",
             "meeting_description",
             "is_internal",
-            "select_mkru"
+            "select_mkru",
+            "department"
         ],
         order_by="start_datetime asc",
         limit=500
     )
 
-    # Load color mapping from MM Status Color doctype
-    color_map = _get_status_color_map()
+    if not meetings:
+        return [], {}
 
-    # Build events list
-    events = []
-    for meeting in meetings:
-        # Get meeting type details (including department)
-        meeting_type_info = None
-        department = None
-        department_name = None
-        meeting_type_name = "Meeting"
-
-        if meeting.meeting_type:
-            meeting_type_info = frappe.db.get_value(
-                "MM Meeting Type",
-                meeting.meeting_type,
-                ["meeting_name", "department"],
-                as_dict=True
-            )
-            if meeting_type_info:
-                meeting_type_name = meeting_type_info.meeting_name
-                department = meeting_type_info.department
-                if department:
-                    department_name = frappe.db.get_value("MM Department", department, "department_name")
-
-        # Filter by department (since booking doesn't have direct department field)
-        if department not in target_depts:
-            continue
+    meeting_names = [m.name for m in meetings]
+
+    # Assigned users (hosts) and internal participants of all meetings
+    assigned_by_meeting = {}
+    for au in frappe.get_all(
+        "MM Meeting Booking Assigned User",
+        filters={"parent": ["in", meeting_names]},
+        fields=["parent", "user", "is_primary_host"],
+        order_by="is_primary_host desc, idx asc"
+    ):
+        assigned_by_meeting.setdefault(au.parent, []).append(au)
 
-        # Get assigned users from child table
-        assigned_users = frappe.get_all(
-            "MM Meeting Booking Assigned User",
-            filters={"parent": meeting.name},
-            fields=["user", "is_primary_host"],
-            order_by="is_primary_host desc"
+    participants_by_meeting = {}
+    for p in frappe.get_all(
+        "MM Meeting Booking Participant",
+        filters={
+            "parent": ["in", meeting_names],
+            "participant_type": "Internal"
+        },
+        fields=["parent", "user"],
+        order_by="idx asc"
+    ):
+        if p.user:
+            participants_by_meeting.setdefault(p.parent, []).append(p.user)
+
+    meeting_type_names = {
+        mt.name: mt.meeting_name
+        for mt in frappe.get_all(
+            "MM Meeting Type",
+            filters={"name": ["in", list({m.meeting_type for m in meetings if m.meeting_type})]},
+            fields=["name", "meeting_name"],
         )
+    }
 
-        # Get internal participants (team members invited to meeting)
-        internal_participants = frappe.get_all(
-            "MM Meeting Booking Participant",
-            filters={
-                "parent": meeting.name,
-                "participant_type": "Internal"
-            },
-            fields=["user"]
+    customer_ids = list({m.customer for m in meetings if m.customer})
+    customer_names = {
+        c.name: c.full_name
+        for c in frappe.get_all(
+            "Contact",
+            filters={"name": ["in", customer_ids]},
+            fields=["name", "full_name"],
         )
-        participant_users = [p.user for p in internal_participants if p.user]
+    } if customer_ids else {}
+
+    finalized_statuses = set(get_finalized_statuses())
+    user = scope.user
+    role_level = scope.role_level
+    led_dept_names = scope.led_dept_names
+
+    bookings = []
+    for meeting in meetings:
+        # Department is denormalized on the booking and already filtered in the query
+        department = meeting.department
+        assigned_users = assigned_by_meeting.get(meeting.name, [])
+        participant_users = list(dict.fromkeys(participants_by_meeting.get(meeting.name, [])))
 
         # Combined list of users who can see this meeting
         meeting_users = [au.user for au in assigned_users]
-        all_meeting_users = list(set(meeting_users + participant_users))
+        all_meeting_users = set(meeting_users + participant_users)
 
         # Role-based filtering
         if role_level == "department_member":
@@ -403,160 +469,230 @@ def get_calendar_events(start, end, departments=None, focus_department=None,
                 if user not in all_meeting_users:
                     continue
 
-        # Get customer name
-        customer_name = None
-        if meeting.customer:
-            customer_name = frappe.db.get_value("Contact", meeting.customer, "full_name")
-        if not customer_name:
-            customer_name = meeting.customer_email_at_booking or "Guest"
-
-        # Determine event title
-        event_title = meeting.meeting_title or f"{customer_name} - {meeting_type_name}"
-
-        # Get status color
-        event_color = color_map.get(meeting.booking_status, "#6b7280")
-
-        # Format datetime for FullCalendar
-        start_dt = meeting.start_datetime
-        end_dt = meeting.end_datetime
-
-        if isinstance(start_dt, str):
-            start_dt = dt.fromisoformat(start_dt.replace('Z', '+00:00'))
-        if isinstance(end_dt, str):
-            end_dt = dt.fromisoformat(end_dt.replace('Z', '+00:00'))
+        customer_name = customer_names.get(meeting.customer) or meeting.customer_email_at_booking or "Guest"
+        meeting_type_name = meeting_type_names.get(meeting.meeting_type) or "Meeting"
 
         # Determine if current user is a host (in assigned_users)
         is_current_user_host = user in meeting_users
 
-        # Get primary host info for display
-        primary_host_user = None
-        primary_host_name = None
-        for au in assigned_users:
-            if au.is_primary_host:
-                primary_host_user = au.user
-                primary_host_name = frappe.db.get_value("User", au.user, "full_name") or au.user
-                break
-        if not primary_host_user and assigned_users:
-            primary_host_user = assigned_users[0].user
-            primary_host_name = frappe.db.get_value("User", assigned_users[0].user, "full_name") or assigned_users[0].user
+        # Finalized bookings cannot be modified (Cancelled, Sale Approved, Not Possible, etc.)
+        is_finalized = meeting.booking_status in finalized_statuses
 
-        # Create event for each assigned user (host) resource
+        hosts = []
         for assigned_user in assigned_users:
-            # Finalized bookings cannot be modified (Cancelled, Sale Approved, Not Possible, etc.)
-            # Include legacy statuses for backwards compatibility
-            if meeting.booking_status in get_finalized_statuses():
-                can_reschedule = False
-                can_reassign = False
-            else:
-                # Determine if user can modify this booking
-                can_reschedule = check_can_reschedule_event(
+            hosts.append({
+                "user": assigned_user.user,
+                "is_primary_host": assigned_user.is_primary_host,
+                "can_reschedule": not is_finalized and check_can_reschedule_event(
                     department, assigned_user.user, meeting.is_internal,
                     user, role_level, led_dept_names, is_host=is_current_user_host
                 )
-                can_reassign = check_can_reassign_event(
-                    department, user, role_level, led_dept_names, is_internal=meeting.is_internal
-                )
+            })
 
-            user_full_name = frappe.db.get_value("User", assigned_user.user, "full_name") or assigned_user.user
-
-            event = {
-                "id": f"{meeting.name}-{assigned_user.user}",
-                "resourceId": assigned_user.user,
-                "title": event_title,
-                "start": start_dt.isoformat(),
-                "end": end_dt.isoformat(),
-                "backgroundColor": event_color,
-                "borderColor": event_color,
-                "textColor": "#ffffff",
-                "extendedProps": {
-                    "booking_id": meeting.name,
-                    "status": meeting.booking_status,
-                    "customer_name": customer_name,
-                    "customer_email": meeting.customer_email_at_booking,
-                    "meeting_type": meeting.meeting_type,
-                    "meeting_type_name": meeting_type_name,
-                    "department": department,
-                    "department_name": department_name,
-                    "assigned_to": assigned_user.user,
-                    "assigned_to_name": user_full_name,
-                    "is_primary_host": assigned_user.is_primary_host,
-                    "is_internal": meeting.is_internal,
-                    "service_type": meeting.select_mkru,
-                    "description": meeting.meeting_description,
-                    "duration": meeting.duration or 0,
-                    "can_reschedule": can_reschedule,
-                    "can_reassign": can_reassign,
-                    "is_participant": False,
-                    "host_user": primary_host_user,
-                    "host_name": primary_host_name
-                },
-                "editable": can_reschedule,
-                "resourceEditable": can_reassign
-            }
+        # Primary host, or the first host if none is marked
+        primary_host = next((au.user for au in assigned_users if au.is_primary_host), None)
+        if not primary_host and assigned_users:
+            primary_host = assigned_users[0].user
+
+        bookings.append({
+            "id": meeting.name,
+            "title": meeting.meeting_title or f"{customer_name} - {meeting_type_name}",
+            "start": get_datetime(meeting.start_datetime).isoformat(),
+            "end": get_datetime(meeting.end_datetime).isoformat(),
+            "status": meeting.booking_status,
+            "customer_name": customer_name,
+            "customer_email": meeting.customer_email_at_booking,
+            "meeting_type": meeting.meeting_type,
+            "department": department,
+            "is_internal": meeting.is_internal,
+            "service_type": meeting.select_mkru,
+            "description": meeting.meeting_description,
+            "duration": meeting.duration or 0,
+            "can_reassign": not is_finalized and check_can_reassign_event(
+                department, user, role_level, led_dept_names, is_internal=meeting.is_internal
+            ),
+            "host": primary_host,
+            "hosts": hosts,
+            # Team meeting participants get their own (read-only) events
+            "participants": [
+                p for p in participant_users if p not in meeting_users
+            ] if meeting.is_internal else []
+        })
 
-            # Add class for team meetings
-            if meeting.is_internal:
-                event["classNames"] = ["team-meeting"]
+    return bookings, meeting_type_names
 
-            events.append(event)
 
-        # For team meetings (is_internal), also create events for internal participants
-        # so they see the meeting on their calendar row
-        if meeting.is_internal and participant_users:
-            for participant_user in participant_users:
-                # Skip if participant is also a host (already has an event)
-                if participant_user in meeting_users:
-                    continue
+def _get_booking_users(bookings):
+    """All hosts and participants referenced by compact bookings"""
+    users = set()
+    for booking in bookings:
+        users.update(host["user"] for host in booking["hosts"])
+        users.update(booking["participants"])
+    return users
 
-                # Participants cannot reschedule or reassign team meetings
-                can_reschedule = False
-                can_reassign = False
-
-                participant_full_name = frappe.db.get_value("User", participant_user, "full_name") or participant_user
-
-                participant_event = {
-                    "id": f"{meeting.name}-participant-{participant_user}",
-                    "resourceId": participant_user,
-                    "title": event_title,
-                    "start": start_dt.isoformat(),
-                    "end": end_dt.isoformat(),
-                    "backgroundColor": event_color,
-                    "borderColor": event_color,
-                    "textColor": "#ffffff",
-                    "extendedProps": {
-                        "booking_id": meeting.name,
-                        "status": meeting.booking_status,
-                        "customer_name": customer_name,
-                        "customer_email": meeting.customer_email_at_booking,
-                        "meeting_type": meeting.meeting_type,
-                        "meeting_type_name": meeting_type_name,
-                        "department": department,
-                        "department_name": department_name,
-                        "assigned_to": participant_user,
-                        "assigned_to_name": participant_full_name,
-                        "is_primary_host": False,
-                        "is_internal": meeting.is_internal,
-                        "service_type": meeting.select_mkru,
-                        "description": meeting.meeting_description,
-                        "duration": meeting.duration or 0,
-                        "can_reschedule": can_reschedule,
-                        "can_reassign": can_reassign,
-                        "is_participant": True,  # Mark as participant, not host
-                        "host_user": primary_host_user,
-                        "host_name": primary_host_name
-                    },
-                    "editable": False,  # Participants cannot drag/drop
-                    "resourceEditable": False  # Participants cannot reassign
-                }
 
-                # Add class for team meetings and participant
-                participant_event["classNames"] = ["team-meeting", "participant-event"]
+def _get_user_names(users):
+    """
+    Get full names of users with a single query.
+
+    Returns:
+        dict: {user: full_name}, falling back to the user ID
+    """
+    users = [u for u in users if u]
+    if not users:
+        return {}
+
+    names = {
+        u.name: u.full_name
+        for u in frappe.get_all("User", filters={"name": ["in", users]}, fields=["name", "full_name"])
+    }
+    return {u: names.get(u) or u for u in users}
+
+
+def _get_booking_events(booking, user_names, department_names, meeting_type_names, color_map):
+    """
+    Expand a compact booking into FullCalendar events.
+
+    Creates one event per host and, for team meetings, one read-only event
+    per internal participant so they see the meeting on their calendar row.
+
+    Args:
+        booking (dict): Booking from _get_calendar_bookings
+        user_names (dict): {user: full_name}
+        department_names (dict): {department: department_name}
+        meeting_type_names (dict): {meeting type: meeting_name}
+        color_map (dict): {status: color}
+
+    Returns:
+        list: FullCalendar event objects
+    """
+    event_color = color_map.get(booking["status"], "#6b7280")
+    primary_host = booking["host"]
+
+    def make_event(event_id, resource_user, is_primary_host, is_participant, can_reschedule, can_reassign):
+        return {
+            "id": event_id,
+            "resourceId": resource_user,
+            "title": booking["title"],
+            "start": booking["start"],
+            "end": booking["end"],
+            "backgroundColor": event_color,
+            "borderColor": event_color,
+            "textColor": "#ffffff",
+            "extendedProps": {
+                "booking_id": booking["id"],
+                "status": booking["status"],
+                "customer_name": booking["customer_name"],
+                "customer_email": booking["customer_email"],
+                "meeting_type": booking["meeting_type"],
+                "meeting_type_name": meeting_type_names.get(booking["meeting_type"]) or "Meeting",
+                "department": booking["department"],
+                "department_name": department_names.get(booking["department"]),
+                "assigned_to": resource_user,
+                "assigned_to_name": user_names.get(resource_user, resource_user),
+                "is_primary_host": is_primary_host,
+                "is_internal": booking["is_internal"],
+                "service_type": booking["service_type"],
+                "description": booking["description"],
+                "duration": booking["duration"],
+                "can_reschedule": can_reschedule,
+                "can_reassign": can_reassign,
+                "is_participant": is_participant,
+                "host_user": primary_host,
+                "host_name": user_names.get(primary_host, primary_host) if primary_host else None
+            },
+            "editable": can_reschedule,
+            "resourceEditable": can_reassign
+        }
 
-                events.append(participant_event)
+    events = []
+    for host in booking["hosts"]:
+        event = make_event(
+            f"{booking['id']}-{host['user']}", host["user"], host["is_primary_host"],
+            False, host["can_reschedule"], booking["can_reassign"]
+        )
+        # Add class for team meetings
+        if booking["is_internal"]:
+            event["classNames"] = ["team-meeting"]
+        events.append(event)
+
+    # Participants cannot reschedule, reassign or drag team meetings
+    for participant_user in booking["participants"]:
+        event = make_event(
+            f"{booking['id']}-participant-{participant_user}", participant_user, False,
+            True, False, False
+        )
+        event["classNames"] = ["team-meeting", "participant-event"]
+        events.append(event)
 
     return events
 
 
+@frappe.whitelist()
+def get_calendar_bootstrap(start, end, departments=None, focus_department=None,
+                           meeting_types=None, statuses=None, services=None):
+    """
+    Get everything the calendar needs for a date range in one request.
+
+    Resolves the user's access scope once and returns resources, bookings,
+    business hours, date overrides, blocked slots and status colors. Users,
+    departments and meeting types are sent once and referenced by ID; each
+    booking is sent once with its hosts and participants, and the client
+    expands it into one event per calendar row (see _get_booking_events).
+
+    Args:
+        start (str): Start date (YYYY-MM-DD)
+        end (str): End date (YYYY-MM-DD)
+        departments (str): JSON array of department IDs
+        focus_department (str): Single department ID for focus mode
+        meeting_types (str): JSON array of meeting type IDs
+        statuses (str): JSON array of status values
+        services (str): JSON array of service type values
+
+    Returns:
+        dict: {
+            "users": {user: full_name},
+            "departments": {department: department_name},
+            "meeting_types": {meeting type: meeting_name},
+            "resources": [{"id", "department", "is_self"}],
+            "bookings": [...],  # See _get_calendar_bookings
+            "business_hours": {user: {"businessHours": [...], "dateOverrides": [...]}},
+            "blocked_slots": {user: [...]},
+            "status_colors": {status: {"color", "is_final"}}
+        }
+    """
+    scope = _get_calendar_scope(departments, focus_department)
+
+    resources = _get_calendar_resources(scope)
+    bookings, meeting_type_names = _get_calendar_bookings(
+        scope, start, end, meeting_types=meeting_types, statuses=statuses, services=services
+    )
+
+    resource_ids = [r["id"] for r in resources]
+    users = {r["id"]: r["title"] for r in resources}
+    users.update(_get_user_names(_get_booking_users(bookings) - set(users)))
+
+    try:
+        business_hours = _get_business_hours_map(resource_ids, start, end)
+    except Exception as e:
+        frappe.log_error(f"Error fetching business hours for resources: {e!s}", "Enhanced Calendar API")
+        business_hours = {}
+
+    return {
+        "users": users,
+        "departments": {d: scope.department_names.get(d) for d in scope.target_depts},
+        "meeting_types": meeting_type_names,
+        "resources": [
+            {"id": r["id"], "department": r["department"], "is_self": r["is_self"]}
+            for r in resources
+        ],
+        "bookings": bookings,
+        "business_hours": business_hours,
+        "blocked_slots": _get_blocked_slots_map(resource_ids, start, end),
+        "status_colors": get_status_colors()
+    }
+
+
 def check_can_reschedule_event(department, assigned_user, is_internal, current_user, role_level, led_dept_names, is_host=False):
     """
     Check if current user can reschedule this event.
@@ -1300,157 +1436,7 @@ def get_resource_business_hours(resource_id, start_date, end_date):
         }
     """
     try:
-        business_hours = []
-
-        # Get user's working hours from MM User Settings
-        user_settings = frappe.get_value(
-            "MM User Settings",
-            {"user": resource_id},
-            ["working_hours_json"],
-            as_dict=True
-        )
-
-        if not user_settings or not user_settings.working_hours_json:
-            # No working hours defined - default to standard 9-5 weekday schedule
-            business_hours = [{
-                "daysOfWeek": [1, 2, 3, 4, 5],  # Monday to Friday
-                "startTime": "09:00",
-                "endTime": "17:00"
-            }]
-        else:
-            try:
-                working_hours = json.loads(user_settings.working_hours_json)
-            except (json.JSONDecodeError, TypeError):
-                # Invalid JSON - default to standard 9-5 weekday schedule
-                business_hours = [{
-                    "daysOfWeek": [1, 2, 3, 4, 5],  # Monday to Friday
-                    "startTime": "09:00",
-                    "endTime": "17:00"
-                }]
-            else:
-                # Convert working hours to FullCalendar businessHours format
-                day_mapping = {
-                    "monday": 1,
-                    "tuesday": 2,
-                    "wednesday": 3,
-                    "thursday": 4,
-                    "friday": 5,
-                    "saturday": 6,
-                    "sunday": 0
-                }
-
-                # Group days by their working hours
-                hours_groups = {}
-                for day_name, day_config in working_hours.items():
-                    if day_name in day_mapping and day_config.get("enabled", False):
-                        start_time = day_config.get("start", "09:00")
-                        end_time = day_config.get("end", "17:00")
-                        hours_key = f"{start_time}-{end_time}"
-
-                        if hours_key not in hours_groups:
-                            hours_groups[hours_key] = []
-                        hours_groups[hours_key].append(day_mapping[day_name])
-
-                # Convert to FullCalendar format
-                for hours_key, days in hours_groups.items():
-                    start_time, end_time = hours_key.split("-")
-                    business_hours.append({
-                        "daysOfWeek": days,
-                        "startTime": start_time,
-                        "endTime": end_time
-                    })
-
-        # Now fetch date-specific overrides
-        date_overrides = []
-
-        # Get user's availability rules
-        availability_rules = frappe.get_all(
-            "MM User Availability Rule",
-            filters={"user": resource_id},
-            fields=["name"]
-        )
-
-        if availability_rules:
-            # Parse date range
-            start_dt = getdate(start_date)
-            end_dt = getdate(end_date)
-
-            # Collect all overrides, grouped by date
-            overrides_by_date = {}
-
-            # Get all date overrides in the range
-            for rule in availability_rules:
-                overrides = frappe.get_all(
-                    "MM User Date Overrides",
-                    filters={
-                        "parent": rule.name,
-                        "parenttype": "MM User Availability Rule",
-                        "date": ["between", [start_dt, end_dt]]
-                    },
-                    fields=["date", "available", "custom_hours_start", "custom_hours_end", "reason"],
-                    order_by="date, custom_hours_start"  # Sort by date and start time
-                )
-
-                for override in overrides:
-                    date_str = str(override.date)
-
-                    if date_str not in overrides_by_date:
-                        overrides_by_date[date_str] = []
-
-                    overrides_by_date[date_str].append(override)
-
-            # Process each date's overrides
-            for date_str, day_overrides in overrides_by_date.items():
-                # Case 1: If ANY override marks the day as unavailable, entire day is blocked
-                if any(not o.available for o in day_overrides):
-                    date_overrides.append({
-                        "date": date_str,
-                        "available": False,
-                        "reason": "Not available",
-                        "allDay": True
-                    })
-                    continue
-
-                # Case 2: Collect all available time slots for this date
-                # These can EXTEND or RESTRICT regular working hours
-                available_slots = []
-                for override in day_overrides:
-                    if override.available and override.custom_hours_start and override.custom_hours_end:
-                        available_slots.append({
-                            "start": str(override.custom_hours_start),
-                            "end": str(override.custom_hours_end),
-                            "reason": override.reason or "Custom hours"
-                        })
-
-                # Store override info - frontend will handle visualization
-                if available_slots:
-                    date_overrides.append({
-                        "date": date_str,
-                        "available": True,
-                        "availableSlots": available_slots,
-                        "allDay": False
-                    })
-
-                    # Add date-specific business hours to prevent gray-out
-                    # This makes extended hours appear WHITE instead of gray non-business hours
-                    for slot in available_slots:
-                        # Convert Python weekday (Mon=0) to FullCalendar (Sun=0)
-                        override_date = getdate(date_str)
-                        fc_weekday = (override_date.weekday() + 1) % 7
-
-                        business_hours.append({
-                            "groupId": f"override-{date_str}",
-                            "daysOfWeek": [fc_weekday],
-                            "startTime": slot["start"],
-                            "endTime": slot["end"],
-                            "startRecur": date_str,
-                            "endRecur": date_str
-                        })
-
-        return {
-            "businessHours": business_hours,
-            "dateOverrides": date_overrides
-        }
+        return _get_business_hours_map([resource_id], start_date, end_date)[resource_id]
 
     except Exception as e:
         frappe.log_error(f"Error fetching business hours for {resource_id}: {str(e)}", "Enhanced Calendar API")
@@ -1466,7 +1452,8 @@ def get_all_resources_business_hours(resource_ids, start_date, end_date):
     """
     Get business hours for multiple resources at once.
 
-    This is more efficient than calling get_resource_business_hours multiple times.
+    Working hours and date overrides of all resources are loaded with one
+    query each.
 
     Args:
         resource_ids (str): JSON array of User IDs
@@ -1480,17 +1467,176 @@ def get_all_resources_business_hours(resource_ids, start_date, end_date):
         if isinstance(resource_ids, str):
             resource_ids = json.loads(resource_ids)
 
-        result = {}
-        for resource_id in resource_ids:
-            result[resource_id] = get_resource_business_hours(resource_id, start_date, end_date)
-
-        return result
+        return _get_business_hours_map(resource_ids, start_date, end_date)
 
     except Exception as e:
         frappe.log_error(f"Error fetching business hours for resources: {str(e)}", "Enhanced Calendar API")
         return {}
 
 
+def _get_business_hours_map(resource_ids, start_date, end_date):
+    """
+    Load working hours and date overrides of several users.
+
+    Args:
+        resource_ids (list): User IDs
+        start_date (str): Start date (YYYY-MM-DD)
+        end_date (str): End date (YYYY-MM-DD)
+
+    Returns:
+        dict: {resource_id: {"businessHours": [...], "dateOverrides": [...]}}
+    """
+    if not resource_ids:
+        return {}
+
+    working_hours_json = {
+        s.user: s.working_hours_json
+        for s in frappe.get_all(
+            "MM User Settings",
+            filters={"user": ["in", resource_ids]},
+            fields=["user", "working_hours_json"]
+        )
+    }
+
+    overrides_by_user = {}
+    for override in frappe.db.sql("""
+        SELECT r.user, o.date, o.available, o.custom_hours_start, o.custom_hours_end, o.reason
+        FROM `tabMM User Date Overrides` o
+        INNER JOIN `tabMM User Availability Rule` r ON r.name = o.parent
+        WHERE o.parenttype = 'MM User Availability Rule'
+        AND r.user IN %(users)s
+        AND o.date BETWEEN %(start)s AND %(end)s
+        ORDER BY o.date, o.custom_hours_start
+    """, {"users": resource_ids, "start": getdate(start_date), "end": getdate(end_date)}, as_dict=True):
+        overrides_by_user.setdefault(override.user, []).append(override)
+
+    return {
+        resource_id: _build_business_hours(
+            working_hours_json.get(resource_id), overrides_by_user.get(resource_id, [])
+        )
+        for resource_id in resource_ids
+    }
+
+
+def _build_business_hours(working_hours_json, overrides):
+    """
+    Convert a user's working hours and date overrides to FullCalendar business hours.
+
+    Args:
+        working_hours_json (str): MM User Settings.working_hours_json
+        overrides (list): MM User Date Overrides rows in the range, ordered by date and start time
+
+    Returns:
+        dict: {"businessHours": [...], "dateOverrides": [...]}
+    """
+    business_hours = []
+
+    # No (valid) working hours defined - default to standard 9-5 weekday schedule
+    working_hours = None
+    if working_hours_json:
+        try:
+            working_hours = json.loads(working_hours_json)
+        except (json.JSONDecodeError, TypeError):
+            working_hours = None
+
+    if working_hours is None:
+        business_hours = [{
+            "daysOfWeek": [1, 2, 3, 4, 5],  # Monday to Friday
+            "startTime": "09:00",
+            "endTime": "17:00"
+        }]
+    else:
+        # Convert working hours to FullCalendar businessHours format
+        day_mapping = {
+            "monday": 1,
+            "tuesday": 2,
+            "wednesday": 3,
+            "thursday": 4,
+            "friday": 5,
+            "saturday": 6,
+            "sunday": 0
+        }
+
+        # Group days by their working hours
+        hours_groups = {}
+        for day_name, day_config in working_hours.items():
+            if day_name in day_mapping and day_config.get("enabled", False):
+                start_time = day_config.get("start", "09:00")
+                end_time = day_config.get("end", "17:00")
+                hours_key = f"{start_time}-{end_time}"
+
+                if hours_key not in hours_groups:
+                    hours_groups[hours_key] = []
+                hours_groups[hours_key].append(day_mapping[day_name])
+
+        # Convert to FullCalendar format
+        for hours_key, days in hours_groups.items():
+            start_time, end_time = hours_key.split("-")
+            business_hours.append({
+                "daysOfWeek": days,
+                "startTime": start_time,
+                "endTime": end_time
+            })
+
+    # Collect all overrides, grouped by date
+    overrides_by_date = {}
+    for override in overrides:
+        overrides_by_date.setdefault(str(override.date), []).append(override)
+
+    date_overrides = []
+
+    # Process each date's overrides
+    for date_str, day_overrides in overrides_by_date.items():
+        # Case 1: If ANY override marks the day as unavailable, entire day is blocked
+        if any(not o.available for o in day_overrides):
+            date_overrides.append({
+                "date": date_str,
+                "available": False,
+                "reason": "Not available",
+                "allDay": True
+            })
+            continue
+
+        # Case 2: Collect all available time slots for this date
+        # These can EXTEND or RESTRICT regular working hours
+        available_slots = []
+        for override in day_overrides:
+            if override.available and override.custom_hours_start and override.custom_hours_end:
+                available_slots.append({
+                    "start": str(override.custom_hours_start),
+                    "end": str(override.custom_hours_end),
+                    "reason": override.reason or "Custom hours"
+                })
+
+        # Store override info - frontend will handle visualization
+        if available_slots:
+            date_overrides.append({
+                "date": date_str,
+                "available": True,
+                "availableSlots": available_slots,
+                "allDay": False
+            })
+
+            # Add date-specific business hours to prevent gray-out
+            # This makes extended hours appear WHITE instead of gray non-business hours
+            # Convert Python weekday (Mon=0) to FullCalendar (Sun=0)
+            fc_weekday = (getdate(date_str).weekday() + 1) % 7
+            for slot in available_slots:
+                business_hours.append({
+                    "groupId": f"override-{date_str}",
+                    "daysOfWeek": [fc_weekday],
+                    "startTime": slot["start"],
+                    "endTime": slot["end"],
+                    "startRecur": date_str,
+                    "endRecur": date_str
+                })
+
+    return {
+        "businessHours": business_hours,
+        "dateOverrides": date_overrides
+    }
+
+
 @frappe.whitelist()
 def get_booking_details(booking_id):
     """
@@ -2043,11 +2189,16 @@ def create_slot_booking(booking_data):
 # BLOCKED SLOTS API
 # =============================================================================
 
+# Most occurrences created by one recurring block
+MAX_RECURRING_BLOCKED_SLOTS = 366
+
 @frappe.whitelist()
 def get_user_blocked_slots(resource_ids, start_date, end_date):
     """
     Get all blocked slots for specified users within a date range.
 
+    Loads the slots of all users with a single query.
+
     Args:
         resource_ids (str): JSON array of User IDs
         start_date (str): Start date (YYYY-MM-DD)
@@ -2059,23 +2210,39 @@ def get_user_blocked_slots(resource_ids, start_date, end_date):
     if isinstance(resource_ids, str):
         resource_ids = json.loads(resource_ids)
 
-    result = {}
-    for resource_id in resource_ids:
-        slots = frappe.get_all(
-            "MM User Blocked Slot",
-            filters={
-                "user": resource_id,
-                "blocked_date": ["between", [start_date, end_date]]
-            },
-            fields=["name", "blocked_date", "start_time", "end_time", "reason"],
-            order_by="blocked_date, start_time"
-        )
+    return _get_blocked_slots_map(resource_ids, start_date, end_date)
+
+
+def _get_blocked_slots_map(resource_ids, start_date, end_date):
+    """
+    Load the blocked slots of several users.
+
+    Returns:
+        dict: {resource_id: [blocked_slots]}
+    """
+    result = {resource_id: [] for resource_id in resource_ids}
+    if not result:
+        return result
+
+    slots = frappe.get_all(
+        "MM User Blocked Slot",
+        filters={
+            "user": ["in", list(result)],
+            "blocked_date": ["between", [start_date, end_date]]
+        },
+        fields=["name", "user", "blocked_date", "start_time", "end_time", "reason"],
+        order_by="blocked_date, start_time"
+    )
+
+    for slot in slots:
         # Convert time objects to strings
-        for slot in slots:
-            slot["blocked_date"] = str(slot["blocked_date"])
-            slot["start_time"] = str(slot["start_time"])
-            slot["end_time"] = str(slot["end_time"])
-        result[resource_id] = slots
+        result[slot.pop("user")].append({
+            "name": slot["name"],
+            "blocked_date": str(slot["blocked_date"]),
+            "start_time": str(slot["start_time"]),
+            "end_time": str(slot["end_time"]),
+            "reason": slot["reason"]
+        })
 
     return result
 
@@ -2129,6 +2296,151 @@ def create_blocked_slot(user, blocked_date, start_time, end_time, reason):
         return {"success": False, "message": str(e)}
 
 
+@frappe.whitelist()
+def create_recurring_blocked_slots(user, start_date, start_time, end_time, reason, rrule, skip_conflicts=0):
+    """
+    Create blocked slots for every occurrence of a recurrence rule.
+
+    All occurrences are checked against existing blocked slots and meetings
+    with one range query each and inserted with a single bulk insert.
+
+    Args:
+        user (str): User ID
+        start_date (str): First date of the series (YYYY-MM-DD)
+        start_time (str): Start time (HH:MM)
+        end_time (str): End time (HH:MM)
+        reason (str): Reason for blocking (MANDATORY)
+        rrule (str): iCalendar RRULE with UNTIL or COUNT,
+            e.g. "FREQ=WEEKLY;BYDAY=FR;UNTIL=20261231"
+        skip_conflicts (int): Create the free occurrences and skip conflicting ones
+            instead of creating nothing
+
+    Returns:
+        dict: {success: bool, message: str, blocked_slots: list, conflicts: list}
+    """
+    from frappe.model.naming import set_new_name
+
+    from meeting_manager.meeting_manager.doctype.mm_user_blocked_slot.mm_user_blocked_slot import (
+        check_blocked_slot_permission,
+        get_blocked_slot_conflicts,
+    )
+
+    try:
+        # Validate reason is provided
+        if not reason or not reason.strip():
+            return {"success": False, "message": _("Reason is mandatory. Please provide a reason for blocking this time slot.")}
+
+        if get_time(start_time) >= get_time(end_time):
+            return {"success": False, "message": _("Start time must be before end time")}
+
+        check_blocked_slot_permission(user)
+
+        dates = _expand_blocked_slot_rule(rrule, getdate(start_date))
+        slots = [
+            {"blocked_date": d, "start_time": start_time, "end_time": end_time}
+            for d in dates
+        ]
+
+        conflicts = get_blocked_slot_conflicts(user, slots)
+        conflict_indexes = {c["index"] for c in conflicts}
+        conflicts = [
+            {"blocked_date": str(slots[c["index"]]["blocked_date"]), "message": c["message"]}
+            for c in conflicts
+        ]
+
+        if conflicts and not frappe.utils.cint(skip_conflicts):
+            return {
+                "success": False,
+                "message": _("{0} of {1} occurrences conflict with existing blocked slots or meetings").format(
+                    len(conflicts), len(slots)
+                ),
+                "blocked_slots": [],
+                "conflicts": conflicts
+            }
+
+        now = now_datetime()
+        reason = reason.strip()
+        values = []
+        created = []
+
+        for index, slot in enumerate(slots):
+            if index in conflict_indexes:
+                continue
+
+            doc = frappe.new_doc("MM User Blocked Slot")
+            doc.update(dict(slot, user=user, reason=reason))
+            set_new_name(doc)
+
+            values.append((
+                doc.name, now, now, frappe.session.user, frappe.session.user, 0,
+                user, slot["blocked_date"], start_time, end_time, reason
+            ))
+            created.append({
+                "name": doc.name,
+                "user": user,
+                "blocked_date": str(slot["blocked_date"]),
+                "start_time": str(start_time),
+                "end_time": str(end_time),
+                "reason": reason
+            })
+
+        if values:
+            frappe.db.bulk_insert(
+                "MM User Blocked Slot",
+                fields=[
+                    "name", "creation", "modified", "owner", "modified_by", "docstatus",
+                    "user", "blocked_date", "start_time", "end_time", "reason"
+                ],
+                values=values
+            )
+        frappe.db.commit()
+
+        return {
+            "success": True,
+            "message": _("{0} blocked slots created").format(len(created)),
+            "blocked_slots": created,
+            "conflicts": conflicts
+        }
+    except Exception as e:
+        frappe.db.rollback()
+        return {"success": False, "message": str(e)}
+
+
+def _expand_blocked_slot_rule(rrule, start_date):
+    """
+    Dates of a recurrence rule, starting at start_date
+
+    Returns:
+        list: Distinct dates (at most MAX_RECURRING_BLOCKED_SLOTS)
+    """
+    from dateutil.rrule import rrulestr
+
+    rule_text = (rrule or "").strip()
+    if rule_text.upper().startswith("RRULE:"):
+        rule_text = rule_text[6:]
+
+    parts = {part.split("=", 1)[0].upper() for part in rule_text.split(";") if part}
+    if not parts & {"UNTIL", "COUNT"}:
+        frappe.throw(_("The recurrence rule must end (UNTIL or COUNT)"))
+
+    try:
+        rule = rrulestr(rule_text, dtstart=datetime.combine(start_date, datetime.min.time()))
+    except (ValueError, TypeError) as e:
+        frappe.throw(_("Invalid recurrence rule: {0}").format(str(e)))
+
+    dates = []
+    for occurrence in rule:
+        if not dates or occurrence.date() != dates[-1]:
+            dates.append(occurrence.date())
+        if len(dates) > MAX_RECURRING_BLOCKED_SLOTS:
+            frappe.throw(_("A recurring block can have at most {0} occurrences").format(MAX_RECURRING_BLOCKED_SLOTS))
+
+    if not dates:
+        frappe.throw(_("The recurrence rule has no occurrences"))
+
+    return dates
+
+
 @frappe.whitelist()
 def delete_blocked_slot(blocked_slot_name):
     """
@@ -2265,101 +2577,69 @@ def search_customers(query):
     """
     Search for customers across Contact and HD Customer doctypes.
 
-    Searches Contact by: first_name, last_name, company_name, child email_id, child phone.
-    Searches HD Customer by: customer_name, email, phone, cvr, domain.
+    Uses the search index (services/search_index.py), which covers
+    Contact: name, company, CVR, all emails and phones, and
+    HD Customer: customer_name, email, phone, cvr, domain.
 
-    Returns combined results with source badges, max 10 total.
+    Returns combined results ranked by relevance with source badges, max 10 total.
     """
+    from meeting_manager.meeting_manager.services.search_index import search
+
     if not query or len(query) < 2:
         return []
 
-    query = query.strip()
-    like_query = f"%{query}%"
-    results = []
+    doctypes = ["Contact"]
+    if frappe.db.exists("DocType", "HD Customer"):
+        doctypes.append("HD Customer")
 
-    # ── Search Contacts ──────────────────────────────────────────────────────
-    try:
-        contact_ids = set()
+    matches = search(doctypes, query, limit=10)
+    contact_names = [m.reference_name for m in matches if m.reference_doctype == "Contact"]
+    hd_names = [m.reference_name for m in matches if m.reference_doctype == "HD Customer"]
 
-        # Search by main fields
-        name_matches = frappe.get_all(
-            "Contact",
-            or_filters=[
-                ["first_name", "like", like_query],
-                ["last_name", "like", like_query],
-                ["company_name", "like", like_query],
-                ["name", "like", like_query],
-            ],
-            fields=["name"],
-            limit_page_length=10,
-        )
-        contact_ids.update(c["name"] for c in name_matches)
+    results = {}
 
-        # Search by child email
-        email_matches = frappe.get_all(
+    # ── Contacts ─────────────────────────────────────────────────────────────
+    if contact_names:
+        emails = {}
+        for e in frappe.get_all(
             "Contact Email",
-            filters={"email_id": ["like", like_query]},
-            fields=["parent"],
-            limit_page_length=10,
-        )
-        contact_ids.update(c["parent"] for c in email_matches)
-
-        # Search by child phone
-        phone_matches = frappe.get_all(
+            filters={"parent": ["in", contact_names], "parenttype": "Contact"},
+            fields=["parent", "email_id", "is_primary"],
+            order_by="is_primary desc, idx asc",
+        ):
+            emails.setdefault(e.parent, e.email_id)
+
+        phones = {}
+        for p in frappe.get_all(
             "Contact Phone",
-            filters={"phone": ["like", like_query]},
-            fields=["parent"],
-            limit_page_length=10,
-        )
-        contact_ids.update(c["parent"] for c in phone_matches)
+            filters={"parent": ["in", contact_names], "parenttype": "Contact"},
+            fields=["parent", "phone", "is_primary_phone", "is_primary_mobile_no"],
+            order_by="is_primary_phone desc, is_primary_mobile_no desc, idx asc",
+        ):
+            phones.setdefault(p.parent, p.phone)
 
-        # Fetch full contact details for matched IDs
-        for cid in list(contact_ids)[:5]:
-            try:
-                doc = frappe.get_doc("Contact", cid)
-                primary_email = ""
-                primary_phone = ""
-                for e in doc.get("email_ids", []):
-                    if e.is_primary:
-                        primary_email = e.email_id
-                    elif not primary_email:
-                        primary_email = e.email_id
-                for p in doc.get("phone_nos", []):
-                    if p.is_primary_phone or p.is_primary_mobile_no:
-                        primary_phone = p.phone
-                    elif not primary_phone:
-                        primary_phone = p.phone
-
-                display_name = " ".join(filter(None, [doc.first_name, doc.last_name])) or doc.name
-                results.append({
-                    "source": "Contact",
-                    "name": doc.name,
-                    "customer_name": display_name,
-                    "email": primary_email,
-                    "phone": primary_phone,
-                    "company": doc.company_name or "",
-                })
-            except Exception:
-                continue
-    except Exception:
-        pass
+        for c in frappe.get_all(
+            "Contact",
+            filters={"name": ["in", contact_names]},
+            fields=["name", "first_name", "last_name", "company_name"],
+        ):
+            results[("Contact", c.name)] = {
+                "source": "Contact",
+                "name": c.name,
+                "customer_name": " ".join(filter(None, [c.first_name, c.last_name])) or c.name,
+                "email": emails.get(c.name, ""),
+                "phone": phones.get(c.name, ""),
+                "company": c.company_name or "",
+            }
 
-    # ── Search HD Customer ────────────────────────────────────────────────────
-    try:
-        hd_customers = frappe.get_all(
+    # ── HD Customers ─────────────────────────────────────────────────────────
+    if hd_names:
+        for hd in frappe.get_all(
             "HD Customer",
-            or_filters=[
-                ["customer_name", "like", like_query],
-                ["email", "like", like_query],
-                ["phone", "like", like_query],
-                ["cvr", "like", like_query],
-                ["domain", "like", like_query],
-            ],
+            filters={"name": ["in", hd_names]},
             fields=["name", "customer_name", "email", "phone", "domain", "cvr"],
-            limit_page_length=5,
-        )
-        for hd in hd_customers:
-            results.append({
+        ):
+            results[("HD Customer", hd.name)] = {
                 "source": "HD Customer",
                 "name": hd.name,
                 "customer_name": hd.customer_name or hd.name,
@@ -2367,11 +2647,14 @@ def search_customers(query):
                 "phone": hd.phone or "",
                 "company": hd.domain or "",
                 "cvr": hd.cvr or "",
-            })
-    except Exception:
-        pass
+            }
 
-    return results[:10]
+    # Keep the ranking of the index
+    return [
+        results[(m.reference_doctype, m.reference_name)]
+        for m in matches
+        if (m.reference_doctype, m.reference_name) in results
+    ]
 
 
 @frappe.whitelist()
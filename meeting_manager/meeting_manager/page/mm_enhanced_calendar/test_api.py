@@ -0,0 +1,141 @@
+# Copyright (c) 2026, Best Security and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests import IntegrationTestCase
+from frappe.utils import add_days, getdate, now_datetime
+
+from meeting_manager.meeting_manager.doctype.mm_booking_status.mm_booking_status import seed_default_statuses
+from meeting_manager.meeting_manager.doctype.mm_department.test_mm_department import (
+	make_department,
+	make_test_user,
+)
+from meeting_manager.meeting_manager.doctype.mm_meeting_booking.test_mm_meeting_booking import (
+	make_booking,
+	make_customer,
+	make_meeting_type,
+)
+from meeting_manager.meeting_manager.page.mm_enhanced_calendar.api import (
+	get_calendar_bootstrap,
+	get_calendar_events,
+)
+
+
+class IntegrationTestMMEnhancedCalendar(IntegrationTestCase):
+	"""
+	Integration tests for the enhanced calendar API.
+	Use this class for testing interactions between multiple components.
+	"""
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		seed_default_statuses()
+
+	def setUp(self):
+		self.host = make_test_user("mm-host")
+		self.participant = make_test_user("mm-participant")
+		self.department = make_department([self.host, self.participant]).name
+		self.meeting_type = make_meeting_type(self.department)
+
+		start = add_days(now_datetime().replace(hour=10, minute=0, second=0, microsecond=0), 3)
+		self.customer_booking = make_booking(
+			self.meeting_type.name, self.host, make_customer().name, start=start
+		)
+		self.team_meeting = make_booking(
+			self.meeting_type.name, self.host, start=add_days(start, 1),
+			participants=[{
+				"participant_type": "Internal",
+				"user": self.participant,
+				"email": self.participant
+			}]
+		)
+		self.blocked_slot = frappe.get_doc({
+			"doctype": "MM User Blocked Slot",
+			"user": self.host,
+			"blocked_date": add_days(getdate(start), 2),
+			"start_time": "13:00",
+			"end_time": "14:00",
+			"reason": "Focus time"
+		}).insert(ignore_permissions=True)
+
+		self.range = (str(getdate(start)), str(add_days(getdate(start), 7)))
+
+	def tearDown(self):
+		frappe.set_user("Administrator")
+		frappe.db.rollback()
+
+	def get_bootstrap(self):
+		return get_calendar_bootstrap(*self.range, focus_department=self.department)
+
+	def test_bootstrap_sends_reference_data_once(self):
+		"""Users, departments and meeting types are sent once and referenced by ID"""
+		data = self.get_bootstrap()
+
+		self.assertEqual(
+			{(r["id"], r["department"]) for r in data["resources"]},
+			{(self.host, self.department), (self.participant, self.department)}
+		)
+		self.assertEqual(set(data["users"]), {self.host, self.participant})
+		self.assertEqual(list(data["departments"]), [self.department])
+		self.assertEqual(data["meeting_types"], {self.meeting_type.name: self.meeting_type.meeting_name})
+		self.assertIn("New Booking", data["status_colors"])
+
+	def test_bootstrap_sends_each_booking_once(self):
+		"""A team meeting is one booking carrying its hosts and participants"""
+		bookings = {b["id"]: b for b in self.get_bootstrap()["bookings"]}
+
+		self.assertEqual(set(bookings), {self.customer_booking.name, self.team_meeting.name})
+
+		team_meeting = bookings[self.team_meeting.name]
+		self.assertEqual(team_meeting["host"], self.host)
+		self.assertEqual([h["user"] for h in team_meeting["hosts"]], [self.host])
+		self.assertEqual(team_meeting["participants"], [self.participant])
+		self.assertEqual(bookings[self.customer_booking.name]["participants"], [])
+
+	def test_bootstrap_includes_hours_and_blocked_slots(self):
+		"""Every resource gets business hours, and blocked slots are grouped by user"""
+		data = self.get_bootstrap()
+
+		# Users without MM User Settings fall back to a Mon-Fri 9-5 schedule
+		self.assertEqual(
+			data["business_hours"][self.host]["businessHours"],
+			[{"daysOfWeek": [1, 2, 3, 4, 5], "startTime": "09:00", "endTime": "17:00"}]
+		)
+		self.assertEqual(
+			[slot["name"] for slot in data["blocked_slots"][self.host]],
+			[self.blocked_slot.name]
+		)
+		self.assertEqual(data["blocked_slots"][self.participant], [])
+
+	def test_team_meeting_expands_to_host_and_participant_events(self):
+		"""A team meeting is one editable event for its host and one read-only event per participant"""
+		events = {
+			e["id"]: e
+			for e in get_calendar_events(*self.range, focus_department=self.department)
+			if e["extendedProps"]["booking_id"] == self.team_meeting.name
+		}
+
+		host_event = events[f"{self.team_meeting.name}-{self.host}"]
+		participant_event = events[f"{self.team_meeting.name}-participant-{self.participant}"]
+		self.assertEqual(len(events), 2)
+
+		self.assertEqual(host_event["resourceId"], self.host)
+		self.assertTrue(host_event["extendedProps"]["is_primary_host"])
+		self.assertEqual(host_event["classNames"], ["team-meeting"])
+
+		self.assertEqual(participant_event["resourceId"], self.participant)
+		self.assertEqual(participant_event["classNames"], ["team-meeting", "participant-event"])
+		self.assertEqual(participant_event["extendedProps"]["host_user"], self.host)
+		self.assertFalse(participant_event["editable"])
+		self.assertFalse(participant_event["resourceEditable"])
+
+	def test_member_sees_only_own_row_and_meetings(self):
+		"""Department members get their own resource and the meetings they take part in"""
+		frappe.set_user(self.participant)
+
+		data = self.get_bootstrap()
+
+		self.assertEqual([r["id"] for r in data["resources"]], [self.participant])
+		self.assertEqual([b["id"] for b in data["bookings"]], [self.team_meeting.name])
+		self.assertEqual(list(data["blocked_slots"]), [self.participant])
@@ -0,0 +1,25 @@
+import frappe
+
+
+def execute():
+	"""Populate MM Meeting Booking.department and primary_host for existing bookings."""
+	frappe.db.sql("""
+		UPDATE `tabMM Meeting Booking` b
+		INNER JOIN `tabMM Meeting Type` mt ON mt.name = b.meeting_type
+		SET b.department = mt.department
+	""")
+
+	# Primary host, falling back to the first assigned user (same rule as the controller)
+	frappe.db.sql("""
+		UPDATE `tabMM Meeting Booking` b
+		SET b.primary_host = (
+			SELECT au.user
+			FROM `tabMM Meeting Booking Assigned User` au
+			WHERE au.parent = b.name
+				AND au.parenttype = 'MM Meeting Booking'
+				AND au.parentfield = 'assigned_users'
+				AND IFNULL(au.user, '') != ''
+			ORDER BY au.is_primary_host DESC, au.idx ASC
+			LIMIT 1
+		)
+	""")
@@ -0,0 +1,5 @@
+def execute():
+	"""Fill MM Customer Identity from existing Contact emails and phone numbers."""
+	from meeting_manager.meeting_manager.services.customer_identity import rebuild_customer_identities
+
+	rebuild_customer_identities()
@@ -0,0 +1,8 @@
+import frappe
+
+
+def execute():
+	"""Build MM Search Index documents for existing bookings and customers."""
+	from meeting_manager.meeting_manager.services.search_index import rebuild_search_index
+
+	rebuild_search_index()
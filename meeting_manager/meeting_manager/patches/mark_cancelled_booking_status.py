@@ -0,0 +1,7 @@
+import frappe
+
+
+def execute():
+	"""Flag the Cancelled booking status so customer booking stats keep leaving it out."""
+	if frappe.db.exists("MM Booking Status", "Cancelled"):
+		frappe.db.set_value("MM Booking Status", "Cancelled", "is_cancelled", 1, update_modified=False)
@@ -0,0 +1,5 @@
+def execute():
+	"""Recount Contact booking stats without cancelled bookings before incremental updates take over."""
+	from meeting_manager.meeting_manager.services.customer_service import reconcile_customer_booking_stats
+
+	reconcile_customer_booking_stats()
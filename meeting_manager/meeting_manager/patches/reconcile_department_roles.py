@@ -0,0 +1,5 @@
+def execute():
+	"""Assign missing MM Department Leader / Member roles with the bulk reconciler (no revocations)."""
+	from meeting_manager.meeting_manager.services.role_service import reconcile_roles
+
+	reconcile_roles(allow_background=False, notify=False)
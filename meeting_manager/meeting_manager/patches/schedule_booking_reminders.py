@@ -0,0 +1,19 @@
+import frappe
+
+
+def execute():
+	"""Materialize MM Booking Reminder rows for existing upcoming bookings."""
+	from meeting_manager.meeting_manager.services.reminder_service import schedule_booking_reminders
+
+	booking_names = frappe.get_all(
+		"MM Meeting Booking",
+		filters={
+			"docstatus": ["!=", 2],
+			"start_datetime": [">", frappe.utils.now_datetime()],
+		},
+		pluck="name",
+	)
+
+	for i in range(0, len(booking_names), 500):
+		schedule_booking_reminders(booking_names[i:i + 500])
+		frappe.db.commit()
@@ -16,6 +16,7 @@ import frappe
 from frappe.utils import now_datetime, add_to_date
 from datetime import timedelta
 import hashlib
+import time
 
 def sync_all_users_calendars():
 	"""
@@ -76,15 +77,27 @@ def sync_user_calendar_integration(integration_id):
 	if not integration.is_active:
 		return
 
-	# Call appropriate sync function based on integration type
-	if integration.integration_type == "Google Calendar":
-		sync_google_calendar(integration)
-	elif integration.integration_type == "Outlook Calendar":
-		sync_outlook_calendar(integration)
-	elif integration.integration_type == "iCal":
-		sync_ical_calendar(integration)
-	else:
-		frappe.throw(f"Unknown integration type: {integration.integration_type}")
+	from meeting_manager.meeting_manager.services.sync_metrics import finish_sync_run, start_sync_run
+
+	metrics = start_sync_run(integration)
+
+	try:
+		# Call appropriate sync function based on integration type
+		if integration.integration_type == "Google Calendar":
+			counts = sync_google_calendar(integration)
+		elif integration.integration_type == "Outlook Calendar":
+			counts = sync_outlook_calendar(integration)
+		elif integration.integration_type == "iCal":
+			counts = sync_ical_calendar(integration)
+		else:
+			frappe.throw(f"Unknown integration type: {integration.integration_type}")
+	except Exception as e:
+		finish_sync_run(metrics, "Failed", str(e))
+		raise
+
+	# iCal returns None when the feed has not changed since the last sync
+	metrics.set_counts(counts)
+	finish_sync_run(metrics, "Success" if counts is not None else "Not Modified")
 
 	# Update last sync time
 	integration.last_sync = now_datetime()
@@ -99,14 +112,17 @@ def sync_google_calendar(integration):
 
 	Args:
 		integration: MM Calendar Integration document
+
+	Returns:
+		dict: Event counts from process_calendar_events
 	"""
-	from meeting_manager.meeting_manager.services.google_calendar_service import GoogleCalendarService
+	from meeting_manager.meeting_manager.services.token_manager import get_calendar_service
 
 	try:
 		frappe.logger().info(f"Syncing Google Calendar for user {integration.user}")
 
-		# Initialize Google Calendar service
-		service = GoogleCalendarService(integration)
+		# Authenticated Google Calendar service (token cached in Redis)
+		service = get_calendar_service(integration)
 
 		# Calculate date range
 		start_date = add_to_date(now_datetime(), days=-integration.sync_past_days)
@@ -116,7 +132,7 @@ def sync_google_calendar(integration):
 		events = service.fetch_events(start_date, end_date, integration.calendar_id or 'primary')
 
 		# Process events (create/update/delete sync records)
-		process_calendar_events(integration, events)
+		counts = process_calendar_events(integration, events)
 
 		# Update integration status
 		frappe.db.set_value(
@@ -135,6 +151,8 @@ def sync_google_calendar(integration):
 			f"Synced {len(events)} events."
 		)
 
+		return counts
+
 	except Exception as e:
 		frappe.logger().error(f"Google Calendar sync error for {integration.user}: {str(e)}")
 		frappe.log_error(
@@ -161,14 +179,17 @@ def sync_outlook_calendar(integration):
 
 	Args:
 		integration: MM Calendar Integration document
+
+	Returns:
+		dict: Event counts from process_calendar_events
 	"""
-	from meeting_manager.meeting_manager.services.outlook_service import OutlookCalendarService
+	from meeting_manager.meeting_manager.services.token_manager import get_calendar_service
 
 	try:
 		frappe.logger().info(f"Syncing Outlook Calendar for user {integration.user}")
 
-		# Initialize Outlook Calendar service
-		service = OutlookCalendarService(integration)
+		# Authenticated Outlook Calendar service (token cached in Redis)
+		service = get_calendar_service(integration)
 
 		# Calculate date range
 		start_date = add_to_date(now_datetime(), days=-integration.sync_past_days)
@@ -178,7 +199,7 @@ def sync_outlook_calendar(integration):
 		events = service.fetch_events(start_date, end_date, integration.calendar_id)
 
 		# Process events (create/update/delete sync records)
-		process_calendar_events(integration, events)
+		counts = process_calendar_events(integration, events)
 
 		# Update integration status
 		frappe.db.set_value(
@@ -197,6 +218,8 @@ def sync_outlook_calendar(integration):
 			f"Synced {len(events)} events."
 		)
 
+		return counts
+
 	except Exception as e:
 		frappe.logger().error(f"Outlook Calendar sync error for {integration.user}: {str(e)}")
 		frappe.log_error(
@@ -221,8 +244,19 @@ def sync_ical_calendar(integration):
 	"""
 	Sync events from iCal URL
 
+	The feed is fetched with a conditional GET (ETag / Last-Modified), so an
+	unchanged feed costs a single 304 round trip. The validators are only sent
+	while the sync window is the one the feed was last expanded for; once the
+	window moves (daily), the feed is expanded again so occurrences entering
+	the window are added and expired ones pruned. Changed feeds are streamed
+	and parsed one VEVENT at a time; recurring events are expanded only inside
+	the integration's sync window before being handed to the bulk upsert.
+
 	Args:
 		integration: MM Calendar Integration document
+
+	Returns:
+		dict: Event counts from process_calendar_events, or None if the feed is unchanged
 	"""
 	if not integration.ical_url:
 		frappe.throw("No iCal URL configured")
@@ -230,47 +264,72 @@ def sync_ical_calendar(integration):
 	frappe.logger().info(f"Syncing iCal for user {integration.user}")
 
 	try:
-		# Fetch and parse iCal feed
 		import requests
-		from icalendar import Calendar
-		from datetime import datetime
-
-		response = requests.get(integration.ical_url, timeout=30)
-		response.raise_for_status()
-
-		# Parse iCal data
-		cal = Calendar.from_ical(response.content)
-
-		# Get events for next 60 days
-		start_date = now_datetime()
-		end_date = add_to_date(start_date, days=60)
-
-		events_to_sync = []
-
-		for component in cal.walk():
-			if component.name == "VEVENT":
-				event_start = component.get('dtstart').dt
-				event_end = component.get('dtend').dt
-
-				# Convert to datetime if date
-				if not isinstance(event_start, datetime):
-					event_start = datetime.combine(event_start, datetime.min.time())
-				if not isinstance(event_end, datetime):
-					event_end = datetime.combine(event_end, datetime.min.time())
-
-				# Only sync events within our window
-				if start_date <= event_start <= end_date:
-					events_to_sync.append({
-						"external_event_id": str(component.get('uid')),
-						"event_summary": str(component.get('summary', 'Busy')),
-						"event_start": event_start,
-						"event_end": event_end,
-						"event_status": "Busy",  # iCal doesn't provide status
-						"is_all_day": component.get('dtstart').dt.__class__.__name__ == 'date'
-					})
+
+		from meeting_manager.meeting_manager.services.sync_metrics import record_api_call
+
+		url = integration.ical_url
+		if url.startswith("webcal://"):
+			url = "https://" + url[len("webcal://"):]
+
+		window_start = add_to_date(now_datetime(), days=-(integration.sync_past_days or 0))
+		window_end = add_to_date(now_datetime(), days=integration.sync_future_days or 60)
+		window = f"{window_start.date()}|{window_end.date()}"
+
+		headers = {}
+		if integration.get("ical_sync_window") == window:
+			if integration.get("ical_etag"):
+				headers["If-None-Match"] = integration.ical_etag
+			if integration.get("ical_last_modified"):
+				headers["If-Modified-Since"] = integration.ical_last_modified
+
+		started = time.monotonic()
+		bytes_received = 0
+
+		def counted(lines):
+			nonlocal bytes_received
+			for line in lines:
+				bytes_received += len(line) + 1
+				yield line
+
+		with requests.get(url, headers=headers, timeout=30, stream=True) as response:
+			if response.status_code == 304:
+				record_api_call(started)
+				frappe.logger().info(f"iCal feed unchanged for {integration.user}, skipping")
+				return None
+
+			response.raise_for_status()
+
+			events_to_sync = collect_ical_events(
+				counted(response.iter_lines(decode_unicode=False)),
+				window_start,
+				window_end
+			)
+			record_api_call(started, bytes_received)
+
+			etag = response.headers.get("ETag")
+			last_modified = response.headers.get("Last-Modified")
 
 		# Process events
-		process_calendar_events(integration, events_to_sync)
+		counts = process_calendar_events(integration, events_to_sync)
+
+		# Remember validators only after a successful upsert, so a failed run is retried in full.
+		# Also set them on the document, since the caller saves it after the sync.
+		integration.ical_etag = etag
+		integration.ical_last_modified = last_modified
+		integration.ical_sync_window = window
+		frappe.db.set_value(
+			"MM Calendar Integration",
+			integration.name,
+			{
+				"ical_etag": etag,
+				"ical_last_modified": last_modified,
+				"ical_sync_window": window
+			},
+			update_modified=False
+		)
+
+		return counts
 
 	except ImportError:
 		frappe.throw(
@@ -281,104 +340,458 @@ def sync_ical_calendar(integration):
 		frappe.throw(f"Failed to sync iCal calendar: {str(e)}")
 
 
+def iter_ical_components(lines, component="VEVENT"):
+	"""
+	Yield raw iCal components from a stream of lines without loading the whole feed
+
+	Handles RFC 5545 line folding and nested components (e.g. VALARM inside VEVENT).
+
+	Args:
+		lines (iterable): Raw feed lines (bytes or str), without line terminators
+		component (str): Component name to extract
+
+	Yields:
+		str: Unfolded component text, including its BEGIN/END lines
+	"""
+	begin = f"BEGIN:{component}"
+	end = f"END:{component}"
+	buffer = None
+	current = None
+
+	for raw in lines:
+		line = raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else raw
+		line = line.rstrip("\r")
+
+		# Folded continuation of the previous line
+		if line[:1] in (" ", "\t"):
+			if current is not None:
+				current += line[1:]
+			continue
+
+		if current is not None and buffer is not None:
+			buffer.append(current)
+		current = None
+
+		upper = line.upper()
+		if upper == begin:
+			buffer = []
+		if buffer is None:
+			continue
+
+		current = line
+		if upper == end:
+			buffer.append(current)
+			yield "\r\n".join(buffer) + "\r\n"
+			buffer = None
+			current = None
+
+
+def collect_ical_events(lines, window_start, window_end):
+	"""
+	Parse VEVENTs from a line stream and return those overlapping the sync window
+
+	Recurring events (RRULE/RDATE/EXDATE) are expanded inside the window only.
+	Modified instances (RECURRENCE-ID) replace the matching generated occurrence.
+
+	Args:
+		lines (iterable): Raw feed lines
+		window_start (datetime): Start of the sync window (system timezone, naive)
+		window_end (datetime): End of the sync window (system timezone, naive)
+
+	Returns:
+		list: Standardized event dictionaries for process_calendar_events
+	"""
+	from icalendar import Event
+
+	events_by_id = {}
+	overridden_ids = set()
+	cutoff = window_start.strftime("%Y%m%d")
+
+	for raw_event in iter_ical_components(lines):
+		# Cheap pre-filter: skip non-recurring events that ended before the window
+		# without paying for a full parse
+		if not _is_recurring_raw(raw_event):
+			raw_end = _raw_property_date(raw_event, "DTEND") or _raw_property_date(raw_event, "DTSTART")
+			if raw_end and raw_end < cutoff:
+				continue
+
+		try:
+			component = Event.from_ical(raw_event)
+		except Exception:
+			continue
+
+		is_override = bool(component.get("recurrence-id"))
+		if is_override and component.get("uid"):
+			# A modified or cancelled instance replaces its generated occurrence,
+			# also when it was moved out of the sync window
+			event_id = _occurrence_id(
+				str(component.get("uid")),
+				_to_system_datetime(component.get("recurrence-id").dt)
+			)
+			overridden_ids.add(event_id)
+			events_by_id.pop(event_id, None)
+
+		if str(component.get("status", "")).upper() == "CANCELLED":
+			continue
+		if not component.get("dtstart"):
+			continue
+
+		for event in _expand_ical_event(component, window_start, window_end):
+			event_id = event["external_event_id"]
+
+			if not is_override and event_id in overridden_ids:
+				continue
+
+			events_by_id[event_id] = event
+
+	return list(events_by_id.values())
+
+
+def _is_recurring_raw(raw_event):
+	"""Check an unparsed VEVENT for recurrence properties"""
+	for line in raw_event.split("\r\n"):
+		name = line.split(":", 1)[0].split(";", 1)[0].upper()
+		if name in ("RRULE", "RDATE", "RECURRENCE-ID"):
+			return True
+	return False
+
+
+def _raw_property_date(raw_event, name):
+	"""Return the YYYYMMDD part of an unparsed date property, or None"""
+	for line in raw_event.split("\r\n"):
+		key, _, value = line.partition(":")
+		if key.split(";", 1)[0].upper() == name and len(value) >= 8:
+			return value[:8]
+	return None
+
+
+def _expand_ical_event(component, window_start, window_end):
+	"""
+	Yield standardized occurrences of a VEVENT that overlap the sync window
+
+	Args:
+		component: icalendar Event
+		window_start (datetime): Start of the sync window
+		window_end (datetime): End of the sync window
+
+	Yields:
+		dict: Standardized event dictionary
+	"""
+	from datetime import date, datetime
+
+	dtstart = component.get("dtstart").dt
+	is_all_day = isinstance(dtstart, date) and not isinstance(dtstart, datetime)
+
+	if component.get("dtend"):
+		dtend = component.get("dtend").dt
+	elif component.get("duration"):
+		dtend = dtstart + component.get("duration").dt
+	else:
+		dtend = dtstart + (timedelta(days=1) if is_all_day else timedelta(0))
+
+	start = _to_system_datetime(dtstart)
+	duration = _to_system_datetime(dtend) - start
+
+	uid = str(component.get("uid") or calculate_event_hash({
+		"external_event_id": "",
+		"event_title": str(component.get("summary", "")),
+		"start_datetime": start,
+		"end_datetime": start + duration
+	}))
+	summary = str(component.get("summary", "Busy"))
+	is_busy = str(component.get("transp", "OPAQUE")).upper() != "TRANSPARENT"
+
+	def make_event(occurrence_start, event_id):
+		return {
+			"external_event_id": event_id,
+			"event_title": summary,
+			"start_datetime": occurrence_start,
+			"end_datetime": occurrence_start + duration,
+			"description": str(component.get("description", "")),
+			"location": str(component.get("location", "")),
+			"event_status": "Busy" if is_busy else "Free",
+			"is_all_day": 1 if is_all_day else 0
+		}
+
+	# A modified instance of a recurring series
+	if component.get("recurrence-id"):
+		recurrence_id = _to_system_datetime(component.get("recurrence-id").dt)
+		if start < window_end and start + duration > window_start:
+			yield make_event(start, _occurrence_id(uid, recurrence_id))
+		return
+
+	if not (component.get("rrule") or component.get("rdate")):
+		if start < window_end and start + duration > window_start:
+			yield make_event(start, uid)
+		return
+
+	for occurrence in _iter_recurrences(component, dtstart, window_start - duration, window_end):
+		yield make_event(occurrence, _occurrence_id(uid, occurrence))
+
+
+def _iter_recurrences(component, dtstart, range_start, range_end):
+	"""
+	Expand RRULE/RDATE/EXDATE of a VEVENT between range_start and range_end
+
+	The rule is evaluated on the wall clock of the event's own timezone (so a
+	weekly 09:00 meeting stays at 09:00 across DST changes) and each occurrence
+	is then converted to the system timezone.
+
+	Args:
+		component: icalendar Event
+		dtstart (date|datetime): DTSTART value as parsed by icalendar
+		range_start (datetime): Start of the range (system timezone, naive)
+		range_end (datetime): End of the range (system timezone, naive)
+
+	Returns:
+		list: Occurrence start datetimes (system timezone, naive)
+	"""
+	from datetime import datetime
+
+	from dateutil.rrule import rruleset, rrulestr
+
+	tz = dtstart.tzinfo if isinstance(dtstart, datetime) else None
+
+	def to_wall_clock(value):
+		if isinstance(value, datetime) and value.tzinfo is not None:
+			return (value.astimezone(tz) if tz else _to_system_datetime(value)).replace(tzinfo=None)
+		return _to_system_datetime(value)
+
+	def to_system(value):
+		if tz is None:
+			return value
+		localized = tz.localize(value) if hasattr(tz, "localize") else value.replace(tzinfo=tz)
+		return _to_system_datetime(localized)
+
+	ruleset = rruleset()
+	base = to_wall_clock(dtstart)
+
+	rrules = component.get("rrule")
+	for rrule in rrules if isinstance(rrules, list) else [rrules] if rrules else []:
+		rule_text = rrule.to_ical().decode()
+		# UNTIL may be UTC-qualified; the ruleset works on naive wall-clock datetimes
+		rule_text = ";".join(
+			part[:-1] if part.upper().startswith("UNTIL=") and part.endswith("Z") else part
+			for part in rule_text.split(";")
+		)
+		ruleset.rrule(rrulestr(rule_text, dtstart=base, ignoretz=True))
+
+	for prop, add in (("rdate", ruleset.rdate), ("exdate", ruleset.exdate)):
+		values = component.get(prop)
+		for value in values if isinstance(values, list) else [values] if values else []:
+			for period in value.dts:
+				dt = period.dt[0] if isinstance(period.dt, tuple) else period.dt
+				add(to_wall_clock(dt))
+
+	# Widen by a day to absorb the offset between event and system timezone,
+	# then filter precisely once occurrences are in system time
+	occurrences = ruleset.between(
+		range_start - timedelta(days=1),
+		range_end + timedelta(days=1),
+		inc=True
+	)
+
+	return [
+		occurrence
+		for occurrence in (to_system(o) for o in occurrences)
+		if range_start <= occurrence < range_end
+	]
+
+
+def _occurrence_id(uid, occurrence_start):
+	"""Build a stable external ID for one occurrence of a recurring event"""
+	return f"{uid}_{occurrence_start.strftime('%Y%m%dT%H%M%S')}"
+
+
+def _to_system_datetime(value):
+	"""Convert an iCal date/datetime to a naive datetime in the system timezone"""
+	from datetime import date, datetime
+
+	import pytz
+	from frappe.utils import get_system_timezone
+
+	if not isinstance(value, datetime):
+		if isinstance(value, date):
+			return datetime.combine(value, datetime.min.time())
+		return value
+
+	if value.tzinfo is None:
+		return value
+
+	return value.astimezone(pytz.timezone(get_system_timezone())).replace(tzinfo=None)
+
+
 def process_calendar_events(integration, events):
 	"""
-	Process fetched calendar events and update MM Calendar Event Sync
+	Bulk upsert fetched calendar events into MM Calendar Event Sync
+
+	Existing rows for the integration are loaded in one query and compared by
+	sync hash; only new rows are inserted (in a single bulk insert) and only
+	changed rows are written. Inbound rows that were not seen in this fetch
+	are deleted in one statement. Outbound rows (bookings pushed to the
+	external calendar) are never touched here.
 
 	Args:
 		integration: MM Calendar Integration document
 		events (list): List of event dictionaries with keys:
 			- external_event_id
-			- event_summary
-			- event_start
-			- event_end
-			- event_status
-			- is_all_day
-	"""
-	synced_event_ids = []
+			- event_title
+			- start_datetime
+			- end_datetime
+			- description (optional)
+			- location (optional)
+			- event_status (optional, "Busy" or "Free")
+			- is_all_day (optional)
+			- external_last_modified (optional)
 
-	for event in events:
-		# Calculate sync hash
-		sync_hash = calculate_event_hash(event)
+	Returns:
+		dict: Counts of fetched, inserted, updated, unchanged and deleted events
+	"""
+	now = now_datetime()
 
-		# Check if event already exists
-		existing_sync = frappe.db.exists(
+	existing = {
+		row.external_event_id: row
+		for row in frappe.get_all(
 			"MM Calendar Event Sync",
-			{
-				"integration": integration.name,
-				"external_event_id": event["external_event_id"]
-			}
+			filters={"calendar_integration": integration.name},
+			fields=["name", "external_event_id", "sync_hash", "sync_direction"]
 		)
+	}
 
-		if existing_sync:
-			# Check if event has changed
-			current_hash = frappe.db.get_value(
-				"MM Calendar Event Sync",
-				existing_sync,
-				"sync_hash"
-			)
+	seen_names = set()
+	to_insert = []
+	updated = 0
 
-			if current_hash != sync_hash:
-				# Event has changed, update it
-				sync_doc = frappe.get_doc("MM Calendar Event Sync", existing_sync)
-				update_calendar_event_sync(sync_doc, integration, event, sync_hash)
-				sync_doc.save(ignore_permissions=True)
+	for event in events:
+		sync_hash = calculate_event_hash(event)
+		row = existing.get(event["external_event_id"])
+
+		if not row:
+			to_insert.append((event, sync_hash))
+			continue
+
+		seen_names.add(row.name)
+
+		if row.sync_direction == "Outbound" or row.sync_hash == sync_hash:
+			continue
+
+		values = get_calendar_event_sync_values(event, sync_hash, now)
+		values.pop("external_event_id")
+		frappe.db.set_value("MM Calendar Event Sync", row.name, values, update_modified=False)
+		updated += 1
+
+	if to_insert:
+		names = reserve_calendar_event_sync_names(integration.name, len(to_insert))
+		columns = [
+			"name", "creation", "modified", "owner", "modified_by", "docstatus",
+			"calendar_integration", "sync_direction"
+		]
+		value_fields = list(get_calendar_event_sync_values(*to_insert[0], now).keys())
+		rows = []
+
+		for name, (event, sync_hash) in zip(names, to_insert, strict=True):
+			values = get_calendar_event_sync_values(event, sync_hash, now)
+			rows.append((
+				name, now, now, integration.user, integration.user, 0, integration.name, "Inbound",
+				*(values[field] for field in value_fields)
+			))
+
+		frappe.db.bulk_insert("MM Calendar Event Sync", columns + value_fields, rows)
+
+	deleted = delete_orphaned_calendar_events(integration, seen_names, existing.values())
+
+	return {
+		"fetched": len(events),
+		"inserted": len(to_insert),
+		"updated": updated,
+		"unchanged": len(seen_names) - updated,
+		"deleted": deleted
+	}
+
+
+def get_calendar_event_sync_values(event, sync_hash, synced_at):
+	"""Map a standardized event dictionary to MM Calendar Event Sync field values"""
+	is_all_day = 1 if event.get("is_all_day") else 0
+
+	return {
+		"external_event_id": event["external_event_id"],
+		"event_title": (event.get("event_title") or "Busy")[:140],
+		"event_type": "All-Day Event" if is_all_day else "External Event",
+		"sync_status": "Synced",
+		"start_datetime": event["start_datetime"],
+		"end_datetime": event["end_datetime"],
+		"description": event.get("description") or "",
+		"location": (event.get("location") or "")[:140],
+		"is_blocking_availability": 0 if event.get("event_status") == "Free" else 1,
+		"last_synced": synced_at,
+		"external_last_modified": event.get("external_last_modified"),
+		"sync_hash": sync_hash
+	}
+
+
+def reserve_calendar_event_sync_names(integration_name, count):
+	"""
+	Reserve a block of names for new MM Calendar Event Sync rows
 
-			synced_event_ids.append(existing_sync)
-		else:
-			# New event, create it
-			sync_doc = frappe.get_doc({
-				"doctype": "MM Calendar Event Sync",
-				"user": integration.user,
-				"integration": integration.name
-			})
+	Follows the doctype's autoname (format:MM-CES-{calendar_integration}-{####})
+	but advances the naming series once for the whole block.
+
+	Args:
+		integration_name (str): MM Calendar Integration ID
+		count (int): Number of names to reserve
 
-			update_calendar_event_sync(sync_doc, integration, event, sync_hash)
-			sync_doc.insert(ignore_permissions=True)
-			synced_event_ids.append(sync_doc.name)
+	Returns:
+		list: Document names
+	"""
+	prefix = f"MM-CES-{integration_name}-"
 
-	# Delete events that no longer exist in external calendar
-	delete_orphaned_calendar_events(integration, synced_event_ids)
+	current = frappe.db.sql(
+		"SELECT `current` FROM `tabSeries` WHERE `name` = %s FOR UPDATE",
+		(prefix,)
+	)
 
+	if current and current[0][0] is not None:
+		start = current[0][0]
+		frappe.db.sql(
+			"UPDATE `tabSeries` SET `current` = `current` + %s WHERE `name` = %s",
+			(count, prefix)
+		)
+	else:
+		start = 0
+		frappe.db.sql(
+			"INSERT INTO `tabSeries` (`name`, `current`) VALUES (%s, %s)",
+			(prefix, count)
+		)
 
-def update_calendar_event_sync(sync_doc, integration, event, sync_hash):
-	"""Update a calendar event sync document with event data"""
-	sync_doc.external_event_id = event["external_event_id"]
-	sync_doc.event_summary = event["event_summary"]
-	sync_doc.event_start = event["event_start"]
-	sync_doc.event_end = event["event_end"]
-	sync_doc.event_status = event.get("event_status", "Busy")
-	sync_doc.is_all_day = event.get("is_all_day", 0)
-	sync_doc.last_synced = now_datetime()
-	sync_doc.sync_hash = sync_hash
+	return [f"{prefix}{i:04d}" for i in range(start + 1, start + count + 1)]
 
 
-def delete_orphaned_calendar_events(integration, synced_event_ids):
+def delete_orphaned_calendar_events(integration, seen_names, existing_rows):
 	"""
-	Delete calendar event syncs that no longer exist in external calendar
+	Delete inbound calendar event syncs that no longer exist in external calendar
 
 	Args:
 		integration: MM Calendar Integration document
-		synced_event_ids (list): List of event sync IDs that were just synced
-	"""
-	# Find all events for this integration that weren't in the sync
-	orphaned_events = frappe.get_all(
-		"MM Calendar Event Sync",
-		filters={
-			"integration": integration.name,
-			"name": ["not in", synced_event_ids] if synced_event_ids else ["!=", ""]
-		},
-		pluck="name"
-	)
+		seen_names (set): Event sync IDs that were present in this fetch
+		existing_rows (iterable): Event sync rows loaded before the fetch
 
-	for event_id in orphaned_events:
-		frappe.delete_doc("MM Calendar Event Sync", event_id, ignore_permissions=True)
+	Returns:
+		int: Number of deleted rows
+	"""
+	orphaned_events = [
+		row.name
+		for row in existing_rows
+		if row.sync_direction == "Inbound" and row.name not in seen_names
+	]
 
 	if orphaned_events:
+		frappe.db.delete("MM Calendar Event Sync", {"name": ["in", orphaned_events]})
 		frappe.logger().info(
 			f"Deleted {len(orphaned_events)} orphaned calendar events for {integration.user}"
 		)
 
+	return len(orphaned_events)
+
 
 def calculate_event_hash(event):
 	"""
@@ -392,10 +805,12 @@ def calculate_event_hash(event):
 	"""
 	event_string = (
 		f"{event['external_event_id']}"
-		f"{event['event_summary']}"
-		f"{event['event_start'].isoformat()}"
-		f"{event['event_end'].isoformat()}"
+		f"{event.get('event_title', '')}"
+		f"{event['start_datetime'].isoformat()}"
+		f"{event['end_datetime'].isoformat()}"
 		f"{event.get('event_status', 'Busy')}"
+		f"{event.get('location', '')}"
+		f"{event.get('description', '')}"
 	)
 
 	return hashlib.md5(event_string.encode()).hexdigest()
@@ -466,125 +881,30 @@ def refresh_outlook_token(integration):
 
 def create_calendar_event_in_external(booking):
 	"""
-	Create/update a booking in the assigned member's external calendar (ACTUAL IMPLEMENTATION)
+	Create/update a booking in the hosts' external calendars
 
 	This is called when a booking is created or updated in Meeting Manager
-	to push the event to the member's Google Calendar/Outlook
+	to push the event to the hosts' Google Calendar/Outlook. The write is
+	queued and sent in a batch by the calendar write queue.
 
 	Args:
 		booking: MM Meeting Booking document
 	"""
-	if not booking.assigned_to:
-		return
-
-	# Get member's active calendar integrations with two-way sync
-	integrations = frappe.get_all(
-		"MM Calendar Integration",
-		filters={
-			"user": booking.assigned_to,
-			"is_active": 1,
-			"sync_direction": "Two-way (Read & Write)"
-		},
-		fields=["name", "integration_type"]
-	)
-
-	for integration in integrations:
-		try:
-			# Prepare event data
-			event_data = {
-				'summary': f"{booking.meeting_type} - {booking.customer_name}",
-				'start': booking.scheduled_datetime,
-				'end': add_to_date(booking.scheduled_datetime, minutes=booking.duration or 30),
-				'description': f"Meeting Manager Booking: {booking.name}\nCustomer: {booking.customer_name}"
-			}
-
-			external_event_id = None
-
-			if integration.integration_type == "Google Calendar":
-				from meeting_manager.meeting_manager.services.google_calendar_service import GoogleCalendarService
-				service = GoogleCalendarService(integration.name)
-				external_event_id = service.create_event(event_data)
-
-			elif integration.integration_type == "Outlook Calendar":
-				from meeting_manager.meeting_manager.services.outlook_service import OutlookCalendarService
-				service = OutlookCalendarService(integration.name)
-				external_event_id = service.create_event(event_data)
-
-			# iCal is read-only, skip
-
-			# Create MM Calendar Event Sync record to track the external event
-			if external_event_id:
-				sync_doc = frappe.get_doc({
-					'doctype': 'MM Calendar Event Sync',
-					'user': booking.assigned_to,
-					'calendar_integration': integration.name,
-					'external_event_id': external_event_id,
-					'event_title': event_data['summary'],
-					'start_datetime': event_data['start'],
-					'end_datetime': event_data['end'],
-					'meeting_booking': booking.name,
-					'sync_direction': 'Outbound',
-					'sync_status': 'Synced'
-				})
-				sync_doc.insert(ignore_permissions=True)
-				frappe.db.commit()
-
-				frappe.logger().info(
-					f"Created event in {integration.integration_type} for booking {booking.name}"
-				)
+	from meeting_manager.meeting_manager.services.calendar_write_queue import queue_booking_calendar_sync
 
-		except Exception as e:
-			frappe.log_error(
-				title=f"Failed to create event in {integration.integration_type}",
-				message=f"Booking: {booking.name}, Error: {str(e)}"
-			)
+	queue_booking_calendar_sync(booking.name)
 
 
 def delete_calendar_event_from_external(booking):
 	"""
-	Delete a booking from external calendar when cancelled (ACTUAL IMPLEMENTATION)
+	Delete a booking from external calendars when cancelled
+
+	The calendar write queue removes the external events of bookings that are
+	cancelled or no longer assigned to the integration's user.
 
 	Args:
 		booking: MM Meeting Booking document
 	"""
-	if not booking.assigned_to:
-		return
+	from meeting_manager.meeting_manager.services.calendar_write_queue import queue_booking_calendar_sync
 
-	# Find linked calendar event syncs for this booking
-	synced_events = frappe.get_all(
-		"MM Calendar Event Sync",
-		filters={
-			"meeting_booking": booking.name,
-			"sync_direction": "Outbound"
-		},
-		fields=["name", "calendar_integration", "external_event_id"]
-	)
-
-	for sync_event in synced_events:
-		try:
-			# Get integration details
-			integration = frappe.get_doc("MM Calendar Integration", sync_event.calendar_integration)
-
-			if integration.integration_type == "Google Calendar":
-				from meeting_manager.meeting_manager.services.google_calendar_service import GoogleCalendarService
-				service = GoogleCalendarService(integration)
-				service.delete_event(sync_event.external_event_id)
-
-			elif integration.integration_type == "Outlook Calendar":
-				from meeting_manager.meeting_manager.services.outlook_service import OutlookCalendarService
-				service = OutlookCalendarService(integration)
-				service.delete_event(sync_event.external_event_id)
-
-			# Delete the sync record
-			frappe.delete_doc("MM Calendar Event Sync", sync_event.name, ignore_permissions=True)
-			frappe.db.commit()
-
-			frappe.logger().info(
-				f"Deleted event from {integration.integration_type} for booking {booking.name}"
-			)
-
-		except Exception as e:
-			frappe.log_error(
-				title=f"Failed to delete event from external calendar",
-				message=f"Booking: {booking.name}, Sync Event: {sync_event.name}, Error: {str(e)}"
-			)
+	queue_booking_calendar_sync(booking.name)
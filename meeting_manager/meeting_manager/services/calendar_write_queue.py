@@ -0,0 +1,442 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+"""
+Calendar Write Queue
+
+Outbound (two-way) calendar writes are not sent from the request that changes
+a booking. The booking name is added to a Redis set instead, and a background
+job flushes the set:
+
+1. Load the queued bookings, their hosts, the hosts' two-way integrations and
+   the existing outbound MM Calendar Event Sync rows in a handful of queries.
+2. Diff desired vs existing events per (booking, integration) into create,
+   update and delete operations. Queuing the same booking many times before
+   a flush therefore results in a single operation per integration.
+3. Send the operations per integration through the provider batch endpoint
+   (Google batch HTTP API, Graph $batch).
+4. Write the resulting sync records in bulk. The job runner commits them
+   when the flush job finishes.
+
+Bookings whose operations failed are put back on the queue for the next
+scheduled flush.
+
+Deleted bookings have no document left to diff against. In on_trash their
+outbound sync rows are unlinked and marked Deleted Locally instead. Those rows
+are the delete queue: a row is removed only once the provider confirmed the
+delete of its external event, so nothing is lost when Redis is flushed.
+"""
+
+import frappe
+from frappe.utils import get_system_timezone, now_datetime
+
+from meeting_manager.meeting_manager.services.calendar_sync import (
+	calculate_event_hash,
+	reserve_calendar_event_sync_names,
+)
+
+OUTBOX_KEY = "mm_calendar_write_queue"
+
+# Bookings popped from the queue, or delete rows read, per flush round
+FLUSH_BATCH_SIZE = 200
+
+# Outbound sync rows of deleted bookings whose external event still has to be deleted
+PENDING_DELETE_STATUS = "Deleted Locally"
+
+WRITABLE_INTEGRATION_TYPES = ("Google Calendar", "Outlook Calendar")
+
+
+def queue_booking_calendar_sync(booking_name):
+	"""
+	Queue a booking for pushing to its hosts' external calendars
+
+	Args:
+		booking_name (str): MM Meeting Booking ID
+	"""
+	frappe.cache().sadd(OUTBOX_KEY, booking_name)
+	_enqueue_flush()
+
+
+def queue_booking_calendar_deletes(booking_name):
+	"""
+	Queue deleting a booking's external events
+
+	Called from MM Meeting Booking on_trash. The outbound sync rows are unlinked
+	from the booking, so they do not block the delete, and marked Deleted Locally
+	until the flush has deleted their external events.
+
+	Args:
+		booking_name (str): MM Meeting Booking ID
+	"""
+	filters = {"meeting_booking": booking_name, "sync_direction": "Outbound"}
+	if not frappe.db.exists("MM Calendar Event Sync", filters):
+		return
+
+	frappe.db.set_value(
+		"MM Calendar Event Sync",
+		filters,
+		{"meeting_booking": None, "sync_status": PENDING_DELETE_STATUS},
+		update_modified=False
+	)
+	_enqueue_flush()
+
+
+def _enqueue_flush():
+	frappe.enqueue(
+		"meeting_manager.meeting_manager.services.calendar_write_queue.flush_calendar_write_queue",
+		queue="short",
+		job_id=f"{frappe.local.site}:{OUTBOX_KEY}",
+		deduplicate=True,
+		enqueue_after_commit=True
+	)
+
+
+def flush_calendar_write_queue():
+	"""
+	Drain the calendar write queue
+
+	Called from the background job enqueued by queue_booking_calendar_sync and
+	from the scheduler, which also retries failed operations.
+
+	A failing round is logged and ends the flush instead of failing the job, so
+	the sync records of earlier rounds, whose external writes already happened,
+	are still committed.
+	"""
+	last_name = ""
+	while True:
+		records = frappe.get_all(
+			"MM Calendar Event Sync",
+			filters={
+				"sync_direction": "Outbound",
+				"sync_status": PENDING_DELETE_STATUS,
+				"name": [">", last_name]
+			},
+			fields=["name", "calendar_integration", "external_event_id"],
+			order_by="name asc",
+			limit=FLUSH_BATCH_SIZE
+		)
+		if not records:
+			break
+
+		last_name = records[-1].name
+		try:
+			delete_external_events(records)
+		except Exception:
+			# The rows stay queued for the next flush
+			frappe.log_error(title="Calendar Write Queue Error - Deletes")
+			return
+
+	failed_bookings = set()
+	while True:
+		booking_names = _pop_batch(OUTBOX_KEY)
+		if not booking_names:
+			break
+
+		try:
+			result = sync_bookings_to_external_calendars(booking_names)
+		except Exception:
+			frappe.log_error(title="Calendar Write Queue Error")
+			failed_bookings.update(booking_names)
+			break
+
+		failed_bookings.update(result["failed_bookings"])
+
+	if failed_bookings:
+		# Retried by the next scheduled flush rather than in this loop
+		frappe.cache().sadd(OUTBOX_KEY, *failed_bookings)
+
+
+def _pop_batch(key):
+	"""
+	Pop up to FLUSH_BATCH_SIZE members of a queue set
+
+	RedisWrapper.spop prefixes the key like sadd does, but pops one member per call.
+	"""
+	cache = frappe.cache()
+	members = []
+
+	while len(members) < FLUSH_BATCH_SIZE:
+		member = cache.spop(key)
+		if member is None:
+			break
+		members.append(member.decode() if isinstance(member, bytes) else member)
+
+	return members
+
+
+def delete_external_events(records):
+	"""
+	Delete the external events of deleted bookings
+
+	Args:
+		records (list): Deleted Locally MM Calendar Event Sync rows with name,
+			calendar_integration and external_event_id
+
+	Returns:
+		dict: Counts of created, updated, deleted and failed operations
+	"""
+	operations_by_integration = {}
+	for record in records:
+		operations_by_integration.setdefault(record.calendar_integration, []).append({
+			# The booking is gone, so the sync row identifies the operation
+			"key": record.name,
+			"action": "delete",
+			"event_id": record.external_event_id,
+			"record": record,
+			"pending_delete": True
+		})
+
+	return _apply_operations(operations_by_integration)
+
+
+def sync_bookings_to_external_calendars(booking_names):
+	"""
+	Push the current state of bookings to their hosts' external calendars
+
+	Args:
+		booking_names (list): MM Meeting Booking IDs
+
+	Returns:
+		dict: Counts of created, updated, deleted and failed operations, and the
+			names of bookings with a failed operation under failed_bookings
+	"""
+	bookings = {
+		b.name: b
+		for b in frappe.get_all(
+			"MM Meeting Booking",
+			filters={"name": ["in", booking_names]},
+			fields=[
+				"name", "meeting_type", "meeting_title", "meeting_description",
+				"meeting_location", "video_meeting_url", "booking_reference",
+				"booking_status", "start_datetime", "end_datetime"
+			]
+		)
+	}
+
+	hosts_by_booking = {}
+	for row in frappe.get_all(
+		"MM Meeting Booking Assigned User",
+		filters={"parent": ["in", list(bookings)], "parenttype": "MM Meeting Booking"},
+		fields=["parent", "user"]
+	) if bookings else []:
+		hosts_by_booking.setdefault(row.parent, set()).add(row.user)
+
+	all_hosts = set().union(*hosts_by_booking.values()) if hosts_by_booking else set()
+	integrations_by_user = {}
+	for row in frappe.get_all(
+		"MM Calendar Integration",
+		filters={
+			"user": ["in", list(all_hosts)],
+			"is_active": 1,
+			"sync_direction": "Two-way (Read & Write)",
+			"integration_type": ["in", WRITABLE_INTEGRATION_TYPES]
+		},
+		fields=["name", "user"]
+	) if all_hosts else []:
+		integrations_by_user.setdefault(row.user, []).append(row.name)
+
+	existing = {
+		(row.meeting_booking, row.calendar_integration): row
+		for row in frappe.get_all(
+			"MM Calendar Event Sync",
+			filters={"meeting_booking": ["in", booking_names], "sync_direction": "Outbound"},
+			fields=["name", "meeting_booking", "calendar_integration", "external_event_id", "sync_hash"]
+		)
+	}
+
+	# Diff desired vs existing events into operations grouped per integration
+	timezone = get_system_timezone()
+	operations_by_integration = {}
+	desired_keys = set()
+
+	for booking in bookings.values():
+		if booking.booking_status == "Cancelled" or not booking.start_datetime or not booking.end_datetime:
+			continue
+
+		event_data = _build_event_data(booking, timezone)
+		sync_hash = calculate_event_hash({
+			"external_event_id": booking.name,
+			"event_title": event_data["summary"],
+			"start_datetime": event_data["start"],
+			"end_datetime": event_data["end"],
+			"location": event_data.get("location", ""),
+			"description": event_data["description"]
+		})
+
+		for user in hosts_by_booking.get(booking.name, ()):
+			for integration_name in integrations_by_user.get(user, ()):
+				desired_keys.add((booking.name, integration_name))
+				record = existing.get((booking.name, integration_name))
+
+				if record and record.sync_hash == sync_hash:
+					continue
+
+				operations_by_integration.setdefault(integration_name, []).append({
+					"key": booking.name,
+					"action": "update" if record else "create",
+					"event_id": record.external_event_id if record else None,
+					"event_data": event_data,
+					"sync_hash": sync_hash,
+					"record": record
+				})
+
+	for (booking_name, integration_name), record in existing.items():
+		if (booking_name, integration_name) not in desired_keys:
+			operations_by_integration.setdefault(integration_name, []).append({
+				"key": booking_name,
+				"action": "delete",
+				"event_id": record.external_event_id,
+				"record": record
+			})
+
+	counts = _apply_operations(operations_by_integration)
+	counts["failed_bookings"] = sorted(counts.pop("failed_keys"))
+	return counts
+
+
+def _build_event_data(booking, timezone):
+	"""Build provider-neutral event data for a booking"""
+	description = f"Meeting Manager Booking: {booking.booking_reference or booking.name}"
+	if booking.video_meeting_url:
+		description += f"\nJoin: {booking.video_meeting_url}"
+
+	event_data = {
+		"summary": booking.meeting_title or booking.meeting_type,
+		"start": booking.start_datetime,
+		"end": booking.end_datetime,
+		"description": description,
+		"timezone": timezone
+	}
+
+	if booking.meeting_location:
+		event_data["location"] = booking.meeting_location
+
+	return event_data
+
+
+def _apply_operations(operations_by_integration):
+	"""
+	Send operations through each integration's batch endpoint and store the results
+
+	Args:
+		operations_by_integration (dict): {integration name: [operation dict]}
+
+	Returns:
+		dict: Counts of created, updated, deleted and failed operations, and the
+			keys of the failed operations under failed_keys
+	"""
+	from meeting_manager.meeting_manager.services.token_manager import get_calendar_service
+
+	now = now_datetime()
+	to_insert = []
+	to_delete = []
+	counts = {"created": 0, "updated": 0, "deleted": 0, "failed": 0}
+	failed_keys = set()
+
+	for integration_name, operations in operations_by_integration.items():
+		try:
+			service = get_calendar_service(integration_name)
+			results = service.batch_write(operations)
+		except Exception as e:
+			frappe.log_error(
+				title=f"Calendar Write Queue Error - {integration_name}",
+				message=str(e)
+			)
+			counts["failed"] += len(operations)
+			failed_keys.update(op["key"] for op in operations)
+			continue
+
+		errors = []
+
+		for op in operations:
+			result = results.get(op["key"]) or {"error": "No response"}
+
+			if result.get("error"):
+				counts["failed"] += 1
+				failed_keys.add(op["key"])
+				errors.append(f"{op['action']} {op['key']}: {result['error']}")
+				if op["record"]:
+					values = {"sync_error_log": result["error"][:1000]}
+					# Rows of deleted bookings stay Deleted Locally, so the delete is retried
+					if not op.get("pending_delete"):
+						values["sync_status"] = "Sync Failed"
+					frappe.db.set_value("MM Calendar Event Sync", op["record"].name, values, update_modified=False)
+				continue
+
+			if op["action"] == "create":
+				to_insert.append((integration_name, op, result["event_id"]))
+				counts["created"] += 1
+			elif op["action"] == "update":
+				frappe.db.set_value(
+					"MM Calendar Event Sync",
+					op["record"].name,
+					{
+						"event_title": op["event_data"]["summary"],
+						"start_datetime": op["event_data"]["start"],
+						"end_datetime": op["event_data"]["end"],
+						"sync_status": "Synced",
+						"sync_error_log": None,
+						"last_synced": now,
+						"sync_hash": op["sync_hash"]
+					},
+					update_modified=False
+				)
+				counts["updated"] += 1
+			else:
+				to_delete.append(op["record"].name)
+				counts["deleted"] += 1
+
+		if errors:
+			frappe.log_error(
+				title=f"Calendar Write Queue Errors - {integration_name}",
+				message="\n".join(errors)
+			)
+
+	_insert_outbound_records(to_insert, now)
+
+	if to_delete:
+		frappe.db.delete("MM Calendar Event Sync", {"name": ["in", to_delete]})
+
+	counts["failed_keys"] = failed_keys
+	return counts
+
+
+def _insert_outbound_records(created, now):
+	"""
+	Bulk insert MM Calendar Event Sync rows for newly created external events
+
+	Args:
+		created (list): Tuples of (integration name, operation dict, external event ID)
+		now (datetime): Sync timestamp
+	"""
+	if not created:
+		return
+
+	columns = [
+		"name", "creation", "modified", "owner", "modified_by", "docstatus",
+		"calendar_integration", "external_event_id", "event_title", "event_type",
+		"sync_status", "start_datetime", "end_datetime", "location", "meeting_booking",
+		"is_blocking_availability", "last_synced", "sync_direction", "sync_hash"
+	]
+
+	by_integration = {}
+	for integration_name, op, event_id in created:
+		by_integration.setdefault(integration_name, []).append((op, event_id))
+
+	rows = []
+	for integration_name, items in by_integration.items():
+		names = reserve_calendar_event_sync_names(integration_name, len(items))
+
+		for name, (op, event_id) in zip(names, items, strict=True):
+			event_data = op["event_data"]
+			rows.append((
+				name, now, now, "Administrator", "Administrator", 0,
+				integration_name, event_id, event_data["summary"], "Meeting Booking",
+				"Synced", event_data["start"], event_data["end"], event_data.get("location", ""),
+				op["key"],
+				# The booking itself already blocks the host's availability
+				0,
+				now, "Outbound", op["sync_hash"]
+			))
+
+	frappe.db.bulk_insert("MM Calendar Event Sync", columns, rows)
@@ -0,0 +1,341 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+"""
+Customer Identity Lookup
+
+MM Customer Identity maps every normalized email address and phone number
+of a Contact to that Contact. The document name is the identity key
+("email:jane@example.com", "phone:+4512345678"), so finding the customer
+for a booking is a primary key lookup instead of a scan over Contact,
+Contact Email and Contact Phone.
+
+- Emails are stripped and lowercased.
+- Phone numbers are reduced to E.164 digits. Numbers with only the national
+  part get the default country code (site config
+  "mm_default_phone_country_code", 45 when unset).
+
+The table is kept in sync from the Contact on_update / on_trash hooks and
+rebuilt by rebuild_customer_identities. An identity belongs to the first
+Contact that claims it; later Contacts with the same email or phone do not
+take it over. When the owner drops the email or phone, or is deleted, the
+identity passes to the oldest other Contact that still has it.
+"""
+
+import re
+
+import frappe
+from frappe.utils import now_datetime
+
+IDENTITY_DOCTYPE = "MM Customer Identity"
+
+DEFAULT_COUNTRY_CODE = "45"
+
+# Phone numbers with only the national part (Danish numbers have 8 digits)
+NATIONAL_NUMBER_LENGTH = 8
+
+# Fewer digits than this are not treated as a phone number
+MIN_PHONE_DIGITS = 6
+
+# Longest identity key that fits the document name
+MAX_KEY_LENGTH = 140
+
+INSERT_BATCH_SIZE = 1000
+
+
+def normalize_email(email):
+	"""Lowercased, stripped email address, or None"""
+	email = (email or "").strip().lower()
+	return email or None
+
+
+def normalize_phone(phone):
+	"""
+	Normalize a phone number to E.164 ("+4512345678")
+
+	Args:
+		phone (str): Phone number as typed ("+45 12 34 56 78", "0045...", "12345678")
+
+	Returns:
+		str: E.164 number, or None if the value has too few digits
+	"""
+	phone = (phone or "").strip()
+	digits = re.sub(r"\D", "", phone)
+	if len(digits) < MIN_PHONE_DIGITS:
+		return None
+
+	if not phone.startswith("+"):
+		if digits.startswith("00"):
+			digits = digits[2:]
+		elif len(digits) == NATIONAL_NUMBER_LENGTH:
+			digits = _get_default_country_code() + digits
+
+	return f"+{digits}"
+
+
+def get_identity_key(identity_type, value):
+	"""Document name of an identity: "<type>:<normalized value>" """
+	return f"{identity_type.lower()}:{value}"
+
+
+def find_contact(email=None, phone=None):
+	"""
+	Find the Contact of an email or phone number
+
+	Email takes priority over phone.
+
+	Args:
+		email (str, optional): Email address
+		phone (str, optional): Phone number
+
+	Returns:
+		tuple: (Contact name, "Email" or "Phone"), or (None, None)
+	"""
+	email = normalize_email(email)
+	if email:
+		contact = get_identity_contact("Email", email)
+		if contact:
+			return contact, "Email"
+
+	phone = normalize_phone(phone)
+	if phone:
+		contact = get_identity_contact("Phone", phone)
+		if contact:
+			return contact, "Phone"
+
+	return None, None
+
+
+def get_identity_contact(identity_type, value, for_update=False):
+	"""
+	Get the Contact that owns a normalized identity
+
+	Args:
+		identity_type (str): "Email" or "Phone"
+		value (str): Normalized email or E.164 phone number
+		for_update (bool): Lock the row and read the latest committed owner
+
+	Returns:
+		str: Contact name, or None
+	"""
+	result = frappe.db.sql(f"""
+		SELECT contact FROM `tabMM Customer Identity`
+		WHERE name = %s
+		{"FOR UPDATE" if for_update else ""}
+	""", (get_identity_key(identity_type, value),))
+
+	return result[0][0] if result else None
+
+
+def get_contact_identities(email_ids=(), phones=()):
+	"""
+	Normalized identities of a contact
+
+	Args:
+		email_ids (iterable): Email addresses
+		phones (iterable): Phone numbers
+
+	Returns:
+		list: (identity_type, value) tuples without duplicates
+	"""
+	identities = [("Email", normalize_email(e)) for e in email_ids]
+	identities += [("Phone", normalize_phone(p)) for p in phones]
+
+	return list(dict.fromkeys(
+		(identity_type, value) for identity_type, value in identities
+		if value and len(get_identity_key(identity_type, value)) <= MAX_KEY_LENGTH
+	))
+
+
+def register_identities(contact, identities):
+	"""
+	Claim identities for a contact
+
+	Identities that already belong to another contact are left alone. A
+	concurrent transaction claiming the same identity makes this insert
+	wait until that transaction ends.
+
+	Args:
+		contact (str): Contact name
+		identities (list): (identity_type, value) tuples
+	"""
+	_insert_identities([(contact, identity_type, value) for identity_type, value in identities])
+
+
+def sync_contact_identities(doc, method=None):
+	"""Contact on_update: register new emails and phones, drop removed ones"""
+	identities = get_contact_identities(
+		[doc.email_id] + [row.email_id for row in doc.get("email_ids") or []],
+		[doc.phone, doc.mobile_no] + [row.phone for row in doc.get("phone_nos") or []]
+	)
+	keys = [get_identity_key(identity_type, value) for identity_type, value in identities]
+
+	register_identities(doc.name, identities)
+	release_identities(doc.name, keep=keys)
+
+
+def remove_contact_identities(doc, method=None):
+	"""Contact on_trash"""
+	release_identities(doc.name)
+
+
+def release_identities(contact, keep=()):
+	"""
+	Drop identities of a contact and pass them to the next owner
+
+	Each released identity is claimed by the oldest other Contact that still
+	has the email or phone number, so existing customers keep being found.
+
+	Args:
+		contact (str): Contact name
+		keep (iterable): Identity keys the contact keeps
+	"""
+	filters = {"contact": contact}
+	if keep:
+		filters["name"] = ["not in", list(keep)]
+
+	released = frappe.get_all(IDENTITY_DOCTYPE, filters=filters, fields=["name", "identity_type", "identity_value"])
+	if not released:
+		return
+
+	frappe.db.delete(IDENTITY_DOCTYPE, {"name": ["in", [row.name for row in released]]})
+	_insert_identities(_find_next_owners(
+		{(row.identity_type, row.identity_value) for row in released}, exclude=contact
+	))
+
+
+def _find_next_owners(identities, exclude):
+	"""
+	Find the oldest Contact, other than exclude, for each identity
+
+	Emails are matched in SQL. Phone numbers are stored as typed, so they are
+	matched on their last national digits and confirmed after normalizing.
+
+	Args:
+		identities (set): (identity_type, value) tuples
+		exclude (str): Contact that released the identities
+
+	Returns:
+		list: (contact, identity_type, value) tuples
+	"""
+	emails = [value for identity_type, value in identities if identity_type == "Email"]
+	phone_suffixes = list({
+		value[-NATIONAL_NUMBER_LENGTH:] for identity_type, value in identities if identity_type == "Phone"
+	})
+
+	queries = []
+	if emails:
+		queries += [
+			"""SELECT c.name AS contact, 'Email' AS identity_type, c.email_id AS value, c.creation
+			FROM `tabContact` c
+			WHERE c.name != %(exclude)s AND LOWER(TRIM(c.email_id)) IN %(emails)s""",
+			"""SELECT c.name, 'Email', ce.email_id, c.creation
+			FROM `tabContact Email` ce
+			INNER JOIN `tabContact` c ON c.name = ce.parent
+			WHERE ce.parenttype = 'Contact' AND c.name != %(exclude)s
+				AND LOWER(TRIM(ce.email_id)) IN %(emails)s""",
+		]
+	if phone_suffixes:
+		queries.append(
+			"""SELECT c.name, 'Phone', cp.phone, c.creation
+			FROM `tabContact Phone` cp
+			INNER JOIN `tabContact` c ON c.name = cp.parent
+			WHERE cp.parenttype = 'Contact' AND c.name != %(exclude)s
+				AND RIGHT(REGEXP_REPLACE(cp.phone, '[^0-9]', ''), %(suffix_length)s) IN %(phone_suffixes)s"""
+		)
+
+	rows = frappe.db.sql(
+		" UNION ALL ".join(queries) + " ORDER BY creation, contact",
+		{
+			"exclude": exclude,
+			"emails": emails,
+			"phone_suffixes": phone_suffixes,
+			"suffix_length": NATIONAL_NUMBER_LENGTH,
+		},
+		as_dict=True
+	)
+
+	owners = {}
+	for row in rows:
+		for identity in get_contact_identities(
+			[row.value] if row.identity_type == "Email" else [],
+			[row.value] if row.identity_type == "Phone" else []
+		):
+			if identity in identities:
+				owners.setdefault(identity, row.contact)
+
+	return [(contact, identity_type, value) for (identity_type, value), contact in owners.items()]
+
+
+def rebuild_customer_identities():
+	"""
+	Rebuild MM Customer Identity from all Contacts
+
+	Older contacts claim shared emails and phone numbers first.
+	"""
+	frappe.db.delete(IDENTITY_DOCTYPE)
+
+	rows = frappe.db.sql("""
+		SELECT c.name AS contact, 'Email' AS identity_type, c.email_id AS value, c.creation
+		FROM `tabContact` c
+		WHERE IFNULL(c.email_id, '') != ''
+		UNION ALL
+		SELECT c.name, 'Email', ce.email_id, c.creation
+		FROM `tabContact Email` ce
+		INNER JOIN `tabContact` c ON c.name = ce.parent
+		WHERE ce.parenttype = 'Contact' AND IFNULL(ce.email_id, '') != ''
+		UNION ALL
+		SELECT c.name, 'Phone', cp.phone, c.creation
+		FROM `tabContact Phone` cp
+		INNER JOIN `tabContact` c ON c.name = cp.parent
+		WHERE cp.parenttype = 'Contact' AND IFNULL(cp.phone, '') != ''
+		ORDER BY creation, contact
+	""", as_dict=True)
+
+	identities = []
+	for row in rows:
+		for identity_type, value in get_contact_identities(
+			[row.value] if row.identity_type == "Email" else [],
+			[row.value] if row.identity_type == "Phone" else []
+		):
+			identities.append((row.contact, identity_type, value))
+
+	for i in range(0, len(identities), INSERT_BATCH_SIZE):
+		_insert_identities(identities[i:i + INSERT_BATCH_SIZE])
+
+
+def _insert_identities(rows):
+	"""
+	Insert (contact, identity_type, value) rows, skipping identities that exist
+
+	Args:
+		rows (list): (contact, identity_type, value) tuples
+	"""
+	if not rows:
+		return
+
+	now = now_datetime()
+	user = frappe.session.user if frappe.session else "Administrator"
+	values = []
+	params = {"now": now, "user": user}
+
+	for i, (contact, identity_type, value) in enumerate(rows):
+		values.append(
+			f"(%(name{i})s, %(type{i})s, %(value{i})s, %(contact{i})s, %(now)s, %(now)s, %(user)s, %(user)s)"
+		)
+		params.update({
+			f"name{i}": get_identity_key(identity_type, value),
+			f"type{i}": identity_type,
+			f"value{i}": value,
+			f"contact{i}": contact,
+		})
+
+	frappe.db.sql(f"""
+		INSERT IGNORE INTO `tabMM Customer Identity`
+			(name, identity_type, identity_value, contact, creation, modified, owner, modified_by)
+		VALUES {", ".join(values)}
+	""", params)
+
+
+def _get_default_country_code():
+	return str(frappe.conf.get("mm_default_phone_country_code") or DEFAULT_COUNTRY_CODE).lstrip("+")
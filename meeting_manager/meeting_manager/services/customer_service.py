@@ -6,22 +6,44 @@ Customer Service Module
 
 Provides utilities for finding, creating, and managing Contact records
 used as customers in Meeting Manager. Uses Frappe's built-in Contact doctype
-instead of a custom MM Customer doctype.
+instead of a custom MM Customer doctype. Email and phone lookups use the
+MM Customer Identity table (see services/customer_identity.py).
 """
 
 import frappe
-import re
+from frappe.utils import getdate
+
+from meeting_manager.meeting_manager.services.customer_identity import (
+    get_identity_contact,
+    normalize_email,
+    normalize_phone,
+)
+
+
+CREATE_CUSTOMER_SAVEPOINT = "mm_create_customer"
+
+# Bookings in a status marked Is Cancelled do not count towards customer booking stats
+NOT_CANCELLED_CONDITION = """IFNULL(booking_status, '') NOT IN (
+    SELECT name FROM `tabMM Booking Status` WHERE is_cancelled = 1
+)"""
 
 
 def find_or_create_customer(email, phone=None, name=None):
     """
     Find existing contact by email or phone, or create a new one.
 
+    Lookups go through MM Customer Identity (normalized email / E.164 phone
+    mapped to Contact), so each one is a primary key probe.
+
     Lookup Priority (Email takes priority over phone):
-    1. Search by email in Contact's email_id field
-    2. Search by email in Contact Email child table
-    3. If email not found, search by phone in Contact Phone child table
-    4. If no match, create new Contact
+    1. Search by normalized email
+    2. If email not found, search by normalized phone
+    3. If no match, create new Contact
+
+    Concurrent bookings for the same new customer end up on one Contact:
+    the identity row is claimed in the same transaction as the new Contact,
+    and the request that loses the claim drops its Contact and uses the
+    winner's.
 
     Args:
         email (str): Customer email (primary identifier, required)
@@ -38,14 +60,10 @@ def find_or_create_customer(email, phone=None, name=None):
     if not email:
         frappe.throw("Email is required to find or create a customer.")
 
-    email = email.strip().lower()
+    email = normalize_email(email)
 
-    # 1. Search by email (Contact email_id field)
-    customer_id = frappe.db.get_value(
-        "Contact",
-        filters={"email_id": ["like", email]},
-        fieldname="name"
-    )
+    # 1. Search by email
+    customer_id = get_identity_contact("Email", email)
 
     if customer_id:
         return {
@@ -54,33 +72,12 @@ def find_or_create_customer(email, phone=None, name=None):
             "customer": frappe.get_doc("Contact", customer_id)
         }
 
-    # 2. Search by email in Contact Email child table
-    result = frappe.db.sql("""
-        SELECT parent FROM `tabContact Email`
-        WHERE LOWER(email_id) = %s
-        LIMIT 1
-    """, (email,), as_dict=True)
-
-    if result:
-        customer_id = result[0]['parent']
-        return {
-            "customer_id": customer_id,
-            "created": False,
-            "customer": frappe.get_doc("Contact", customer_id)
-        }
-
-    # 3. Search by phone if email not found
-    if phone:
-        phone_digits = re.sub(r'[\s\-\(\)\+]', '', phone)
+    # 2. Search by phone if email not found
+    normalized_phone = normalize_phone(phone)
+    if normalized_phone:
+        customer_id = get_identity_contact("Phone", normalized_phone)
 
-        result = frappe.db.sql("""
-            SELECT parent FROM `tabContact Phone`
-            WHERE REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(phone, ' ', ''), '-', ''), '(', ''), ')', ''), '+', '') = %s
-            LIMIT 1
-        """, (phone_digits,), as_dict=True)
-
-        if result:
-            customer_id = result[0]['parent']
+        if customer_id:
             customer = frappe.get_doc("Contact", customer_id)
 
             # Add the new email to this contact's email list
@@ -96,7 +93,7 @@ def find_or_create_customer(email, phone=None, name=None):
                 "customer": customer
             }
 
-    # 4. Create new Contact
+    # 3. Create new Contact
     customer_name = name.strip() if name else email.split('@')[0].replace('.', ' ').title()
 
     customer = frappe.get_doc({
@@ -118,7 +115,26 @@ def find_or_create_customer(email, phone=None, name=None):
             "is_primary_phone": 1
         })
 
+    # Background jobs registered after this point belong to the new Contact
+    after_commit = frappe.db.after_commit._functions
+    pending_jobs = len(after_commit)
+
+    frappe.db.savepoint(CREATE_CUSTOMER_SAVEPOINT)
     customer.insert(ignore_permissions=True)
+
+    # The Contact hook claimed the email; a concurrent request may have won it
+    owner = get_identity_contact("Email", email, for_update=True)
+    if owner and owner != customer.name:
+        frappe.db.rollback(save_point=CREATE_CUSTOMER_SAVEPOINT)
+        # A rollback to a savepoint keeps after-commit callbacks; drop those of the discarded Contact
+        while len(after_commit) > pending_jobs:
+            after_commit.pop()
+        return {
+            "customer_id": owner,
+            "created": False,
+            "customer": frappe.get_doc("Contact", owner)
+        }
+
     frappe.db.commit()
 
     return {
@@ -138,32 +154,13 @@ def get_customer_by_email(email):
     Returns:
         Document or None: Contact document if found
     """
+    email = normalize_email(email)
     if not email:
         return None
 
-    email = email.strip().lower()
+    customer_id = get_identity_contact("Email", email)
 
-    # Check email_id first (primary email on Contact)
-    customer_id = frappe.db.get_value(
-        "Contact",
-        filters={"email_id": ["like", email]},
-        fieldname="name"
-    )
-
-    if customer_id:
-        return frappe.get_doc("Contact", customer_id)
-
-    # Check Contact Email child table
-    result = frappe.db.sql("""
-        SELECT parent FROM `tabContact Email`
-        WHERE LOWER(email_id) = %s
-        LIMIT 1
-    """, (email,), as_dict=True)
-
-    if result:
-        return frappe.get_doc("Contact", result[0]['parent'])
-
-    return None
+    return frappe.get_doc("Contact", customer_id) if customer_id else None
 
 
 def get_customer_by_phone(phone):
@@ -176,26 +173,21 @@ def get_customer_by_phone(phone):
     Returns:
         Document or None: Contact document if found
     """
+    phone = normalize_phone(phone)
     if not phone:
         return None
 
-    phone_digits = re.sub(r'[\s\-\(\)\+]', '', phone)
-
-    result = frappe.db.sql("""
-        SELECT parent FROM `tabContact Phone`
-        WHERE REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(phone, ' ', ''), '-', ''), '(', ''), ')', ''), '+', '') = %s
-        LIMIT 1
-    """, (phone_digits,), as_dict=True)
+    customer_id = get_identity_contact("Phone", phone)
 
-    if result:
-        return frappe.get_doc("Contact", result[0]['parent'])
-
-    return None
+    return frappe.get_doc("Contact", customer_id) if customer_id else None
 
 
 def update_customer_booking_stats(customer_id):
     """
-    Update booking statistics for a contact.
+    Recount booking statistics for a single contact.
+
+    Bookings keep the statistics current incrementally (see
+    apply_booking_stats_change); this is for repairing one contact.
 
     Args:
         customer_id (str): Contact document name
@@ -206,28 +198,111 @@ def update_customer_booking_stats(customer_id):
     if not frappe.db.exists("Contact", customer_id):
         return
 
-    # Count total bookings
-    total_bookings = frappe.db.count(
-        "MM Meeting Booking",
-        filters={"customer": customer_id}
-    )
-
-    # Get last booking date
-    last_booking = frappe.db.get_value(
-        "MM Meeting Booking",
-        filters={"customer": customer_id},
-        fieldname="start_datetime",
-        order_by="start_datetime desc"
-    )
-
-    last_booking_date = last_booking.date() if last_booking else None
+    stats = frappe.db.sql(f"""
+        SELECT COUNT(*) AS total_bookings, MAX(start_datetime) AS last_booking
+        FROM `tabMM Meeting Booking`
+        WHERE customer = %s AND {NOT_CANCELLED_CONDITION}
+    """, (customer_id,), as_dict=True)[0]
 
     frappe.db.set_value("Contact", customer_id, {
-        "mm_total_bookings": total_bookings,
-        "mm_last_booking_date": last_booking_date
+        "mm_total_bookings": stats.total_bookings,
+        "mm_last_booking_date": stats.last_booking.date() if stats.last_booking else None
     }, update_modified=False)
 
 
+def apply_booking_stats_change(booking, old_booking=None):
+    """
+    Update mm_total_bookings / mm_last_booking_date for a booking change.
+
+    Called from the MM Meeting Booking on_update (old_booking is the version
+    before the save, None for new bookings) and on_trash (booking is None).
+    Cancelled bookings and bookings without a customer are not counted.
+    The counters are changed with single UPDATE statements; the Contact
+    document is not loaded or saved.
+
+    Args:
+        booking: Booking after the change, or None when it is deleted
+        old_booking: Booking before the change, or None when it is new
+    """
+    old = _get_booking_stats_key(old_booking)
+    new = _get_booking_stats_key(booking)
+
+    if old == new:
+        return
+
+    if old:
+        _remove_booking_from_stats((booking or old_booking).name, *old)
+    if new:
+        _add_booking_to_stats(*new)
+
+
+def reconcile_customer_booking_stats():
+    """
+    Recompute the booking statistics of all contacts with one grouped query.
+
+    Scheduled daily to repair any drift of the incremental counters; only
+    contacts whose values differ are written.
+    """
+    frappe.db.sql(f"""
+        UPDATE `tabContact` c
+        LEFT JOIN (
+            SELECT customer, COUNT(*) AS total_bookings, DATE(MAX(start_datetime)) AS last_booking_date
+            FROM `tabMM Meeting Booking`
+            WHERE IFNULL(customer, '') != '' AND {NOT_CANCELLED_CONDITION}
+            GROUP BY customer
+        ) stats ON stats.customer = c.name
+        SET c.mm_total_bookings = IFNULL(stats.total_bookings, 0),
+            c.mm_last_booking_date = stats.last_booking_date
+        WHERE IFNULL(c.mm_total_bookings, 0) != IFNULL(stats.total_bookings, 0)
+            OR NOT (c.mm_last_booking_date <=> stats.last_booking_date)
+    """)
+
+
+def _get_booking_stats_key(booking):
+    """(customer, booking date) if the booking counts towards customer stats"""
+    if not booking or not booking.customer:
+        return None
+
+    if booking.booking_status and frappe.get_cached_value("MM Booking Status", booking.booking_status, "is_cancelled"):
+        return None
+
+    return (booking.customer, getdate(booking.start_datetime) if booking.start_datetime else None)
+
+
+def _add_booking_to_stats(customer_id, booking_date):
+    frappe.db.sql("""
+        UPDATE `tabContact`
+        SET mm_total_bookings = IFNULL(mm_total_bookings, 0) + 1,
+            mm_last_booking_date = CASE
+                WHEN %(date)s IS NULL THEN mm_last_booking_date
+                ELSE GREATEST(IFNULL(mm_last_booking_date, %(date)s), %(date)s)
+            END
+        WHERE name = %(customer)s
+    """, {"customer": customer_id, "date": booking_date})
+
+
+def _remove_booking_from_stats(booking_id, customer_id, booking_date):
+    frappe.db.sql("""
+        UPDATE `tabContact`
+        SET mm_total_bookings = GREATEST(IFNULL(mm_total_bookings, 0) - 1, 0)
+        WHERE name = %(customer)s
+    """, {"customer": customer_id})
+
+    # Only look for the new last booking date if this booking was the last one
+    if booking_date and frappe.db.get_value("Contact", customer_id, "mm_last_booking_date") == booking_date:
+        frappe.db.sql(f"""
+            UPDATE `tabContact`
+            SET mm_last_booking_date = (
+                SELECT DATE(MAX(start_datetime))
+                FROM `tabMM Meeting Booking`
+                WHERE customer = %(customer)s
+                    AND name != %(booking)s
+                    AND {NOT_CANCELLED_CONDITION}
+            )
+            WHERE name = %(customer)s
+        """, {"customer": customer_id, "booking": booking_id})
+
+
 def get_customer_bookings(customer_id, limit=10):
     """
     Get recent bookings for a contact.
@@ -6,6 +6,9 @@ Google Calendar Service
 Handles Google Calendar API integration via OAuth 2.0
 """
 
+import json
+import time
+
 import frappe
 from frappe import _
 from frappe.integrations.google_oauth import GoogleOAuth
@@ -13,10 +16,15 @@ from frappe.utils import get_datetime, now_datetime
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 
+from meeting_manager.meeting_manager.services.sync_metrics import record_api_call
+
 
 class GoogleCalendarService:
 	"""Service class for Google Calendar API operations"""
 
+	# Google accepts up to 1000 calls per batch but recommends staying at or below 50
+	BATCH_SIZE = 50
+
 	def __init__(self, integration):
 		"""
 		Initialize Google Calendar service
@@ -29,25 +37,29 @@ class GoogleCalendarService:
 		else:
 			self.integration = integration
 
+		self._service = None
+		self._access_token = None
+
 	def get_authenticated_service(self):
 		"""
 		Return authenticated Google Calendar API service
 
+		The API client is reused by this instance until the token changes.
+
 		Returns:
 			Resource: Google Calendar API service object
 		"""
-		from meeting_manager.meeting_manager.services.token_manager import should_refresh_token
+		from meeting_manager.meeting_manager.services.token_manager import get_access_token
 
-		# Check if token needs refresh
-		if should_refresh_token(self.integration):
-			self.refresh_token()
+		# Cached in Redis, refreshed if needed (serialized across workers)
+		access_token = get_access_token(self.integration, self.refresh_token)
 
-		# Build service
-		access_token = self.integration.get_password("access_token")
-		credentials = self._get_credentials(access_token)
-		service = build('calendar', 'v3', credentials=credentials)
+		if access_token != self._access_token or self._service is None:
+			credentials = self._get_credentials(access_token)
+			self._service = build('calendar', 'v3', credentials=credentials, cache_discovery=False)
+			self._access_token = access_token
 
-		return service
+		return self._service
 
 	def _get_credentials(self, access_token):
 		"""
@@ -76,6 +88,7 @@ class GoogleCalendarService:
 		service = self.get_authenticated_service()
 
 		try:
+			started = time.monotonic()
 			events_result = service.events().list(
 				calendarId=calendar_id,
 				timeMin=time_min.isoformat() + 'Z',
@@ -84,6 +97,7 @@ class GoogleCalendarService:
 				singleEvents=True,  # Expand recurring events
 				orderBy='startTime'
 			).execute()
+			record_api_call(started, len(json.dumps(events_result)))
 
 			google_events = events_result.get('items', [])
 			return self._standardize_events(google_events)
@@ -171,21 +185,7 @@ class GoogleCalendarService:
 		service = self.get_authenticated_service()
 
 		try:
-			event = {
-				'summary': event_data['summary'],
-				'start': {
-					'dateTime': event_data['start'].isoformat(),
-					'timeZone': 'UTC'
-				},
-				'end': {
-					'dateTime': event_data['end'].isoformat(),
-					'timeZone': 'UTC'
-				},
-				'description': event_data.get('description', '')
-			}
-
-			if event_data.get('location'):
-				event['location'] = event_data['location']
+			event = self._build_event_body(event_data)
 
 			created = service.events().insert(
 				calendarId='primary',
@@ -215,21 +215,7 @@ class GoogleCalendarService:
 		service = self.get_authenticated_service()
 
 		try:
-			event = {
-				'summary': event_data['summary'],
-				'start': {
-					'dateTime': event_data['start'].isoformat(),
-					'timeZone': 'UTC'
-				},
-				'end': {
-					'dateTime': event_data['end'].isoformat(),
-					'timeZone': 'UTC'
-				},
-				'description': event_data.get('description', '')
-			}
-
-			if event_data.get('location'):
-				event['location'] = event_data['location']
+			event = self._build_event_body(event_data)
 
 			updated = service.events().update(
 				calendarId='primary',
@@ -246,6 +232,99 @@ class GoogleCalendarService:
 			)
 			raise
 
+	def _build_event_body(self, event_data):
+		"""
+		Convert event data to a Google Calendar event resource
+
+		Args:
+			event_data (dict): Event data (see create_event); may include
+				'timezone' for the start/end wall clock (default: UTC)
+
+		Returns:
+			dict: Google Calendar event resource
+		"""
+		timezone = event_data.get('timezone') or 'UTC'
+		event = {
+			'summary': event_data['summary'],
+			'start': {
+				'dateTime': event_data['start'].isoformat(),
+				'timeZone': timezone
+			},
+			'end': {
+				'dateTime': event_data['end'].isoformat(),
+				'timeZone': timezone
+			},
+			'description': event_data.get('description', '')
+		}
+
+		if event_data.get('location'):
+			event['location'] = event_data['location']
+
+		return event
+
+	def batch_write(self, operations):
+		"""
+		Create, update and delete events through the Google batch HTTP API
+
+		Args:
+			operations (list): Dicts with keys:
+				- key (str): Caller's identifier for the operation
+				- action (str): "create", "update" or "delete"
+				- event_id (str): External event ID (update/delete)
+				- event_data (dict): Event data (create/update)
+
+		Returns:
+			dict: {key: {"event_id": str}} on success or {key: {"error": str}} on failure
+		"""
+		service = self.get_authenticated_service()
+		operations_by_key = {op['key']: op for op in operations}
+		results = {}
+
+		def callback(request_id, response, exception):
+			op = operations_by_key[request_id]
+			status = getattr(getattr(exception, 'resp', None), 'status', None)
+
+			# An event that is already gone counts as deleted
+			if exception and not (op['action'] == 'delete' and status in (404, 410)):
+				results[request_id] = {'error': str(exception)}
+			else:
+				results[request_id] = {'event_id': (response or {}).get('id') or op.get('event_id')}
+
+		for i in range(0, len(operations), self.BATCH_SIZE):
+			batch = service.new_batch_http_request(callback=callback)
+
+			for op in operations[i:i + self.BATCH_SIZE]:
+				if op['action'] == 'create':
+					request = service.events().insert(
+						calendarId='primary',
+						body=self._build_event_body(op['event_data'])
+					)
+				elif op['action'] == 'update':
+					request = service.events().update(
+						calendarId='primary',
+						eventId=op['event_id'],
+						body=self._build_event_body(op['event_data'])
+					)
+				else:
+					request = service.events().delete(
+						calendarId='primary',
+						eventId=op['event_id']
+					)
+
+				batch.add(request, request_id=op['key'])
+
+			try:
+				batch.execute()
+			except Exception as e:
+				frappe.log_error(
+					title=f"Google Calendar Batch Error - {self.integration.user}",
+					message=str(e)
+				)
+				for op in operations[i:i + self.BATCH_SIZE]:
+					results.setdefault(op['key'], {'error': str(e)})
+
+		return results
+
 	def delete_event(self, event_id):
 		"""
 		Delete event from Google Calendar
@@ -0,0 +1,323 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+"""
+Notification Outbox
+
+Notification emails are not sent over SMTP from the request that triggers
+them. send_notification stores the rendered message as an MM Notification
+Outbox row and a background job flushes the outbox:
+
+1. Claim a batch of queued messages with a single UPDATE (claim token).
+2. Open one SMTP connection for the batch and send the messages over it,
+   ordered by recipient. Identical messages to the same recipient within
+   a batch are sent once.
+3. Write the per-message result to the row and to the booking history.
+
+Failed messages are retried up to MAX_ATTEMPTS times, and nothing is sent
+while emails are muted or the Email Queue is suspended.
+
+The outbox sends over its own SMTP connection, so these emails do not go
+through Frappe's Email Queue (no unsubscribe links, no Email Queue log). It
+is therefore off by default; set "mm_notification_outbox": 1 in
+site_config.json to enable it. "mm_outbox_smtp_server" ({"server":
+"127.0.0.1", "port": 8025}) points the flush at another SMTP server, e.g.
+the local aiosmtpd instance of test_mm_notification_outbox.
+"""
+
+import smtplib
+
+import frappe
+from frappe.utils import add_to_date, cint, now_datetime
+
+# Messages sent per SMTP connection
+FLUSH_BATCH_SIZE = 100
+
+# Messages claimed but not finished within this time are picked up again
+CLAIM_TIMEOUT_MINUTES = 15
+
+# Delay before a failed message is retried
+RETRY_DELAY_MINUTES = 5
+
+MAX_ATTEMPTS = 3
+
+
+def is_outbox_enabled():
+	"""Whether notifications go through the outbox instead of being sent inline"""
+	return bool(cint(frappe.conf.get("mm_notification_outbox")))
+
+
+def queue_email(recipient, subject, message, booking_id=None, email_type=None, recipient_type=None):
+	"""
+	Queue a rendered notification email
+
+	Args:
+		recipient (str): Email address
+		subject (str): Rendered subject
+		message (str): Rendered HTML body
+		booking_id (str): MM Meeting Booking the email is about
+		email_type (str): Template email type, for history and filtering
+		recipient_type (str): Template recipient type
+
+	Returns:
+		str: MM Notification Outbox ID
+	"""
+	outbox = frappe.get_doc({
+		"doctype": "MM Notification Outbox",
+		"recipient": recipient,
+		"subject": subject,
+		"message": message,
+		"booking": booking_id,
+		"email_type": email_type,
+		"recipient_type": recipient_type,
+		"status": "Queued"
+	}).insert(ignore_permissions=True)
+
+	frappe.enqueue(
+		"meeting_manager.meeting_manager.services.notification_outbox.flush_notification_outbox",
+		queue="short",
+		job_id=f"{frappe.local.site}:mm_notification_outbox",
+		deduplicate=True,
+		enqueue_after_commit=True
+	)
+
+	return outbox.name
+
+
+def flush_notification_outbox():
+	"""
+	Send queued notification emails
+
+	Called from the background job enqueued by queue_email and from the
+	scheduler as a safety net (retries, messages queued during a flush).
+	"""
+	if frappe.are_emails_muted() or cint(frappe.db.get_default("suspend_email_queue")):
+		# Honour the system-wide email pause like the Email Queue does
+		return
+
+	while True:
+		claim_token = _claim_messages()
+		if not claim_token:
+			break
+
+		messages = frappe.get_all(
+			"MM Notification Outbox",
+			filters={"claim_token": claim_token, "status": "Sending"},
+			fields=["name", "recipient", "subject", "message", "booking", "email_type", "attempts"],
+			order_by="recipient asc, creation asc"
+		)
+
+		try:
+			results = _send_batch(messages)
+		except Exception as e:
+			# Connection-level failure: release the batch and retry on the next flush
+			_release_messages(claim_token)
+			frappe.db.commit()
+			frappe.log_error(title="Notification Outbox Error", message=str(e))
+			break
+
+		_record_results(messages, results)
+		frappe.db.commit()
+
+		if len(messages) < FLUSH_BATCH_SIZE:
+			break
+
+
+def _claim_messages():
+	"""
+	Claim a batch of queued messages
+
+	Returns:
+		str: Claim token, or None when the outbox is empty
+	"""
+	now = now_datetime()
+	token = frappe.generate_hash(length=12)
+
+	frappe.db.sql("""
+		UPDATE `tabMM Notification Outbox`
+		SET status = 'Sending', claim_token = %(token)s, claimed_at = %(now)s
+		WHERE (status = 'Queued' AND (claimed_at IS NULL OR claimed_at < %(retry_after)s))
+			OR (status = 'Sending' AND claimed_at < %(stale)s)
+		ORDER BY creation
+		LIMIT %(limit)s
+	""", {
+		"token": token,
+		"now": now,
+		"retry_after": add_to_date(now, minutes=-RETRY_DELAY_MINUTES),
+		"stale": add_to_date(now, minutes=-CLAIM_TIMEOUT_MINUTES),
+		"limit": FLUSH_BATCH_SIZE,
+	})
+	frappe.db.commit()
+
+	return token if frappe.db.exists("MM Notification Outbox", {"claim_token": token}) else None
+
+
+def _release_messages(claim_token):
+	frappe.db.sql("""
+		UPDATE `tabMM Notification Outbox`
+		SET status = 'Queued', claim_token = NULL, claimed_at = NULL
+		WHERE claim_token = %(token)s AND status = 'Sending'
+	""", {"token": claim_token})
+
+
+def _send_batch(messages):
+	"""
+	Send messages over a single SMTP connection
+
+	Args:
+		messages (list): Claimed outbox rows, ordered by recipient
+
+	Returns:
+		dict: {outbox name: error message or None}; messages missing from
+		the result were not attempted because the connection was lost
+	"""
+	from frappe.email.email_body import get_email
+
+	email_account = _get_outgoing_email_account()
+	sender = email_account.default_sender
+	smtp_server = _get_smtp_server(email_account)
+	results = {}
+	sent = {}
+
+	# Connect up front so connection errors release the whole batch
+	smtp_server.session
+
+	try:
+		for message in messages:
+			# Send identical messages to the same recipient only once per batch
+			dedupe_key = (message.recipient, message.subject, message.message)
+			if dedupe_key in sent:
+				results[message.name] = results[sent[dedupe_key]]
+				continue
+			sent[dedupe_key] = message.name
+
+			try:
+				email = get_email(
+					recipients=[message.recipient],
+					sender=sender,
+					msg=message.message,
+					subject=message.subject,
+					email_account=email_account
+				)
+				smtp_server.session.sendmail(sender, [message.recipient], email.as_string())
+				results[message.name] = None
+			except smtplib.SMTPServerDisconnected as e:
+				frappe.log_error(title="Notification Outbox Error", message=f"SMTP connection lost: {e}")
+				break
+			except smtplib.SMTPException as e:
+				results[message.name] = str(e) or e.__class__.__name__
+	finally:
+		try:
+			smtp_server.quit()
+		except smtplib.SMTPException:
+			# Connection already gone
+			pass
+
+	return results
+
+
+def _get_outgoing_email_account():
+	"""Default outgoing Email Account"""
+	from frappe.email.doctype.email_account.email_account import EmailAccount
+
+	return EmailAccount.find_outgoing(_raise_error=True)
+
+
+def _get_smtp_server(email_account):
+	"""SMTP connection of the email account, or the server set in mm_outbox_smtp_server"""
+	override = frappe.conf.get("mm_outbox_smtp_server")
+	if not override:
+		return email_account.get_smtp_server()
+
+	from frappe.email.smtp import SMTPServer
+
+	return SMTPServer(
+		server=override.get("server", "127.0.0.1"),
+		port=cint(override.get("port")) or 25,
+		use_tls=cint(override.get("use_tls")),
+		use_ssl=cint(override.get("use_ssl"))
+	)
+
+
+def _record_results(messages, results):
+	"""Write per-message status to the outbox rows and booking history"""
+	now = now_datetime()
+	history = []
+
+	for message in messages:
+		if message.name not in results:
+			# Not attempted: back to the queue without counting an attempt
+			frappe.db.set_value(
+				"MM Notification Outbox",
+				message.name,
+				{"status": "Queued", "claim_token": None, "claimed_at": None},
+				update_modified=False
+			)
+			continue
+
+		error = results[message.name]
+		attempts = (message.attempts or 0) + 1
+
+		if error is None:
+			values = {"status": "Sent", "sent_at": now, "error": None}
+		else:
+			values = {"status": "Queued" if attempts < MAX_ATTEMPTS else "Failed", "error": error[:1000]}
+
+		frappe.db.set_value(
+			"MM Notification Outbox",
+			message.name,
+			dict(values, attempts=attempts, claim_token=None),
+			update_modified=False
+		)
+
+		if message.booking and values["status"] != "Queued":
+			history.append((message, values["status"], error))
+
+	_add_booking_history(history, now)
+
+
+def _add_booking_history(entries, now):
+	"""
+	Append Email Sent / Email Failed rows to booking_history
+
+	Args:
+		entries (list): Tuples of (outbox row, status, error)
+		now (datetime): Event timestamp
+	"""
+	if not entries:
+		return
+
+	booking_names = list({entry[0].booking for entry in entries})
+	next_idx = {
+		row.parent: row.idx
+		for row in frappe.db.sql("""
+			SELECT parent, MAX(idx) AS idx
+			FROM `tabMM Meeting Booking History`
+			WHERE parent IN %(bookings)s
+				AND parenttype = 'MM Meeting Booking'
+				AND parentfield = 'booking_history'
+			GROUP BY parent
+		""", {"bookings": booking_names}, as_dict=True)
+	}
+
+	for message, status, error in entries:
+		idx = next_idx.get(message.booking, 0) + 1
+		next_idx[message.booking] = idx
+
+		email_type = message.email_type or "Notification"
+		if status == "Sent":
+			description = f"{email_type} email sent to {message.recipient}"
+		else:
+			description = f"{email_type} email to {message.recipient} failed: {error}"
+
+		frappe.get_doc({
+			"doctype": "MM Meeting Booking History",
+			"parent": message.booking,
+			"parenttype": "MM Meeting Booking",
+			"parentfield": "booking_history",
+			"idx": idx,
+			"event_type": "Email Sent" if status == "Sent" else "Email Failed",
+			"event_datetime": now,
+			"event_by": "Administrator",
+			"event_description": description
+		}).db_insert()
@@ -6,18 +6,25 @@ Outlook Calendar Service
 Handles Microsoft Outlook Calendar API integration via OAuth 2.0
 """
 
+import time
+
 import frappe
 from frappe import _
 from frappe.utils import get_datetime, now_datetime, add_to_date
 import msal
 import requests
 
+from meeting_manager.meeting_manager.services.sync_metrics import record_api_call
+
 
 class OutlookCalendarService:
 	"""Service class for Microsoft Outlook Calendar API operations"""
 
 	GRAPH_API_ENDPOINT = 'https://graph.microsoft.com/v1.0'
 
+	# Microsoft Graph JSON batching accepts at most 20 requests per call
+	BATCH_SIZE = 20
+
 	def __init__(self, integration):
 		"""
 		Initialize Outlook Calendar service
@@ -30,7 +37,10 @@ class OutlookCalendarService:
 		else:
 			self.integration = integration
 
-		self.settings = frappe.get_single("MM OAuth Settings")
+		self.settings = frappe.get_cached_doc("MM OAuth Settings")
+		self._session = None
+		self._access_token = None
+		self._msal_client = None
 
 	def get_authenticated_client(self):
 		"""
@@ -42,11 +52,39 @@ class OutlookCalendarService:
 		if not self.settings.enable_outlook:
 			frappe.throw(_("Outlook integration is not enabled in MM OAuth Settings"))
 
-		return msal.ConfidentialClientApplication(
-			self.settings.outlook_client_id,
-			authority=f"https://login.microsoftonline.com/{self.settings.outlook_tenant_id}",
-			client_credential=self.settings.get_password("outlook_client_secret")
-		)
+		if self._msal_client is None:
+			self._msal_client = msal.ConfidentialClientApplication(
+				self.settings.outlook_client_id,
+				authority=f"https://login.microsoftonline.com/{self.settings.outlook_tenant_id}",
+				client_credential=self.settings.get_password("outlook_client_secret")
+			)
+
+		return self._msal_client
+
+	def get_session(self):
+		"""
+		Return an authenticated requests session for the Graph API
+
+		The session (and its connection pool) is reused by this instance until
+		the token changes.
+
+		Returns:
+			Session: requests session with the Authorization header set
+		"""
+		from meeting_manager.meeting_manager.services.token_manager import get_access_token
+
+		# Cached in Redis, refreshed if needed (serialized across workers)
+		access_token = get_access_token(self.integration, self.refresh_token)
+
+		if access_token != self._access_token or self._session is None:
+			self._session = requests.Session()
+			self._session.headers.update({
+				'Authorization': f'Bearer {access_token}',
+				'Content-Type': 'application/json'
+			})
+			self._access_token = access_token
+
+		return self._session
 
 	def fetch_events(self, time_min, time_max, calendar_id=None):
 		"""
@@ -60,17 +98,7 @@ class OutlookCalendarService:
 		Returns:
 			list: List of standardized event dictionaries
 		"""
-		from meeting_manager.meeting_manager.services.token_manager import should_refresh_token
-
-		# Check if token needs refresh
-		if should_refresh_token(self.integration):
-			self.refresh_token()
-
-		access_token = self.integration.get_password("access_token")
-		headers = {
-			'Authorization': f'Bearer {access_token}',
-			'Content-Type': 'application/json'
-		}
+		session = self.get_session()
 
 		# Build request
 		url = f"{self.GRAPH_API_ENDPOINT}/me/calendar/events"
@@ -86,7 +114,9 @@ class OutlookCalendarService:
 
 			# Handle pagination
 			while url:
-				response = requests.get(url, headers=headers, params=params)
+				started = time.monotonic()
+				response = session.get(url, params=params)
+				record_api_call(started, len(response.content))
 				response.raise_for_status()
 				data = response.json()
 
@@ -179,35 +209,13 @@ class OutlookCalendarService:
 		Returns:
 			str: External event ID
 		"""
-		access_token = self.integration.get_password("access_token")
-		headers = {
-			'Authorization': f'Bearer {access_token}',
-			'Content-Type': 'application/json'
-		}
-
-		event = {
-			'subject': event_data['summary'],
-			'start': {
-				'dateTime': event_data['start'].isoformat(),
-				'timeZone': 'UTC'
-			},
-			'end': {
-				'dateTime': event_data['end'].isoformat(),
-				'timeZone': 'UTC'
-			},
-			'body': {
-				'contentType': 'text',
-				'content': event_data.get('description', '')
-			}
-		}
+		session = self.get_session()
 
-		if event_data.get('location'):
-			event['location'] = {'displayName': event_data['location']}
+		event = self._build_event_body(event_data)
 
 		try:
-			response = requests.post(
+			response = session.post(
 				f"{self.GRAPH_API_ENDPOINT}/me/calendar/events",
-				headers=headers,
 				json=event
 			)
 			response.raise_for_status()
@@ -233,21 +241,48 @@ class OutlookCalendarService:
 		Returns:
 			str: External event ID
 		"""
-		access_token = self.integration.get_password("access_token")
-		headers = {
-			'Authorization': f'Bearer {access_token}',
-			'Content-Type': 'application/json'
-		}
+		session = self.get_session()
+
+		event = self._build_event_body(event_data)
+
+		try:
+			response = session.patch(
+				f"{self.GRAPH_API_ENDPOINT}/me/calendar/events/{event_id}",
+				json=event
+			)
+			response.raise_for_status()
+			updated = response.json()
 
+			return updated['id']
+
+		except Exception as e:
+			frappe.log_error(
+				title=f"Outlook Update Event Error - {self.integration.user}",
+				message=str(e)
+			)
+			raise
+
+	def _build_event_body(self, event_data):
+		"""
+		Convert event data to a Graph API event resource
+
+		Args:
+			event_data (dict): Event data (see create_event); may include
+				'timezone' for the start/end wall clock (default: UTC)
+
+		Returns:
+			dict: Graph API event resource
+		"""
+		timezone = event_data.get('timezone') or 'UTC'
 		event = {
 			'subject': event_data['summary'],
 			'start': {
 				'dateTime': event_data['start'].isoformat(),
-				'timeZone': 'UTC'
+				'timeZone': timezone
 			},
 			'end': {
 				'dateTime': event_data['end'].isoformat(),
-				'timeZone': 'UTC'
+				'timeZone': timezone
 			},
 			'body': {
 				'contentType': 'text',
@@ -258,23 +293,83 @@ class OutlookCalendarService:
 		if event_data.get('location'):
 			event['location'] = {'displayName': event_data['location']}
 
-		try:
-			response = requests.patch(
-				f"{self.GRAPH_API_ENDPOINT}/me/calendar/events/{event_id}",
-				headers=headers,
-				json=event
-			)
-			response.raise_for_status()
-			updated = response.json()
+		return event
 
-			return updated['id']
+	def batch_write(self, operations):
+		"""
+		Create, update and delete events through Graph JSON batching ($batch)
 
-		except Exception as e:
-			frappe.log_error(
-				title=f"Outlook Update Event Error - {self.integration.user}",
-				message=str(e)
-			)
-			raise
+		Args:
+			operations (list): Dicts with keys:
+				- key (str): Caller's identifier for the operation
+				- action (str): "create", "update" or "delete"
+				- event_id (str): External event ID (update/delete)
+				- event_data (dict): Event data (create/update)
+
+		Returns:
+			dict: {key: {"event_id": str}} on success or {key: {"error": str}} on failure
+		"""
+		session = self.get_session()
+		results = {}
+
+		for i in range(0, len(operations), self.BATCH_SIZE):
+			chunk = operations[i:i + self.BATCH_SIZE]
+			batch_requests = []
+
+			for idx, op in enumerate(chunk):
+				request = {'id': str(idx)}
+
+				if op['action'] == 'create':
+					request.update({
+						'method': 'POST',
+						'url': '/me/calendar/events',
+						'body': self._build_event_body(op['event_data']),
+						'headers': {'Content-Type': 'application/json'}
+					})
+				elif op['action'] == 'update':
+					request.update({
+						'method': 'PATCH',
+						'url': f"/me/calendar/events/{op['event_id']}",
+						'body': self._build_event_body(op['event_data']),
+						'headers': {'Content-Type': 'application/json'}
+					})
+				else:
+					request.update({
+						'method': 'DELETE',
+						'url': f"/me/calendar/events/{op['event_id']}"
+					})
+
+				batch_requests.append(request)
+
+			try:
+				response = session.post(
+					f"{self.GRAPH_API_ENDPOINT}/$batch",
+					json={'requests': batch_requests}
+				)
+				response.raise_for_status()
+				responses = response.json().get('responses', [])
+			except Exception as e:
+				frappe.log_error(
+					title=f"Outlook Batch Error - {self.integration.user}",
+					message=str(e)
+				)
+				for op in chunk:
+					results[op['key']] = {'error': str(e)}
+				continue
+
+			for item in responses:
+				op = chunk[int(item['id'])]
+				status = item.get('status', 0)
+				body = item.get('body') or {}
+
+				# An event that is already gone counts as deleted
+				if 200 <= status < 300 or (op['action'] == 'delete' and status == 404):
+					results[op['key']] = {'event_id': body.get('id') or op.get('event_id')}
+				else:
+					error = body.get('error', {}).get('message') if isinstance(body, dict) else None
+					results[op['key']] = {'error': f"HTTP {status}: {error or 'Unknown error'}"}
+
+		return results
 
 	def delete_event(self, event_id):
 		"""
@@ -283,15 +378,11 @@ class OutlookCalendarService:
 		Args:
 			event_id (str): External event ID
 		"""
-		access_token = self.integration.get_password("access_token")
-		headers = {
-			'Authorization': f'Bearer {access_token}'
-		}
+		session = self.get_session()
 
 		try:
-			response = requests.delete(
-				f"{self.GRAPH_API_ENDPOINT}/me/calendar/events/{event_id}",
-				headers=headers
+			response = session.delete(
+				f"{self.GRAPH_API_ENDPOINT}/me/calendar/events/{event_id}"
 			)
 			response.raise_for_status()
 
@@ -309,15 +400,11 @@ class OutlookCalendarService:
 		Returns:
 			list: List of calendar dictionaries with id and name
 		"""
-		access_token = self.integration.get_password("access_token")
-		headers = {
-			'Authorization': f'Bearer {access_token}'
-		}
+		session = self.get_session()
 
 		try:
-			response = requests.get(
-				f"{self.GRAPH_API_ENDPOINT}/me/calendars",
-				headers=headers
+			response = session.get(
+				f"{self.GRAPH_API_ENDPOINT}/me/calendars"
 			)
 			response.raise_for_status()
 			data = response.json()
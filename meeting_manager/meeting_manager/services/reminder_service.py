@@ -3,6 +3,15 @@ Automated Reminder Service for Meeting Manager
 
 Runs on a schedule (cron) to send reminders for upcoming bookings
 based on each meeting type's reminder_schedule configuration.
+
+Each automated reminder of a booking is materialized as an MM Booking Reminder
+row with its due time, so the scheduled job only reads reminders that are due
+(indexed on status, due_at) instead of scanning upcoming bookings.
+
+Due reminders are claimed in batches and sent by background jobs on the
+short queue, at most MAX_PARALLEL_BATCHES at a time. Every (booking, reminder,
+recipient) send is guarded by an idempotency key, so a batch that is retried
+after a worker died does not email the same recipient twice.
 """
 
 import json
@@ -10,124 +19,505 @@ import frappe
 from frappe.utils import now_datetime, add_to_date, get_datetime
 from meeting_manager.meeting_manager.utils.email_notifications import (
 	send_notification,
-	build_booking_context,
+	build_booking_contexts,
+	check_email_configured,
+	get_template,
 )
 
 
+# Reminders per dispatch job
+DISPATCH_BATCH_SIZE = 100
+
+# Dispatch jobs allowed to run at the same time
+MAX_PARALLEL_BATCHES = 4
+
+# Claimed reminders not finished within this time are picked up again
+CLAIM_TIMEOUT_MINUTES = 30
+
+# Statuses of reminders that were handled and are never rescheduled
+HANDLED_STATUSES = ("Sent", "Queued", "Processing")
+
+# Lifetime of per-recipient idempotency keys (longer than any retry window)
+IDEMPOTENCY_KEY_TTL = 7 * 24 * 60 * 60
+
+
 def process_scheduled_reminders():
 	"""
 	Main entry point called by the scheduler.
 
-	For each upcoming non-finalized booking:
-	  1. Look up the meeting type's reminder_schedule (child table rows)
-	  2. For each active reminder row, calculate send_time = start_datetime - hours_before
-	  3. If send_time <= now AND this specific reminder hasn't been sent yet, send it
-	  4. Log to booking_history, update reminders_sent JSON and last_reminder_sent
+	Reminders are materialized in MM Booking Reminder when bookings are created
+	or rescheduled (see schedule_booking_reminders), so the job only touches
+	reminders that are due. It claims them in batches and hands each batch to
+	dispatch_reminder_batch on a worker, keeping at most MAX_PARALLEL_BATCHES
+	batches in flight.
 	"""
 	now = now_datetime()
 
-	# Look ahead: find bookings starting within the next 30 days that aren't finalized
-	max_lookahead = add_to_date(now, days=30)
+	in_flight = frappe.db.sql("""
+		SELECT COUNT(DISTINCT claim_token)
+		FROM `tabMM Booking Reminder`
+		WHERE status = 'Processing' AND claimed_at >= %(stale)s
+	""", {"stale": add_to_date(now, minutes=-CLAIM_TIMEOUT_MINUTES)})[0][0]
+
+	for _ in range(MAX_PARALLEL_BATCHES - in_flight):
+		claim_token = _claim_due_reminders(DISPATCH_BATCH_SIZE)
+		if not claim_token:
+			break
+
+		frappe.enqueue(
+			"meeting_manager.meeting_manager.services.reminder_service.dispatch_reminder_batch",
+			queue="short",
+			job_id=f"mm_reminder_batch:{claim_token}",
+			# The claim is committed with this job
+			enqueue_after_commit=True,
+			claim_token=claim_token,
+		)
 
-	# Get finalized statuses to exclude
+
+def _claim_due_reminders(limit):
+	"""
+	Claim a batch of due reminders
+
+	A single UPDATE marks the rows Processing with a unique claim token, so
+	concurrent runs never pick up the same reminder. Rows stuck in Processing
+	(worker died mid-batch) are reclaimed after CLAIM_TIMEOUT_MINUTES. The
+	claim is committed by the scheduled job that made it.
+
+	Args:
+		limit (int): Maximum number of reminders to claim
+
+	Returns:
+		str: Claim token, or None when nothing was due
+	"""
+	now = now_datetime()
+	token = frappe.generate_hash(length=12)
+
+	frappe.db.sql("""
+		UPDATE `tabMM Booking Reminder`
+		SET status = 'Processing', claim_token = %(token)s, claimed_at = %(now)s
+		WHERE (status = 'Pending' AND due_at <= %(now)s)
+			OR (status = 'Processing' AND claimed_at < %(stale)s)
+		ORDER BY due_at
+		LIMIT %(limit)s
+	""", {
+		"token": token,
+		"now": now,
+		"stale": add_to_date(now, minutes=-CLAIM_TIMEOUT_MINUTES),
+		"limit": limit,
+	})
+
+	return token if frappe.db.exists("MM Booking Reminder", {"claim_token": token}) else None
+
+
+def dispatch_reminder_batch(claim_token):
+	"""
+	Send a batch of claimed reminders (background job)
+
+	Bookings, recipients, contexts and templates are loaded once per batch;
+	each booking's context is reused for all its recipients.
+
+	Args:
+		claim_token (str): Token returned by _claim_due_reminders
+	"""
 	from meeting_manager.meeting_manager.doctype.mm_booking_status.mm_booking_status import (
 		get_finalized_statuses,
 	)
-	finalized = get_finalized_statuses()
 
-	filters = {
-		"docstatus": ["!=", 2],
-		"start_datetime": ["between", [now, max_lookahead]],
+	reminders = frappe.db.sql("""
+		SELECT
+			r.name, r.booking, r.reminder_key, r.hours_before, r.notification_type,
+			mb.start_datetime, mb.booking_status, mb.docstatus
+		FROM `tabMM Booking Reminder` r
+		LEFT JOIN `tabMM Meeting Booking` mb ON mb.name = r.booking
+		WHERE r.claim_token = %(token)s AND r.status = 'Processing'
+		ORDER BY r.due_at
+	""", {"token": claim_token}, as_dict=True)
+
+	if not reminders:
+		return
+
+	is_configured, error_msg = check_email_configured()
+	if not is_configured:
+		# Release the reminders so they go out once email is configured
+		frappe.logger().warning(f"Reminder service: email not configured ({error_msg})")
+		for reminder in reminders:
+			_set_reminder_status(reminder.name, "Pending")
+		return
+
+	finalized = set(get_finalized_statuses())
+	now = now_datetime()
+	due = []
+
+	for reminder in reminders:
+		if (
+			reminder.docstatus is None
+			or reminder.docstatus == 2
+			or reminder.booking_status in finalized
+			or get_datetime(reminder.start_datetime) <= now
+			# Only Email is supported for now (SMS requires gateway integration)
+			or reminder.notification_type not in ("Email", "Both")
+		):
+			_set_reminder_status(reminder.name, "Skipped")
+		else:
+			due.append(reminder)
+
+	bookings = {
+		name: frappe.get_doc("MM Meeting Booking", name)
+		for name in {reminder.booking for reminder in due}
 	}
-	if finalized:
-		filters["booking_status"] = ["not in", finalized]
+	recipients = _get_reminder_recipients(bookings.values())
+	contexts = build_booking_contexts(list(bookings))
+	templates = {}
+	sent_count = queued_count = 0
 
-	bookings = frappe.get_all(
+	for reminder in due:
+		booking = bookings[reminder.booking]
+
+		try:
+			sent_to, queued_for = _send_reminder(
+				reminder, booking, contexts[booking.name], recipients[booking.name], templates
+			)
+		except Exception:
+			frappe.log_error(
+				f"Failed to send automated reminder for {reminder.booking} ({reminder.reminder_key})",
+				"Reminder Service Error",
+			)
+			_set_reminder_status(reminder.name, "Failed", error=frappe.get_traceback()[-1000:])
+			continue
+
+		if not sent_to and not queued_for:
+			_set_reminder_status(reminder.name, "Skipped")
+			continue
+
+		_record_reminder_sent(reminder, booking, sent_to, queued_for)
+		sent_count += len(sent_to)
+		queued_count += len(queued_for)
+
+	if sent_count or queued_count:
+		frappe.logger().info(
+			f"Reminder service: sent {sent_count} and queued {queued_count} reminder(s) "
+			f"for {len(due)} due reminder(s)"
+		)
+
+
+def _get_reminder_recipients(bookings):
+	"""
+	Resolve reminder recipients of many bookings with one User and one Contact query
+
+	Sends to customer (external bookings) and hosts always.
+	For internal meetings, also sends to participants.
+
+	Returns:
+		dict: {booking name: [(email, recipient_type, recipient_name, label)]}
+	"""
+	user_ids = set()
+	customer_ids = set()
+	for booking in bookings:
+		user_ids.update(au.user for au in booking.assigned_users or [])
+		if booking.is_internal:
+			user_ids.update(p.user for p in booking.participants or [] if p.user)
+		elif booking.customer:
+			customer_ids.add(booking.customer)
+
+	users = {
+		u.name: u
+		for u in frappe.get_all(
+			"User", filters={"name": ["in", list(user_ids)]}, fields=["name", "email", "full_name"]
+		)
+	} if user_ids else {}
+
+	contact_emails = dict(frappe.get_all(
+		"Contact", filters={"name": ["in", list(customer_ids)]}, fields=["name", "email_id"], as_list=True
+	)) if customer_ids else {}
+
+	result = {}
+	for booking in bookings:
+		recipients = result.setdefault(booking.name, [])
+
+		if not booking.is_internal:
+			customer_email = booking.customer_email_at_booking or contact_emails.get(booking.customer)
+			if customer_email:
+				recipients.append((customer_email, "Customer", None, f"Customer ({customer_email})"))
+
+		host_users = set()
+		for assignment in booking.assigned_users or []:
+			host_users.add(assignment.user)
+			user = users.get(assignment.user)
+			if user and user.email:
+				recipients.append((user.email, "Host", user.full_name, f"Host ({user.full_name or user.email})"))
+
+		if booking.is_internal:
+			for participant in booking.participants or []:
+				if not participant.user or participant.user in host_users:
+					continue
+				user = users.get(participant.user)
+				if user and user.email:
+					recipients.append((
+						user.email, "Participant", user.full_name,
+						f"Participant ({user.full_name or user.email})"
+					))
+
+	return result
+
+
+def _send_reminder(reminder, booking, booking_context, recipients, templates):
+	"""
+	Send one automated reminder to all its recipients
+
+	Args:
+		reminder (dict): Claimed MM Booking Reminder row
+		booking (Document): MM Meeting Booking
+		booking_context (dict): Context from build_booking_contexts
+		recipients (list): Output of _get_reminder_recipients for the booking
+		templates (dict): Per-batch template cache
+
+	Returns:
+		tuple: Labels of the recipients the reminder was sent to, and labels of
+			those it was queued for in the notification outbox
+	"""
+	service_type = booking.select_mkru or ""
+	base_context = dict(
+		booking_context,
+		custom_message="",
+		reminder_sent_by="Automated Reminder System",
+		hours_before=reminder.hours_before,
+	)
+
+	sent_to = []
+	queued_for = []
+	for email, recipient_type, recipient_name, label in recipients:
+		idempotency_key = f"mm_reminder_sent:{booking.name}:{reminder.reminder_key}:{email}"
+		if not _acquire_idempotency_key(idempotency_key):
+			# Already sent by an earlier attempt of this batch
+			sent_to.append(label)
+			continue
+
+		try:
+			template_key = ("Reminder", recipient_type, service_type)
+			if template_key not in templates:
+				templates[template_key] = get_template(*template_key)
+
+			context = dict(base_context, recipient_name=recipient_name or "")
+			result = send_notification(
+				email, "Reminder", recipient_type,
+				context, service_type, booking.name,
+				template=templates[template_key],
+			)
+		except Exception:
+			# Nothing was sent, so a retry must be able to send it
+			frappe.cache().delete_value(idempotency_key)
+			raise
+
+		if not result.get("success"):
+			frappe.cache().delete_value(idempotency_key)
+		elif result.get("queued"):
+			queued_for.append(label)
+		else:
+			sent_to.append(label)
+
+	return sent_to, queued_for
+
+
+def _acquire_idempotency_key(key):
+	"""Atomically set an idempotency key; False if it already existed"""
+	cache = frappe.cache()
+	return bool(cache.set(cache.make_key(key), 1, ex=IDEMPOTENCY_KEY_TTL, nx=True))
+
+
+def _record_reminder_sent(reminder, booking, sent_to, queued_for):
+	"""
+	Log a sent or queued reminder to booking history, reminders_sent and the reminder row
+
+	Queued reminders are handed to the notification outbox, which logs the
+	actual delivery of each email to the booking history.
+	"""
+	now = now_datetime()
+
+	outcome = []
+	if sent_to:
+		outcome.append(f"sent to: {', '.join(sent_to)}")
+	if queued_for:
+		outcome.append(f"queued for: {', '.join(queued_for)}")
+
+	history = booking.append("booking_history", {
+		"event_type": "Reminder Queued" if queued_for else "Reminder Sent",
+		"event_datetime": now,
+		"event_by": "Administrator",
+		"event_description": (
+			f"Automated reminder ({reminder.hours_before}h before meeting) {'; '.join(outcome)}"
+		),
+	})
+	history.db_insert()
+
+	# Keep reminders_sent on the booking in sync for the booking UI
+	already_sent = _parse_reminders_sent(booking.reminders_sent)
+	already_sent.append({
+		"reminder_key": reminder.reminder_key,
+		"sent_at": str(now),
+		"sent_by": "System (Automated)",
+		"hours_before": reminder.hours_before,
+		"recipients": sent_to + queued_for,
+		"queued": queued_for,
+		"type": "automated",
+	})
+	booking.reminders_sent = json.dumps(already_sent)
+	frappe.db.set_value(
 		"MM Meeting Booking",
-		filters=filters,
-		fields=["name", "meeting_type", "start_datetime", "reminders_sent"],
-		order_by="start_datetime asc",
-		limit_page_length=500,
+		booking.name,
+		{
+			"reminders_sent": booking.reminders_sent,
+			"last_reminder_sent": now,
+		},
+		update_modified=False,
+	)
+
+	_set_reminder_status(
+		reminder.name,
+		"Queued" if queued_for else "Sent",
+		sent_at=now,
+		recipients="\n".join(sent_to + queued_for),
+	)
+
+
+def _set_reminder_status(name, status, **values):
+	"""Update the status of a claimed reminder"""
+	frappe.db.set_value(
+		"MM Booking Reminder",
+		name,
+		dict(values, status=status, claim_token=None),
+		update_modified=False,
+	)
+
+
+def schedule_booking_reminders(booking_names):
+	"""
+	Materialize the automated reminders of bookings in MM Booking Reminder
+
+	Called when bookings are created or rescheduled and when a meeting type's
+	reminder schedule changes. Pending reminders are inserted, moved to their
+	new due time or removed; reminders that were already sent are kept as-is,
+	so a reschedule never sends the same reminder twice.
+
+	Args:
+		booking_names (str or list): MM Meeting Booking ID(s)
+	"""
+	from meeting_manager.meeting_manager.doctype.mm_booking_status.mm_booking_status import (
+		get_finalized_statuses,
 	)
 
-	if not bookings:
+	if isinstance(booking_names, str):
+		booking_names = [booking_names]
+	if not booking_names:
 		return
 
-	# Cache meeting type reminder schedules
+	bookings = frappe.get_all(
+		"MM Meeting Booking",
+		filters={"name": ["in", booking_names]},
+		fields=["name", "meeting_type", "start_datetime", "booking_status", "docstatus", "reminders_sent"],
+	)
+
+	existing = {}
+	for row in frappe.get_all(
+		"MM Booking Reminder",
+		filters={"booking": ["in", booking_names]},
+		fields=["name", "booking", "reminder_key", "due_at", "notification_type", "status"],
+	):
+		existing.setdefault(row.booking, {})[row.reminder_key] = row
+
+	finalized = set(get_finalized_statuses())
 	mt_cache = {}
-	sent_count = 0
+	now = now_datetime()
+	to_insert = []
+	to_delete = []
 
 	for b in bookings:
-		if not b.meeting_type:
-			continue
-
-		# Get reminder schedule for this meeting type
-		if b.meeting_type not in mt_cache:
-			mt_cache[b.meeting_type] = _get_active_reminders(b.meeting_type)
+		desired = {}
 
-		reminders = mt_cache[b.meeting_type]
-		if not reminders:
-			continue
+		if b.docstatus != 2 and b.booking_status not in finalized and b.meeting_type and b.start_datetime:
+			if b.meeting_type not in mt_cache:
+				mt_cache[b.meeting_type] = _get_active_reminders(b.meeting_type)
 
-		# Parse already-sent reminders for this booking
-		already_sent = _parse_reminders_sent(b.reminders_sent)
-		already_sent_keys = {r.get("reminder_key") for r in already_sent if r.get("reminder_key")}
+			# Reminders recorded as sent before the reminder queue existed
+			already_sent_keys = {
+				r.get("reminder_key") for r in _parse_reminders_sent(b.reminders_sent) if r.get("reminder_key")
+			}
+			start_dt = get_datetime(b.start_datetime)
 
-		start_dt = get_datetime(b.start_datetime)
-		booking_changed = False
+			for reminder in mt_cache[b.meeting_type]:
+				reminder_key = f"auto_{reminder.hours_before_meeting}h"
+				if reminder_key not in already_sent_keys:
+					desired[reminder_key] = (add_to_date(start_dt, hours=-reminder.hours_before_meeting), reminder)
 
-		for reminder in reminders:
-			hours_before = reminder.hours_before_meeting
-			reminder_key = f"auto_{hours_before}h"
+		current = existing.get(b.name, {})
 
-			# Skip if already sent
-			if reminder_key in already_sent_keys:
+		for reminder_key, row in current.items():
+			if row.status in HANDLED_STATUSES:
 				continue
 
-			# Calculate when this reminder should fire
-			send_time = add_to_date(start_dt, hours=-hours_before)
-
-			# Is it time to send?
-			if send_time > now:
+			if reminder_key not in desired:
+				if row.status == "Pending":
+					to_delete.append(row.name)
 				continue
 
-			# Send the reminder
-			try:
-				result = _send_automated_reminder(b.name, reminder)
-				if result.get("sent_count", 0) > 0:
-					sent_count += result["sent_count"]
-					booking_changed = True
-
-					# Record in the already_sent list
-					already_sent.append({
-						"reminder_key": reminder_key,
-						"sent_at": str(now),
-						"sent_by": "System (Automated)",
-						"hours_before": hours_before,
-						"recipients": result.get("sent_to", []),
-						"type": "automated",
-					})
-			except Exception:
-				frappe.log_error(
-					f"Failed to send automated reminder for {b.name} ({reminder_key})",
-					"Reminder Service Error",
+			due_at, reminder = desired[reminder_key]
+			if get_datetime(row.due_at) != due_at or row.notification_type != reminder.notification_type:
+				frappe.db.set_value(
+					"MM Booking Reminder",
+					row.name,
+					{
+						"due_at": due_at,
+						"notification_type": reminder.notification_type,
+						"status": "Pending",
+						"error": None,
+					},
+					update_modified=False,
 				)
 
-		# Persist changes if any reminders were sent
-		if booking_changed:
-			frappe.db.set_value(
-				"MM Meeting Booking",
-				b.name,
-				{
-					"reminders_sent": json.dumps(already_sent),
-					"last_reminder_sent": now,
-				},
-				update_modified=False,
-			)
+		for reminder_key, (due_at, reminder) in desired.items():
+			if reminder_key not in current:
+				to_insert.append((
+					frappe.generate_hash(length=10), now, now, "Administrator", "Administrator", 0,
+					b.name, reminder_key, reminder.hours_before_meeting, reminder.notification_type,
+					due_at, "Pending",
+				))
+
+	if to_delete:
+		frappe.db.delete("MM Booking Reminder", {"name": ["in", to_delete]})
+
+	if to_insert:
+		frappe.db.bulk_insert(
+			"MM Booking Reminder",
+			[
+				"name", "creation", "modified", "owner", "modified_by", "docstatus",
+				"booking", "reminder_key", "hours_before", "notification_type",
+				"due_at", "status",
+			],
+			to_insert,
+		)
+
+
+def reschedule_meeting_type_reminders(meeting_type):
+	"""
+	Re-materialize reminders of all upcoming bookings of a meeting type
 
-	if sent_count:
+	Runs in the background after the meeting type's reminder schedule changed.
+
+	Args:
+		meeting_type (str): MM Meeting Type ID
+	"""
+	booking_names = frappe.get_all(
+		"MM Meeting Booking",
+		filters={
+			"meeting_type": meeting_type,
+			"docstatus": ["!=", 2],
+			"start_datetime": [">", now_datetime()],
+		},
+		pluck="name",
+	)
+
+	for i in range(0, len(booking_names), 500):
+		schedule_booking_reminders(booking_names[i:i + 500])
 		frappe.db.commit()
-		frappe.logger().info(f"Reminder service: sent {sent_count} reminder(s) across {len(bookings)} booking(s)")
 
 
 def _get_active_reminders(meeting_type_name):
@@ -153,96 +543,3 @@ def _parse_reminders_sent(reminders_sent_json):
 		return data if isinstance(data, list) else []
 	except (json.JSONDecodeError, TypeError):
 		return []
-
-
-def _send_automated_reminder(booking_id, reminder_config):
-	"""
-	Send an automated reminder for a booking.
-
-	Sends to customer (external bookings) and hosts always.
-	For internal meetings, also sends to participants.
-
-	Returns dict with sent_count and sent_to list.
-	"""
-	booking = frappe.get_doc("MM Meeting Booking", booking_id)
-	service_type = booking.select_mkru or ""
-	notification_type = reminder_config.notification_type or "Email"
-	hours_before = reminder_config.hours_before_meeting
-
-	sent_to = []
-	extra_context = {
-		"custom_message": "",
-		"reminder_sent_by": "Automated Reminder System",
-		"hours_before": hours_before,
-	}
-
-	# Only handle Email for now (SMS requires gateway integration)
-	if notification_type not in ("Email", "Both"):
-		return {"sent_count": 0, "sent_to": []}
-
-	# Send to customer (non-internal bookings)
-	if not booking.is_internal:
-		customer_email = booking.customer_email_at_booking
-		if not customer_email and booking.customer:
-			customer_email = frappe.db.get_value("Contact", booking.customer, "email_id")
-
-		if customer_email:
-			context = build_booking_context(booking, extra_context=extra_context)
-			result = send_notification(
-				customer_email, "Reminder", "Customer",
-				context, service_type, booking_id,
-			)
-			if result.get("success"):
-				sent_to.append(f"Customer ({customer_email})")
-
-	# Send to host(s)
-	if booking.assigned_users:
-		for assignment in booking.assigned_users:
-			user_email = frappe.db.get_value("User", assignment.user, ["email", "full_name"], as_dict=True)
-			if user_email and user_email.email:
-				context = build_booking_context(
-					booking, recipient_name=user_email.full_name,
-					extra_context=extra_context,
-				)
-				result = send_notification(
-					user_email.email, "Reminder", "Host",
-					context, service_type, booking_id,
-				)
-				if result.get("success"):
-					sent_to.append(f"Host ({user_email.full_name or user_email.email})")
-
-	# Send to participants (internal meetings)
-	if booking.is_internal and booking.participants:
-		host_users = {au.user for au in booking.assigned_users} if booking.assigned_users else set()
-		for participant in booking.participants:
-			if not participant.user or participant.user in host_users:
-				continue
-			user_email = frappe.db.get_value("User", participant.user, ["email", "full_name"], as_dict=True)
-			if user_email and user_email.email:
-				context = build_booking_context(
-					booking, recipient_name=user_email.full_name,
-					extra_context=extra_context,
-				)
-				result = send_notification(
-					user_email.email, "Reminder", "Participant",
-					context, service_type, booking_id,
-				)
-				if result.get("success"):
-					sent_to.append(f"Participant ({user_email.full_name or user_email.email})")
-
-	# Log to booking history
-	if sent_to:
-		description = (
-			f"Automated reminder ({hours_before}h before meeting) sent to: "
-			f"{', '.join(sent_to)}"
-		)
-		booking.append("booking_history", {
-			"event_type": "Reminder Sent",
-			"event_datetime": now_datetime(),
-			"event_by": "Administrator",
-			"event_description": description,
-		})
-		booking.flags.ignore_validate = True
-		booking.save(ignore_permissions=True)
-
-	return {"sent_count": len(sent_to), "sent_to": sent_to}
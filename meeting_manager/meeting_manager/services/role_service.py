@@ -5,13 +5,30 @@
 Role management service for Meeting Manager app.
 Handles automatic assignment and revocation of MM Department Leader
 and MM Department Member roles based on department assignments.
+
+Department changes go through reconcile_roles, which compares the roles
+users should have with their Has Role rows for many users at once and
+applies the difference with bulk inserts and deletes. Large differences
+are applied in a background job.
+
+Roles are only revoked from users whose department links are being
+reconciled (the users passed in). A reconcile of the whole organisation
+only assigns missing roles, so roles granted by hand to users outside any
+department are kept unless revoke_unlinked is set explicitly.
 """
 
+import hashlib
+
 import frappe
+from frappe.utils import now_datetime
 
 # Role names as constants
 MM_DEPARTMENT_LEADER_ROLE = "MM Department Leader"
 MM_DEPARTMENT_MEMBER_ROLE = "MM Department Member"
+MM_ROLES = (MM_DEPARTMENT_LEADER_ROLE, MM_DEPARTMENT_MEMBER_ROLE)
+
+# Role changes above this count are applied in a background job
+BACKGROUND_RECONCILE_THRESHOLD = 20
 
 
 def assign_role_to_user(user, role_name):
@@ -53,7 +70,7 @@ def assign_role_to_user(user, role_name):
     if has_role:
         return False  # Already has role
 
-    # Assign the role
+    # Assign the role (User save clears the user's role and access scope caches)
     user_doc = frappe.get_doc("User", user)
     user_doc.append("roles", {"role": role_name})
     user_doc.save(ignore_permissions=True)
@@ -98,6 +115,11 @@ def revoke_role_from_user(user, role_name):
     # Remove the role
     frappe.db.delete("Has Role", has_role)
 
+    # Deleting Has Role bypasses User hooks; drop cached roles and access scope
+    from meeting_manager.meeting_manager.utils.permissions import clear_access_scope_cache
+    frappe.clear_cache(user=user)
+    clear_access_scope_cache(user)
+
     frappe.msgprint(
         f"Role '{role_name}' has been revoked from {user}",
         indicator="orange",
@@ -230,6 +252,220 @@ def revoke_department_member_role(user, exclude_department=None):
     return revoke_role_from_user(user, MM_DEPARTMENT_MEMBER_ROLE)
 
 
+def reconcile_roles(users=None, exclude_department=None, allow_background=True,
+                    revoke_unlinked=False, notify=True):
+    """
+    Give users the MM roles their department assignments call for.
+
+    Desired roles (leader of a department, active member of a department)
+    and existing Has Role rows are loaded with one query each, for all
+    users at once. Missing roles are bulk inserted, surplus roles bulk
+    deleted, and caches are cleared once per affected user.
+
+    Surplus roles are only revoked from the given users, whose department
+    links changed. Without users (whole organisation) roles are only
+    assigned, unless revoke_unlinked is set: then MM roles of every user who
+    is not a current leader or active member are revoked, including roles
+    granted by hand.
+
+    Args:
+        users (iterable, optional): User IDs to reconcile; all users when omitted
+        exclude_department (str, optional): Department to ignore (being deleted)
+        allow_background (bool): Apply large differences in a background job
+        revoke_unlinked (bool): Also revoke surplus roles when reconciling all users
+        notify (bool): Show a message with the number of changes
+
+    Returns:
+        dict: {"added": int, "removed": int, "queued": bool}
+    """
+    if users is not None:
+        users = sorted({u for u in users if u})
+        if not users:
+            return {"added": 0, "removed": 0, "queued": False}
+
+    to_add, to_remove = get_role_changes(users, exclude_department)
+
+    if users is None and not revoke_unlinked:
+        to_remove = []
+
+    if not to_add and not to_remove:
+        return {"added": 0, "removed": 0, "queued": False}
+
+    if (
+        allow_background
+        and len(to_add) + len(to_remove) > BACKGROUND_RECONCILE_THRESHOLD
+        and not frappe.flags.in_test
+    ):
+        frappe.enqueue(
+            "meeting_manager.meeting_manager.services.role_service.reconcile_roles",
+            queue="long",
+            job_id=_get_reconcile_job_id(users, exclude_department),
+            deduplicate=True,
+            enqueue_after_commit=True,
+            users=users,
+            exclude_department=exclude_department,
+            allow_background=False,
+            revoke_unlinked=revoke_unlinked,
+            notify=False
+        )
+        return {"added": len(to_add), "removed": len(to_remove), "queued": True}
+
+    apply_role_changes(to_add, to_remove)
+
+    if notify:
+        frappe.msgprint(
+            f"Meeting Manager roles updated: {len(to_add)} assigned, {len(to_remove)} revoked",
+            indicator="green",
+            alert=True
+        )
+
+    return {"added": len(to_add), "removed": len(to_remove), "queued": False}
+
+
+def reconcile_all_roles():
+    """
+    Scheduled reconcile of MM roles for the whole organisation.
+
+    Only assigns missing roles; roles are revoked when department links change.
+    """
+    reconcile_roles(allow_background=False, notify=False)
+
+
+def get_role_changes(users=None, exclude_department=None):
+    """
+    Compare desired MM roles with existing Has Role rows.
+
+    Args:
+        users (list, optional): User IDs; all users when omitted
+        exclude_department (str, optional): Department to ignore
+
+    Returns:
+        tuple: (to_add [(user, role)], to_remove [(Has Role name, user, role)])
+    """
+    desired = get_desired_roles(users, exclude_department)
+    user_filter = "AND parent IN %(users)s" if users is not None else ""
+
+    actual = {}
+    for row in frappe.db.sql(f"""
+        SELECT name, parent, role FROM `tabHas Role`
+        WHERE parenttype = 'User' AND role IN %(roles)s
+            {user_filter}
+    """, {"roles": MM_ROLES, "users": users}, as_dict=True):
+        actual[(row.parent, row.role)] = row.name
+
+    to_add = sorted(set(desired) - set(actual))
+    to_remove = sorted(
+        (name, user, role) for (user, role), name in actual.items()
+        if (user, role) not in desired
+    )
+
+    if to_add:
+        # Only existing users, and only roles that exist
+        existing_users = set(frappe.get_all(
+            "User", filters={"name": ["in", list({u for u, _ in to_add})]}, pluck="name"
+        ))
+        existing_roles = set(frappe.get_all("Role", filters={"name": ["in", MM_ROLES]}, pluck="name"))
+
+        for role in set(MM_ROLES) - existing_roles:
+            frappe.log_error(
+                f"Cannot assign role '{role}' - Role does not exist",
+                "Role Service"
+            )
+
+        to_add = [(u, r) for u, r in to_add if u in existing_users and r in existing_roles]
+
+    return to_add, to_remove
+
+
+def get_desired_roles(users=None, exclude_department=None):
+    """
+    MM roles users should have based on their departments.
+
+    Args:
+        users (list, optional): User IDs; all users when omitted
+        exclude_department (str, optional): Department to ignore
+
+    Returns:
+        set: (user, role) tuples
+    """
+    params = {"users": users, "exclude_department": exclude_department or ""}
+
+    leaders = frappe.db.sql_list(f"""
+        SELECT DISTINCT department_leader FROM `tabMM Department`
+        WHERE IFNULL(department_leader, '') != ''
+            AND name != %(exclude_department)s
+            {"AND department_leader IN %(users)s" if users is not None else ""}
+    """, params)
+
+    members = frappe.db.sql_list(f"""
+        SELECT DISTINCT dm.member FROM `tabMM Department Member` dm
+        INNER JOIN `tabMM Department` d ON d.name = dm.parent
+        WHERE dm.parenttype = 'MM Department'
+            AND dm.is_active = 1
+            AND dm.parent != %(exclude_department)s
+            {"AND dm.member IN %(users)s" if users is not None else ""}
+    """, params)
+
+    return (
+        {(user, MM_DEPARTMENT_LEADER_ROLE) for user in leaders}
+        | {(user, MM_DEPARTMENT_MEMBER_ROLE) for user in members}
+    )
+
+
+def apply_role_changes(to_add, to_remove):
+    """
+    Bulk insert and delete Has Role rows, then clear caches once.
+
+    Writing Has Role directly bypasses User hooks, so the role caches of the
+    affected users and the MM access scopes are cleared here.
+
+    Args:
+        to_add (list): (user, role) tuples
+        to_remove (list): (Has Role name, user, role) tuples
+    """
+    if to_remove:
+        frappe.db.delete("Has Role", {"name": ["in", [name for name, _, _ in to_remove]]})
+
+    if to_add:
+        next_idx = {
+            row.parent: row.idx
+            for row in frappe.db.sql("""
+                SELECT parent, MAX(idx) AS idx FROM `tabHas Role`
+                WHERE parenttype = 'User' AND parentfield = 'roles' AND parent IN %(users)s
+                GROUP BY parent
+            """, {"users": list({u for u, _ in to_add})}, as_dict=True)
+        }
+
+        now = now_datetime()
+        values = []
+        for user, role in to_add:
+            next_idx[user] = (next_idx.get(user) or 0) + 1
+            values.append((
+                frappe.generate_hash(length=10), user, "User", "roles", role, next_idx[user],
+                now, now, "Administrator", "Administrator", 0
+            ))
+
+        frappe.db.bulk_insert(
+            "Has Role",
+            fields=[
+                "name", "parent", "parenttype", "parentfield", "role", "idx",
+                "creation", "modified", "owner", "modified_by", "docstatus"
+            ],
+            values=values
+        )
+
+    from meeting_manager.meeting_manager.utils.permissions import clear_access_scope_cache
+
+    for user in {u for u, _ in to_add} | {u for _, u, _ in to_remove}:
+        frappe.clear_cache(user=user)
+    clear_access_scope_cache()
+
+
+def _get_reconcile_job_id(users, exclude_department):
+    scope = "all" if users is None else hashlib.md5("|".join(users).encode()).hexdigest()
+    return f"mm_role_reconcile:{scope}:{exclude_department or ''}"
+
+
 def sync_leader_role_on_department_change(department_name, old_leader, new_leader):
     """
     Sync leader role when department leader changes.
@@ -239,13 +475,7 @@ def sync_leader_role_on_department_change(department_name, old_leader, new_leade
         old_leader (str): Previous department leader (may be None)
         new_leader (str): New department leader (may be None)
     """
-    # Revoke from old leader if they're no longer leading any department
-    if old_leader and old_leader != new_leader:
-        revoke_department_leader_role(old_leader, exclude_department=department_name)
-
-    # Assign to new leader
-    if new_leader:
-        assign_department_leader_role(new_leader)
+    reconcile_roles([old_leader, new_leader])
 
 
 def sync_member_roles_on_department_change(department_name, old_members, new_members):
@@ -257,19 +487,21 @@ def sync_member_roles_on_department_change(department_name, old_members, new_mem
         old_members (set): Set of previous active member user IDs
         new_members (set): Set of current active member user IDs
     """
-    # Find removed members (were active, now removed or inactive)
-    removed_members = old_members - new_members
+    reconcile_roles(set(old_members) ^ set(new_members))
 
-    # Find added members (new active members)
-    added_members = new_members - old_members
 
-    # Revoke roles from removed members (if not active elsewhere)
-    for member in removed_members:
-        revoke_department_member_role(member, exclude_department=department_name)
+def sync_department_roles(department_name, old_leader, new_leader, old_members, new_members):
+    """
+    Sync leader and member roles after a department is saved.
 
-    # Assign roles to new active members
-    for member in added_members:
-        assign_department_member_role(member)
+    Args:
+        department_name (str): Name of the department being updated
+        old_leader (str): Previous department leader (may be None)
+        new_leader (str): New department leader (may be None)
+        old_members (set): Set of previous active member user IDs
+        new_members (set): Set of current active member user IDs
+    """
+    reconcile_roles({old_leader, new_leader} | (set(old_members) ^ set(new_members)))
 
 
 def sync_all_roles_on_department_delete(department_name, leader, members):
@@ -281,13 +513,7 @@ def sync_all_roles_on_department_delete(department_name, leader, members):
         leader (str): Department leader user ID
         members (list): List of member user IDs
     """
-    # Revoke leader role if not leading other departments
-    if leader:
-        revoke_department_leader_role(leader, exclude_department=department_name)
-
-    # Revoke member roles if not active in other departments
-    for member in members:
-        revoke_department_member_role(member, exclude_department=department_name)
+    reconcile_roles([leader, *members], exclude_department=department_name)
 
 
 def sync_user_roles(user):
@@ -301,29 +527,7 @@ def sync_user_roles(user):
     if not user:
         return
 
-    # Check leader status
-    is_leader = is_user_leader_of_any_department(user)
-    has_leader_role = frappe.db.exists(
-        "Has Role",
-        {"parent": user, "role": MM_DEPARTMENT_LEADER_ROLE, "parenttype": "User"}
-    )
-
-    if is_leader and not has_leader_role:
-        assign_department_leader_role(user)
-    elif not is_leader and has_leader_role:
-        revoke_role_from_user(user, MM_DEPARTMENT_LEADER_ROLE)
-
-    # Check member status
-    is_member = is_user_active_member_of_any_department(user)
-    has_member_role = frappe.db.exists(
-        "Has Role",
-        {"parent": user, "role": MM_DEPARTMENT_MEMBER_ROLE, "parenttype": "User"}
-    )
-
-    if is_member and not has_member_role:
-        assign_department_member_role(user)
-    elif not is_member and has_member_role:
-        revoke_role_from_user(user, MM_DEPARTMENT_MEMBER_ROLE)
+    reconcile_roles([user], allow_background=False)
 
 
 def create_mm_roles():
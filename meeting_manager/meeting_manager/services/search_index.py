@@ -0,0 +1,431 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+"""
+Search Index
+
+Bookings and customers are searched through MM Search Index, one
+denormalized search document per record, instead of leading-wildcard LIKE
+scans over joined tables:
+
+- MM Meeting Booking: reference, title, notes, description, customer
+  snapshot, linked contact and primary host
+- Contact: names, company, CVR, all emails and phone numbers
+- HD Customer (when Helpdesk is installed): name, email, phone, CVR, domain
+
+Documents are kept current by doc hooks (booking controller, doc_events for
+Contact and HD Customer); rebuild_search_index rebuilds everything.
+
+Queries use MariaDB FULLTEXT in boolean mode. Every word is matched as a
+prefix and results are ranked by relevance, with title matches weighted
+higher. Words shorter than the InnoDB minimum token size are not in the
+FULLTEXT index and are matched with LIKE on the indexed text instead. When the strict query finds nothing, it is retried with every word
+shortened, so a typo near the end of a word still matches. Digit groups are
+joined in both documents and queries, so "12 34 56" and "123456" match the
+same phone number; phone numbers are also indexed by their national part.
+"""
+
+import re
+
+import frappe
+from frappe.utils import cstr, now_datetime
+
+BOOKING = "MM Meeting Booking"
+CONTACT = "Contact"
+HD_CUSTOMER = "HD Customer"
+
+# Records indexed per batch when rebuilding
+REBUILD_BATCH_SIZE = 500
+
+# InnoDB ignores shorter words (innodb_ft_min_token_size)
+MIN_TOKEN_LENGTH = 3
+
+# Title matches count this much more than body matches
+TITLE_WEIGHT = 2
+
+# Separators between digit groups (phone numbers, references)
+DIGIT_SEPARATOR_RE = re.compile(r"(?<=\d)[\s\-()./]+(?=\d)")
+
+# Digits kept as the national part of phone numbers
+NATIONAL_NUMBER_LENGTH = 8
+
+
+# ---------------------------------------------------------------------------
+# Querying
+# ---------------------------------------------------------------------------
+
+def search(reference_doctypes, text, limit=20):
+	"""
+	Search the index
+
+	Args:
+		reference_doctypes (str or list): Doctype(s) to search
+		text (str): User input
+		limit (int): Maximum number of results
+
+	Returns:
+		list: [{"reference_doctype", "reference_name", "score"}], best match first
+	"""
+	if isinstance(reference_doctypes, str):
+		reference_doctypes = [reference_doctypes]
+
+	for relaxed in (False, True):
+		condition = get_search_condition(text, relaxed=relaxed)
+		if not condition:
+			return []
+
+		results = frappe.db.sql(f"""
+			SELECT si.reference_doctype, si.reference_name, {condition["score"]} AS score
+			FROM `tabMM Search Index` si
+			WHERE si.reference_doctype IN %(doctypes)s
+				AND {condition["where"]}
+			ORDER BY score DESC, si.sort_datetime DESC
+			LIMIT %(limit)s
+		""", dict(condition["params"], doctypes=tuple(reference_doctypes), limit=limit), as_dict=True)
+
+		if results or not condition["can_relax"]:
+			return results
+
+	return []
+
+
+def get_search_condition(text, relaxed=False, alias="si"):
+	"""
+	Build the match condition and score expression for a search text
+
+	Args:
+		text (str): User input
+		relaxed (bool): Match shortened word prefixes (typo tolerance)
+		alias (str): Alias of `tabMM Search Index` in the calling query
+
+	Returns:
+		dict: {"where", "score", "params", "can_relax"}, or None when the text
+		has nothing to search for
+	"""
+	words = _tokenize(text)
+	if not words:
+		return None
+
+	fulltext_words = [w for w in words if len(w) >= MIN_TOKEN_LENGTH]
+
+	if frappe.db.db_type != "mariadb" or not fulltext_words:
+		# Short words are not in the FULLTEXT index; scan the search documents instead
+		params = {f"search_like_{i}": f"%{w}%" for i, w in enumerate(words)}
+		where = " AND ".join(f"{alias}.content LIKE %({key})s" for key in params)
+		return {"where": f"({where})", "score": "1", "params": params, "can_relax": False}
+
+	if relaxed:
+		fulltext_words = [_shorten(w) for w in fulltext_words]
+
+	query = " ".join(f"+{w}*" for w in fulltext_words)
+	where = f"MATCH({alias}.title, {alias}.content) AGAINST (%(search_query)s IN BOOLEAN MODE)"
+	params = {"search_query": query}
+
+	# Short words are not in the FULLTEXT index; match them on the indexed text
+	for i, word in enumerate(w for w in words if len(w) < MIN_TOKEN_LENGTH):
+		key = f"search_like_{i}"
+		params[key] = f"%{word}%"
+		where += f" AND ({alias}.title LIKE %({key})s OR {alias}.content LIKE %({key})s)"
+
+	return {
+		"where": f"({where})",
+		"score": (
+			f"(MATCH({alias}.title) AGAINST (%(search_query)s IN BOOLEAN MODE) * {TITLE_WEIGHT}"
+			f" + MATCH({alias}.title, {alias}.content) AGAINST (%(search_query)s IN BOOLEAN MODE))"
+		),
+		"params": params,
+		"can_relax": not relaxed and any(_shorten(w) != w for w in fulltext_words),
+	}
+
+
+def _tokenize(text):
+	"""Lowercase words of the input; digit groups are joined so phone numbers match"""
+	text = cstr(text).strip().lower()
+	if not text:
+		return []
+
+	return list(dict.fromkeys(re.findall(r"\w+", _join_digit_groups(text))))
+
+
+def _join_digit_groups(text):
+	"""Join digit groups split by spaces or separators: "+45 12 34-56" -> "+45123456" """
+	return DIGIT_SEPARATOR_RE.sub("", text)
+
+
+def _shorten(word):
+	"""Drop the last characters of longer words for the relaxed query"""
+	if len(word) <= MIN_TOKEN_LENGTH + 1 or word.isdigit():
+		return word
+	return word[:max(MIN_TOKEN_LENGTH, len(word) - 2)]
+
+
+# ---------------------------------------------------------------------------
+# Indexing
+# ---------------------------------------------------------------------------
+
+def index_bookings(booking_names):
+	"""
+	(Re)build the search documents of bookings
+
+	Args:
+		booking_names (str or list): MM Meeting Booking IDs
+	"""
+	if isinstance(booking_names, str):
+		booking_names = [booking_names]
+	if not booking_names:
+		return
+
+	bookings = frappe.get_all(
+		BOOKING,
+		filters={"name": ["in", booking_names]},
+		fields=[
+			"name", "booking_reference", "meeting_title", "customer_notes", "meeting_description",
+			"customer", "customer_email_at_booking", "customer_phone_at_booking", "start_datetime",
+			"primary_host",
+		],
+	)
+
+	contact_names = list({b.customer for b in bookings if b.customer})
+	contacts = {
+		c.name: c
+		for c in frappe.get_all(
+			CONTACT,
+			filters={"name": ["in", contact_names]},
+			fields=["name", "full_name", "first_name", "company_name", "email_id"],
+		)
+	} if contact_names else {}
+
+	host_users = list({b.primary_host for b in bookings if b.primary_host})
+	host_names = {
+		u.name: u.full_name
+		for u in frappe.get_all("User", filters={"name": ["in", host_users]}, fields=["name", "full_name"])
+	} if host_users else {}
+
+	documents = []
+	for booking in bookings:
+		contact = contacts.get(booking.customer) or frappe._dict()
+		documents.append((
+			booking.name,
+			booking.meeting_title or booking.name,
+			booking.start_datetime,
+			[
+				booking.name, booking.booking_reference, booking.meeting_title,
+				booking.customer_notes, booking.meeting_description,
+				booking.customer_email_at_booking, _phone_terms(booking.customer_phone_at_booking),
+				contact.full_name, contact.first_name, contact.company_name, contact.email_id,
+				host_names.get(booking.primary_host),
+			],
+		))
+
+	_write_documents(BOOKING, booking_names, documents)
+
+
+def index_contacts(contact_names):
+	"""
+	(Re)build the search documents of contacts
+
+	Args:
+		contact_names (str or list): Contact IDs
+	"""
+	if isinstance(contact_names, str):
+		contact_names = [contact_names]
+	if not contact_names:
+		return
+
+	contacts = frappe.get_all(
+		CONTACT,
+		filters={"name": ["in", contact_names]},
+		fields=[
+			"name", "full_name", "first_name", "last_name", "company_name",
+			"email_id", "mm_cvr_number", "modified",
+		],
+	)
+
+	emails = {}
+	for row in frappe.get_all(
+		"Contact Email",
+		filters={"parent": ["in", contact_names], "parenttype": CONTACT},
+		fields=["parent", "email_id"],
+	):
+		emails.setdefault(row.parent, []).append(row.email_id)
+
+	phones = {}
+	for row in frappe.get_all(
+		"Contact Phone",
+		filters={"parent": ["in", contact_names], "parenttype": CONTACT},
+		fields=["parent", "phone"],
+	):
+		phones.setdefault(row.parent, []).append(_phone_terms(row.phone))
+
+	documents = []
+	for contact in contacts:
+		title = contact.full_name or " ".join(filter(None, [contact.first_name, contact.last_name])) or contact.name
+		documents.append((
+			contact.name,
+			title,
+			contact.modified,
+			[
+				contact.name, contact.first_name, contact.last_name, contact.company_name,
+				contact.email_id, contact.mm_cvr_number,
+				*emails.get(contact.name, []), *phones.get(contact.name, []),
+			],
+		))
+
+	_write_documents(CONTACT, contact_names, documents)
+
+
+def index_hd_customers(customer_names):
+	"""
+	(Re)build the search documents of Helpdesk customers
+
+	Args:
+		customer_names (str or list): HD Customer IDs
+	"""
+	if isinstance(customer_names, str):
+		customer_names = [customer_names]
+	if not customer_names or not frappe.db.exists("DocType", HD_CUSTOMER):
+		return
+
+	customers = frappe.get_all(
+		HD_CUSTOMER,
+		filters={"name": ["in", customer_names]},
+		fields=["name", "customer_name", "email", "phone", "cvr", "domain", "modified"],
+	)
+
+	documents = [
+		(
+			c.name,
+			c.customer_name or c.name,
+			c.modified,
+			[c.name, c.customer_name, c.email, _phone_terms(c.phone), c.cvr, c.domain],
+		)
+		for c in customers
+	]
+
+	_write_documents(HD_CUSTOMER, customer_names, documents)
+
+
+def remove_from_index(reference_doctype, reference_names):
+	"""Delete the search documents of deleted records"""
+	if isinstance(reference_names, str):
+		reference_names = [reference_names]
+	if not reference_names:
+		return
+
+	frappe.db.delete("MM Search Index", {
+		"reference_doctype": reference_doctype,
+		"reference_name": ["in", reference_names],
+	})
+
+
+def _write_documents(reference_doctype, reference_names, documents):
+	"""
+	Replace the search documents of records
+
+	Args:
+		reference_doctype (str): Doctype of the records
+		reference_names (list): All records being indexed; records without a
+			document (deleted meanwhile) lose their search document
+		documents (list): Tuples of (name, title, sort_datetime, content parts)
+	"""
+	remove_from_index(reference_doctype, reference_names)
+	if not documents:
+		return
+
+	now = now_datetime()
+	user = frappe.session.user
+	rows = [
+		(
+			frappe.generate_hash(length=10), now, now, user, user,
+			reference_doctype, name, cstr(title)[:140], sort_datetime,
+			" ".join(_content_terms(part) for part in parts if part),
+		)
+		for name, title, sort_datetime, parts in documents
+	]
+
+	frappe.db.bulk_insert(
+		"MM Search Index",
+		[
+			"name", "creation", "modified", "owner", "modified_by",
+			"reference_doctype", "reference_name", "title", "sort_datetime", "content",
+		],
+		rows,
+	)
+
+
+def _content_terms(value):
+	"""Value as stored plus, if different, with digit groups joined as queries are"""
+	value = cstr(value)
+	joined = _join_digit_groups(value)
+	return value if joined == value else f"{value} {joined}"
+
+
+def _phone_terms(phone):
+	"""Phone number as typed plus its national part"""
+	if not phone:
+		return ""
+
+	digits = re.sub(r"\D", "", phone)
+	return " ".join(dict.fromkeys(filter(None, [phone, digits[-NATIONAL_NUMBER_LENGTH:]])))
+
+
+# ---------------------------------------------------------------------------
+# Doc hooks and rebuild
+# ---------------------------------------------------------------------------
+
+def update_contact_index(doc, method=None):
+	"""Contact on_update: reindex the contact and the bookings showing its name"""
+	index_contacts(doc.name)
+
+	if doc.get_doc_before_save() and any(
+		doc.has_value_changed(field) for field in ("full_name", "first_name", "company_name", "email_id")
+	):
+		frappe.enqueue(
+			"meeting_manager.meeting_manager.services.search_index.reindex_contact_bookings",
+			queue="long",
+			job_id=f"mm_search_index:contact_bookings:{doc.name}",
+			deduplicate=True,
+			enqueue_after_commit=True,
+			contact=doc.name
+		)
+
+
+def remove_contact_index(doc, method=None):
+	"""Contact on_trash"""
+	remove_from_index(CONTACT, doc.name)
+
+
+def update_hd_customer_index(doc, method=None):
+	"""HD Customer on_update"""
+	index_hd_customers(doc.name)
+
+
+def remove_hd_customer_index(doc, method=None):
+	"""HD Customer on_trash"""
+	remove_from_index(HD_CUSTOMER, doc.name)
+
+
+def reindex_contact_bookings(contact):
+	"""Background job: reindex all bookings of a contact"""
+	names = frappe.get_all(BOOKING, filters={"customer": contact}, pluck="name")
+	for start in range(0, len(names), REBUILD_BATCH_SIZE):
+		index_bookings(names[start:start + REBUILD_BATCH_SIZE])
+
+
+def reindex_meeting_type_bookings(meeting_type):
+	"""Background job: reindex all bookings of a meeting type"""
+	names = frappe.get_all(BOOKING, filters={"meeting_type": meeting_type}, pluck="name")
+	for start in range(0, len(names), REBUILD_BATCH_SIZE):
+		index_bookings(names[start:start + REBUILD_BATCH_SIZE])
+
+
+def rebuild_search_index():
+	"""Rebuild the search documents of all bookings and customers"""
+	for doctype, index in ((BOOKING, index_bookings), (CONTACT, index_contacts), (HD_CUSTOMER, index_hd_customers)):
+		if not frappe.db.exists("DocType", doctype):
+			continue
+
+		names = frappe.get_all(doctype, pluck="name", order_by="creation asc")
+		for start in range(0, len(names), REBUILD_BATCH_SIZE):
+			index(names[start:start + REBUILD_BATCH_SIZE])
+			frappe.db.commit()
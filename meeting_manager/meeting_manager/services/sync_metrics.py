@@ -0,0 +1,132 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+"""
+Calendar Sync Metrics
+
+Collects per-run metrics for calendar syncs (event counts, provider API calls,
+bytes received, provider latency, wall time and sync lag) and stores one
+MM Calendar Sync Run row per run.
+
+Provider services call record_api_call() around each HTTP request; it is a
+no-op when no sync run is being tracked, so the services can be used outside
+of the scheduled sync without changes.
+"""
+
+import time
+
+import frappe
+from frappe.utils import get_datetime, now_datetime
+
+
+class SyncRunMetrics:
+	"""Metrics collector for a single sync run of one integration"""
+
+	def __init__(self, integration):
+		self.integration = integration
+		self.started_at = now_datetime()
+		self._started = time.monotonic()
+		self.latencies_ms = []
+		self.bytes_received = 0
+		self.counts = {}
+		self.status = None
+
+	def record_api_call(self, latency_ms, bytes_received=0):
+		"""Record one provider API call"""
+		self.latencies_ms.append(latency_ms)
+		self.bytes_received += bytes_received or 0
+
+	def set_counts(self, counts):
+		"""Record event counts as returned by process_calendar_events"""
+		self.counts = counts or {}
+
+	def percentile(self, pct):
+		"""Nearest-rank percentile of recorded latencies, in milliseconds"""
+		if not self.latencies_ms:
+			return None
+
+		ordered = sorted(self.latencies_ms)
+		rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+		return int(ordered[rank])
+
+	def save(self, status, error=None):
+		"""Insert the MM Calendar Sync Run row for this run"""
+		last_sync = self.integration.get("last_sync")
+		sync_lag = (self.started_at - get_datetime(last_sync)).total_seconds() if last_sync else None
+
+		frappe.get_doc({
+			"doctype": "MM Calendar Sync Run",
+			"integration": self.integration.name,
+			"user": self.integration.user,
+			"integration_type": self.integration.integration_type,
+			"status": status,
+			"started_at": self.started_at,
+			"wall_time_ms": int((time.monotonic() - self._started) * 1000),
+			"sync_lag_seconds": int(sync_lag) if sync_lag is not None else None,
+			"fetched": self.counts.get("fetched", 0),
+			"inserted": self.counts.get("inserted", 0),
+			"updated": self.counts.get("updated", 0),
+			"deleted": self.counts.get("deleted", 0),
+			"unchanged": self.counts.get("unchanged", 0),
+			"api_calls": len(self.latencies_ms),
+			"bytes_received": self.bytes_received,
+			"latency_p50_ms": self.percentile(50),
+			"latency_p95_ms": self.percentile(95),
+			"latency_max_ms": int(max(self.latencies_ms)) if self.latencies_ms else None,
+			"error": (error or "")[:1000] or None
+		}).insert(ignore_permissions=True)
+
+
+def start_sync_run(integration):
+	"""
+	Start tracking a sync run for an integration
+
+	Args:
+		integration: MM Calendar Integration document
+
+	Returns:
+		SyncRunMetrics: The active collector
+	"""
+	metrics = SyncRunMetrics(integration)
+	frappe.local.mm_sync_metrics = metrics
+	return metrics
+
+
+def finish_sync_run(metrics, status, error=None):
+	"""
+	Store the metrics of a sync run and stop tracking it
+
+	Failures to store metrics are logged and never fail the sync itself.
+
+	Args:
+		metrics (SyncRunMetrics): Collector returned by start_sync_run
+		status (str): "Success", "Not Modified" or "Failed"
+		error (str): Error message for failed runs
+	"""
+	frappe.local.mm_sync_metrics = None
+
+	try:
+		metrics.save(status, error)
+	except Exception as e:
+		frappe.log_error(
+			title=f"Calendar Sync Metrics Error - {metrics.integration.name}",
+			message=str(e)
+		)
+
+
+def get_active_sync_run():
+	"""Return the collector of the sync run in progress, if any"""
+	return getattr(frappe.local, "mm_sync_metrics", None)
+
+
+def record_api_call(started, bytes_received=0):
+	"""
+	Record a provider API call on the active sync run
+
+	Args:
+		started (float): time.monotonic() taken before the call
+		bytes_received (int): Size of the response body
+	"""
+	metrics = get_active_sync_run()
+	if metrics:
+		metrics.record_api_call((time.monotonic() - started) * 1000, bytes_received)
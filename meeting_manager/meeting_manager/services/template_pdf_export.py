@@ -0,0 +1,255 @@
+# Copyright (c) 2026, Best Security and contributors
+# For license information, please see license.txt
+
+"""
+Email Template PDF Export
+
+Exports every active MM Email Template as one PDF in a background job:
+
+1. Each template page is converted to its own PDF. Pages are cached in Redis
+   by (template, modified), so only changed templates are converted again.
+2. Missing pages are converted in parallel. Every conversion runs
+   wkhtmltopdf as a separate process; the worker threads only wait on those
+   processes, each with its own site connection.
+3. The cover and the pages are merged and written straight to a private
+   File, without building the combined document in memory.
+
+Progress is kept in the cache for polling (get_templates_pdf_export_status)
+and published as the "mm_template_pdf_export" realtime event.
+"""
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+
+import frappe
+from frappe import _
+from frappe.utils import cint, now_datetime
+
+from meeting_manager.meeting_manager.utils.email_templates import get_email_template_by_name
+
+# Parallel wkhtmltopdf conversions per export
+MAX_WORKERS = 4
+
+# Redis hash: "template name|modified" -> page PDF bytes
+PAGE_CACHE_KEY = "mm_template_pdf_pages"
+
+# Bump when the page layout changes so cached pages are not reused
+PAGE_LAYOUT_VERSION = 1
+
+STATUS_CACHE_PREFIX = "mm_template_pdf_export"
+STATUS_TTL_SECONDS = 60 * 60
+
+REALTIME_EVENT = "mm_template_pdf_export"
+
+
+@frappe.whitelist()
+def start_templates_pdf_export():
+	"""
+	Start a background PDF export of all active email templates
+
+	Returns:
+		dict: {"export_id": str} to poll with get_templates_pdf_export_status
+	"""
+	if frappe.session.user == "Guest":
+		frappe.throw(_("You must be logged in"), frappe.PermissionError)
+
+	export_id = frappe.generate_hash(length=12)
+	_set_status(export_id, status="Queued", done=0, total=0)
+
+	frappe.enqueue(
+		"meeting_manager.meeting_manager.services.template_pdf_export.export_templates_pdf",
+		queue="long",
+		job_id=f"{STATUS_CACHE_PREFIX}:{export_id}",
+		enqueue_after_commit=True,
+		export_id=export_id
+	)
+
+	return {"export_id": export_id}
+
+
+@frappe.whitelist()
+def get_templates_pdf_export_status(export_id):
+	"""
+	Get the progress of a PDF export
+
+	Args:
+		export_id (str): ID returned by start_templates_pdf_export
+
+	Returns:
+		dict: {"status", "done", "total", "file_url", "error"}
+	"""
+	status = frappe.cache().get_value(_status_key(export_id))
+	if not status or status.get("user") != frappe.session.user:
+		frappe.throw(_("PDF export {0} not found").format(export_id), frappe.DoesNotExistError)
+
+	return status
+
+
+def export_templates_pdf(export_id):
+	"""
+	Background job: render, convert and merge all template pages into a File
+
+	Args:
+		export_id (str): Export ID for progress reporting
+	"""
+	from meeting_manager.meeting_manager.utils.email_notifications import get_pdf_export_templates
+
+	try:
+		templates = [get_email_template_by_name(t.name) for t in get_pdf_export_templates()]
+		_set_status(export_id, status="Running", done=0, total=len(templates))
+
+		pages = _get_template_pages(export_id, templates)
+		file_url = _write_export_file(export_id, templates, pages)
+
+		# The File is committed by the job runner; only then can it be downloaded
+		frappe.db.after_commit.add(partial(
+			_set_status, export_id,
+			status="Completed", done=len(templates), total=len(templates), file_url=file_url
+		))
+	except Exception as e:
+		frappe.db.rollback()
+		frappe.log_error(title="Template PDF Export Error", message=frappe.get_traceback())
+		_set_status(export_id, status="Failed", error=str(e))
+
+
+def _get_template_pages(export_id, templates):
+	"""
+	Get the PDF of every template page, converting only uncached pages
+
+	Args:
+		export_id (str): Export ID for progress reporting
+		templates (list): Templates in export order
+
+	Returns:
+		dict: {template name: page PDF bytes}
+	"""
+	from meeting_manager.meeting_manager.utils.email_notifications import (
+		get_pdf_export_document,
+		get_pdf_template_page,
+	)
+
+	cache_keys = {t.name: _page_cache_key(t) for t in templates}
+
+	pages = {}
+	missing = {}
+	for template in templates:
+		page = frappe.cache().hget(PAGE_CACHE_KEY, cache_keys[template.name])
+		if page:
+			pages[template.name] = page
+		else:
+			# Jinja rendering needs the job's site context; only conversion runs in the pool
+			missing[template.name] = get_pdf_export_document(get_pdf_template_page(template))
+
+	done = len(pages)
+	_set_status(export_id, status="Running", done=done, total=len(templates))
+
+	if not missing:
+		return pages
+
+	site = frappe.local.site
+	sites_path = frappe.local.sites_path
+
+	with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(missing))) as executor:
+		futures = {
+			executor.submit(_convert_page, site, sites_path, html): name
+			for name, html in missing.items()
+		}
+		for future in as_completed(futures):
+			name = futures[future]
+			pages[name] = future.result()
+			frappe.cache().hset(PAGE_CACHE_KEY, cache_keys[name], pages[name])
+
+			done += 1
+			_set_status(export_id, status="Running", done=done, total=len(templates))
+
+	return pages
+
+
+def _convert_page(site, sites_path, html):
+	"""
+	Convert one page to PDF in a worker thread
+
+	frappe.local is per thread, so each worker opens its own site context for
+	get_pdf (print settings, URL scrubbing).
+	"""
+	from frappe.utils.pdf import get_pdf
+
+	from meeting_manager.meeting_manager.utils.email_notifications import PDF_OPTIONS
+
+	frappe.init(site=site, sites_path=sites_path)
+	try:
+		frappe.connect()
+		return get_pdf(html, options=dict(PDF_OPTIONS))
+	finally:
+		frappe.destroy()
+
+
+def _write_export_file(export_id, templates, pages):
+	"""
+	Merge the cover and the template pages into a private File
+
+	Returns:
+		str: File URL
+	"""
+	from frappe.utils.pdf import get_pdf
+	from pypdf import PdfReader, PdfWriter
+
+	from meeting_manager.meeting_manager.utils.email_notifications import (
+		PDF_OPTIONS,
+		get_pdf_export_document,
+		get_pdf_export_title,
+	)
+
+	writer = PdfWriter()
+
+	cover = get_pdf(get_pdf_export_document(get_pdf_export_title(len(templates))), options=dict(PDF_OPTIONS))
+	writer.append(PdfReader(io.BytesIO(cover)))
+	for template in templates:
+		writer.append(PdfReader(io.BytesIO(pages[template.name])))
+
+	file_name = f"BestSecurity_Email_Templates_{now_datetime().strftime('%Y%m%d_%H%M')}_{export_id}.pdf"
+	file_path = frappe.get_site_path("private", "files", file_name)
+
+	with open(file_path, "wb") as f:
+		writer.write(f)
+	writer.close()
+
+	file_doc = frappe.get_doc({
+		"doctype": "File",
+		"file_name": file_name,
+		"file_url": f"/private/files/{file_name}",
+		"is_private": 1,
+		"file_size": os.path.getsize(file_path)
+	}).insert(ignore_permissions=True)
+
+	return file_doc.file_url
+
+
+def _page_cache_key(template):
+	return f"{template.name}|{template.modified}|{PAGE_LAYOUT_VERSION}"
+
+
+def _status_key(export_id):
+	return f"{STATUS_CACHE_PREFIX}:{export_id}"
+
+
+def _set_status(export_id, **values):
+	"""Store export progress for polling and publish it to the requesting user"""
+	status = frappe.cache().get_value(_status_key(export_id)) or {
+		"export_id": export_id,
+		"user": frappe.session.user,
+		"file_url": None,
+		"error": None,
+	}
+	status.update(values)
+	status["progress"] = int(cint(status.get("done")) * 100 / status["total"]) if status.get("total") else 0
+
+	frappe.cache().set_value(_status_key(export_id), status, expires_in_sec=STATUS_TTL_SECONDS)
+	frappe.publish_realtime(REALTIME_EVENT, status, user=status["user"])
+
+
+def clear_template_page_cache():
+	"""Drop cached template pages (called when MM Email Templates change)"""
+	frappe.cache().delete_value(PAGE_CACHE_KEY)
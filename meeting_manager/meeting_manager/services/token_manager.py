@@ -4,18 +4,44 @@
 """
 Token Manager Service
 Handles OAuth token refresh and validation for calendar integrations
+
+Decrypted access tokens are cached in Redis per integration, so every worker
+sees a refreshed or revoked token; the API clients built from them are cheap
+and are created for each call. Token refreshes are serialized across workers
+with a Redis lock, and the scheduler refreshes tokens shortly before they
+expire so request paths rarely have to refresh inline.
 """
 
+from functools import partial
+
 import frappe
-from frappe.utils import now_datetime, add_to_date
+from frappe import _
+from frappe.utils import now_datetime, add_to_date, get_datetime
+
+
+# Refresh inline when less than this many seconds remain on the token
+TOKEN_REFRESH_MARGIN = 300
+
+# The scheduled job refreshes tokens expiring within this many seconds.
+# Must be larger than the job interval (10 minutes) plus TOKEN_REFRESH_MARGIN.
+PROACTIVE_REFRESH_WINDOW = 1200
 
+# Upper bound on how long a decrypted access token is kept in Redis
+ACCESS_TOKEN_CACHE_TTL = 600
 
-def should_refresh_token(integration):
+# How long a worker holds / waits for the per-integration refresh lock
+REFRESH_LOCK_TIMEOUT = 60
+
+OAUTH_INTEGRATION_TYPES = ("Google Calendar", "Outlook Calendar")
+
+
+def should_refresh_token(integration, margin=TOKEN_REFRESH_MARGIN):
 	"""
-	Check if token needs refresh (<1 hour remaining)
+	Check if token needs refresh (less than `margin` seconds remaining)
 
 	Args:
 		integration: MM Calendar Integration document
+		margin (int): Seconds before expiry at which the token is refreshed
 
 	Returns:
 		bool: True if token should be refreshed
@@ -23,8 +49,55 @@ def should_refresh_token(integration):
 	if not integration.token_expiry:
 		return True
 
-	time_remaining = integration.token_expiry - now_datetime()
-	return time_remaining.total_seconds() < 3600  # 1 hour
+	time_remaining = get_datetime(integration.token_expiry) - now_datetime()
+	return time_remaining.total_seconds() < margin
+
+
+def ensure_fresh_token(integration, refresh, margin=TOKEN_REFRESH_MARGIN):
+	"""
+	Refresh the integration's token if it is about to expire
+
+	Only one worker refreshes a given integration at a time. Workers that were
+	waiting on the lock re-read the expiry and reuse the token that the first
+	worker stored instead of refreshing again.
+
+	Args:
+		integration: MM Calendar Integration document
+		refresh (callable): Performs the provider-specific refresh and stores the tokens
+		margin (int): Seconds before expiry at which the token is refreshed
+
+	Returns:
+		bool: True if the stored token changed
+	"""
+	if not should_refresh_token(integration, margin):
+		return False
+
+	cache = frappe.cache()
+	lock = cache.lock(
+		cache.make_key(f"mm_token_refresh:{integration.name}"),
+		timeout=REFRESH_LOCK_TIMEOUT,
+		blocking_timeout=REFRESH_LOCK_TIMEOUT
+	)
+
+	if not lock.acquire():
+		frappe.throw(_("Timed out waiting for the token refresh of {0}").format(integration.name))
+
+	try:
+		# Another worker may have refreshed while we were waiting for the lock
+		stored_expiry = frappe.db.get_value("MM Calendar Integration", integration.name, "token_expiry")
+		token_changed = str(stored_expiry) != str(integration.token_expiry)
+		integration.token_expiry = stored_expiry
+
+		if should_refresh_token(integration, margin):
+			refresh()
+			integration.token_expiry = frappe.db.get_value(
+				"MM Calendar Integration", integration.name, "token_expiry"
+			)
+			token_changed = True
+
+		return token_changed
+	finally:
+		lock.release()
 
 
 def update_integration_tokens(integration_id, access_token, refresh_token, expires_in):
@@ -61,4 +134,111 @@ def validate_token_expiry(integration):
 	if not integration.token_expiry:
 		return False
 
-	return integration.token_expiry > now_datetime()
+	return get_datetime(integration.token_expiry) > now_datetime()
+
+
+def get_access_token(integration, refresh):
+	"""
+	Return a usable access token for an integration, refreshing it if needed
+
+	The token is cached in Redis until TOKEN_REFRESH_MARGIN seconds before it
+	expires (at most ACCESS_TOKEN_CACHE_TTL), so most calls skip the refresh
+	check and the password decryption.
+
+	Args:
+		integration: MM Calendar Integration document
+		refresh (callable): Performs the provider-specific refresh and stores the tokens
+
+	Returns:
+		str: OAuth access token
+	"""
+	cache = frappe.cache()
+	key = _access_token_cache_key(integration.name)
+
+	access_token = cache.get_value(key)
+	if access_token:
+		return access_token
+
+	ensure_fresh_token(integration, refresh)
+	access_token = integration.get_password("access_token")
+
+	time_remaining = get_datetime(integration.token_expiry) - now_datetime()
+	expires_in = min(int(time_remaining.total_seconds()) - TOKEN_REFRESH_MARGIN, ACCESS_TOKEN_CACHE_TTL)
+	if expires_in > 0:
+		cache.set_value(key, access_token, expires_in_sec=expires_in)
+
+	return access_token
+
+
+def clear_access_token_cache(integration_name):
+	"""
+	Drop the cached access token of an integration for all workers
+
+	The token is dropped now and again after the commit, so a worker that read
+	the old token before the commit does not keep it cached.
+
+	Args:
+		integration_name (str): MM Calendar Integration ID
+	"""
+	_clear_access_token(integration_name)
+	frappe.db.after_commit.add(partial(_clear_access_token, integration_name))
+
+
+def _clear_access_token(integration_name):
+	frappe.cache().delete_value(_access_token_cache_key(integration_name))
+
+
+def _access_token_cache_key(integration_name):
+	return f"mm_access_token:{integration_name}"
+
+
+def get_calendar_service(integration):
+	"""
+	Return an authenticated calendar service for an integration
+
+	Args:
+		integration: MM Calendar Integration document or name
+
+	Returns:
+		GoogleCalendarService | OutlookCalendarService: Service instance
+	"""
+	if isinstance(integration, str):
+		integration = frappe.get_doc("MM Calendar Integration", integration)
+
+	if integration.integration_type == "Google Calendar":
+		from meeting_manager.meeting_manager.services.google_calendar_service import GoogleCalendarService
+		return GoogleCalendarService(integration)
+
+	if integration.integration_type == "Outlook Calendar":
+		from meeting_manager.meeting_manager.services.outlook_service import OutlookCalendarService
+		return OutlookCalendarService(integration)
+
+	frappe.throw(_("{0} integrations do not use OAuth").format(integration.integration_type))
+
+
+def refresh_expiring_tokens():
+	"""
+	Scheduled job to refresh OAuth tokens before they expire
+
+	Runs every 10 minutes and refreshes every active Google/Outlook integration
+	whose token expires within PROACTIVE_REFRESH_WINDOW seconds.
+	"""
+	integrations = frappe.get_all(
+		"MM Calendar Integration",
+		filters={
+			"is_active": 1,
+			"integration_type": ["in", OAUTH_INTEGRATION_TYPES],
+			"token_expiry": ["<", add_to_date(now_datetime(), seconds=PROACTIVE_REFRESH_WINDOW)]
+		},
+		pluck="name"
+	)
+
+	for integration_name in integrations:
+		try:
+			service = get_calendar_service(integration_name)
+			ensure_fresh_token(service.integration, service.refresh_token, margin=PROACTIVE_REFRESH_WINDOW)
+		except Exception as e:
+			frappe.log_error(
+				title=f"Token Refresh Error - {integration_name}",
+				message=str(e)
+			)
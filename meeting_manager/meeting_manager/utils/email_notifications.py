@@ -6,6 +6,11 @@ Template-based email notification system for Meeting Manager
 import frappe
 from frappe import _
 from frappe.utils import get_datetime, format_datetime, format_time, get_url
+from meeting_manager.meeting_manager.utils.email_templates import (
+	get_email_template,
+	get_email_template_by_name,
+	render_email_template,
+)
 
 
 def get_email_wrapper(body_html: str, subject: str = "", include_logo: bool = False) -> str:
@@ -93,50 +98,18 @@ def get_template(email_type: str, recipient_type: str, service_type: str = None)
 		service_type: Service type from booking.select_mkru (optional)
 
 	Returns:
-		MM Email Template document or None
+		Cached template fields (see utils.email_templates) or None
 	"""
-	filters = {
-		"email_type": email_type,
-		"recipient_type": recipient_type,
-		"is_active": 1
-	}
-
-	# Try to find template matching service type first
-	if service_type:
-		filters["service_type"] = service_type
-		template = frappe.db.get_value(
-			"MM Email Template",
-			filters,
-			["name", "priority"],
-			as_dict=True,
-			order_by="priority desc"
-		)
-		if template:
-			return frappe.get_doc("MM Email Template", template.name)
-
-	# Fall back to default template (no service type)
-	if "service_type" in filters:
-		del filters["service_type"]
-	filters["service_type"] = ["in", ["", None]]
-
-	template = frappe.db.get_value(
-		"MM Email Template",
-		filters,
-		["name", "priority"],
-		as_dict=True,
-		order_by="priority desc"
-	)
+	return get_email_template(email_type, recipient_type, service_type)
 
-	if template:
-		return frappe.get_doc("MM Email Template", template.name)
 
-	return None
-
-
-def build_booking_context(booking, recipient_name: str = None, extra_context: dict = None) -> dict:
+def build_booking_context(booking, recipient_name: str | None = None, extra_context: dict | None = None) -> dict:
 	"""
 	Build template context from a booking document.
 
+	A Document is used as passed, including unsaved changes; a booking ID is
+	loaded from the database.
+
 	Args:
 		booking: MM Meeting Booking document or booking_id string
 		recipient_name: Name of the email recipient
@@ -146,112 +119,202 @@ def build_booking_context(booking, recipient_name: str = None, extra_context: di
 		Dictionary with all template variables
 	"""
 	if isinstance(booking, str):
-		booking = frappe.get_doc("MM Meeting Booking", booking)
-
-	# Get customer information
-	customer = None
-	customer_name = ""
-	customer_firstname = ""
-	customer_email = ""
-	customer_phone = ""
-	company = ""
-
-	if booking.customer:
-		customer = frappe.get_doc("Contact", booking.customer)
-		customer_name = customer.full_name or customer.first_name or ""
-		customer_firstname = customer_name.split()[0] if customer_name else ""
-		company = customer.company_name or ""
-		customer_email = customer.email_id or booking.customer_email_at_booking or ""
-		# Get primary phone from Contact Phone child table
-		primary_phone = ""
-		if customer.phone_nos:
-			for p in customer.phone_nos:
-				if p.is_primary_phone:
-					primary_phone = p.phone
-					break
-			if not primary_phone:
-				primary_phone = customer.phone_nos[0].phone if customer.phone_nos else ""
-		customer_phone = primary_phone or booking.customer_phone_at_booking or ""
+		context = build_booking_contexts([booking], extra_context=extra_context).get(booking)
+		if context is None:
+			frappe.throw(_("Meeting Booking {0} not found").format(booking), frappe.DoesNotExistError)
 	else:
-		customer_email = booking.customer_email_at_booking or ""
-		customer_phone = booking.customer_phone_at_booking or ""
-
-	# Get provider (primary host)
-	provider = ""
-	if booking.assigned_users and len(booking.assigned_users) > 0:
-		primary_assigned = None
-		for au in booking.assigned_users:
-			if au.is_primary:
-				primary_assigned = au
-				break
-		if not primary_assigned:
-			primary_assigned = booking.assigned_users[0]
-		provider = frappe.db.get_value("User", primary_assigned.user, "full_name") or primary_assigned.user
-
-	# Get booker information
-	booker = frappe.db.get_value("User", frappe.session.user, "full_name") or frappe.session.user
-
-	# Format date and time
-	start_dt = get_datetime(booking.start_datetime) if booking.start_datetime else None
-	end_dt = get_datetime(booking.end_datetime) if booking.end_datetime else None
-
-	event_date = format_datetime(start_dt, "EEEE, MMMM d, yyyy") if start_dt else ""
-	event_time = format_time(start_dt, "HH:mm") if start_dt else ""
-	end_time = format_time(end_dt, "HH:mm") if end_dt else ""
-	event_datetime = f"{event_date} at {event_time}" if start_dt else ""
-
-	# Calculate duration
-	duration = booking.duration_minutes if hasattr(booking, 'duration_minutes') and booking.duration_minutes else ""
-	if not duration and start_dt and end_dt:
-		duration = int((end_dt - start_dt).total_seconds() / 60)
-
-	# Get meeting type info
-	meeting_type = None
-	if booking.meeting_type:
-		meeting_type = frappe.get_doc("MM Meeting Type", booking.meeting_type)
-
-	# Build context
-	context = {
-		# Recipient
-		"recipient_name": recipient_name or "",
-
-		# Customer info
-		"customer_name": customer_name,
-		"customer_firstname": customer_firstname,
-		"company": company,
-		"customer_email": customer_email,
-		"customer_phone": customer_phone,
-
-		# Meeting info
-		"provider": provider,
-		"event_date": event_date,
-		"event_time": event_time,
-		"end_time": end_time,
-		"event_datetime": event_datetime,
-		"duration": duration,
-		"booker": booker,
-		"booking_reference": booking.booking_reference or booking.name,
-		"service_type": booking.select_mkru or "",
-		"meeting_title": booking.meeting_title or "",
-		"meeting_description": booking.meeting_description or "",
-
-		# Links
-		"cancel_link": booking.cancel_link or "",
-		"reschedule_link": booking.reschedule_link or "",
-		"remote_support_link": "https://rmmeu-bestsecurity.screenconnect.com/",
-		"booking_url": f"{get_url()}/app/mm-meeting-booking/{booking.name}",
-
-		# Raw objects for advanced templates
-		"booking": booking,
-		"customer": customer,
-		"meeting_type": meeting_type,
-	}
+		# Primary host (first assigned user if none is marked primary)
+		assigned_users = booking.get("assigned_users") or []
+		primary_host = next((au.user for au in assigned_users if au.is_primary_host), None)
+		if not primary_host and assigned_users:
+			primary_host = assigned_users[0].user
+
+		context = _build_contexts(
+			[booking.as_dict(no_child_table=True)],
+			{booking.name: primary_host} if primary_host else {},
+			extra_context
+		)[booking.name]
+
+	context["recipient_name"] = recipient_name or ""
+	return context
 
-	# Merge extra context
-	if extra_context:
-		context.update(extra_context)
 
-	return context
+def build_booking_contexts(booking_ids, extra_context: dict | None = None) -> dict:
+	"""
+	Build template contexts for many bookings.
+
+	Bookings, contacts (with their primary phone), host and booker names and
+	meeting types are prefetched with one query each. Contexts only contain
+	plain values; "booking", "customer" and "meeting_type" are field
+	snapshots (frappe._dict), not Document objects.
+
+	Set recipient_name per recipient on a copy of the returned context,
+	e.g. dict(context, recipient_name=...).
+
+	Args:
+		booking_ids: List of MM Meeting Booking IDs
+		extra_context: Additional context variables added to every context
+
+	Returns:
+		Dict of booking ID -> context dictionary
+	"""
+	booking_ids = list(dict.fromkeys(booking_ids or []))
+	if not booking_ids:
+		return {}
+
+	bookings = frappe.get_all(
+		"MM Meeting Booking",
+		filters={"name": ["in", booking_ids]},
+		fields=["*"]
+	)
+	if not bookings:
+		return {}
+
+	# Primary host per booking (first assigned user if none is marked primary)
+	primary_hosts = {}
+	for row in frappe.get_all(
+		"MM Meeting Booking Assigned User",
+		filters={"parent": ["in", booking_ids], "parenttype": "MM Meeting Booking"},
+		fields=["parent", "user"],
+		order_by="is_primary_host desc, idx asc"
+	):
+		primary_hosts.setdefault(row.parent, row.user)
+
+	return _build_contexts(bookings, primary_hosts, extra_context)
+
+
+def _build_contexts(bookings, primary_hosts, extra_context=None):
+	"""
+	Build template contexts from booking field snapshots.
+
+	Args:
+		bookings: MM Meeting Booking field dicts (frappe._dict)
+		primary_hosts: Dict of booking ID -> primary host user
+		extra_context: Additional context variables added to every context
+
+	Returns:
+		Dict of booking ID -> context dictionary
+	"""
+	customer_ids = list({b.customer for b in bookings if b.customer})
+	contacts = {
+		c.name: c
+		for c in frappe.get_all(
+			"Contact",
+			filters={"name": ["in", customer_ids]},
+			fields=["name", "full_name", "first_name", "last_name", "company_name", "email_id", "phone", "mobile_no"]
+		)
+	} if customer_ids else {}
+
+	primary_phones = {}
+	if customer_ids:
+		for row in frappe.get_all(
+			"Contact Phone",
+			filters={"parent": ["in", customer_ids], "parenttype": "Contact"},
+			fields=["parent", "phone"],
+			order_by="is_primary_phone desc, idx asc"
+		):
+			primary_phones.setdefault(row.parent, row.phone)
+
+	user_names = dict(frappe.get_all(
+		"User",
+		filters={"name": ["in", list(set(primary_hosts.values()) | {frappe.session.user})]},
+		fields=["name", "full_name"],
+		as_list=True
+	))
+
+	meeting_type_ids = list({b.meeting_type for b in bookings if b.meeting_type})
+	meeting_types = {
+		mt.name: mt
+		for mt in frappe.get_all(
+			"MM Meeting Type",
+			filters={"name": ["in", meeting_type_ids]},
+			fields=["*"]
+		)
+	} if meeting_type_ids else {}
+
+	# Same for every booking in this request
+	booker = user_names.get(frappe.session.user) or frappe.session.user
+	site_url = get_url()
+
+	contexts = {}
+	for booking in bookings:
+		customer = contacts.get(booking.customer) if booking.customer else None
+
+		# Get customer information
+		customer_name = ""
+		customer_firstname = ""
+		company = ""
+		if customer:
+			customer_name = customer.full_name or customer.first_name or ""
+			customer_firstname = customer_name.split()[0] if customer_name else ""
+			company = customer.company_name or ""
+			customer_email = customer.email_id or booking.customer_email_at_booking or ""
+			customer_phone = primary_phones.get(customer.name) or booking.customer_phone_at_booking or ""
+		else:
+			customer_email = booking.customer_email_at_booking or ""
+			customer_phone = booking.customer_phone_at_booking or ""
+
+		# Get provider (primary host)
+		primary_host = primary_hosts.get(booking.name)
+		provider = (user_names.get(primary_host) or primary_host) if primary_host else ""
+
+		# Format date and time
+		start_dt = get_datetime(booking.start_datetime) if booking.start_datetime else None
+		end_dt = get_datetime(booking.end_datetime) if booking.end_datetime else None
+
+		event_date = format_datetime(start_dt, "EEEE, MMMM d, yyyy") if start_dt else ""
+		event_time = format_time(start_dt, "HH:mm") if start_dt else ""
+		end_time = format_time(end_dt, "HH:mm") if end_dt else ""
+		event_datetime = f"{event_date} at {event_time}" if start_dt else ""
+
+		# Calculate duration
+		duration = booking.duration or ""
+		if not duration and start_dt and end_dt:
+			duration = int((end_dt - start_dt).total_seconds() / 60)
+
+		context = {
+			# Recipient
+			"recipient_name": "",
+
+			# Customer info
+			"customer_name": customer_name,
+			"customer_firstname": customer_firstname,
+			"company": company,
+			"customer_email": customer_email,
+			"customer_phone": customer_phone,
+
+			# Meeting info
+			"provider": provider,
+			"event_date": event_date,
+			"event_time": event_time,
+			"end_time": end_time,
+			"event_datetime": event_datetime,
+			"duration": duration,
+			"booker": booker,
+			"booking_reference": booking.booking_reference or booking.name,
+			"service_type": booking.select_mkru or "",
+			"meeting_title": booking.meeting_title or "",
+			"meeting_description": booking.meeting_description or "",
+
+			# Links
+			"cancel_link": booking.cancel_link or "",
+			"reschedule_link": booking.reschedule_link or "",
+			"remote_support_link": "https://rmmeu-bestsecurity.screenconnect.com/",
+			"booking_url": f"{site_url}/app/mm-meeting-booking/{booking.name}",
+
+			# Field snapshots for advanced templates
+			"booking": booking,
+			"customer": customer,
+			"meeting_type": meeting_types.get(booking.meeting_type),
+		}
+
+		# Merge extra context
+		if extra_context:
+			context.update(extra_context)
+
+		contexts[booking.name] = context
+
+	return contexts
 
 
 def send_notification(
@@ -260,7 +323,8 @@ def send_notification(
 	recipient_type: str,
 	context: dict,
 	service_type: str = None,
-	booking_id: str = None
+	booking_id: str = None,
+	template=None
 ) -> dict:
 	"""
 	Send a notification email using the template system.
@@ -272,6 +336,7 @@ def send_notification(
 		context: Template context dictionary
 		service_type: Service type for template selection
 		booking_id: Booking ID for reference
+		template: Already resolved MM Email Template (skips the lookup)
 
 	Returns:
 		Dict with success status and message
@@ -290,7 +355,8 @@ def send_notification(
 			return {"success": False, "message": "No recipient email provided"}
 
 		# Get template
-		template = get_template(email_type, recipient_type, service_type)
+		if not template:
+			template = get_template(email_type, recipient_type, service_type)
 		frappe.logger().info(f"Template lookup: found={template is not None}, service_type={service_type}")
 		if not template:
 			frappe.log_error(
@@ -304,12 +370,21 @@ def send_notification(
 			context["remote_support_link"] = template.remote_support_url
 
 		# Render template
-		subject = frappe.render_template(template.subject, context)
-		body = frappe.render_template(template.email_body, context)
+		subject, body = render_email_template(template, context)
 
 		# Wrap in branded email layout
 		wrapped_body = get_email_wrapper(body, subject)
 
+		# Queue for the outbox worker instead of holding the request on SMTP
+		from meeting_manager.meeting_manager.services.notification_outbox import (
+			is_outbox_enabled,
+			queue_email,
+		)
+		if is_outbox_enabled():
+			queue_email(recipient_email, subject, wrapped_body, booking_id, email_type, recipient_type)
+			frappe.logger().info(f"Email queued for {recipient_email} ({email_type} - {recipient_type})")
+			return {"success": True, "queued": True, "message": f"Email queued for {recipient_email}"}
+
 		# Send email
 		frappe.sendmail(
 			recipients=[recipient_email],
@@ -349,6 +424,7 @@ def send_booking_confirmation(booking_id: str, notify_customer: bool = True, not
 		booking = frappe.get_doc("MM Meeting Booking", booking_id)
 		service_type = booking.select_mkru or ""
 		results = {"customer": None, "hosts": []}
+		base_context = build_booking_context(booking)
 
 		# Send to customer
 		if notify_customer and not booking.is_internal:
@@ -358,7 +434,7 @@ def send_booking_confirmation(booking_id: str, notify_customer: bool = True, not
 				customer_email = customer.email_id
 
 			if customer_email:
-				context = build_booking_context(booking)
+				context = dict(base_context)
 				results["customer"] = send_notification(
 					customer_email,
 					"Booking Confirmation",
@@ -373,7 +449,7 @@ def send_booking_confirmation(booking_id: str, notify_customer: bool = True, not
 			for assignment in booking.assigned_users:
 				user = frappe.get_doc("User", assignment.user)
 				if user.email:
-					context = build_booking_context(booking, recipient_name=user.full_name)
+					context = dict(base_context, recipient_name=user.full_name or "")
 					result = send_notification(
 						user.email,
 						"Booking Confirmation",
@@ -428,6 +504,7 @@ def send_reschedule_notification(
 			"old_datetime": old_datetime or "",
 			"changed_by": changed_by or frappe.db.get_value("User", frappe.session.user, "full_name") or frappe.session.user
 		}
+		base_context = build_booking_context(booking, extra_context=extra_context)
 
 		# Send to customer (non-internal meetings)
 		if notify_customer and not booking.is_internal:
@@ -437,7 +514,7 @@ def send_reschedule_notification(
 				customer_email = customer.email_id
 
 			if customer_email:
-				context = build_booking_context(booking, extra_context=extra_context)
+				context = dict(base_context)
 				results["customer"] = send_notification(
 					customer_email,
 					"Reschedule Notification",
@@ -452,7 +529,7 @@ def send_reschedule_notification(
 			for assignment in booking.assigned_users:
 				user = frappe.get_doc("User", assignment.user)
 				if user.email:
-					context = build_booking_context(booking, recipient_name=user.full_name, extra_context=extra_context)
+					context = dict(base_context, recipient_name=user.full_name or "")
 					result = send_notification(
 						user.email,
 						"Reschedule Notification",
@@ -469,7 +546,7 @@ def send_reschedule_notification(
 				if participant.user:
 					user = frappe.get_doc("User", participant.user)
 					if user.email:
-						context = build_booking_context(booking, recipient_name=user.full_name, extra_context=extra_context)
+						context = dict(base_context, recipient_name=user.full_name or "")
 						result = send_notification(
 							user.email,
 							"Reschedule Notification",
@@ -523,11 +600,12 @@ def send_reassignment_notification(
 			"previous_host": previous_host or "",
 			"changed_by": changed_by or frappe.db.get_value("User", frappe.session.user, "full_name") or frappe.session.user
 		}
+		base_context = build_booking_context(booking, extra_context=extra_context)
 
 		# Send to new host
 		if notify_new_host and new_host_email:
 			new_host_name = frappe.db.get_value("User", {"email": new_host_email}, "full_name") or new_host_email
-			context = build_booking_context(booking, recipient_name=new_host_name, extra_context=extra_context)
+			context = dict(base_context, recipient_name=new_host_name or "")
 			results["new_host"] = send_notification(
 				new_host_email,
 				"Reassignment Notification",
@@ -545,7 +623,7 @@ def send_reassignment_notification(
 				customer_email = customer.email_id
 
 			if customer_email:
-				context = build_booking_context(booking, extra_context=extra_context)
+				context = dict(base_context)
 				results["customer"] = send_notification(
 					customer_email,
 					"Reassignment Notification",
@@ -594,13 +672,14 @@ def send_extension_notification(
 			"old_duration": old_duration or "",
 			"changed_by": changed_by or frappe.db.get_value("User", frappe.session.user, "full_name") or frappe.session.user
 		}
+		base_context = build_booking_context(booking, extra_context=extra_context)
 
 		# Send to host(s)
 		if notify_host and booking.assigned_users:
 			for assignment in booking.assigned_users:
 				user = frappe.get_doc("User", assignment.user)
 				if user.email:
-					context = build_booking_context(booking, recipient_name=user.full_name, extra_context=extra_context)
+					context = dict(base_context, recipient_name=user.full_name or "")
 					result = send_notification(
 						user.email,
 						"Extension Notification",
@@ -649,6 +728,7 @@ def send_cancellation_notification(
 		extra_context = {
 			"changed_by": changed_by or frappe.db.get_value("User", frappe.session.user, "full_name") or frappe.session.user
 		}
+		base_context = build_booking_context(booking, extra_context=extra_context)
 
 		# Send to customer (non-internal meetings)
 		if notify_customer and not booking.is_internal:
@@ -658,7 +738,7 @@ def send_cancellation_notification(
 				customer_email = customer.email_id
 
 			if customer_email:
-				context = build_booking_context(booking, extra_context=extra_context)
+				context = dict(base_context)
 				results["customer"] = send_notification(
 					customer_email,
 					"Cancellation",
@@ -673,7 +753,7 @@ def send_cancellation_notification(
 			for assignment in booking.assigned_users:
 				user = frappe.get_doc("User", assignment.user)
 				if user.email:
-					context = build_booking_context(booking, recipient_name=user.full_name, extra_context=extra_context)
+					context = dict(base_context, recipient_name=user.full_name or "")
 					result = send_notification(
 						user.email,
 						"Cancellation",
@@ -690,7 +770,7 @@ def send_cancellation_notification(
 				if participant.user:
 					user = frappe.get_doc("User", participant.user)
 					if user.email:
-						context = build_booking_context(booking, recipient_name=user.full_name, extra_context=extra_context)
+						context = dict(base_context, recipient_name=user.full_name or "")
 						result = send_notification(
 							user.email,
 							"Cancellation",
@@ -732,58 +812,47 @@ def send_team_meeting_invitations(booking_id: str, notify_participants: bool = T
 		if not booking.is_internal:
 			return {"success": False, "message": "Not a team meeting"}
 
-		# Get hosts list for context
-		hosts_list = []
-		host_users = set()
-		if booking.assigned_users:
-			for assignment in booking.assigned_users:
-				host_name = frappe.db.get_value("User", assignment.user, "full_name") or assignment.user
-				hosts_list.append(host_name)
-				host_users.add(assignment.user)
+		host_users = [assignment.user for assignment in booking.assigned_users or []]
+		participant_users = [
+			participant.user
+			for participant in booking.participants or []
+			# Skip hosts (notified below) and respect the filter
+			if participant.user and participant.user not in host_users
+			and (participant_filter is None or participant.user in participant_filter)
+		] if notify_participants else []
+
+		users = {
+			u.name: u
+			for u in frappe.get_all(
+				"User",
+				filters={"name": ["in", host_users + participant_users]},
+				fields=["name", "email", "full_name"]
+			)
+		} if host_users or participant_users else {}
 
+		# Get hosts list for context
 		extra_context = {
-			"hosts": ", ".join(hosts_list)
+			"hosts": ", ".join((users.get(u) or {}).get("full_name") or u for u in host_users)
 		}
+		base_context = build_booking_context(booking, extra_context=extra_context)
 
-		# Send to hosts (always notified)
-		if booking.assigned_users:
-			for assignment in booking.assigned_users:
-				user = frappe.get_doc("User", assignment.user)
-				if user.email:
-					context = build_booking_context(booking, recipient_name=user.full_name, extra_context=extra_context)
-					result = send_notification(
-						user.email,
-						"Team Meeting Invitation",
-						"Participant",
-						context,
-						None,
-						booking_id
-					)
-					results["hosts"].append({"user": user.email, "result": result})
-
-		# Send to participants (excluding hosts, respecting filter)
-		if notify_participants and booking.participants:
-			for participant in booking.participants:
-				if not participant.user:
-					continue
-				# Skip hosts (already notified above)
-				if participant.user in host_users:
-					continue
-				# If filter is provided, only notify those in the filter
-				if participant_filter is not None and participant.user not in participant_filter:
+		# Send to hosts (always notified), then participants
+		for group, user_ids in (("hosts", host_users), ("participants", participant_users)):
+			for user_id in user_ids:
+				user = users.get(user_id)
+				if not user or not user.email:
 					continue
-				user = frappe.get_doc("User", participant.user)
-				if user.email:
-					context = build_booking_context(booking, recipient_name=user.full_name, extra_context=extra_context)
-					result = send_notification(
-						user.email,
-						"Team Meeting Invitation",
-						"Participant",
-						context,
-						None,
-						booking_id
-					)
-					results["participants"].append({"user": user.email, "result": result})
+
+				context = dict(base_context, recipient_name=user.full_name or "")
+				result = send_notification(
+					user.email,
+					"Team Meeting Invitation",
+					"Participant",
+					context,
+					None,
+					booking_id
+				)
+				results[group].append({"user": user.email, "result": result})
 
 		return {"success": True, "results": results}
 
@@ -829,6 +898,7 @@ def send_booking_reminder(
 			"custom_message": custom_message or "",
 			"reminder_sent_by": frappe.db.get_value("User", frappe.session.user, "full_name") or frappe.session.user,
 		}
+		base_context = build_booking_context(booking, extra_context=extra_context)
 
 		# Send to customer (non-internal meetings)
 		if notify_customer and not booking.is_internal:
@@ -838,7 +908,7 @@ def send_booking_reminder(
 				customer_email = customer.email_id
 
 			if customer_email:
-				context = build_booking_context(booking, extra_context=extra_context)
+				context = dict(base_context)
 				result = send_notification(
 					customer_email,
 					"Reminder",
@@ -856,7 +926,7 @@ def send_booking_reminder(
 			for assignment in booking.assigned_users:
 				user = frappe.get_doc("User", assignment.user)
 				if user.email:
-					context = build_booking_context(booking, recipient_name=user.full_name, extra_context=extra_context)
+					context = dict(base_context, recipient_name=user.full_name or "")
 					result = send_notification(
 						user.email,
 						"Reminder",
@@ -883,7 +953,7 @@ def send_booking_reminder(
 					continue
 				user = frappe.get_doc("User", participant.user)
 				if user.email:
-					context = build_booking_context(booking, recipient_name=user.full_name, extra_context=extra_context)
+					context = dict(base_context, recipient_name=user.full_name or "")
 					result = send_notification(
 						user.email,
 						"Reminder",
@@ -994,7 +1064,7 @@ def get_available_templates(email_type: str = None, recipient_type: str = None,
 @frappe.whitelist()
 def preview_template(template_name: str, booking_id: str = None) -> dict:
 	"""Preview a rendered template."""
-	template = frappe.get_doc("MM Email Template", template_name)
+	template = get_email_template_by_name(template_name)
 
 	if booking_id:
 		booking = frappe.get_doc("MM Meeting Booking", booking_id)
@@ -1029,8 +1099,7 @@ def preview_template(template_name: str, booking_id: str = None) -> dict:
 			"hosts": "Rasmus Berg, Lars Nielsen",
 		}
 
-	subject = frappe.render_template(template.subject, context)
-	body = frappe.render_template(template.email_body, context)
+	subject, body = render_email_template(template, context)
 
 	return {
 		"subject": subject,
@@ -1070,66 +1139,85 @@ Phone: (+45) 82 82 82 35
 </div>'''
 
 
-@frappe.whitelist()
-def export_all_templates_pdf():
-	"""Generate a PDF document showing all email templates with rendered previews."""
-	templates = frappe.get_all(
+# Sample booking data rendered into templates for the PDF export
+PDF_SAMPLE_CONTEXT = {
+	"recipient_name": "John Doe",
+	"customer_name": "John Smith",
+	"customer_firstname": "John",
+	"company": "Acme Corporation",
+	"customer_email": "john@example.com",
+	"customer_phone": "+45 12 34 56 78",
+	"provider": "Rasmus Berg",
+	"event_date": "Monday, January 27, 2026",
+	"event_time": "14:30",
+	"end_time": "15:30",
+	"event_datetime": "Monday, January 27, 2026 at 14:30",
+	"duration": 60,
+	"booker": "Anna Jensen",
+	"booking_reference": "BK-2026-00123",
+	"service_type": "Business",
+	"meeting_title": "Security Review Meeting",
+	"meeting_description": "Review of IT security measures",
+	"cancel_link": "#",
+	"reschedule_link": "#",
+	"booking_url": "#",
+	"remote_support_link": "https://rmmeu-bestsecurity.screenconnect.com/",
+	"old_datetime": "Friday, January 24, 2026 at 10:00",
+	"changed_by": "Anna Jensen",
+	"previous_host": "Lars Nielsen",
+	"old_duration": 30,
+	"hosts": "Rasmus Berg, Lars Nielsen",
+	"custom_message": "Please have your IT admin credentials ready for the security audit.",
+	"reminder_sent_by": "Anna Jensen",
+}
+
+PDF_OPTIONS = {
+	"page-size": "A4",
+	"margin-top": "12mm",
+	"margin-bottom": "12mm",
+	"margin-left": "12mm",
+	"margin-right": "12mm",
+	"encoding": "UTF-8",
+	"print-media-type": "",
+	"no-outline": "",
+}
+
+
+def get_pdf_export_templates() -> list:
+	"""Active templates in PDF export order"""
+	return frappe.get_all(
 		"MM Email Template",
 		filters={"is_active": 1},
 		fields=["name", "template_name", "email_type", "recipient_type", "service_type"],
 		order_by="email_type asc, recipient_type asc, priority desc",
 	)
 
-	sample_context = {
-		"recipient_name": "John Doe",
-		"customer_name": "John Smith",
-		"customer_firstname": "John",
-		"company": "Acme Corporation",
-		"customer_email": "john@example.com",
-		"customer_phone": "+45 12 34 56 78",
-		"provider": "Rasmus Berg",
-		"event_date": "Monday, January 27, 2026",
-		"event_time": "14:30",
-		"end_time": "15:30",
-		"event_datetime": "Monday, January 27, 2026 at 14:30",
-		"duration": 60,
-		"booker": "Anna Jensen",
-		"booking_reference": "BK-2026-00123",
-		"service_type": "Business",
-		"meeting_title": "Security Review Meeting",
-		"meeting_description": "Review of IT security measures",
-		"cancel_link": "#",
-		"reschedule_link": "#",
-		"booking_url": "#",
-		"remote_support_link": "https://rmmeu-bestsecurity.screenconnect.com/",
-		"old_datetime": "Friday, January 24, 2026 at 10:00",
-		"changed_by": "Anna Jensen",
-		"previous_host": "Lars Nielsen",
-		"old_duration": 30,
-		"hosts": "Rasmus Berg, Lars Nielsen",
-		"custom_message": "Please have your IT admin credentials ready for the security audit.",
-		"reminder_sent_by": "Anna Jensen",
-	}
 
-	pages_html = []
-	for idx, t in enumerate(templates):
-		template = frappe.get_doc("MM Email Template", t.name)
-		context = dict(sample_context)
-		if template.include_remote_support_link and template.remote_support_url:
-			context["remote_support_link"] = template.remote_support_url
+def get_pdf_template_page(template, page_break: bool = False) -> str:
+	"""
+	Render one template as a PDF export page (header card + rendered email)
 
-		subject = frappe.render_template(template.subject, context)
-		body = frappe.render_template(template.email_body, context)
-		rendered = _get_pdf_email_render(body, subject)
+	Args:
+		template: Template returned by get_email_template_by_name
+		page_break: Force a page break after this page
+
+	Returns:
+		str: Page HTML
+	"""
+	context = dict(PDF_SAMPLE_CONTEXT)
+	if template.include_remote_support_link and template.remote_support_url:
+		context["remote_support_link"] = template.remote_support_url
 
-		meta_badge = f'{t.email_type} &rarr; {t.recipient_type}'
-		if t.service_type:
-			meta_badge += f' &rarr; {t.service_type}'
+	subject, body = render_email_template(template, context)
+	rendered = _get_pdf_email_render(body, subject)
 
-		is_last = idx == len(templates) - 1
-		page_break = '' if is_last else 'page-break-after:always;'
+	meta_badge = f'{template.email_type} &rarr; {template.recipient_type}'
+	if template.service_type:
+		meta_badge += f' &rarr; {template.service_type}'
 
-		page = f'''<div style="{page_break}">
+	page_style = 'page-break-after:always;' if page_break else ''
+
+	return f'''<div style="{page_style}">
 <div style="margin-bottom:12px;padding:10px 14px;background:#f8fafc;border:1px solid #e2e8f0;border-radius:6px;">
 <h2 style="margin:0 0 3px;font-size:15px;font-weight:700;color:#1e293b;">{template.template_name}</h2>
 <p style="margin:0 0 4px;font-size:10px;color:#64748b;">{meta_badge}</p>
@@ -1137,9 +1225,19 @@ def export_all_templates_pdf():
 </div>
 {rendered}
 </div>'''
-		pages_html.append(page)
 
-	full_html = f'''<!DOCTYPE html>
+
+def get_pdf_export_title(template_count: int) -> str:
+	"""Title block shown at the top of the PDF export"""
+	return f'''<div style="text-align:center;margin-bottom:24px;padding:16px 0 16px;border-bottom:3px solid #e8a914;">
+<h1 style="margin:0 0 4px;font-size:22px;font-weight:700;color:#1e293b;font-style:italic;">BestSecurity Email Templates</h1>
+<p style="margin:0;font-size:12px;color:#64748b;">Generated {frappe.utils.now_datetime().strftime("%B %d, %Y at %H:%M")} &bull; {template_count} templates</p>
+</div>'''
+
+
+def get_pdf_export_document(content_html: str) -> str:
+	"""Wrap PDF export content in a standalone HTML document"""
+	return f'''<!DOCTYPE html>
 <html>
 <head>
 <meta charset="utf-8">
@@ -1152,25 +1250,30 @@ img {{ max-width: 100%; height: auto; }}
 </style>
 </head>
 <body>
-<div style="text-align:center;margin-bottom:24px;padding:16px 0 16px;border-bottom:3px solid #e8a914;">
-<h1 style="margin:0 0 4px;font-size:22px;font-weight:700;color:#1e293b;font-style:italic;">BestSecurity Email Templates</h1>
-<p style="margin:0;font-size:12px;color:#64748b;">Generated {frappe.utils.now_datetime().strftime("%B %d, %Y at %H:%M")} &bull; {len(templates)} templates</p>
-</div>
-{"".join(pages_html)}
+{content_html}
 </body>
 </html>'''
 
+
+@frappe.whitelist()
+def export_all_templates_pdf():
+	"""
+	Generate a PDF document showing all email templates with rendered previews.
+
+	Renders everything inside the request; large template sets should use
+	start_templates_pdf_export (services/template_pdf_export.py) instead.
+	"""
 	from frappe.utils.pdf import get_pdf
-	pdf_content = get_pdf(full_html, options={
-		"page-size": "A4",
-		"margin-top": "12mm",
-		"margin-bottom": "12mm",
-		"margin-left": "12mm",
-		"margin-right": "12mm",
-		"encoding": "UTF-8",
-		"print-media-type": "",
-		"no-outline": "",
-	})
+
+	templates = get_pdf_export_templates()
+
+	pages_html = [
+		get_pdf_template_page(get_email_template_by_name(t.name), page_break=idx < len(templates) - 1)
+		for idx, t in enumerate(templates)
+	]
+
+	full_html = get_pdf_export_document(get_pdf_export_title(len(templates)) + "".join(pages_html))
+	pdf_content = get_pdf(full_html, options=PDF_OPTIONS)
 
 	frappe.local.response.filename = "BestSecurity_Email_Templates.pdf"
 	frappe.local.response.filecontent = pdf_content
@@ -1184,7 +1287,7 @@ def send_test_email(template_name: str, recipient_email: str) -> dict:
 		if not recipient_email or "@" not in recipient_email:
 			return {"success": False, "message": "Please enter a valid email address"}
 
-		template = frappe.get_doc("MM Email Template", template_name)
+		template = get_email_template_by_name(template_name)
 
 		context = {
 			"recipient_name": "John Doe",
@@ -1217,8 +1320,7 @@ def send_test_email(template_name: str, recipient_email: str) -> dict:
 			"reminder_sent_by": "Anna Jensen",
 		}
 
-		subject = frappe.render_template(template.subject, context)
-		body = frappe.render_template(template.email_body, context)
+		subject, body = render_email_template(template, context)
 		wrapped_body = get_email_wrapper(body, subject)
 
 		frappe.sendmail(
@@ -1250,13 +1352,12 @@ def send_template_email(booking_id: str, template_name: str = None, email_type:
 			return {"success": False, "message": "No recipient email found"}
 
 		if template_name:
-			template = frappe.get_doc("MM Email Template", template_name)
+			template = get_email_template_by_name(template_name)
 			context = build_booking_context(booking)
 			if template.include_remote_support_link and template.remote_support_url:
 				context["remote_support_link"] = template.remote_support_url
 
-			subject = frappe.render_template(template.subject, context)
-			body = frappe.render_template(template.email_body, context)
+			subject, body = render_email_template(template, context)
 			wrapped_body = get_email_wrapper(body, subject)
 
 			frappe.sendmail(
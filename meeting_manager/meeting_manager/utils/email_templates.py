@@ -0,0 +1,151 @@
+"""
+MM Email Template Registry
+Cached template selection and compiled Jinja templates for notifications
+"""
+
+import frappe
+from frappe import _
+
+# Redis hash: "email_type|recipient_type|service_type" -> template name ("" if none)
+SELECTION_CACHE_KEY = "mm_email_template_selection"
+
+# Redis hash: template name -> template fields
+TEMPLATE_CACHE_KEY = "mm_email_templates"
+
+TEMPLATE_FIELDS = [
+	"name", "modified", "template_name", "email_type", "recipient_type", "service_type",
+	"subject", "email_body", "include_remote_support_link", "remote_support_url",
+	"include_brochure",
+]
+
+# Compiled template code per worker process: (site, name, modified, field) -> code
+_compiled_code = {}
+MAX_COMPILED_TEMPLATES = 512
+
+
+def get_email_template(email_type: str, recipient_type: str, service_type: str | None = None):
+	"""
+	Get the active template for an email, preferring one for the service type.
+
+	The selection and the template fields are cached in Redis until an
+	MM Email Template is changed.
+
+	Args:
+		email_type: Type of email (Booking Confirmation, Reschedule Notification, etc.)
+		recipient_type: Who receives it (Customer, Host, Participant, Team Member)
+		service_type: Service type from booking.select_mkru (optional)
+
+	Returns:
+		frappe._dict with the template fields, or None
+	"""
+	selection_key = f"{email_type}|{recipient_type}|{service_type or ''}"
+	name = frappe.cache().hget(SELECTION_CACHE_KEY, selection_key)
+
+	if name is None:
+		name = _select_template(email_type, recipient_type, service_type) or ""
+		frappe.cache().hset(SELECTION_CACHE_KEY, selection_key, name)
+
+	return get_email_template_by_name(name) if name else None
+
+
+def get_email_template_by_name(name: str):
+	"""
+	Get the fields of an MM Email Template by name (cached).
+
+	Returns:
+		frappe._dict with the template fields
+
+	Raises:
+		frappe.DoesNotExistError: If the template does not exist
+	"""
+	template = frappe.cache().hget(TEMPLATE_CACHE_KEY, name)
+
+	if template is None:
+		template = frappe.db.get_value("MM Email Template", name, TEMPLATE_FIELDS, as_dict=True)
+		if not template:
+			frappe.throw(_("MM Email Template {0} not found").format(name), frappe.DoesNotExistError)
+		frappe.cache().hset(TEMPLATE_CACHE_KEY, name, template)
+
+	return frappe._dict(template)
+
+
+def _select_template(email_type, recipient_type, service_type):
+	"""Find the highest-priority matching template, falling back to the default one"""
+	filters = {
+		"email_type": email_type,
+		"recipient_type": recipient_type,
+		"is_active": 1
+	}
+
+	# Try to find template matching service type first
+	if service_type:
+		name = frappe.db.get_value(
+			"MM Email Template",
+			dict(filters, service_type=service_type),
+			"name",
+			order_by="priority desc"
+		)
+		if name:
+			return name
+
+	# Fall back to default template (no service type)
+	return frappe.db.get_value(
+		"MM Email Template",
+		dict(filters, service_type=["in", ["", None]]),
+		"name",
+		order_by="priority desc"
+	)
+
+
+def render_email_template(template, context: dict) -> tuple:
+	"""
+	Render the subject and body of a template.
+
+	Templates are compiled once per (template, modified) and worker process;
+	rendering only executes the compiled code.
+
+	Args:
+		template: Template returned by get_email_template or an MM Email Template document
+		context: Template context dictionary
+
+	Returns:
+		tuple: (subject, body)
+	"""
+	return (
+		_render_field(template, "subject", context),
+		_render_field(template, "email_body", context),
+	)
+
+
+def _render_field(template, field, context):
+	source = template.get(field) or ""
+	if not source:
+		return ""
+
+	jenv = frappe.get_jenv()
+	cache_key = (frappe.local.site, template.name, str(template.modified), field)
+	code = _compiled_code.get(cache_key)
+
+	if code is None:
+		# Same guard as frappe.render_template
+		if ".__" in source:
+			frappe.throw(_("Illegal template"))
+
+		if len(_compiled_code) >= MAX_COMPILED_TEMPLATES:
+			_compiled_code.clear()
+
+		code = jenv.compile(source, name=f"{template.name}:{field}")
+		_compiled_code[cache_key] = code
+
+	# Bind to this request's environment so request-scoped globals stay current
+	compiled = jenv.template_class.from_code(jenv, code, jenv.make_globals(None))
+	return compiled.render(context)
+
+
+def clear_email_template_cache():
+	"""Drop cached template selections and fields (called from MM Email Template hooks)"""
+	frappe.cache().delete_value(SELECTION_CACHE_KEY)
+	frappe.cache().delete_value(TEMPLATE_CACHE_KEY)
+
+	from meeting_manager.meeting_manager.services.template_pdf_export import clear_template_page_cache
+	clear_template_page_cache()
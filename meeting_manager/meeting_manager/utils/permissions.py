@@ -26,6 +26,94 @@ from frappe import _
 MM_DEPARTMENT_LEADER_ROLE = "MM Department Leader"
 MM_DEPARTMENT_MEMBER_ROLE = "MM Department Member"
 
+# Redis hash: user -> access scope (see get_access_scope)
+ACCESS_SCOPE_CACHE_KEY = "mm_access_scope"
+
+
+# =============================================================================
+# ACCESS SCOPE
+# =============================================================================
+
+def get_access_scope(user=None):
+	"""
+	Get the cached access scope of a user
+
+	The scope holds everything the permission hooks need, so list queries and
+	row checks do not repeat role and department lookups. It is cached in
+	Redis until a department, the user or their MM roles change.
+
+	Args:
+		user (str, optional): User ID. Defaults to current user.
+
+	Returns:
+		frappe._dict: {
+			"user", "is_system_manager", "is_department_leader", "is_department_member",
+			"led_departments", "member_departments", "team_members"
+		}
+	"""
+	if not user:
+		user = frappe.session.user
+
+	scope = frappe.cache().hget(ACCESS_SCOPE_CACHE_KEY, user)
+	if scope is None:
+		scope = _build_access_scope(user)
+		frappe.cache().hset(ACCESS_SCOPE_CACHE_KEY, user, scope)
+
+	return frappe._dict(scope)
+
+
+def _build_access_scope(user):
+	roles = frappe.get_roles(user)
+
+	led_departments = frappe.get_all(
+		"MM Department",
+		filters={"department_leader": user, "is_active": 1},
+		pluck="name"
+	)
+	member_departments = frappe.get_all(
+		"MM Department Member",
+		filters={"member": user, "is_active": 1},
+		pluck="parent",
+		distinct=True
+	)
+
+	# Members of departments led by the user, including the user
+	team_members = {user}
+	if led_departments:
+		team_members.update(frappe.get_all(
+			"MM Department Member",
+			filters={"parent": ["in", led_departments], "is_active": 1},
+			pluck="member"
+		))
+
+	return {
+		"user": user,
+		"is_system_manager": user == "Administrator" or "System Manager" in roles,
+		"is_department_leader": MM_DEPARTMENT_LEADER_ROLE in roles,
+		"is_department_member": MM_DEPARTMENT_MEMBER_ROLE in roles,
+		"led_departments": led_departments,
+		"member_departments": member_departments,
+		"team_members": sorted(team_members),
+	}
+
+
+def clear_access_scope_cache(user=None):
+	"""
+	Drop cached access scopes
+
+	Args:
+		user (str, optional): Only this user; all users when omitted
+	"""
+	if user:
+		frappe.cache().hdel(ACCESS_SCOPE_CACHE_KEY, user)
+	else:
+		frappe.cache().delete_value(ACCESS_SCOPE_CACHE_KEY)
+
+
+def clear_user_access_scope(doc, method=None):
+	"""User on_update: roles may have changed"""
+	clear_access_scope_cache(doc.name)
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -92,36 +180,12 @@ def get_user_departments(user=None, as_leader=False, as_member=False):
 
 def get_led_departments(user=None):
 	"""Get departments where user is the leader"""
-	if not user:
-		user = frappe.session.user
-
-	return frappe.get_all(
-		"MM Department",
-		filters={"department_leader": user, "is_active": 1},
-		pluck="name"
-	)
+	return list(get_access_scope(user).led_departments)
 
 
 def get_team_members(user=None):
-	"""Get all team members in departments led by user"""
-	if not user:
-		user = frappe.session.user
-
-	led_depts = get_led_departments(user)
-	if not led_depts:
-		return [user]  # At least include themselves
-
-	members = frappe.get_all(
-		"MM Department Member",
-		filters={"parent": ["in", led_depts], "is_active": 1},
-		pluck="member"
-	)
-
-	# Include the leader themselves
-	if user not in members:
-		members.append(user)
-
-	return list(set(members))
+	"""Get all team members in departments led by user (always includes the user)"""
+	return list(get_access_scope(user).team_members)
 
 
 def has_app_permission(user=None):
@@ -173,53 +237,50 @@ def get_mm_meeting_booking_permission_query_conditions(user):
 	- System Manager: See all
 	- Department Leader: See bookings where assigned users are in their departments
 	- Department Member: See bookings they are assigned to
+
+	Emitted as a correlated EXISTS on the assigned-user child table.
 	"""
-	if not user:
-		user = frappe.session.user
+	scope = get_access_scope(user)
 
-	if user == "Administrator" or is_system_manager(user):
+	if scope.is_system_manager:
 		return ""
 
-	if is_department_leader(user):
-		team_members = get_team_members(user)
-		if team_members:
-			members_str = ", ".join([frappe.db.escape(m) for m in team_members])
-			return f"""
-				`tabMM Meeting Booking`.name IN (
-					SELECT DISTINCT parent FROM `tabMM Meeting Booking Assigned User`
-					WHERE user IN ({members_str})
-				)
-			"""
+	if scope.is_department_leader:
+		users = scope.team_members
+	elif scope.is_department_member:
+		users = [scope.user]
+	else:
 		return "1=0"
 
-	if is_department_member(user):
-		return f"""
-			`tabMM Meeting Booking`.name IN (
-				SELECT parent FROM `tabMM Meeting Booking Assigned User`
-				WHERE user = {frappe.db.escape(user)}
-			)
-		"""
+	return f"""EXISTS (
+		SELECT 1 FROM `tabMM Meeting Booking Assigned User` mm_perm_au
+		WHERE mm_perm_au.parent = `tabMM Meeting Booking`.name
+			AND mm_perm_au.parenttype = 'MM Meeting Booking'
+			AND mm_perm_au.user IN ({_escape_list(users)})
+	)"""
 
-	return "1=0"
+
+def _escape_list(values):
+	"""SQL literal list of escaped values"""
+	return ", ".join(frappe.db.escape(v) for v in values)
 
 
 def has_mm_meeting_booking_permission(doc, ptype, user):
 	"""Row-level permission check for MM Meeting Booking"""
-	if not user:
-		user = frappe.session.user
+	scope = get_access_scope(user)
 
-	if user == "Administrator" or is_system_manager(user):
+	if scope.is_system_manager:
 		return True
 
 	# Get assigned users for this booking
 	assigned_users = [au.user for au in doc.assigned_users] if doc.assigned_users else []
 
-	if is_department_leader(user):
-		team_members = get_team_members(user)
+	if scope.is_department_leader:
+		team_members = set(scope.team_members)
 		return any(au in team_members for au in assigned_users)
 
-	if is_department_member(user):
-		return user in assigned_users
+	if scope.is_department_member:
+		return scope.user in assigned_users
 
 	return False
 
@@ -236,91 +297,85 @@ def get_contact_permission_query_conditions(user):
 	- Department Leader: See contacts who have bookings with their team
 	- Department Member: See contacts from bookings they're assigned to
 	- Non-MM users: No restriction (passthrough)
+
+	Emitted as a correlated EXISTS over the contact's bookings.
 	"""
-	if not user:
-		user = frappe.session.user
+	scope = get_access_scope(user)
 
-	if user == "Administrator" or is_system_manager(user):
+	if scope.is_system_manager:
 		return ""
 
 	# Passthrough for non-MM users (don't restrict ERPNext/Helpdesk Contact access)
-	if not is_department_leader(user) and not is_department_member(user):
+	if not scope.is_department_leader and not scope.is_department_member:
 		return ""
 
-	if is_department_leader(user):
-		team_members = get_team_members(user)
-		if team_members:
-			members_str = ", ".join([frappe.db.escape(m) for m in team_members])
-			return f"""
-				`tabContact`.name IN (
-					SELECT DISTINCT mb.customer FROM `tabMM Meeting Booking` mb
-					INNER JOIN `tabMM Meeting Booking Assigned User` au ON au.parent = mb.name
-					WHERE au.user IN ({members_str}) AND mb.customer IS NOT NULL
-				)
-			"""
-		return "1=0"
-
-	if is_department_member(user):
-		return f"""
-			`tabContact`.name IN (
-				SELECT DISTINCT mb.customer FROM `tabMM Meeting Booking` mb
-				INNER JOIN `tabMM Meeting Booking Assigned User` au ON au.parent = mb.name
-				WHERE au.user = {frappe.db.escape(user)} AND mb.customer IS NOT NULL
-			)
-		"""
+	users = scope.team_members if scope.is_department_leader else [scope.user]
 
-	return "1=0"
+	return f"""EXISTS (
+		SELECT 1 FROM `tabMM Meeting Booking` mm_perm_mb
+		INNER JOIN `tabMM Meeting Booking Assigned User` mm_perm_au
+			ON mm_perm_au.parent = mm_perm_mb.name
+			AND mm_perm_au.parenttype = 'MM Meeting Booking'
+		WHERE mm_perm_mb.customer = `tabContact`.name
+			AND mm_perm_au.user IN ({_escape_list(users)})
+	)"""
 
 
 def has_contact_permission(doc, ptype, user):
 	"""Row-level permission check for Contact (scoped to MM roles only)"""
-	if not user:
-		user = frappe.session.user
+	scope = get_access_scope(user)
 
-	if user == "Administrator" or is_system_manager(user):
+	if scope.is_system_manager:
 		return True
 
 	# Passthrough for non-MM users (don't restrict ERPNext/Helpdesk Contact access)
-	if not is_department_leader(user) and not is_department_member(user):
+	if not scope.is_department_leader and not scope.is_department_member:
 		return True
 
 	# For create permission, allow if user has the role
 	if ptype == "create":
-		return is_department_leader(user)
+		return scope.is_department_leader
 
-	# Check if user has access to any booking with this contact
-	customer_bookings = frappe.get_all(
-		"MM Meeting Booking",
-		filters={"customer": doc.name},
-		pluck="name"
-	)
+	# Contact forms and link validation check the same contact many times per request
+	memo = getattr(frappe.local, "mm_contact_permission", None)
+	if memo is None:
+		frappe.local.mm_contact_permission = memo = {}
+	key = (scope.user, doc.name)
+	if key not in memo:
+		memo[key] = _can_access_contact(scope, doc.name)
 
-	if not customer_bookings:
-		# New contact or no bookings - leaders can access
-		return is_department_leader(user)
+	return memo[key]
 
-	if is_department_leader(user):
-		team_members = get_team_members(user)
-		booking_exists = frappe.db.exists(
-			"MM Meeting Booking Assigned User",
-			{
-				"user": ["in", team_members],
-				"parent": ["in", customer_bookings]
-			}
-		)
-		return bool(booking_exists)
 
-	if is_department_member(user):
-		booking_exists = frappe.db.exists(
-			"MM Meeting Booking Assigned User",
-			{
-				"user": user,
-				"parent": ["in", customer_bookings]
-			}
-		)
-		return bool(booking_exists)
+def _can_access_contact(scope, contact):
+	"""
+	Check in one query whether a contact has a booking with the user (members)
+	or any team member (leaders) as host.
 
-	return False
+	Contacts without bookings (new contacts) are accessible to leaders.
+	"""
+	users = scope.team_members if scope.is_department_leader else [scope.user]
+
+	result = frappe.db.sql("""
+		SELECT
+			EXISTS (
+				SELECT 1 FROM `tabMM Meeting Booking`
+				WHERE customer = %(contact)s
+			) AS has_bookings,
+			EXISTS (
+				SELECT 1 FROM `tabMM Meeting Booking` mb
+				INNER JOIN `tabMM Meeting Booking Assigned User` au
+					ON au.parent = mb.name
+					AND au.parenttype = 'MM Meeting Booking'
+				WHERE mb.customer = %(contact)s
+					AND au.user IN %(users)s
+			) AS has_access
+	""", {"contact": contact, "users": tuple(users)}, as_dict=True)[0]
+
+	if not result.has_bookings:
+		return bool(scope.is_department_leader)
+
+	return bool(result.has_access)
 
 
 # =============================================================================
@@ -42,6 +42,11 @@ def check_blocked_slots(member, scheduled_date, start_time, end_time):
 		fields=["name", "start_time", "end_time", "reason"]
 	)
 
+	return _evaluate_blocked_slots(blocked_slots, start_time, end_time)
+
+
+def _evaluate_blocked_slots(blocked_slots, start_time, end_time):
+	"""Check a requested time against a member's blocked slots for the day"""
 	if not blocked_slots:
 		return {"available": True, "reason": None, "has_blocked_slot": False}
 
@@ -167,6 +172,237 @@ def check_member_availability(member, scheduled_date, scheduled_start_time, dura
 	}
 
 
+def check_members_availability(members, scheduled_date, scheduled_start_time, duration_minutes, exclude_booking=None):
+	"""
+	Check several members at once with the same rules as check_member_availability
+
+	Loads every source (blocked slots, date overrides, working hours, bookings,
+	calendar events, availability rules) with one query for all members, so
+	the number of queries does not grow with the number of members.
+
+	Args:
+		members (list): User IDs
+		scheduled_date (date or str): Date of the booking
+		scheduled_start_time (time or str): Start time of the booking
+		duration_minutes (int): Duration of the meeting in minutes
+		exclude_booking (str, optional): Booking ID to exclude from conflict check (for updates)
+
+	Returns:
+		dict: {member: {
+			"available": bool,
+			"conflicts": list of conflict details,
+			"reason": str (if not available),
+			"day_bookings": int (active bookings on the date),
+			"max_bookings_per_day": int or None
+		}}
+	"""
+	members = list(dict.fromkeys(m for m in members if m))
+	if not members:
+		return {}
+
+	scheduled_date = getdate(scheduled_date)
+	scheduled_start_time = get_time(scheduled_start_time)
+
+	start_datetime = datetime.combine(scheduled_date, scheduled_start_time)
+	end_datetime = start_datetime + timedelta(minutes=duration_minutes)
+	scheduled_end_time = end_datetime.time()
+
+	week_start = scheduled_date - timedelta(days=scheduled_date.weekday())
+	week_end = week_start + timedelta(days=6)
+
+	blocked_slots = {}
+	for slot in frappe.get_all(
+		"MM User Blocked Slot",
+		filters={"user": ["in", members], "blocked_date": scheduled_date},
+		fields=["user", "name", "start_time", "end_time", "reason"]
+	):
+		blocked_slots.setdefault(slot.user, []).append(slot)
+
+	date_overrides = {}
+	for override in frappe.db.sql("""
+		SELECT r.user, o.available, o.custom_hours_start, o.custom_hours_end, o.reason
+		FROM `tabMM User Availability Rule` r
+		INNER JOIN `tabMM User Date Overrides` o
+			ON o.parent = r.name AND o.parenttype = 'MM User Availability Rule'
+		WHERE r.user IN %(members)s
+			AND o.date = %(scheduled_date)s
+		ORDER BY r.modified DESC, o.custom_hours_start
+	""", {"members": members, "scheduled_date": scheduled_date}, as_dict=True):
+		date_overrides.setdefault(override.user, []).append(override)
+
+	working_hours = {}
+	for settings in frappe.get_all(
+		"MM User Settings",
+		filters={"user": ["in", members]},
+		fields=["user", "working_hours_json"]
+	):
+		working_hours.setdefault(settings.user, settings.working_hours_json)
+
+	# Default rule per member (same ordering as the single-member checks)
+	rules = {}
+	for rule in frappe.get_all(
+		"MM User Availability Rule",
+		filters={"user": ["in", members]},
+		fields=[
+			"user", "buffer_time_before", "buffer_time_after",
+			"max_bookings_per_day", "max_bookings_per_week", "is_default"
+		],
+		order_by="is_default desc"
+	):
+		rules.setdefault(rule.user, rule)
+
+	# Bookings of the week (for limits and buffers) and any overlapping the slot
+	bookings = {}
+	for row in frappe.db.sql("""
+		SELECT au.user, mb.name, mb.start_datetime, mb.end_datetime, 'host' AS role
+		FROM `tabMM Meeting Booking` mb
+		INNER JOIN `tabMM Meeting Booking Assigned User` au
+			ON au.parent = mb.name AND au.parenttype = 'MM Meeting Booking'
+		WHERE au.user IN %(members)s
+			AND mb.booking_status NOT IN (SELECT name FROM `tabMM Booking Status` WHERE is_final = 1)
+			AND (
+				(mb.start_datetime >= %(week_start)s AND mb.start_datetime < %(week_after)s)
+				OR (mb.start_datetime < %(conflict_end)s AND mb.end_datetime > %(conflict_start)s)
+			)
+		UNION
+		SELECT p.user, mb.name, mb.start_datetime, mb.end_datetime, 'participant' AS role
+		FROM `tabMM Meeting Booking` mb
+		INNER JOIN `tabMM Meeting Booking Participant` p
+			ON p.parent = mb.name AND p.parenttype = 'MM Meeting Booking'
+		WHERE p.user IN %(members)s
+			AND p.participant_type = 'Internal'
+			AND mb.booking_status NOT IN (SELECT name FROM `tabMM Booking Status` WHERE is_final = 1)
+			AND (
+				(mb.start_datetime >= %(week_start)s AND mb.start_datetime < %(week_after)s)
+				OR (mb.start_datetime < %(conflict_end)s AND mb.end_datetime > %(conflict_start)s)
+			)
+	""", {
+		"members": members,
+		"week_start": week_start,
+		"week_after": week_end + timedelta(days=1),
+		"conflict_start": datetime.combine(scheduled_date, scheduled_start_time),
+		"conflict_end": datetime.combine(scheduled_date, scheduled_end_time),
+	}, as_dict=True):
+		member_bookings = bookings.setdefault(row.user, {})
+		# Host rows win over participant rows for the same booking
+		if row.name not in member_bookings or row.role == "host":
+			member_bookings[row.name] = row
+
+	calendar_events = {}
+	for event in frappe.db.sql("""
+		SELECT ci.user, ces.name, ces.event_title, ces.start_datetime, ces.end_datetime
+		FROM `tabMM Calendar Event Sync` ces
+		INNER JOIN `tabMM Calendar Integration` ci
+			ON ces.calendar_integration = ci.name
+		WHERE ci.user IN %(members)s
+			AND ces.is_blocking_availability = 1
+			AND ces.event_type != 'All-Day Event'
+			AND ces.sync_status = 'Synced'
+			AND ces.start_datetime < %(end_datetime)s
+			AND ces.end_datetime > %(start_datetime)s
+	""", {"members": members, "start_datetime": start_datetime, "end_datetime": end_datetime}, as_dict=True):
+		calendar_events.setdefault(event.user, []).append(event)
+
+	results = {}
+	for member in members:
+		member_bookings = list(bookings.get(member, {}).values())
+		rule = rules.get(member)
+
+		day_bookings = sum(1 for b in member_bookings if get_datetime(b.start_datetime).date() == scheduled_date)
+		week_bookings = sum(
+			1 for b in member_bookings
+			if week_start <= get_datetime(b.start_datetime).date() <= week_end
+		)
+
+		result = {
+			"day_bookings": day_bookings,
+			"max_bookings_per_day": rule.max_bookings_per_day if rule and rule.max_bookings_per_day else None,
+		}
+		results[member] = result
+
+		# 0. Blocked slots are absolute
+		blocked_slot_check = _evaluate_blocked_slots(blocked_slots.get(member), scheduled_start_time, scheduled_end_time)
+		if not blocked_slot_check["available"]:
+			result.update({
+				"available": False,
+				"conflicts": [{"type": "blocked_slot", "message": blocked_slot_check["reason"]}],
+				"reason": blocked_slot_check["reason"]
+			})
+			continue
+
+		conflicts = []
+
+		# 1. Date overrides replace working hours
+		date_override_check = _evaluate_date_overrides(date_overrides.get(member, []), scheduled_start_time, scheduled_end_time)
+		if date_override_check.get("has_override", False):
+			if not date_override_check["available"]:
+				conflicts.append({"type": "date_override", "message": date_override_check["reason"]})
+		else:
+			working_hours_check = _evaluate_working_hours(working_hours.get(member), scheduled_date, scheduled_start_time, scheduled_end_time)
+			if not working_hours_check["available"]:
+				conflicts.append({"type": "working_hours", "message": working_hours_check["reason"]})
+
+		# 3. Existing bookings
+		slot_start = datetime.combine(scheduled_date, scheduled_start_time)
+		slot_end = datetime.combine(scheduled_date, scheduled_end_time)
+		for booking in member_bookings:
+			if booking.name == exclude_booking:
+				continue
+
+			booking_start = get_datetime(booking.start_datetime)
+			booking_end = get_datetime(booking.end_datetime)
+			if booking_start < slot_end and booking_end > slot_start:
+				role_info = " (as participant)" if booking.role == "participant" else ""
+				conflicts.append({
+					"type": "booking_conflict",
+					"booking_id": booking.name,
+					"message": f"Conflicts with existing booking {booking.name}{role_info} ({booking_start.strftime('%H:%M')} - {booking_end.strftime('%H:%M')})"
+				})
+
+		# 4. Synced calendar events
+		for event in calendar_events.get(member, []):
+			event_start = get_datetime(event.start_datetime)
+			event_end = get_datetime(event.end_datetime)
+			conflicts.append({
+				"type": "calendar_event",
+				"event_title": event.event_title or "Busy",
+				"message": f"Conflicts with calendar event: {event.event_title or 'Busy'} ({event_start.strftime('%H:%M')} - {event_end.strftime('%H:%M')})"
+			})
+
+		# 5. Buffer times
+		if rule and (rule.buffer_time_before or rule.buffer_time_after):
+			conflicts.extend(
+				{"type": "buffer_time", "message": conflict["message"]}
+				for conflict in _evaluate_buffer_times(
+					[b for b in member_bookings if b.name != exclude_booking],
+					start_datetime,
+					end_datetime,
+					rule.buffer_time_before or 0,
+					rule.buffer_time_after or 0
+				)
+			)
+
+		# 6. Max bookings per day/week
+		if rule and rule.max_bookings_per_day and day_bookings >= rule.max_bookings_per_day:
+			conflicts.append({
+				"type": "availability_rule",
+				"message": f"Member has reached maximum bookings per day ({rule.max_bookings_per_day})"
+			})
+		elif rule and rule.max_bookings_per_week and week_bookings >= rule.max_bookings_per_week:
+			conflicts.append({
+				"type": "availability_rule",
+				"message": f"Member has reached maximum bookings per week ({rule.max_bookings_per_week})"
+			})
+
+		result.update({
+			"available": len(conflicts) == 0,
+			"conflicts": conflicts,
+			"reason": conflicts[0]["message"] if conflicts else None
+		})
+
+	return results
+
+
 def check_working_hours(member, scheduled_date, start_time, end_time):
 	"""
 	Check if the time falls within member's working hours
@@ -174,12 +410,6 @@ def check_working_hours(member, scheduled_date, start_time, end_time):
 	Returns:
 		dict: {"available": bool, "reason": str}
 	"""
-	# Get day of week (0 = Monday, 6 = Sunday)
-	day_of_week = scheduled_date.weekday()
-	day_names = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-	day_name = day_names[day_of_week]
-	is_weekend = day_of_week >= 5  # Saturday (5) and Sunday (6)
-
 	# Get user settings
 	user_settings = frappe.get_value(
 		"MM User Settings",
@@ -188,7 +418,23 @@ def check_working_hours(member, scheduled_date, start_time, end_time):
 		as_dict=True
 	)
 
-	if not user_settings or not user_settings.working_hours_json:
+	return _evaluate_working_hours(
+		user_settings.working_hours_json if user_settings else None,
+		scheduled_date,
+		start_time,
+		end_time
+	)
+
+
+def _evaluate_working_hours(working_hours_json, scheduled_date, start_time, end_time):
+	"""Check a requested time against a member's working_hours_json"""
+	# Get day of week (0 = Monday, 6 = Sunday)
+	day_of_week = scheduled_date.weekday()
+	day_names = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+	day_name = day_names[day_of_week]
+	is_weekend = day_of_week >= 5  # Saturday (5) and Sunday (6)
+
+	if not working_hours_json:
 		# No working hours configured - default to weekdays only (Mon-Fri)
 		if is_weekend:
 			return {
@@ -198,7 +444,7 @@ def check_working_hours(member, scheduled_date, start_time, end_time):
 		return {"available": True, "reason": None}
 
 	try:
-		working_hours = json.loads(user_settings.working_hours_json)
+		working_hours = json.loads(working_hours_json)
 	except (json.JSONDecodeError, TypeError):
 		# Malformed config - fall back to weekdays only
 		if is_weekend:
@@ -271,6 +517,11 @@ def check_date_overrides(member, scheduled_date, start_time, end_time):
 		)
 		all_overrides.extend(overrides)
 
+	return _evaluate_date_overrides(all_overrides, start_time, end_time)
+
+
+def _evaluate_date_overrides(all_overrides, start_time, end_time):
+	"""Check a requested time against a member's date overrides for the day"""
 	# If no overrides for this date, return without override flag
 	if not all_overrides:
 		return {"available": True, "reason": None, "has_override": False}
@@ -547,13 +798,42 @@ def check_buffer_time_conflicts(member, start_datetime, end_datetime, exclude_bo
 		if booking.name not in nearby_bookings_dict:
 			nearby_bookings_dict[booking.name] = booking
 
-	nearby_bookings = list(nearby_bookings_dict.values())
+	return _evaluate_buffer_times(
+		list(nearby_bookings_dict.values()),
+		start_datetime,
+		end_datetime,
+		buffer_before,
+		buffer_after
+	)
+
+
+def _evaluate_buffer_times(bookings, start_datetime, end_datetime, buffer_before, buffer_after):
+	"""
+	Find bookings on the same day that fall inside the buffer before or after a meeting
+
+	Args:
+		bookings (list): Active bookings of the member (name, start_datetime, end_datetime)
+		start_datetime (datetime): Meeting start
+		end_datetime (datetime): Meeting end
+		buffer_before (int): Minutes required before the meeting
+		buffer_after (int): Minutes required after the meeting
+
+	Returns:
+		list: List of buffer time violations
+	"""
+	buffer_start = start_datetime - timedelta(minutes=buffer_before)
+	buffer_end = end_datetime + timedelta(minutes=buffer_after)
 
 	conflicts = []
-	for booking in nearby_bookings:
+	for booking in bookings:
 		booking_start = get_datetime(booking.start_datetime)
 		booking_end = get_datetime(booking.end_datetime)
 
+		if booking_start.date() != start_datetime.date():
+			continue
+		if not (buffer_start <= booking_start < buffer_end or buffer_start < booking_end <= buffer_end):
+			continue
+
 		# Check if booking violates buffer zones
 		if not (booking_end <= buffer_start or booking_start >= buffer_end):
 			if booking_end > buffer_start and booking_end <= start_datetime: